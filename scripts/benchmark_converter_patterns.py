@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark precompiled converter patterns against module-level re calls.
+
+Compares calling ``re.sub(pattern_literal, ...)`` (which looks the pattern up
+in the ``re`` module's internal cache on every call) with calling the
+precompiled patterns from ``rxiv_maker.converters.patterns`` directly, on the
+short strings typical of table cells and lines.
+
+Usage:
+    python scripts/benchmark_converter_patterns.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rxiv_maker.converters import patterns  # noqa: E402
+
+# (name, pattern literal, flags, precompiled pattern, replacement, sample input)
+CASES = [
+    (
+        "bold in table cell",
+        r"\*\*([^*]+)\*\*",
+        0,
+        patterns.BOLD_SIMPLE_PATTERN,
+        r"\\textbf{\1}",
+        "**Mean** value",
+    ),
+    (
+        "unescaped percent",
+        r"(?<!\\)%",
+        0,
+        patterns.UNESCAPED_PERCENT_PATTERN,
+        r"\\%",
+        "95% CI",
+    ),
+    (
+        "inline code",
+        r"`([^`]+)`",
+        0,
+        patterns.SINGLE_BACKTICK_CODE_PATTERN,
+        r"\\texttt{\1}",
+        "use `rxiv pdf` to build",
+    ),
+    (
+        "citation",
+        r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)",
+        0,
+        patterns.SINGLE_CITATION_PATTERN,
+        r"\\cite{\1}",
+        "as shown before @smith2020",
+    ),
+    (
+        "html bold",
+        r"<b>(.*?)</b>",
+        re.IGNORECASE | re.DOTALL,
+        patterns.HTML_BOLD_PATTERN,
+        r"\\textbf{\1}",
+        "a <b>bold</b> word",
+    ),
+    (
+        "section header",
+        r"^## (.+)$",
+        re.MULTILINE,
+        patterns.SECTION_HEADER_PATTERN,
+        r"\\section{\1}",
+        "## Methods",
+    ),
+]
+
+
+def benchmark_case(literal, flags, compiled, replacement, sample, iterations):
+    """Time both call styles for one pattern.
+
+    Returns:
+        Tuple of (module-level call time, precompiled call time) in nanoseconds per call
+    """
+    module_call = timeit.timeit(lambda: re.sub(literal, replacement, sample, flags=flags), number=iterations)
+    precompiled_call = timeit.timeit(lambda: compiled.sub(replacement, sample), number=iterations)
+    return module_call / iterations * 1e9, precompiled_call / iterations * 1e9
+
+
+def main():
+    """Run the benchmark and print a per-pattern comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000, help="Calls per pattern and call style")
+    args = parser.parse_args()
+
+    print(f"Converter pattern micro-benchmark ({args.iterations:,} calls per case)\n")
+    print(f"{'case':<22} {'re.sub':>10} {'compiled':>10} {'saved':>10}")
+
+    total_module = total_precompiled = 0.0
+    for name, literal, flags, compiled, replacement, sample in CASES:
+        # Sanity check: both call styles must produce identical output
+        assert re.sub(literal, replacement, sample, flags=flags) == compiled.sub(replacement, sample)
+
+        module_ns, precompiled_ns = benchmark_case(literal, flags, compiled, replacement, sample, args.iterations)
+        total_module += module_ns
+        total_precompiled += precompiled_ns
+        saved = (1 - precompiled_ns / module_ns) * 100 if module_ns else 0.0
+        print(f"{name:<22} {module_ns:>8.0f}ns {precompiled_ns:>8.0f}ns {saved:>9.1f}%")
+
+    saved = (1 - total_precompiled / total_module) * 100 if total_module else 0.0
+    print(f"\n{'total':<22} {total_module:>8.0f}ns {total_precompiled:>8.0f}ns {saved:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
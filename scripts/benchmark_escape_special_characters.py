@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Benchmark single-scan special character escaping against the multi-pass version.
+
+Converts a manuscript's markdown files with ``convert_markdown_to_latex``,
+records the text handed to ``escape_special_characters`` at the point where the
+pipeline calls it, and times the single-scan implementation against the
+previous one-pass-per-rule implementation on exactly that input.
+
+Usage:
+    python scripts/benchmark_escape_special_characters.py [--manuscript DIR] [--repeat N] [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rxiv_maker.converters import md2tex, text_formatters  # noqa: E402
+from rxiv_maker.converters.patterns import (  # noqa: E402
+    DETOKENIZE_PATTERN,
+    DOUBLE_TEXTBACKSLASH_PATTERN,
+    DOUBLE_TEXTBACKSLASH_SPACE_PATTERN,
+    INCLUDEGRAPHICS_PATTERN,
+    LATEX_REFERENCE_COMMAND_PATTERNS,
+    NUMBERED_FILENAME_PATTERN,
+    PARENTHESIZED_TEXT_PATTERN,
+    PROTECTED_CONTEXT_SPLIT_PATTERN,
+    TEXTTT_DETOKENIZE_PATTERN,
+    TEXTTT_NESTED_PATTERN,
+    UNDERSCORE_FILENAME_PATTERN,
+    UNESCAPED_CARET_PATTERN,
+    UNESCAPED_INLINE_PERCENT_PATTERN,
+)
+
+DEFAULT_MANUSCRIPT = Path(__file__).resolve().parent.parent / "EXAMPLE_MANUSCRIPT"
+
+
+def escape_special_characters_multipass(text: str) -> str:
+    """Escape special LaTeX characters with one substitution pass per rule.
+
+    A frozen copy of the implementation ``escape_special_characters``
+    replaced, kept here as the baseline of the benchmark.
+
+    Args:
+        text: Text to escape
+
+    Returns:
+        Text with LaTeX special characters escaped
+    """
+    # First, handle all specific cases that contain listings environments
+    # This handles the nested brace issue where regex fails
+
+    # Find all texttt environments that contain listings
+    def replace_listings_texttt(text: str) -> str:
+        # Simple approach: find texttt blocks with listings and replace with verb
+        # Find all \texttt{...} blocks
+        def process_texttt_block(match):
+            full_content = match.group(1)
+
+            # If this texttt block contains listings, replace with verb
+            if "\\begin{lstlisting}" in full_content:
+                # Use verb with a delimiter that's not in the content
+                delimiters = [
+                    "|",
+                    "!",
+                    "@",
+                    "#",
+                    "$",
+                    "%",
+                    "^",
+                    "&",
+                    "*",
+                    "+",
+                    "=",
+                    "~",
+                ]
+                delimiter = "|"
+                for d in delimiters:
+                    if d not in full_content:
+                        delimiter = d
+                        break
+                return f"\\verb{delimiter}{full_content}{delimiter}"
+            else:
+                # Return unchanged
+                return f"\\texttt{{{full_content}}}"
+
+        # Match across newlines, handling one level of nested braces
+        text = TEXTTT_NESTED_PATTERN.sub(process_texttt_block, text)
+
+        return text
+
+    text = replace_listings_texttt(text)
+
+    # IMPORTANT: Protect LaTeX commands FIRST before any underscore escaping
+    # Protect LaTeX reference commands that should not have underscores escaped
+    # These commands use identifiers that often contain underscores (like fig:name_with_underscores)
+    protected_latex_commands: dict[str, str] = {}
+
+    def protect_latex_command(match: re.Match[str]) -> str:
+        """Replace LaTeX command with placeholder."""
+        command = match.group(0)
+        placeholder = f"XXPROTECTEDLATEXCOMMANDXX{len(protected_latex_commands)}XXPROTECTEDLATEXCOMMANDXX"
+        protected_latex_commands[placeholder] = command
+        return placeholder
+
+    # CRITICAL: Protect content that's already been processed by table_processor
+    # The table processor uses \detokenize{} for complex cases - don't touch these
+    # Protect \texttt{\detokenize{...}} commands (from table processor)
+    text = TEXTTT_DETOKENIZE_PATTERN.sub(protect_latex_command, text)
+
+    # Protect standalone \detokenize{...} commands
+    text = DETOKENIZE_PATTERN.sub(protect_latex_command, text)
+
+    # Protect \includegraphics{} commands
+    text = INCLUDEGRAPHICS_PATTERN.sub(protect_latex_command, text)
+
+    # Protect \ref{}, \cite{} and the other reference commands
+    for pattern in LATEX_REFERENCE_COMMAND_PATTERNS:
+        text = pattern.sub(protect_latex_command, text)
+
+    # Then apply the general function for other cases
+    # Escape special characters in texttt commands
+    def escape_specials_in_texttt_content(content: str) -> str:
+        # Special handling for listings environments - they interfere with texttt
+        if "\\begin{lstlisting}" in content or "\\end{lstlisting}" in content:
+            # Use verb instead of texttt for listings content
+            # Find a delimiter that's not in the content
+            delimiters = ["|", "!", "@", "#", "$", "%", "^", "&", "*", "+", "=", "~"]
+            delimiter = "|"
+            for d in delimiters:
+                if d not in content:
+                    delimiter = d
+                    break
+            return f"\\verb{delimiter}{content}{delimiter}"
+        # Special handling for detokenize commands - don't escape the backslashes
+        elif "\\detokenize{" in content:
+            # This content already has detokenize, just return it wrapped in texttt
+            return f"\\texttt{{{content}}}"
+        # Special handling for LaTeX command protected content - don't escape backslashes
+        elif "LATEXCMD_PROTECTED_START{" in content and "}LATEXCMD_PROTECTED_END" in content:
+            # Extract the protected content and return it as-is
+            start_marker = "LATEXCMD_PROTECTED_START{"
+            end_marker = "}LATEXCMD_PROTECTED_END"
+            start_idx = content.find(start_marker)
+            end_idx = content.find(end_marker)
+            if start_idx != -1 and end_idx != -1:
+                protected_content = content[start_idx + len(start_marker) : end_idx]
+                return f"\\texttt{{{protected_content}}}"
+            # Fallback if markers are malformed
+            return f"\\texttt{{{content}}}"
+        else:
+            # For other backslashes, use textbackslash
+            # Skip processing if text already contains any form of textbackslash (already escaped)
+            if "textbackslash" not in content:
+                content = content.replace("\\", "\\textbackslash{}")
+
+        # Escape # characters only if not already escaped
+        if "\\#" not in content:
+            content = content.replace("#", "\\#")
+        return f"\\texttt{{{content}}}"
+
+    # Use a more sophisticated approach to handle nested braces
+    def find_and_replace_texttt(text: str) -> str:
+        result = []
+        i = 0
+        while i < len(text):
+            # Look for \texttt{
+            if text[i : i + 8] == "\\texttt{":
+                # Find the matching closing brace
+                brace_count = 0
+                start = i + 8
+                j = start
+                while j < len(text):
+                    if text[j] == "{":
+                        brace_count += 1
+                    elif text[j] == "}":
+                        if brace_count == 0:
+                            # Found the matching closing brace
+                            content = text[start:j]
+                            replacement = escape_specials_in_texttt_content(content)
+                            result.append(replacement)
+                            i = j + 1
+                            break
+                        else:
+                            brace_count -= 1
+                    j += 1
+                else:
+                    # No matching brace found, just add the original text
+                    result.append(text[i])
+                    i += 1
+            else:
+                result.append(text[i])
+                i += 1
+        return "".join(result)
+
+    text = find_and_replace_texttt(text)
+
+    # Handle underscores carefully - LaTeX is very picky about this
+    # We need to escape underscores in text mode but NOT double-escape them
+
+    # Handle remaining underscores in file paths within parentheses
+    def escape_file_paths_in_parens(match: re.Match[str]) -> str:
+        paren_content = match.group(1)
+        # Only escape if it looks like a file path (has extension or
+        # is all caps directory)
+        if ("." in paren_content and "_" in paren_content) or (
+            paren_content.endswith(".md")
+            or paren_content.endswith(".bib")
+            or paren_content.endswith(".tex")
+            or paren_content.endswith(".py")
+            or paren_content.endswith(".csv")
+        ):
+            return f"({paren_content.replace('_', 'XUNDERSCOREX')})"
+        return match.group(0)
+
+    text = PARENTHESIZED_TEXT_PATTERN.sub(escape_file_paths_in_parens, text)
+
+    # Handle remaining underscores in file names and paths
+    # Match common filename patterns: WORD_WORD.ext, word_word.ext, etc.
+    def escape_filenames(match: re.Match[str]) -> str:
+        filename = match.group(0)
+        # Escape underscores in anything that looks like a filename
+        return filename.replace("_", "XUNDERSCOREX")
+
+    # Match filenames with extensions
+    text = UNDERSCORE_FILENAME_PATTERN.sub(escape_filenames, text)
+
+    # Also match numbered files like 00_CONFIG, 01_MAIN, etc.
+    text = NUMBERED_FILENAME_PATTERN.sub(escape_filenames, text)
+
+    # Escape percent signs in text (but not in comments that start with %)
+    # Use a regex to avoid escaping percent signs at the start of lines (which are comments)
+    text = UNESCAPED_INLINE_PERCENT_PATTERN.sub(r"\\%", text)
+
+    # Final step: replace all placeholders with properly escaped underscores
+    text = text.replace("XUNDERSCOREX", "\\_")
+
+    # Restore protected LaTeX commands after escaping
+    for placeholder, original_command in protected_latex_commands.items():
+        text = text.replace(placeholder, original_command)
+
+    # Handle special characters that can cause LaTeX issues
+    # Escape caret character outside of math mode and texttt blocks
+    def escape_carets_outside_protected_contexts(text):
+        """Escape carets but not inside LaTeX commands or math mode."""
+        # Split by the combined protection pattern - protected parts will be in groups
+        parts = PROTECTED_CONTEXT_SPLIT_PATTERN.split(text)
+        result = []
+
+        for part in parts:
+            if part is None or part == "":
+                continue
+
+            # Check if this part matches any of our protection patterns
+            is_protected = (
+                part.startswith("\\texttt{")
+                or part.startswith("\\text{")
+                or (part.startswith("$") and not part.startswith("$$"))
+                or part.startswith("$$")
+                or part.startswith("\\begin{equation}")
+            )
+
+            if not is_protected:
+                # Only escape carets in unprotected parts
+                # Only escape isolated carets that aren't already in math mode
+                part = UNESCAPED_CARET_PATTERN.sub(r"\\textasciicircum{}", part)
+
+            result.append(part)
+
+        return "".join(result)
+
+    text = escape_carets_outside_protected_contexts(text)
+
+    # Handle Unicode arrows that can cause LaTeX math mode issues
+    # These need to be converted to proper LaTeX math commands
+    text = text.replace("→", "$\\rightarrow$")
+    text = text.replace("←", "$\\leftarrow$")
+    text = text.replace("↑", "$\\uparrow$")
+    text = text.replace("↓", "$\\downarrow$")
+
+    # Clean up double escaping that may have occurred during table processing
+    text = _cleanup_double_escaping(text)
+
+    return text
+
+
+def _cleanup_double_escaping(text: str) -> str:
+    r"""Clean up double-escaped backslashes in texttt environments.
+
+    Fixes patterns like \\textbackslash{}textbackslash that break LaTeX parsing.
+    """
+    # Fix the specific pattern of double-escaped backslashes
+    # Replace \\textbackslash{}textbackslash (with space) with just \\textbackslash{}
+    text = DOUBLE_TEXTBACKSLASH_SPACE_PATTERN.sub(r"\\textbackslash{}", text)
+
+    # Also try without requiring space after
+    text = DOUBLE_TEXTBACKSLASH_PATTERN.sub(r"\\textbackslash{}", text)
+
+    return text
+
+
+def capture_escape_inputs(manuscript_dir):
+    """Convert every markdown file in a manuscript and record the escaping inputs.
+
+    Returns:
+        List of texts passed to ``escape_special_characters`` by the converter
+    """
+    inputs = []
+    original = md2tex.escape_special_characters
+
+    def recording_escape(text):
+        inputs.append(text)
+        return original(text)
+
+    md2tex.escape_special_characters = recording_escape
+    try:
+        for markdown_file in sorted(Path(manuscript_dir).glob("*.md")):
+            md2tex.convert_markdown_to_latex(markdown_file.read_text(encoding="utf-8"))
+    finally:
+        md2tex.escape_special_characters = original
+    return inputs
+
+
+def main():
+    """Run the benchmark and print a comparison of both implementations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--manuscript", type=Path, default=DEFAULT_MANUSCRIPT, help="Manuscript directory")
+    parser.add_argument("--repeat", type=int, default=10, help="Times the manuscript text is concatenated")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per implementation")
+    args = parser.parse_args()
+
+    inputs = capture_escape_inputs(args.manuscript)
+    if not inputs:
+        sys.exit(f"No markdown content found in {args.manuscript}")
+    document = "\n\n".join(inputs * args.repeat)
+
+    # Sanity check: both implementations must produce identical output
+    single_scan = text_formatters.escape_special_characters(document)
+    multipass = escape_special_characters_multipass(document)
+    assert single_scan == multipass, "implementations disagree on this manuscript"
+
+    print(f"Special character escaping on {args.manuscript.name} x{args.repeat} ({len(document):,} characters)\n")
+    print(f"{'implementation':<16} {'time':>10}")
+
+    timings = {}
+    for name, function in (
+        ("multi-pass", escape_special_characters_multipass),
+        ("single-scan", text_formatters.escape_special_characters),
+    ):
+        timings[name] = min(
+            timeit.repeat(lambda function=function: function(document), number=1, repeat=args.iterations)
+        )
+        print(f"{name:<16} {timings[name] * 1000:>8.1f}ms")
+
+    saved = (1 - timings["single-scan"] / timings["multi-pass"]) * 100
+    print(f"\n{'saved':<16} {saved:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
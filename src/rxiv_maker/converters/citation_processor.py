@@ -7,6 +7,12 @@ key validation.
 
 import re
 
+from .patterns import (
+    BRACKETED_CITATION_PATTERN,
+    CITATION_KEY_PATTERN,
+    EMAIL_LIKE_PATTERN,
+    SINGLE_CITATION_PATTERN,
+)
 from .types import CitationKey, LatexContent, MarkdownContent, ProtectedContent
 
 
@@ -32,7 +38,7 @@ def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
                 citations.append(clean_cite)
         return "\\cite{" + ",".join(citations) + "}"
 
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
+    text = BRACKETED_CITATION_PATTERN.sub(process_multiple_citations, text)
 
     # First, protect email addresses and domain-like patterns by temporarily replacing them
     email_patterns = []
@@ -42,12 +48,12 @@ def convert_citations_to_latex(text: MarkdownContent) -> LatexContent:
         return f"__EMAIL_PATTERN_{len(email_patterns) - 1}__"
 
     # Match email-like patterns: word@word.word or @word.word (domain patterns)
-    text = re.sub(r"(\w+@[\w.-]+\.\w+|@[\w.-]+\.\w+)", protect_email, text)
+    text = EMAIL_LIKE_PATTERN.sub(protect_email, text)
 
     # Handle single citations like @citation_key (but not figure/equation references)
     # Allow alphanumeric, underscore, and hyphen in citation keys
     # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
+    text = SINGLE_CITATION_PATTERN.sub(r"\\cite{\1}", text)
 
     # Restore protected email patterns
     for i, pattern in enumerate(email_patterns):
@@ -125,7 +131,7 @@ def process_citations_in_text(text: MarkdownContent) -> LatexContent:
                 citations.append(clean_cite)
         return "\\cite{" + ",".join(citations) + "}"
 
-    text = re.sub(r"\[(@[^]]+)\]", process_multiple_citations, text)
+    text = BRACKETED_CITATION_PATTERN.sub(process_multiple_citations, text)
 
     # First, protect email addresses and domain-like patterns by temporarily replacing them
     email_patterns = []
@@ -135,12 +141,12 @@ def process_citations_in_text(text: MarkdownContent) -> LatexContent:
         return f"__EMAIL_PATTERN_{len(email_patterns) - 1}__"
 
     # Match email-like patterns: word@word.word or @word.word (domain patterns)
-    text = re.sub(r"(\w+@[\w.-]+\.\w+|@[\w.-]+\.\w+)", protect_email, text)
+    text = EMAIL_LIKE_PATTERN.sub(protect_email, text)
 
     # Handle single citations like @citation_key (but not figure/equation references)
     # Allow alphanumeric, underscore, and hyphen in citation keys
     # Exclude figure and equation references by not matching @fig: or @eq: patterns
-    text = re.sub(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", r"\\cite{\1}", text)
+    text = SINGLE_CITATION_PATTERN.sub(r"\\cite{\1}", text)
 
     # Restore protected email patterns
     for i, pattern in enumerate(email_patterns):
@@ -159,7 +165,7 @@ def validate_citation_key(citation_key: CitationKey) -> bool:
     """
     # Citation keys should contain only alphanumeric characters,
     # underscores, and hyphens
-    return bool(re.match(r"^[a-zA-Z0-9_-]+$", citation_key))
+    return bool(CITATION_KEY_PATTERN.match(citation_key))
 
 
 def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
@@ -174,7 +180,7 @@ def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
     citations: list[CitationKey] = []
 
     # Find bracketed multiple citations
-    bracketed_matches = re.findall(r"\[(@[^]]+)\]", text)
+    bracketed_matches = BRACKETED_CITATION_PATTERN.findall(text)
     for match in bracketed_matches:
         for cite in match.split(";"):
             clean_cite = cite.strip().lstrip("@").strip()
@@ -182,7 +188,7 @@ def extract_citations_from_text(text: MarkdownContent) -> list[CitationKey]:
                 citations.append(clean_cite)
 
     # Find single citations (excluding figure and equation references)
-    single_matches = re.findall(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)", text)
+    single_matches = SINGLE_CITATION_PATTERN.findall(text)
     for cite in single_matches:
         if cite not in citations:
             citations.append(cite)
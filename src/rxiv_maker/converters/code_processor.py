@@ -6,6 +6,7 @@ to LaTeX listings or verbatim environments with proper syntax highlighting.
 
 import re
 
+from .placeholders import restore_placeholders
 from .types import LatexContent, MarkdownContent
 
 
@@ -210,9 +211,7 @@ def restore_protected_code(text: LatexContent, protected_content: dict[str, str]
     Returns:
         Text with code content restored
     """
-    for placeholder, original_content in protected_content.items():
-        text = text.replace(placeholder, original_content)
-    return text
+    return restore_placeholders(text, protected_content)
 
 
 def validate_code_block_syntax(code_block: str, language: str = "") -> bool:
@@ -1,23 +1,49 @@
 r"""Custom markdown command processor for rxiv-maker.
 
 This module handles custom markdown commands that get converted to LaTeX.
-It provides an extensible framework for adding new commands while maintaining
-the same patterns as other processors in the converters package.
+Commands are expanded by a registry-driven engine: the patterns of all
+registered commands, together with code spans that must be left untouched,
+are combined into one alternation regex so a single scan over the document
+dispatches every command type. New command types are added with
+``register_custom_command`` and do not add another pass over the document.
 
 Currently supported commands:
 - {{blindtext}} → \blindtext
-- {{Blindtext}} → \\Blindtext
-
-Future planned commands:
-- {{py: code}} → Execute Python code and insert output
-- {py: code} → Execute Python code inline
+- {{Blindtext}} → \Blindtext
+- {{py: code}} → Execute Python code and insert output as code block
+- {py: code} → Execute Python code inline and insert result
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Dict
 
 from .types import LatexContent, MarkdownContent
 
+# Handler signature: receives the full text and the match of the command
+# pattern, and returns the replacement plus the position where scanning
+# resumes, or None if the match is not a complete command.
+CommandHandler = Callable[[str, re.Match[str]], tuple[LatexContent, int] | None]
+
+# Code spans are matched by the same scan so commands inside them are skipped
+_CODE_SPAN_PATTERN = r"(?s:```.*?```)|`[^`]+`"
+
+
+@dataclass(frozen=True)
+class CustomCommand:
+    """A custom command recognised by the expansion engine.
+
+    Attributes:
+        name: Unique name of the command
+        pattern: Regex source matching the command, or its opening delimiter
+        handler: Function producing the replacement for a match
+    """
+
+    name: str
+    pattern: str
+    handler: CommandHandler
+
 
 def process_custom_commands(text: MarkdownContent) -> LatexContent:
     """Process all custom markdown commands and convert them to LaTeX.
@@ -28,37 +54,156 @@ def process_custom_commands(text: MarkdownContent) -> LatexContent:
     Returns:
         LaTeX content with custom commands converted
     """
-    # First protect code blocks from command processing
-    protected_blocks: list[str] = []
+    return _expand_commands(text, tuple(CUSTOM_COMMANDS.values()))
 
-    # Protect fenced code blocks
-    def protect_fenced_code(match: re.Match[str]) -> str:
-        protected_blocks.append(match.group(0))
-        return f"__CUSTOM_CODE_BLOCK_{len(protected_blocks) - 1}__"
 
-    text = re.sub(r"```.*?```", protect_fenced_code, text, flags=re.DOTALL)
+def _expand_commands(
+    text: MarkdownContent, commands: tuple[CustomCommand, ...], protect_code: bool = True
+) -> LatexContent:
+    """Expand the given commands in a single scan.
 
-    # Protect inline code (backticks)
-    def protect_inline_code(match: re.Match[str]) -> str:
-        protected_blocks.append(match.group(0))
-        return f"__CUSTOM_CODE_BLOCK_{len(protected_blocks) - 1}__"
+    Args:
+        text: Markdown content with custom commands
+        commands: Commands to expand
+        protect_code: Whether to leave commands inside code spans untouched
 
-    text = re.sub(r"`[^`]+`", protect_inline_code, text)
+    Returns:
+        LaTeX content with the commands expanded
+    """
+    if not commands:
+        return text
 
-    # Process custom commands
-    text = _process_blindtext_commands(text)
-    text = _process_python_commands(text)
-    # Future: text = _process_r_commands(text)
+    pattern = _compile_command_pattern(tuple(command.pattern for command in commands), protect_code)
+    result: list[str] = []
+    pos = 0
+    search_pos = 0
 
-    # Restore protected code blocks
-    for i, block in enumerate(protected_blocks):
-        text = text.replace(f"__CUSTOM_CODE_BLOCK_{i}__", block)
+    while True:
+        match = pattern.search(text, search_pos)
+        if match is None:
+            break
+
+        group = match.lastgroup
+        if group is None or group == "code":
+            # Leave fenced and inline code exactly as written
+            search_pos = match.end()
+            continue
+
+        expansion = commands[int(group[3:])].handler(text, match)
+        if expansion is None:
+            # Not a complete command, retry from the next character
+            search_pos = match.start() + 1
+            continue
+
+        replacement, end = expansion
+        result.append(text[pos : match.start()])
+        result.append(replacement)
+        pos = search_pos = end
+
+    result.append(text[pos:])
+    return "".join(result)
+
+
+@lru_cache(maxsize=32)
+def _compile_command_pattern(command_patterns: tuple[str, ...], protect_code: bool) -> re.Pattern[str]:
+    """Combine code spans and command patterns into one alternation regex.
+
+    Each command pattern is wrapped in a named group ``cmd<index>`` so the
+    match's ``lastgroup`` identifies which command to dispatch.
+
+    Args:
+        command_patterns: Regex sources of the commands, in dispatch order
+        protect_code: Whether to match code spans ahead of the commands
+
+    Returns:
+        Compiled alternation pattern
+    """
+    alternatives = [f"(?P<code>{_CODE_SPAN_PATTERN})"] if protect_code else []
+    alternatives.extend(f"(?P<cmd{index}>{source})" for index, source in enumerate(command_patterns))
+    return re.compile("|".join(alternatives))
+
+
+def _expand_blindtext(text: str, match: re.Match[str]) -> tuple[LatexContent, int]:
+    """Expand {{blindtext}} and {{Blindtext}} to the matching LaTeX command."""
+    return f"\\{match.group('blindtext_name')}", match.end()
+
+
+def _get_executor():
+    """Get the Python executor, or None if it is not available."""
+    try:
+        from .python_executor import get_python_executor
+
+        return get_python_executor()
+    except ImportError:
+        return None
+
+
+def _expand_python_block(text: str, match: re.Match[str]) -> tuple[LatexContent, int] | None:
+    """Expand a {{py: code}} block, matching nested braces in the code."""
+    # Find the matching closing }}
+    brace_count = 2  # Start with {{
+    start = j = match.end()
+    while j < len(text) and brace_count > 0:
+        if text[j] == "{":
+            brace_count += 1
+        elif text[j] == "}":
+            brace_count -= 1
+        j += 1
+
+    if brace_count != 0:
+        # No matching braces found
+        return None
+
+    executor = _get_executor()
+    if executor is None:
+        # If python_executor is not available, leave the command unchanged
+        return text[match.start() : j], j
+
+    code = text[start : j - 2].strip()  # Exclude the }}
+    try:
+        return executor.execute_block(code), j
+    except Exception as e:
+        return f"```\nPython execution error: {str(e)}\n```", j
+
+
+def _expand_python_inline(text: str, match: re.Match[str]) -> tuple[LatexContent, int]:
+    """Expand an inline {py: code} command."""
+    executor = _get_executor()
+    if executor is None:
+        return match.group(0), match.end()
+
+    code = match.group("py_inline_code").strip()
+    try:
+        return executor.execute_inline(code), match.end()
+    except Exception as e:
+        return f"[Error: {str(e)}]", match.end()
+
+
+BLINDTEXT_COMMAND = CustomCommand(
+    "blindtext", r"\{\{\s*(?P<blindtext_name>blindtext|Blindtext)\s*\}\}", _expand_blindtext
+)
+PYTHON_BLOCK_COMMAND = CustomCommand("python_block", r"\{\{py:", _expand_python_block)
+PYTHON_INLINE_COMMAND = CustomCommand("python_inline", r"\{py:\s*(?P<py_inline_code>[^}]+)\}", _expand_python_inline)
+
+# Registry of commands expanded by process_custom_commands, in dispatch order
+CUSTOM_COMMANDS: Dict[str, CustomCommand] = {
+    command.name: command for command in (BLINDTEXT_COMMAND, PYTHON_BLOCK_COMMAND, PYTHON_INLINE_COMMAND)
+}
 
-    return text
+
+def register_custom_command(command: CustomCommand) -> None:
+    """Register a command with the single-scan expansion engine.
+
+    Args:
+        command: Command to expand; its pattern must not use the group names
+            ``code`` or ``cmd<index>``, and named groups must be unique across
+            registered commands
+    """
+    CUSTOM_COMMANDS[command.name] = command
 
 
 def _process_blindtext_commands(text: MarkdownContent) -> LatexContent:
-    r"""Process blindtext commands converting {{blindtext}} → \\blindtext and {{Blindtext}} → \\Blindtext.
+    r"""Process blindtext commands converting {{blindtext}} → \blindtext and {{Blindtext}} → \Blindtext.
 
     Args:
         text: Markdown content with blindtext commands
@@ -66,19 +211,7 @@ def _process_blindtext_commands(text: MarkdownContent) -> LatexContent:
     Returns:
         LaTeX content with blindtext commands converted
     """
-    # Define the command mappings
-    command_mappings = {
-        "blindtext": r"\\blindtext",
-        "Blindtext": r"\\Blindtext",
-    }
-
-    # Process each command type
-    for markdown_cmd, latex_cmd in command_mappings.items():
-        # Pattern matches {{command}} with optional whitespace
-        pattern = rf"\{{\{{\s*{re.escape(markdown_cmd)}\s*\}}\}}"
-        text = re.sub(pattern, latex_cmd, text)
-
-    return text
+    return _expand_commands(text, (BLINDTEXT_COMMAND,), protect_code=False)
 
 
 def _process_python_commands(text: MarkdownContent) -> LatexContent:
@@ -94,84 +227,7 @@ def _process_python_commands(text: MarkdownContent) -> LatexContent:
     Returns:
         LaTeX content with Python commands processed
     """
-    try:
-        from .python_executor import get_python_executor
-
-        executor = get_python_executor()
-    except ImportError:
-        # If python_executor is not available, return text unchanged
-        return text
-
-    # Process block Python commands {{py: code}}
-    def process_block_python(match: re.Match[str]) -> str:
-        code = match.group(1).strip()
-        try:
-            result = executor.execute_block(code)
-            return result
-        except Exception as e:
-            return f"```\nPython execution error: {str(e)}\n```"
-
-    # Process inline Python commands {py: code}
-    def process_inline_python(match: re.Match[str]) -> str:
-        code = match.group(1).strip()
-        try:
-            result = executor.execute_inline(code)
-            return result
-        except Exception as e:
-            return f"[Error: {str(e)}]"
-
-    # Apply block command processing first
-    # Use non-greedy matching and handle nested braces properly
-    def find_and_replace_block_python(text):
-        result = []
-        i = 0
-        while i < len(text):
-            # Look for {{py:
-            start_marker = "{{py:"
-            if text[i : i + len(start_marker)] == start_marker:
-                # Find the matching closing }}
-                brace_count = 2  # Start with {{
-                start = i + len(start_marker)
-                j = start
-                while j < len(text) and brace_count > 0:
-                    if text[j] == "{":
-                        brace_count += 1
-                    elif text[j] == "}":
-                        brace_count -= 1
-                    j += 1
-
-                if brace_count == 0:
-                    # Found matching braces
-                    code = text[start : j - 2]  # Exclude the }}
-
-                    # Create a mock match object with captured code
-                    captured_code = code.strip()
-
-                    class MockMatch:
-                        def __init__(self, captured_code_param):
-                            self.captured_code = captured_code_param
-
-                        def group(self, n):
-                            return self.captured_code
-
-                    replacement = process_block_python(MockMatch(captured_code))
-                    result.append(replacement)
-                    i = j
-                else:
-                    # No matching braces found
-                    result.append(text[i])
-                    i += 1
-            else:
-                result.append(text[i])
-                i += 1
-        return "".join(result)
-
-    text = find_and_replace_block_python(text)
-
-    # Apply inline command processing (simpler, single line)
-    text = re.sub(r"\{py:\s*([^}]+)\}", process_inline_python, text)
-
-    return text
+    return _expand_commands(text, (PYTHON_BLOCK_COMMAND, PYTHON_INLINE_COMMAND), protect_code=False)
 
 
 def _process_r_commands(text: MarkdownContent) -> LatexContent:
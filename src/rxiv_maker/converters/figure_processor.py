@@ -9,6 +9,27 @@ import re
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from .patterns import (
+    ABSOLUTE_DIMENSION_PATTERN,
+    ATTRIBUTE_BLOCK_ID_PATTERN,
+    ATTRIBUTE_ID_PATTERN,
+    ATTRIBUTE_KEY_VALUE_PATTERN,
+    BOLD_SIMPLE_PATTERN,
+    EQUATION_REFERENCE_PATTERN,
+    FENCED_CODE_BLOCK_PATTERN,
+    FIGURE_BLOCK_PATTERN,
+    FIGURE_PANEL_REFERENCE_PATTERN,
+    FIGURE_REFERENCE_PATTERN,
+    FIGURE_WITHOUT_ATTRIBUTES_PATTERN,
+    INLINE_CODE_PATTERN,
+    INLINE_FIGURE_WITH_ATTRIBUTES_PATTERN,
+    ITALIC_SIMPLE_PATTERN,
+    NUMBER_PATTERN,
+    PERCENT_DIMENSION_PATTERN,
+    RELATIVE_DIMENSION_PATTERN,
+    SUPPLEMENTARY_FIGURE_PANEL_REFERENCE_PATTERN,
+    SUPPLEMENTARY_FIGURE_REFERENCE_PATTERN,
+)
 from .types import (
     FigureAttributes,
     FigureCaption,
@@ -39,14 +60,14 @@ def convert_figures_to_latex(text: MarkdownContent, is_supplementary: bool = Fal
         protected_blocks.append(match.group(0))
         return f"__CODE_BLOCK_{len(protected_blocks) - 1}__"
 
-    text = re.sub(r"```.*?```", protect_fenced_code, text, flags=re.DOTALL)
+    text = FENCED_CODE_BLOCK_PATTERN.sub(protect_fenced_code, text)
 
     # Protect inline code (backticks) AFTER fenced code blocks
     def protect_inline_code(match: re.Match[str]) -> str:
         protected_blocks.append(match.group(0))
         return f"__CODE_BLOCK_{len(protected_blocks) - 1}__"
 
-    text = re.sub(r"`[^`]+`", protect_inline_code, text)
+    text = INLINE_CODE_PATTERN.sub(protect_inline_code, text)
 
     # Process different figure formats
     text = _process_new_figure_format(text)
@@ -74,17 +95,17 @@ def convert_figure_references_to_latex(text: MarkdownContent) -> LatexContent:
     """
     # Convert @fig:id followed by space and panel letter to Figure \ref{fig:id}PanelLetter (no space)
     # Use empty group {} to prevent LaTeX from inserting unwanted spaces after \ref{}
-    text = re.sub(r"@fig:([a-zA-Z0-9_-]+)\s+([A-Z])", r"Fig. \\ref{fig:\1}{}\2", text)
+    text = FIGURE_PANEL_REFERENCE_PATTERN.sub(r"Fig. \\ref{fig:\1}{}\2", text)
 
     # Convert @fig:id to Figure \ref{fig:id} (remaining basic references)
-    text = re.sub(r"@fig:([a-zA-Z0-9_-]+)", r"Fig. \\ref{fig:\1}", text)
+    text = FIGURE_REFERENCE_PATTERN.sub(r"Fig. \\ref{fig:\1}", text)
 
     # Convert @sfig:id followed by space and panel letter to Figure \ref{sfig:id}PanelLetter (no space)
     # Use empty group {} to prevent LaTeX from inserting unwanted spaces after \ref{}
-    text = re.sub(r"@sfig:([a-zA-Z0-9_-]+)\s+([A-Z])", r"Fig. \\ref{sfig:\1}{}\2", text)
+    text = SUPPLEMENTARY_FIGURE_PANEL_REFERENCE_PATTERN.sub(r"Fig. \\ref{sfig:\1}{}\2", text)
 
     # Convert @sfig:id to Figure \ref{sfig:id} (supplementary figures)
-    text = re.sub(r"@sfig:([a-zA-Z0-9_-]+)", r"Fig. \\ref{sfig:\1}", text)
+    text = SUPPLEMENTARY_FIGURE_REFERENCE_PATTERN.sub(r"Fig. \\ref{sfig:\1}", text)
 
     return text
 
@@ -101,7 +122,7 @@ def convert_equation_references_to_latex(text: MarkdownContent) -> LatexContent:
         Text with equation references converted to LaTeX format
     """
     # Convert @eq:id to \eqref{eq:id} for numbered equations
-    text = re.sub(r"@eq:([a-zA-Z0-9_-]+)", r"\\eqref{eq:\1}", text)
+    text = EQUATION_REFERENCE_PATTERN.sub(r"\\eqref{eq:\1}", text)
 
     return text
 
@@ -118,12 +139,12 @@ def parse_figure_attributes(attr_string: str) -> FigureAttributes:
     attributes: FigureAttributes = {}
 
     # Extract ID (starts with #)
-    id_match = re.search(r"#([a-zA-Z0-9_:-]+)", attr_string)
+    id_match = ATTRIBUTE_ID_PATTERN.search(attr_string)
     if id_match:
         attributes["id"] = id_match.group(1)
 
     # Extract other attributes (key="value" or key=value)
-    attr_matches = re.findall(r'(\w+)=(["\'])([^"\']*)\2', attr_string)
+    attr_matches = ATTRIBUTE_KEY_VALUE_PATTERN.findall(attr_string)
     for match in attr_matches:
         key, _, value = match
         attributes[key] = value
@@ -175,8 +196,8 @@ def create_latex_figure_environment(
     singlecol_p   = _b("singlecol_floatpage", False)  # keep 1-col [p] only if you *really* want it
 
     # ---------- caption markdown -> LaTeX ----------
-    processed_caption = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", caption)
-    processed_caption = re.sub(r"\*([^*]+)\*", r"\\textit{\1}", processed_caption)
+    processed_caption = BOLD_SIMPLE_PATTERN.sub(r"\\textbf{\1}", caption)
+    processed_caption = ITALIC_SIMPLE_PATTERN.sub(r"\\textit{\1}", processed_caption)
 
     # ---------- placement sanitizers ----------
     def _strip_br(s: Optional[str]) -> str:
@@ -191,28 +212,27 @@ def create_latex_figure_environment(
         return f"[{filt or '!tbp'}]"
 
     # ---------- length parsing ----------
-    ABS_DIM = re.compile(r"^[0-9]*\.?[0-9]+\s*(pt|bp|mm|cm|in|ex|em|dd|pc|sp)$")
     def _parse_len(expr, rel_unit: str) -> Tuple[str, str]:
         if expr is None:
             return rel_unit, ("rel-line" if rel_unit == r"\linewidth" else "rel-text")
         s = str(expr).strip()
         if s in (r"\linewidth", r"\columnwidth"): return s, "rel-line"
         if s in (r"\textwidth", r"\textheight"):  return s, ("rel-text" if "width" in s else "rel-height")
-        m = re.fullmatch(r"([0-9]*\.?[0-9]+)\s*\\(line|column|text)(width|height)", s)
+        m = RELATIVE_DIMENSION_PATTERN.fullmatch(s)
         if m:
             f = min(float(m.group(1)), 1.0)
             unit = "\\" + m.group(2) + m.group(3)
             kind = "rel-line" if m.group(2) in ("line","column") else ("rel-text" if m.group(3)=="width" else "rel-height")
             return f"{f:.3f}{unit}", kind
-        if s.endswith("%") and re.fullmatch(r"[0-9]*\.?[0-9]+%", s):
+        if s.endswith("%") and PERCENT_DIMENSION_PATTERN.fullmatch(s):
             f = min(float(s[:-1])/100.0, 1.0)
             kind = "rel-line" if rel_unit == r"\linewidth" else ("rel-text" if rel_unit == r"\textwidth" else "rel-height")
             return f"{f:.3f}{rel_unit}", kind
-        if re.fullmatch(r"[0-9]*\.?[0-9]+", s):
+        if NUMBER_PATTERN.fullmatch(s):
             f = min(float(s), 1.0)
             kind = "rel-line" if rel_unit == r"\linewidth" else ("rel-text" if rel_unit == r"\textwidth" else "rel-height")
             return f"{f:.3f}{rel_unit}", kind
-        if ABS_DIM.match(s): return s, "abs"
+        if ABSOLUTE_DIMENSION_PATTERN.match(s): return s, "abs"
         return s, "unit"
 
     def _parse_height(h):
@@ -340,40 +360,6 @@ def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
       ![](FIGURES/Fig1.pdf)
       {#fig:Figure1 width="\textwidth" tex_position="p"} **Title**.
     """
-    import re
-
-    # Allow: plain path, or quoted path "..." / '...'
-    # Attributes may contain quoted values and spaces.
-    # Caption is everything up to the next blank line (two consecutive newlines) or EOF.
-    pattern = re.compile(
-        r"""
-        ^[ \t]*                          # optional leading spaces
-        !\[\]                            # literal ![]
-        \(
-            (?P<path>                    # path can be quoted or unquoted (no newline)
-                "(?:[^"\\]|\\.)+"        # double-quoted path (allow escaped chars)
-                |'(?:[^'\\]|\\.)+'       # single-quoted path
-                |[^)\r\n]+               # unquoted path without ) or newline
-            )
-        \)
-        [ \t]*\r?\n                      # newline after )
-        [ \t]*\{                         # start attributes line (allow leading spaces)
-            (?P<attrs>                   # attributes content (no need to be ultra-fancy)
-                (?:
-                    [^{}\r\n"']+         # anything except braces/quotes/newlines
-                    |"(?:[^"\\]|\\.)*"   # double-quoted chunks
-                    |'(?:[^'\\]|\\.)*'   # single-quoted chunks
-                    |\s+                 # spaces/tabs
-                )*
-            )
-        \}[ \t]*                         # end attributes
-        (?P<caption>                     # caption until the next blank line or EOF
-            (?s:.*?)                     # DOTALL, non-greedy
-        )
-        (?=(?:\r?\n){2,}|\Z)             # stop at a blank line (>=2 newlines) or end
-        """,
-        re.MULTILINE | re.VERBOSE,
-    )
 
     def _strip_quotes(s: str) -> str:
         if (len(s) >= 2) and ((s[0] == s[-1]) and s[0] in ("'", '"')):
@@ -397,41 +383,10 @@ def _process_new_figure_format(text: MarkdownContent) -> LatexContent:
             # If LaTeX emission fails, keep original block untouched
             return m.group(0)
 
-    return pattern.sub(_repl, text)
+    return FIGURE_BLOCK_PATTERN.sub(_repl, text)
 
 def _process_figure_without_attributes(text: MarkdownContent) -> LatexContent:
     """Process figures without attributes: ![caption](path) or ![caption](path "title")."""
-    import re
-
-    # Matches:
-    #   ![caption](path)
-    #   ![caption](path "optional title")
-    #   ![caption]("quoted path with spaces")
-    # Does NOT match if immediately followed by {attributes} (handled upstream).
-    pattern = re.compile(
-        r"""
-        !\[
-            (?P<cap>(?:\\\]|[^\]])*)      # caption (allow escaped ])
-        \]
-        \(
-            [ \t]*
-            (?P<path>                     # path: quoted or unquoted (no newline)
-                "(?:[^"\\]|\\.)+"         # double-quoted path
-                |'(?:[^'\\]|\\.)+'        # single-quoted path
-                |[^)\s][^)\r\n]*          # unquoted path (no leading space, up to ) or EOL)
-            )
-            (?:[ \t]+                     # optional title (ignored; used only if caption empty)
-               (?P<title>
-                    "(?:[^"\\]|\\.)*"     # "title"
-                    |'(?:[^'\\]|\\.)*'    # 'title'
-               )
-            )?
-            [ \t]*
-        \)
-        (?![ \t]*\{)                      # don't consume cases with immediate {attributes}
-        """,
-        re.VERBOSE,
-    )
 
     def _strip_quotes(s: str) -> str:
         s = s.strip()
@@ -460,7 +415,7 @@ def _process_figure_without_attributes(text: MarkdownContent) -> LatexContent:
         except Exception:
             return m.group(0)
 
-    return pattern.sub(_repl, text)
+    return FIGURE_WITHOUT_ATTRIBUTES_PATTERN.sub(_repl, text)
 
 
 def validate_figure_path(path: FigurePath) -> bool:
@@ -505,7 +460,7 @@ def _process_figure_with_attributes(text: MarkdownContent) -> LatexContent:
         return create_latex_figure_environment(path, caption, attributes)
 
     # Handle figures with attributes (old format)
-    return re.sub(r"!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}", process_figure_with_attributes, text)
+    return INLINE_FIGURE_WITH_ATTRIBUTES_PATTERN.sub(process_figure_with_attributes, text)
 
 
 def extract_figure_ids_from_text(text: MarkdownContent) -> list[FigureId]:
@@ -520,7 +475,7 @@ def extract_figure_ids_from_text(text: MarkdownContent) -> list[FigureId]:
     figure_ids: list[FigureId] = []
 
     # Find figure attribute blocks
-    attr_matches = re.findall(r"\{#([a-zA-Z0-9_:-]+)[^}]*\}", text)
+    attr_matches = ATTRIBUTE_BLOCK_ID_PATTERN.findall(text)
     for match in attr_matches:
         if (match.startswith("fig:") or match.startswith("sfig:")) and match not in figure_ids:
             figure_ids.append(match)
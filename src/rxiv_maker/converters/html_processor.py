@@ -6,6 +6,19 @@ including comments, tags, and special HTML constructs.
 
 import re
 
+from .patterns import (
+    HTML_BOLD_PATTERN,
+    HTML_BREAK_PATTERN,
+    HTML_CODE_PATTERN,
+    HTML_COMMENT_PATTERN,
+    HTML_EMPHASIS_PATTERN,
+    HTML_ITALIC_PATTERN,
+    HTML_REMOVED_ELEMENT_PATTERNS,
+    HTML_STRONG_PATTERN,
+    HTML_TAG_NAME_PATTERN,
+    HTML_TAG_PARTS_PATTERN,
+    HTML_TAG_PATTERN,
+)
 from .types import LatexContent, MarkdownContent
 
 
@@ -32,7 +45,7 @@ def convert_html_comments_to_latex(text: MarkdownContent) -> LatexContent:
                 latex_comment_lines.append("%")
         return "\n".join(latex_comment_lines)
 
-    return re.sub(r"<!--(.*?)-->", replace_comment, text, flags=re.DOTALL)
+    return HTML_COMMENT_PATTERN.sub(replace_comment, text)
 
 
 def convert_html_tags_to_latex(text: MarkdownContent) -> LatexContent:
@@ -45,23 +58,18 @@ def convert_html_tags_to_latex(text: MarkdownContent) -> LatexContent:
         Text with HTML tags converted to LaTeX
     """
     # Convert line breaks
-    text = re.sub(r"<br\s*/?>", r"\\\\", text, flags=re.IGNORECASE)
+    text = HTML_BREAK_PATTERN.sub(r"\\\\", text)
 
     # Convert bold tags
-    text = re.sub(r"<b>(.*?)</b>", r"\\textbf{\1}", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(
-        r"<strong>(.*?)</strong>",
-        r"\\textbf{\1}",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    text = HTML_BOLD_PATTERN.sub(r"\\textbf{\1}", text)
+    text = HTML_STRONG_PATTERN.sub(r"\\textbf{\1}", text)
 
     # Convert italic tags
-    text = re.sub(r"<i>(.*?)</i>", r"\\textit{\1}", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<em>(.*?)</em>", r"\\textit{\1}", text, flags=re.IGNORECASE | re.DOTALL)
+    text = HTML_ITALIC_PATTERN.sub(r"\\textit{\1}", text)
+    text = HTML_EMPHASIS_PATTERN.sub(r"\\textit{\1}", text)
 
     # Convert code tags
-    text = re.sub(r"<code>(.*?)</code>", r"\\texttt{\1}", text, flags=re.IGNORECASE | re.DOTALL)
+    text = HTML_CODE_PATTERN.sub(r"\\texttt{\1}", text)
 
     return text
 
@@ -107,7 +115,7 @@ def strip_html_tags(text: MarkdownContent) -> MarkdownContent:
         Text with HTML tags removed
     """
     # Remove all HTML tags but keep their content
-    return re.sub(r"<[^>]+>", "", text)
+    return HTML_TAG_PATTERN.sub("", text)
 
 
 def validate_html_structure(text: MarkdownContent) -> bool:
@@ -123,7 +131,7 @@ def validate_html_structure(text: MarkdownContent) -> bool:
     stack: list[str] = []
 
     # Find all HTML tags
-    tags = re.findall(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>", text)
+    tags = HTML_TAG_NAME_PATTERN.findall(text)
 
     for is_closing, tag_name in tags:
         tag_name = tag_name.lower()
@@ -157,9 +165,7 @@ def extract_html_tags_from_text(text: MarkdownContent) -> list[tuple[str, str, b
     tags: list[tuple[str, str, bool]] = []
 
     # Find all HTML tags
-    tag_pattern = r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*(/?)>"
-
-    for match in re.finditer(tag_pattern, text):
+    for match in HTML_TAG_PARTS_PATTERN.finditer(text):
         bool(match.group(1))
         tag_name = match.group(2).lower()
         is_self_closing = bool(match.group(3)) or tag_name in [
@@ -195,10 +201,9 @@ def clean_html_for_latex(text: MarkdownContent) -> LatexContent:
     text = convert_html_comments_to_latex(text)
 
     # Remove any remaining unsupported HTML tags
-    # List of tags to completely remove (including content)
-    remove_tags = ["script", "style", "head", "meta", "link"]
-    for tag in remove_tags:
-        text = re.sub(rf"<{tag}[^>]*>.*?</{tag}>", "", text, flags=re.IGNORECASE | re.DOTALL)
+    # Tags to completely remove (including content)
+    for pattern in HTML_REMOVED_ELEMENT_PATTERNS:
+        text = pattern.sub("", text)
 
     # Remove remaining HTML tags but keep content
     text = strip_html_tags(text)
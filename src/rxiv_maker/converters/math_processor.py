@@ -6,6 +6,7 @@ notation while converting surrounding content.
 
 import re
 
+from .placeholders import restore_placeholders
 from .types import LatexContent, MarkdownContent
 
 
@@ -49,10 +50,7 @@ def restore_math_expressions(content: LatexContent, protected_math: dict[str, st
     Returns:
         Content with math expressions restored
     """
-    for placeholder, math_expr in protected_math.items():
-        content = content.replace(placeholder, math_expr)
-
-    return content
+    return restore_placeholders(content, protected_math)
 
 
 def process_latex_math_blocks(content: MarkdownContent) -> LatexContent:
@@ -25,7 +25,9 @@ from .math_processor import (
     protect_math_expressions,
     restore_math_expressions,
 )
+from .placeholders import restore_placeholders
 from .section_processor import extract_content_sections, map_section_title_to_key
+from .span_tokenizer import SpanType, tokenize_markdown
 from .supplementary_note_processor import (
     process_supplementary_note_references,
     process_supplementary_notes,
@@ -44,7 +46,11 @@ from .types import LatexContent, MarkdownContent, ProtectedContent
 from .url_processor import convert_links_to_latex
 
 
-def convert_markdown_to_latex(content: MarkdownContent, is_supplementary: bool = False) -> LatexContent:
+def convert_markdown_to_latex(
+    content: MarkdownContent,
+    is_supplementary: bool = False,
+    engine: str | None = None,
+) -> LatexContent:
     r"""Convert basic markdown formatting to LaTeX.
 
     This function now uses the centralized ContentProcessor for enhanced
@@ -54,10 +60,20 @@ def convert_markdown_to_latex(content: MarkdownContent, is_supplementary: bool =
     Args:
         content: The markdown content to convert
         is_supplementary: If True, adds \newpage after figures and tables
+        engine: Conversion engine to use ("legacy" or "spans"). Defaults to the
+            RXIV_CONVERTER_ENGINE environment variable, or "legacy" if unset.
 
     Returns:
         LaTeX formatted content
     """
+    if engine is None:
+        engine = _get_default_engine()
+
+    if engine == "spans":
+        return _convert_markdown_to_latex_spans(content, is_supplementary)
+    elif engine != "legacy":
+        raise ValueError(f"Unknown conversion engine: {engine}")
+
     # Use the new centralized ContentProcessor for enhanced processing
     # ContentProcessor is now complete with all processors from legacy logic
     # TEMPORARY DISABLE: ContentProcessor bypasses table_processor.py fixes for % escaping
@@ -97,7 +113,69 @@ def convert_markdown_to_latex(content: MarkdownContent, is_supplementary: bool =
             except Exception:
                 pass  # Continue silently if logging also fails
 
-    # Legacy conversion logic (original implementation)
+    return _convert_markdown_to_latex_legacy(content, is_supplementary)
+
+
+def _get_default_engine() -> str:
+    """Get the conversion engine selected through the environment."""
+    try:
+        from ..core.environment_manager import EnvironmentManager
+
+        return EnvironmentManager.get_converter_engine()
+    except ImportError:
+        return "legacy"
+
+
+def _convert_markdown_to_latex_spans(content: MarkdownContent, is_supplementary: bool = False) -> LatexContent:
+    r"""Convert markdown to LaTeX with code, math and tables split out as spans.
+
+    This is a partial step towards a span-based converter, not a replacement
+    for the legacy pipeline. Only fenced code blocks, display math and tables
+    are tokenized: code blocks are converted on their own, display math is
+    passed through, and each table (with its caption lines) still runs through
+    the legacy pipeline in isolation. All other text, including figures and
+    citations, goes through the whole legacy pipeline with the spans replaced
+    by placeholders, so the gain is limited to the passes no longer rescanning
+    code, math and tables. The output is identical to the legacy engine.
+
+    Args:
+        content: The markdown content to convert
+        is_supplementary: If True, adds \newpage after figures and tables
+
+    Returns:
+        LaTeX formatted content
+    """
+    converted_spans: list[str] = []
+    text_parts: list[str] = []
+
+    for span in tokenize_markdown(content):
+        if span.type is SpanType.TEXT:
+            text_parts.append(span.text)
+            continue
+
+        if span.type is SpanType.CODE:
+            converted = convert_code_blocks_to_latex(span.text)
+        elif span.type is SpanType.TABLE:
+            converted = _convert_markdown_to_latex_legacy(span.text, is_supplementary)
+        else:
+            # Display math is protected and restored untouched by the legacy engine
+            converted = span.text
+
+        text_parts.append(f"XXSPANXX{len(converted_spans)}XXSPANXX")
+        converted_spans.append(converted)
+
+    if not converted_spans:
+        return _convert_markdown_to_latex_legacy(content, is_supplementary)
+
+    text_latex = _convert_markdown_to_latex_legacy("".join(text_parts), is_supplementary)
+    return _SPAN_PLACEHOLDER_PATTERN.sub(lambda m: converted_spans[int(m.group(1))], text_latex)
+
+
+_SPAN_PLACEHOLDER_PATTERN = re.compile(r"XXSPANXX(\d+)XXSPANXX")
+
+
+def _convert_markdown_to_latex_legacy(content: MarkdownContent, is_supplementary: bool = False) -> LatexContent:
+    """Convert markdown to LaTeX by running every processing step over the whole content."""
     # FIRST: Convert fenced code blocks BEFORE protecting backticks
     content = convert_code_blocks_to_latex(content)
 
@@ -297,17 +375,15 @@ def _process_tables_with_protection(
 ) -> LatexContent:
     """Process tables with proper content protection."""
     # Restore protected markdown tables before table processing
-    for placeholder, original in protected_markdown_tables.items():
-        content = content.replace(placeholder, original)
+    content = restore_placeholders(content, protected_markdown_tables)
 
     # Restore backticks only in table rows to avoid affecting verbatim blocks
+    restored_backticks: set[str] = set()
     table_lines = content.split("\n")
     for i, line in enumerate(table_lines):
         if "|" in line and line.strip().startswith("|") and line.strip().endswith("|"):
             # Restore backticks in table rows only
-            for placeholder, original in protected_backtick_content.items():
-                line = line.replace(placeholder, original)
-            table_lines[i] = line
+            table_lines[i] = restore_placeholders(line, protected_backtick_content, restored_backticks)
 
     temp_content = "\n".join(table_lines)
 
@@ -326,13 +402,14 @@ def _process_tables_with_protection(
         return placeholder
 
     # Protect all LaTeX table environments
-    for env in ["table", "sidewaystable", "stable"]:
+    for env in ["table", "sidewaystable", "stable", "rxivlongtable", "longtable"]:
         pattern = rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}"
         table_processed_content = re.sub(pattern, protect_latex_table, table_processed_content, flags=re.DOTALL)
 
-    # Re-protect unconverted backtick content
-    for original, placeholder in [(v, k) for k, v in protected_backtick_content.items()]:
-        if original in table_processed_content:
+    # Re-protect unconverted backtick content (only content restored into
+    # table rows above can be present in unprotected form)
+    for placeholder, original in protected_backtick_content.items():
+        if placeholder in restored_backticks and original in table_processed_content:
             table_processed_content = table_processed_content.replace(original, placeholder)
 
     return table_processed_content
@@ -368,8 +445,7 @@ def _process_text_formatting(content: LatexContent, protected_backtick_content:
     # code spans is preserved as literal text
 
     # First restore protected backtick content so we can process it
-    for placeholder, original in protected_backtick_content.items():
-        content = content.replace(placeholder, original)
+    content = restore_placeholders(content, protected_backtick_content)
 
     # Then convert backticks to texttt with proper underscore handling
     content = process_code_spans(content)
@@ -394,8 +470,7 @@ def _restore_protected_content(
 ) -> LatexContent:
     """Restore all protected content."""
     # Restore protected tables at the very end (after all other conversions)
-    for placeholder, table_content in protected_tables.items():
-        content = content.replace(placeholder, table_content)
+    content = restore_placeholders(content, protected_tables)
 
     # Restore protected verbatim blocks at the very end
     content = restore_protected_code(content, protected_verbatim_content)
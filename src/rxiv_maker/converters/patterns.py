@@ -0,0 +1,289 @@
+"""Precompiled regular expressions shared by the markdown to LaTeX converters.
+
+Every pattern used by the converters is compiled once, when this module is
+first imported. Converters call the methods of the compiled pattern objects
+directly (``PATTERN.sub(...)``), so hot loops over table cells and lines do not
+go through the ``re`` module's internal pattern cache on every call.
+"""
+
+import re
+
+# ---------------------------------------------------------------------------
+# Markdown inline formatting
+# ---------------------------------------------------------------------------
+
+# **bold** and *italic*, non-greedy over any character
+BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+
+# **bold** and *italic* whose content contains no asterisks
+BOLD_SIMPLE_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+ITALIC_SIMPLE_PATTERN = re.compile(r"\*([^*]+)\*")
+
+# **bold** and *italic* markers that may be empty (used to strip formatting)
+BOLD_MARKERS_PATTERN = re.compile(r"\*\*(.*?)\*\*")
+ITALIC_MARKERS_PATTERN = re.compile(r"\*(.*?)\*")
+
+# *italic* that is not part of a **bold** marker
+ITALIC_STANDALONE_PATTERN = re.compile(r"(?<!\*)\*([^*]+?)\*(?!\*)")
+
+# *italic* in table cells: no surrounding whitespace inside the markers
+TABLE_ITALIC_PATTERN = re.compile(r"(?<!\*)\*([^*\s][^*]*[^*\s]|\w)\*(?!\*)")
+
+# H~2~O and E=mc^2^
+SUBSCRIPT_PATTERN = re.compile(r"~([^~\s]+)~")
+SUPERSCRIPT_PATTERN = re.compile(r"\^([^\^\s]+)\^")
+
+# Executable commands ({{py:...}} and {py:...}), which share state across documents
+EXECUTABLE_COMMAND_PATTERN = re.compile(r"\{\{?\s*py\s*:")
+
+# Markdown headers
+SECTION_HEADER_PATTERN = re.compile(r"^## (.+)$", re.MULTILINE)
+SUBSECTION_HEADER_PATTERN = re.compile(r"^### (.+)$", re.MULTILINE)
+SUBSUBSECTION_HEADER_PATTERN = re.compile(r"^#### (.+)$", re.MULTILINE)
+
+# ---------------------------------------------------------------------------
+# Code
+# ---------------------------------------------------------------------------
+
+FENCED_CODE_BLOCK_PATTERN = re.compile(r"```.*?```", re.DOTALL)
+INLINE_CODE_PATTERN = re.compile(r"`[^`]+`")
+SINGLE_BACKTICK_CODE_PATTERN = re.compile(r"`([^`]+)`")
+DOUBLE_BACKTICK_CODE_PATTERN = re.compile(r"``([^`]+)``")
+
+# `` `code` `` (double backticks wrapping inner backticks)
+NESTED_BACKTICK_CODE_PATTERN = re.compile(r"``\s*`([^`]+)`\s*``")
+
+# ---------------------------------------------------------------------------
+# LaTeX commands and protected contexts
+# ---------------------------------------------------------------------------
+
+# Regions where markdown syntax must not be converted: \texttt{}, \text{},
+# inline and display math, and equation environments
+PROTECTED_CONTEXT_SPLIT_PATTERN = re.compile(
+    r"(\\texttt\{[^}]*\})|"  # \texttt{...}
+    r"(\\text\{[^}]*\})|"  # \text{...}
+    r"(\$[^$]*\$)|"  # Inline math $...$
+    r"(\$\$.*?\$\$)|"  # Display math $$...$$
+    r"(\\begin\{equation\}.*?\\end\{equation\})",  # equation environments
+    re.DOTALL,
+)
+
+LATEX_COMMAND_SPLIT_PATTERN = re.compile(r"(\\[a-zA-Z]+\{[^}]*\})")
+LATEX_COMMAND_START_PATTERN = re.compile(r"\\[a-zA-Z]+\{")
+TEXTTT_SPLIT_PATTERN = re.compile(r"(\\texttt\{[^}]*\})")
+TEXTTT_OR_ENVIRONMENT_SPLIT_PATTERN = re.compile(
+    r"(\\texttt\{[^}]*\}|\\begin\{[^}]*\*?\}.*?\\end\{[^}]*\*?\})", re.DOTALL
+)
+CITE_COMMAND_SPLIT_PATTERN = re.compile(r"(\\cite\{[^}]*\})")
+
+# \texttt{...} with one level of nested braces, without ReDoS vulnerability
+TEXTTT_NESTED_PATTERN = re.compile(r"\\texttt\{([^{}]*(?:\{[^}]*\}[^{}]*)*)\}", re.DOTALL)
+
+TEXTTT_DETOKENIZE_PATTERN = re.compile(r"\\texttt\{\\detokenize\{[^}]*\}\}")
+DETOKENIZE_PATTERN = re.compile(r"\\detokenize\{[^}]*\}")
+INCLUDEGRAPHICS_PATTERN = re.compile(r"\\includegraphics\[[^\]]*\]\{[^}]*\}")
+
+# Reference commands whose arguments often contain underscores
+LATEX_REFERENCE_COMMAND_PATTERNS = tuple(
+    re.compile(rf"\\{command}\{{[^}}]*\}}")
+    for command in (
+        "ref",  # \ref{fig:name_with_underscores}
+        "eqref",  # \eqref{eq:name_with_underscores}
+        "label",  # \label{fig:name_with_underscores}
+        "pageref",  # \pageref{sec:name_with_underscores}
+        "cite",  # \cite{author_2024}
+        "citep",  # \citep{author_2024}
+        "citet",  # \citet{author_2024}
+        "citealt",  # \citealt{author_2024}
+        "cref",  # \cref{fig:name_with_underscores} (cleveref)
+        "Cref",  # \Cref{fig:name_with_underscores} (cleveref)
+    )
+)
+
+LATEX_URL_COMMAND_PATTERN = re.compile(r"\\url\{[^}]+\}")
+LATEX_HREF_COMMAND_PATTERN = re.compile(r"\\href\{[^}]+\}\{[^}]+\}")
+
+# ---------------------------------------------------------------------------
+# Special character escaping
+# ---------------------------------------------------------------------------
+
+PARENTHESIZED_TEXT_PATTERN = re.compile(r"\(([^)]+)\)")
+_UNDERSCORE_FILENAME = r"[\w]+_[\w._]*\.(?:md|yml|yaml|bib|tex|py|csv|pdf|png|svg|jpg)\b"
+UNDERSCORE_FILENAME_PATTERN = re.compile(rf"\b{_UNDERSCORE_FILENAME}")
+NUMBERED_FILENAME_PATTERN = re.compile(r"\b\d+_[A-Z_]+\b")
+UNESCAPED_PERCENT_PATTERN = re.compile(r"(?<!\\)%")
+UNESCAPED_INLINE_PERCENT_PATTERN = re.compile(r"(?<!\\)(?<!^)%", re.MULTILINE)
+UNESCAPED_CARET_PATTERN = re.compile(r"(?<!\$)(?<!\\\$)\^(?!\^)(?![^$]*\$)")
+UNESCAPED_UNDERSCORE_PATTERN = re.compile(r"(?<!\\)_")
+DOUBLE_TEXTBACKSLASH_SPACE_PATTERN = re.compile(r"\\textbackslash\{\}textbackslash\s+")
+DOUBLE_TEXTBACKSLASH_PATTERN = re.compile(r"\\textbackslash\{\}textbackslash")
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+# Single-scan escaping (text_formatters.escape_special_characters): one named
+# alternative per region or character with its own escaping rule. Earlier
+# alternatives win when several match at the same position.
+PROTECTED_LATEX_COMMAND_PATTERN = re.compile(
+    "|".join(
+        pattern.pattern
+        for pattern in (
+            TEXTTT_DETOKENIZE_PATTERN,
+            DETOKENIZE_PATTERN,
+            INCLUDEGRAPHICS_PATTERN,
+            *LATEX_REFERENCE_COMMAND_PATTERNS,
+        )
+    )
+)
+_ESCAPE_CHARACTER_ALTERNATIVES = (
+    # An escaped underscore placeholder, with a file name it starts
+    rf"(?P<placeholder>XUNDERSCOREX(?:{_UNDERSCORE_FILENAME})?)"
+    rf"|(?P<paren>\((?P<paren_content>(?:{PROTECTED_LATEX_COMMAND_PATTERN.pattern}|[^)])+)\))"
+    rf"|(?P<filename>{UNDERSCORE_FILENAME_PATTERN.pattern})"
+    rf"|(?P<numbered>{NUMBERED_FILENAME_PATTERN.pattern})"
+    r"|(?P<double_backslash>\\textbackslash\{\}textbackslash\s*)"
+    r"|(?P<percent>(?<!\\)%)"
+    r"|(?P<caret>(?<!\$)\^(?!\^))"
+    r"|(?P<underscore>_)"
+    r"|(?P<character>[→←↑↓])"
+)
+# Document text: protected commands, code and caret-free regions, then characters
+ESCAPE_SCAN_PATTERN = re.compile(
+    rf"(?P<protected>{PROTECTED_LATEX_COMMAND_PATTERN.pattern})"
+    r"|(?P<texttt>\\texttt\{)"
+    r"|(?P<no_caret>\\text\{[^}]*\}|\$[^$]*\$|(?s:\$\$.*?\$\$)|(?s:\\begin\{equation\}.*?\\end\{equation\}))"
+    rf"|{_ESCAPE_CHARACTER_ALTERNATIVES}"
+)
+# Escaped \texttt{} and \verb blocks: only the character rules still apply
+ESCAPE_CODE_SCAN_PATTERN = re.compile(_ESCAPE_CHARACTER_ALTERNATIVES)
+
+# ---------------------------------------------------------------------------
+# Citations
+# ---------------------------------------------------------------------------
+
+BRACKETED_CITATION_PATTERN = re.compile(r"\[(@[^]]+)\]")
+EMAIL_LIKE_PATTERN = re.compile(r"(\w+@[\w.-]+\.\w+|@[\w.-]+\.\w+)")
+SINGLE_CITATION_PATTERN = re.compile(r"@(?!fig:|eq:)([a-zA-Z0-9_-]+)")
+CITATION_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# ---------------------------------------------------------------------------
+# Figures and equations
+# ---------------------------------------------------------------------------
+
+FIGURE_PANEL_REFERENCE_PATTERN = re.compile(r"@fig:([a-zA-Z0-9_-]+)\s+([A-Z])")
+FIGURE_REFERENCE_PATTERN = re.compile(r"@fig:([a-zA-Z0-9_-]+)")
+SUPPLEMENTARY_FIGURE_PANEL_REFERENCE_PATTERN = re.compile(r"@sfig:([a-zA-Z0-9_-]+)\s+([A-Z])")
+SUPPLEMENTARY_FIGURE_REFERENCE_PATTERN = re.compile(r"@sfig:([a-zA-Z0-9_-]+)")
+EQUATION_REFERENCE_PATTERN = re.compile(r"@eq:([a-zA-Z0-9_-]+)")
+
+ATTRIBUTE_ID_PATTERN = re.compile(r"#([a-zA-Z0-9_:-]+)")
+ATTRIBUTE_KEY_VALUE_PATTERN = re.compile(r'(\w+)=(["\'])([^"\']*)\2')
+ATTRIBUTE_BLOCK_ID_PATTERN = re.compile(r"\{#([a-zA-Z0-9_:-]+)[^}]*\}")
+
+ABSOLUTE_DIMENSION_PATTERN = re.compile(r"^[0-9]*\.?[0-9]+\s*(pt|bp|mm|cm|in|ex|em|dd|pc|sp)$")
+RELATIVE_DIMENSION_PATTERN = re.compile(r"([0-9]*\.?[0-9]+)\s*\\(line|column|text)(width|height)")
+PERCENT_DIMENSION_PATTERN = re.compile(r"[0-9]*\.?[0-9]+%")
+NUMBER_PATTERN = re.compile(r"[0-9]*\.?[0-9]+")
+
+# ![caption](path){attributes} on a single line
+INLINE_FIGURE_WITH_ATTRIBUTES_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}")
+
+# ![](path) followed by an {attributes} line and a caption paragraph.
+# Caption is everything up to the next blank line (two consecutive newlines) or EOF.
+FIGURE_BLOCK_PATTERN = re.compile(
+    r"""
+    ^[ \t]*                          # optional leading spaces
+    !\[\]                            # literal ![]
+    \(
+        (?P<path>                    # path can be quoted or unquoted (no newline)
+            "(?:[^"\\]|\\.)+"        # double-quoted path (allow escaped chars)
+            |'(?:[^'\\]|\\.)+'       # single-quoted path
+            |[^)\r\n]+               # unquoted path without ) or newline
+        )
+    \)
+    [ \t]*\r?\n                      # newline after )
+    [ \t]*\{                         # start attributes line (allow leading spaces)
+        (?P<attrs>                   # attributes content (no need to be ultra-fancy)
+            (?:
+                [^{}\r\n"']+         # anything except braces/quotes/newlines
+                |"(?:[^"\\]|\\.)*"   # double-quoted chunks
+                |'(?:[^'\\]|\\.)*'   # single-quoted chunks
+                |\s+                 # spaces/tabs
+            )*
+        )
+    \}[ \t]*                         # end attributes
+    (?P<caption>                     # caption until the next blank line or EOF
+        (?s:.*?)                     # DOTALL, non-greedy
+    )
+    (?=(?:\r?\n){2,}|\Z)             # stop at a blank line (>=2 newlines) or end
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# ![caption](path) or ![caption](path "title"), not followed by {attributes}
+FIGURE_WITHOUT_ATTRIBUTES_PATTERN = re.compile(
+    r"""
+    !\[
+        (?P<cap>(?:\\\]|[^\]])*)      # caption (allow escaped ])
+    \]
+    \(
+        [ \t]*
+        (?P<path>                     # path: quoted or unquoted (no newline)
+            "(?:[^"\\]|\\.)+"         # double-quoted path
+            |'(?:[^'\\]|\\.)+'        # single-quoted path
+            |[^)\s][^)\r\n]*          # unquoted path (no leading space, up to ) or EOL)
+        )
+        (?:[ \t]+                     # optional title (ignored; used only if caption empty)
+           (?P<title>
+                "(?:[^"\\]|\\.)*"     # "title"
+                |'(?:[^'\\]|\\.)*'    # 'title'
+           )
+        )?
+        [ \t]*
+    \)
+    (?![ \t]*\{)                      # don't consume cases with immediate {attributes}
+    """,
+    re.VERBOSE,
+)
+
+# ---------------------------------------------------------------------------
+# Tables
+# ---------------------------------------------------------------------------
+
+TABLE_CAPTION_PREFIX_PATTERN = re.compile(r"^Table\*?\s+\d+[\s:.]\s*", re.IGNORECASE)
+TABLE_CAPTION_LINE_PATTERN = re.compile(r"^Table\*?\s+\d+[\s:.]?\s*(.*)$", re.IGNORECASE)
+TABLE_ATTRIBUTE_CAPTION_START_PATTERN = re.compile(r"^\{#[a-zA-Z0-9_:-]+.*\}\s*\*\*.*\*\*")
+TABLE_ATTRIBUTE_CAPTION_PATTERN = re.compile(r"^\{#([a-zA-Z0-9_:-]+)([^}]*)\}\s*(.+)$")
+TABLE_ROTATION_PATTERN = re.compile(r"rotate=(\d+)")
+TABLE_LONGTABLE_PATTERN = re.compile(r"\blongtable=(true|yes|1)\b", re.IGNORECASE)
+TABLE_REFERENCE_PATTERN = re.compile(r"@table:([a-zA-Z0-9_-]+)")
+SUPPLEMENTARY_TABLE_REFERENCE_PATTERN = re.compile(r"@stable:([a-zA-Z0-9_-]+)")
+
+# ---------------------------------------------------------------------------
+# URLs and email addresses
+# ---------------------------------------------------------------------------
+
+MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+BARE_URL_PATTERN = re.compile(r"https?://[^\s\}>\]]+")
+URL_FORMAT_PATTERN = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+EMAIL_ADDRESS_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+
+HTML_COMMENT_PATTERN = re.compile(r"<!--(.*?)-->", re.DOTALL)
+HTML_BREAK_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+HTML_BOLD_PATTERN = re.compile(r"<b>(.*?)</b>", re.IGNORECASE | re.DOTALL)
+HTML_STRONG_PATTERN = re.compile(r"<strong>(.*?)</strong>", re.IGNORECASE | re.DOTALL)
+HTML_ITALIC_PATTERN = re.compile(r"<i>(.*?)</i>", re.IGNORECASE | re.DOTALL)
+HTML_EMPHASIS_PATTERN = re.compile(r"<em>(.*?)</em>", re.IGNORECASE | re.DOTALL)
+HTML_CODE_PATTERN = re.compile(r"<code>(.*?)</code>", re.IGNORECASE | re.DOTALL)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+HTML_TAG_NAME_PATTERN = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
+HTML_TAG_PARTS_PATTERN = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*(/?)>")
+
+# Elements that are removed together with their content
+HTML_REMOVED_ELEMENT_PATTERNS = tuple(
+    re.compile(rf"<{tag}[^>]*>.*?</{tag}>", re.IGNORECASE | re.DOTALL)
+    for tag in ("script", "style", "head", "meta", "link")
+)
@@ -0,0 +1,55 @@
+"""Placeholder restoration for protected markdown content.
+
+Converters protect regions of the document (code, math, tables, backtick
+spans) by swapping them for placeholders of the form
+``XX<NAME>XX<index>XX<NAME>XX`` and restore them after the other processing
+steps have run. This module restores a whole table of placeholders with a
+single linear scan of the content, instead of one full-document replace per
+placeholder.
+"""
+
+import re
+
+from .types import LatexContent, ProtectedContent
+
+# Matches every placeholder family used by the converters
+PLACEHOLDER_PATTERN = re.compile(r"XX([A-Z]+)XX\d+XX\1XX")
+
+
+def restore_placeholders(
+    content: LatexContent,
+    protected_content: ProtectedContent,
+    restored: set[str] | None = None,
+) -> LatexContent:
+    """Restore all placeholders of a protection table in one pass.
+
+    Placeholders that are not in the table (for example, those belonging to a
+    different protection step) are left untouched.
+
+    Args:
+        content: Content containing placeholders
+        protected_content: Dictionary mapping placeholders to original content
+        restored: Optional set that receives every placeholder that was restored
+
+    Returns:
+        Content with the placeholders of the table restored
+    """
+    if not protected_content or "XX" not in content:
+        return content
+
+    def replace_placeholder(match: re.Match[str]) -> str:
+        placeholder = match.group(0)
+        original = protected_content.get(placeholder)
+        if original is None:
+            return placeholder
+        if restored is not None:
+            restored.add(placeholder)
+        return original
+
+    return PLACEHOLDER_PATTERN.sub(replace_placeholder, content)
+
+
+__all__ = [
+    "PLACEHOLDER_PATTERN",
+    "restore_placeholders",
+]
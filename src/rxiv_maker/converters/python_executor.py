@@ -12,13 +12,23 @@ Security considerations:
 """
 
 import ast
-import io
+import hashlib
 import json
+import logging
 import subprocess
 import sys
 import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+from .python_worker import PythonWorker
+
+if TYPE_CHECKING:
+    from ..utils.advanced_cache import AdvancedCache
+
+logger = logging.getLogger(__name__)
 
 # Whitelist of safe modules that can be imported
 SAFE_MODULES = {
@@ -104,16 +114,32 @@ class SecurityError(PythonExecutionError):
 class PythonExecutor:
     """Secure Python code executor for markdown commands."""
 
-    def __init__(self, timeout: int = 10, max_output_length: int = 10000):
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_output_length: int = 10000,
+        result_cache: Optional["AdvancedCache"] = None,
+        use_worker: bool = False,
+        working_dir: Optional[Path] = None,
+    ):
         """Initialize Python executor.
 
         Args:
             timeout: Maximum execution time in seconds
             max_output_length: Maximum length of captured output
+            result_cache: Optional cache of execution results keyed on the code,
+                its input context and the Python version
+            use_worker: Whether to run code in one persistent worker process
+                instead of a fresh subprocess per call
+            working_dir: Directory code is executed in (defaults to the current
+                directory at execution time)
         """
         self.timeout = timeout
         self.max_output_length = max_output_length
         self.execution_context: Dict[str, Any] = {}
+        self.result_cache = result_cache
+        self.working_dir = working_dir
+        self.worker = PythonWorker(timeout=timeout, working_dir=working_dir) if use_worker else None
 
     def validate_code_security(self, code: str) -> None:
         """Validate code for security issues.
@@ -221,41 +247,31 @@ class PythonExecutor:
         # Add persistent execution context
         exec_context.update(self.execution_context)
 
-        # Capture output
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        captured_output = io.StringIO()
-        captured_errors = io.StringIO()
+        # The code runs in a subprocess, which captures its output; sys.stdout
+        # is shared by every thread, so it is not swapped here
+        result = self._execute_with_subprocess(code, exec_context)
 
-        try:
-            # Redirect stdout and stderr
-            sys.stdout = captured_output
-            sys.stderr = captured_errors
+        if result["success"]:
+            output = result["output"]
+            # Update persistent context with any new variables
+            self.execution_context.update(result.get("context", {}))
+        else:
+            output = f"Error: {result['error']}"
 
-            # Execute code with timeout using subprocess for better isolation
-            result = self._execute_with_subprocess(code, exec_context)
+        # Limit output length
+        if len(output) > self.max_output_length:
+            output = output[: self.max_output_length] + "... (output truncated)"
 
-            if result["success"]:
-                output = result["output"]
-                # Update persistent context with any new variables
-                self.execution_context.update(result.get("context", {}))
-            else:
-                output = f"Error: {result['error']}"
-
-            # Limit output length
-            if len(output) > self.max_output_length:
-                output = output[: self.max_output_length] + "... (output truncated)"
-
-            return output.strip(), result["success"]
-
-        finally:
-            # Restore stdout and stderr
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+        return output.strip(), result["success"]
 
     def _execute_with_subprocess(self, code: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute code in subprocess for better isolation.
 
+        The code runs in the persistent worker when one is configured, and in
+        a fresh subprocess otherwise. Successful results are stored in the result cache, so re-running code
+        with the same input context returns the stored output and resulting
+        context without spawning a subprocess.
+
         Args:
             code: Python code to execute
             context: Execution context
@@ -263,15 +279,63 @@ class PythonExecutor:
         Returns:
             Dictionary with execution results
         """
-        # Create a script that properly handles context persistence
+        # Only simple types are passed to (and returned from) the subprocess
         context_json = json.dumps(
             {
                 k: v
                 for k, v in context.items()
                 if k != "__builtins__" and isinstance(v, (int, float, str, bool, list, dict))
-            }
+            },
+            sort_keys=True,
         )
 
+        run = self.worker.execute if self.worker is not None else self._run_subprocess
+        if self.result_cache is None:
+            return run(code, context_json)
+
+        cache_key = self._make_cache_key(code, context_json)
+        cached_result = self.result_cache.get_data(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Using cached Python execution result {cache_key[:12]}")
+            if self.worker is not None:
+                # The worker did not see this code run, so its namespace is stale
+                self.worker.needs_context = True
+            return cached_result
+
+        result = run(code, context_json)
+        # Failures may be transient (timeouts), so only successful runs are stored
+        if result.get("success"):
+            self.result_cache.set(cache_key, result)
+        return result
+
+    @staticmethod
+    def _make_cache_key(code: str, context_json: str) -> str:
+        """Build the content-addressed cache key for an execution.
+
+        Args:
+            code: Python code to execute
+            context_json: Serialized input context
+
+        Returns:
+            Hex digest identifying the execution inputs
+        """
+        hasher = hashlib.sha256()
+        for part in (sys.version, context_json, code):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _run_subprocess(self, code: str, context_json: str) -> Dict[str, Any]:
+        """Run code with the given serialized context in a fresh subprocess.
+
+        Args:
+            code: Python code to execute
+            context_json: Serialized input context
+
+        Returns:
+            Dictionary with execution results
+        """
+        # Create a script that properly handles context persistence
         script_content = f"""
 import sys
 import io
@@ -286,7 +350,7 @@ error_msg = None
 final_context = {{}}
 
 try:
-    # Redirect stdout to capture print statements
+    # Redirect stdout to capture print statements; this script runs in its own process
     old_stdout = sys.stdout
     sys.stdout = output_buffer
 
@@ -356,7 +420,7 @@ print(json.dumps(result))
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
-                cwd=Path.cwd(),  # Restrict to current directory
+                cwd=self.working_dir or Path.cwd(),  # Restrict to working directory
             )
 
             if process.returncode == 0:
@@ -467,15 +531,80 @@ print(json.dumps(result))
     def reset_context(self) -> None:
         """Reset the execution context."""
         self.execution_context.clear()
+        if self.worker is not None:
+            self.worker.needs_context = True
+
+    def close(self) -> None:
+        """Stop the persistent worker process, if any."""
+        if self.worker is not None:
+            self.worker.close()
 
 
 # Global executor instance for persistence across commands
 _global_executor = None
 
+# Executor of the build running in the current thread, see python_execution_scope
+_scoped_executor: ContextVar[Optional[PythonExecutor]] = ContextVar("rxiv_python_executor", default=None)
+
 
 def get_python_executor() -> PythonExecutor:
-    """Get or create global Python executor instance."""
+    """Get the Python executor of the current build, or the global instance."""
+    scoped_executor = _scoped_executor.get()
+    if scoped_executor is not None:
+        return scoped_executor
+
     global _global_executor
     if _global_executor is None:
-        _global_executor = PythonExecutor()
+        _global_executor = _create_executor()
     return _global_executor
+
+
+@contextmanager
+def python_execution_scope(working_dir: Optional[Path] = None) -> Iterator[PythonExecutor]:
+    """Use a separate Python executor for the commands run inside this block.
+
+    Builds running at the same time in different threads each get their own
+    execution context, so variables defined by one manuscript are never
+    visible to another.
+
+    Args:
+        working_dir: Directory the manuscript's code is executed in
+
+    Yields:
+        The executor returned by ``get_python_executor`` inside the block
+    """
+    executor = _create_executor(working_dir)
+    token = _scoped_executor.set(executor)
+    try:
+        yield executor
+    finally:
+        _scoped_executor.reset(token)
+        executor.close()
+
+
+def _create_executor(working_dir: Optional[Path] = None) -> PythonExecutor:
+    """Create an executor configured from the environment."""
+    from ..core.environment_manager import EnvironmentManager
+
+    return PythonExecutor(
+        result_cache=_get_result_cache(),
+        use_worker=EnvironmentManager.is_python_worker_enabled(),
+        working_dir=working_dir,
+    )
+
+
+def _get_result_cache() -> Optional["AdvancedCache"]:
+    """Get the persistent execution result cache, if enabled."""
+    from ..core.environment_manager import EnvironmentManager
+
+    if not EnvironmentManager.is_python_cache_enabled():
+        return None
+
+    try:
+        from ..utils.advanced_cache import get_global_cache
+
+        return get_global_cache("python_execution", max_memory_items=500, ttl_hours=24 * 30)
+    except Exception as e:
+        # The cache only saves time, so execution proceeds without it
+        logger.debug(f"Python execution cache unavailable: {e}")
+        return None
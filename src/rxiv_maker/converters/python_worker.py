@@ -0,0 +1,226 @@
+"""Persistent interpreter worker for Python markdown commands.
+
+Starting a fresh interpreter for every ``{py: ...}`` command dominates the
+cost of short commands. This module keeps one worker interpreter alive and
+sends it code over its stdin/stdout pipes using length-prefixed JSON frames.
+Variables stay in the worker's namespace between commands, so the execution
+context only has to be sent when the worker is new or out of sync.
+
+Security checks are not performed here: callers validate code with
+``PythonExecutor.validate_code_security`` before sending it.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import struct
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Frame header: payload length as a 4-byte big-endian unsigned integer
+FRAME_HEADER = struct.Struct(">I")
+
+# Source of the worker interpreter. Responses use the same result dictionary
+# as the one-shot subprocess script in python_executor.
+WORKER_SCRIPT = r"""
+import io
+import json
+import struct
+import sys
+
+FRAME_HEADER = struct.Struct(">I")
+BUILTIN_NAMES = {
+    'print': print, 'range': range, 'len': len, 'str': str, 'int': int, 'float': float,
+    'bool': bool, 'list': list, 'dict': dict, 'tuple': tuple, 'set': set, 'abs': abs,
+    'max': max, 'min': min, 'sum': sum, 'round': round, 'pow': pow,
+}
+
+protocol_in = sys.stdin.buffer
+protocol_out = sys.stdout.buffer
+sys.stdin = io.StringIO()
+sys.stdout = io.StringIO()
+
+
+def read_frame():
+    header = protocol_in.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    return json.loads(protocol_in.read(length).decode('utf-8'))
+
+
+def write_frame(message):
+    payload = json.dumps(message).encode('utf-8')
+    protocol_out.write(FRAME_HEADER.pack(len(payload)) + payload)
+    protocol_out.flush()
+
+
+def new_namespace(context):
+    namespace = dict(context)
+    namespace['__builtins__'] = __builtins__
+    namespace.update(BUILTIN_NAMES)
+    return namespace
+
+
+def simple_context(namespace):
+    context = {}
+    for key, value in namespace.items():
+        if key.startswith('_') or key in BUILTIN_NAMES:
+            continue
+        if isinstance(value, (int, float, str, bool, list, dict)):
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            context[key] = value
+    return context
+
+
+namespace = new_namespace({})
+while True:
+    request = read_frame()
+    if request is None:
+        break
+    if request.get('context') is not None:
+        namespace = new_namespace(json.loads(request['context']))
+
+    output_buffer = io.StringIO()
+    sys.stdout = output_buffer
+    try:
+        exec(request['code'], namespace)
+        result = {'success': True, 'error': None, 'context': simple_context(namespace)}
+    except Exception as e:
+        result = {'success': False, 'error': str(e), 'context': {}}
+    finally:
+        sys.stdout = io.StringIO()
+    result['output'] = output_buffer.getvalue()
+    write_frame(result)
+"""
+
+
+class PythonWorker:
+    """A long-lived interpreter process that executes code sent over a pipe."""
+
+    def __init__(self, timeout: int = 10, working_dir: Optional[Path] = None):
+        """Initialize the worker without starting it.
+
+        Args:
+            timeout: Maximum execution time per call in seconds
+            working_dir: Directory the worker runs in (defaults to the current
+                directory when it is started)
+        """
+        self.timeout = timeout
+        self.working_dir = working_dir
+        self.needs_context = True
+        self._process: Optional[subprocess.Popen] = None
+        self._stdin: Optional[IO[bytes]] = None
+        self._responses: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._atexit_registered = False
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> IO[bytes]:
+        """Start a new worker process, replacing any previous one.
+
+        Returns:
+            Pipe that requests are written to
+        """
+        self.close()
+        process = subprocess.Popen(
+            [sys.executable, "-c", WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.working_dir or Path.cwd(),  # Restrict to working directory
+        )
+        # Both pipes exist, as they were requested above
+        assert process.stdin is not None and process.stdout is not None
+        self._process, self._stdin = process, process.stdin
+        # Responses are read on a thread so calls can time out portably
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read_responses, args=(process.stdout, self._responses), daemon=True).start()
+        # A new namespace is empty until the context is sent
+        self.needs_context = True
+
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+        logger.debug(f"Started Python worker process {process.pid}")
+        return process.stdin
+
+    @staticmethod
+    def _read_responses(stream: IO[bytes], responses: "queue.Queue[Optional[Dict[str, Any]]]") -> None:
+        """Read response frames until the worker closes its stdout."""
+        while True:
+            header = stream.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                break
+            (length,) = FRAME_HEADER.unpack(header)
+            payload = stream.read(length)
+            if len(payload) < length:
+                break
+            responses.put(json.loads(payload.decode("utf-8")))
+        responses.put(None)
+
+    def execute(self, code: str, context_json: str) -> Dict[str, Any]:
+        """Execute code in the worker, restarting it if it is not running.
+
+        Args:
+            code: Python code to execute (already security-validated)
+            context_json: Serialized execution context, sent only when the
+                worker's namespace is out of sync
+
+        Returns:
+            Dictionary with execution results
+        """
+        stdin = self._stdin if self.is_alive() else None
+        if stdin is None:
+            stdin = self.start()
+
+        request = {"code": code, "context": context_json if self.needs_context else None}
+        payload = json.dumps(request).encode("utf-8")
+
+        try:
+            stdin.write(FRAME_HEADER.pack(len(payload)) + payload)
+            stdin.flush()
+        except OSError as e:
+            self.close()
+            return {"success": False, "output": "", "error": f"Execution error: {str(e)}"}
+
+        try:
+            result = self._responses.get(timeout=self.timeout)
+        except queue.Empty:
+            # The worker may be stuck in user code, so replace it
+            self.close()
+            return {"success": False, "output": "", "error": f"Code execution timed out after {self.timeout} seconds"}
+
+        if result is None:
+            self.close()
+            return {"success": False, "output": "", "error": "Python worker process exited unexpectedly"}
+
+        # A failed call may have partially updated the namespace
+        self.needs_context = not result["success"]
+        return result
+
+    def close(self) -> None:
+        """Stop the worker process if it is running."""
+        process, self._process, self._stdin = self._process, None, None
+        if process is None:
+            return
+
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        logger.debug(f"Stopped Python worker process {process.pid}")
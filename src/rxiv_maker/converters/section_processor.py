@@ -5,15 +5,20 @@ and mapping of section titles to standardized keys.
 """
 
 import re
+from typing import TYPE_CHECKING
 
 from .types import MarkdownContent, SectionDict, SectionKey, SectionTitle
 
+if TYPE_CHECKING:
+    from ..utils.section_cache import SectionCache
 
-def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
+
+def extract_content_sections(article_md: MarkdownContent, section_cache: "SectionCache | None" = None) -> SectionDict:
     """Extract content sections from markdown file and convert to LaTeX.
 
     Args:
         article_md: Either markdown content as string or path to markdown file
+        section_cache: Optional cache used to skip re-converting unchanged sections
 
     Returns:
         Dictionary mapping section keys to LaTeX content
@@ -24,6 +29,8 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     # Import here to avoid circular imports
     from .md2tex import convert_markdown_to_latex
 
+    convert = section_cache.convert if section_cache is not None else convert_markdown_to_latex
+
     # Check if article_md is a file path or content
     if article_md.startswith("#") or article_md.startswith("---") or "\n" in article_md:
         # It's content, not a file path
@@ -47,7 +54,7 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     if not section_matches:
         # Check if entire content is supplementary
         is_supplementary = "supplementary" in content.lower()
-        sections["main"] = convert_markdown_to_latex(content, is_supplementary)
+        sections["main"] = convert(content, is_supplementary)
         return sections
 
     # Extract main content (everything before first ## header)
@@ -56,7 +63,7 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
     if main_content:
         # Check if main content is supplementary
         is_main_supplementary = "supplementary" in main_content.lower()
-        sections["main"] = convert_markdown_to_latex(main_content, is_main_supplementary)
+        sections["main"] = convert(main_content, is_main_supplementary)
 
     # Extract each section
     for i, match in enumerate(section_matches):
@@ -74,7 +81,7 @@ def extract_content_sections(article_md: MarkdownContent) -> SectionDict:
         # Check if this is supplementary content (check both title and content)
         is_supplementary = "supplementary" in section_title.lower() or "supplementary" in section_content.lower()
 
-        section_content_latex = convert_markdown_to_latex(section_content, is_supplementary)
+        section_content_latex = convert(section_content, is_supplementary)
 
         # Map section titles to our standard keys
         section_key = map_section_title_to_key(section_title)
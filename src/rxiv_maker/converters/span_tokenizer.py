@@ -0,0 +1,144 @@
+"""Single-pass span tokenizer for markdown to LaTeX conversion.
+
+This module splits markdown content into a stream of typed spans (code, math,
+table and text). The "spans" conversion engine uses it to keep code blocks,
+display math and tables out of the legacy processing passes over the text;
+figures, citations and inline formatting are still found by those passes.
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+
+from .types import MarkdownContent
+
+# Fenced code blocks, identical to the pattern used by the code processor
+FENCED_CODE_PATTERN = re.compile(r"^```(?:\w+)?\n(.*?)\n```$", re.MULTILINE | re.DOTALL)
+
+# Attributed display math ($$...$$ {#eq:id}) is converted to LaTeX environments
+# by the math processor and stays part of the text stream
+ATTRIBUTED_MATH_PATTERN = re.compile(r"\$\$(.*?)\$\$\s*\{([^}]*#[^}]*)\}", re.DOTALL)
+
+# Everything that can start a non-text span inside a gap between code blocks.
+# Inline code is matched only so that its content is never mistaken for math
+# or tables; it is emitted as text.
+_GAP_SCANNER = re.compile(
+    r"(?P<inline_code>``[^`]+``|`[^`]+`)"
+    r"|(?P<table>(?:^[ \t]*\|[^\n]*\|[ \t]*(?:\n|$))+)"
+    r"|(?P<math>\$\$.*?\$\$)",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Caption lines that belong to a table ("Table 1: ..." before it, or a blank
+# line followed by "{#stable:id} **...**" after it)
+_TABLE_CAPTION_BEFORE = re.compile(r"^[ \t]*Table\*?[ \t]+\d+[ \t:.].*\n(?:[ \t]*\n)?\Z", re.MULTILINE | re.IGNORECASE)
+_TABLE_CAPTION_AFTER = re.compile(r"\n[ \t]*\n[ \t]*\{#[a-zA-Z0-9_:-]+.*\}[ \t]*\*\*.*\*\*.*")
+
+
+class SpanType(Enum):
+    """Types of spans produced by the tokenizer."""
+
+    TEXT = "text"
+    CODE = "code"
+    MATH = "math"
+    TABLE = "table"
+
+
+@dataclass(frozen=True)
+class MarkdownSpan:
+    """A contiguous region of markdown content with a known type.
+
+    Attributes:
+        type: The kind of content in this span
+        text: The markdown source of the span
+        start: Offset of the span in the original content
+        end: Offset one past the end of the span in the original content
+    """
+
+    type: SpanType
+    text: str
+    start: int
+    end: int
+
+
+def tokenize_markdown(content: MarkdownContent) -> list[MarkdownSpan]:
+    """Split markdown content into a stream of typed spans.
+
+    Fenced code blocks are found first, as the legacy converter does. The gaps
+    between them are then scanned once for markdown tables and display math.
+    Concatenating the text of all spans always yields the original content.
+
+    Args:
+        content: The markdown content to tokenize
+
+    Returns:
+        List of spans covering the whole content in document order
+    """
+    spans: list[MarkdownSpan] = []
+    position = 0
+
+    for match in FENCED_CODE_PATTERN.finditer(content):
+        _tokenize_gap(content, position, match.start(), spans)
+        spans.append(MarkdownSpan(SpanType.CODE, match.group(0), match.start(), match.end()))
+        position = match.end()
+
+    _tokenize_gap(content, position, len(content), spans)
+    return spans
+
+
+def _tokenize_gap(content: str, start: int, end: int, spans: list[MarkdownSpan]) -> None:
+    """Tokenize the content between two fenced code blocks."""
+    if start >= end:
+        return
+
+    gap = content[start:end]
+
+    # Attributed math blocks are rewritten by the math processor before math
+    # protection happens, so plain $$...$$ inside their match range must stay text
+    attributed_ranges = [(m.start(), m.end()) for m in ATTRIBUTED_MATH_PATTERN.finditer(gap)]
+
+    position = 0
+    for match in _GAP_SCANNER.finditer(gap):
+        kind = match.lastgroup
+        if kind == "inline_code":
+            continue
+        if kind == "math" and any(s < match.end() and match.start() < e for s, e in attributed_ranges):
+            continue
+
+        span_start, span_end = match.start(), match.end()
+        if kind == "table":
+            span_start, span_end = _extend_table_span(gap, span_start, span_end, position)
+            span_type = SpanType.TABLE
+        else:
+            span_type = SpanType.MATH
+
+        if span_start > position:
+            spans.append(MarkdownSpan(SpanType.TEXT, gap[position:span_start], start + position, start + span_start))
+        spans.append(MarkdownSpan(span_type, gap[span_start:span_end], start + span_start, start + span_end))
+        position = span_end
+
+    if position < len(gap):
+        spans.append(MarkdownSpan(SpanType.TEXT, gap[position:], start + position, end))
+
+
+def _extend_table_span(gap: str, start: int, end: int, lower_bound: int) -> tuple[int, int]:
+    """Extend a table span to include its caption lines and drop its trailing newline."""
+    caption_before = _TABLE_CAPTION_BEFORE.search(gap, lower_bound, start)
+    if caption_before:
+        start = caption_before.start()
+
+    if gap[end - 1 : end] == "\n":
+        end -= 1
+
+    caption_after = _TABLE_CAPTION_AFTER.match(gap, end)
+    if caption_after:
+        end = caption_after.end()
+
+    return start, end
+
+
+__all__ = [
+    "MarkdownSpan",
+    "SpanType",
+    "tokenize_markdown",
+]
@@ -5,7 +5,8 @@ a reference system for citing supplementary notes from the main text.
 """
 
 import re
-from typing import TYPE_CHECKING
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     pass
@@ -84,16 +85,16 @@ def process_supplementary_notes(content: LatexContent) -> LatexContent:
     # Replace patterns with placeholders
     processed_content = re.sub(pattern, replace_with_placeholder, content, flags=re.MULTILINE)
 
-    # Store the replacements for later restoration after text formatting
-    # We use a global variable since strings don't have attributes
-    global _snote_replacements
-    _snote_replacements = replacements
+    # Store the replacements for later restoration after text formatting.
+    # Strings don't have attributes, and a context variable keeps concurrent
+    # builds in other threads from seeing each other's notes.
+    _snote_replacements.set(replacements)
 
     return processed_content
 
 
-# Global variable to store replacements
-_snote_replacements: dict[str, str] = {}
+# Replacements of the conversion running in the current context
+_snote_replacements: ContextVar[Optional[dict[str, str]]] = ContextVar("rxiv_snote_replacements", default=None)
 
 
 def restore_supplementary_note_placeholders(content: LatexContent) -> LatexContent:
@@ -107,14 +108,12 @@ def restore_supplementary_note_placeholders(content: LatexContent) -> LatexConte
     Returns:
         Content with placeholders replaced by LaTeX commands
     """
-    global _snote_replacements
-
     # Replace placeholders with final LaTeX
-    for placeholder, latex_replacement in _snote_replacements.items():
+    for placeholder, latex_replacement in (_snote_replacements.get() or {}).items():
         content = content.replace(placeholder, latex_replacement)
 
     # Clear the replacements after use
-    _snote_replacements = {}
+    _snote_replacements.set(None)
 
     return content
 
@@ -26,9 +26,36 @@ comment syntax. Without proper escaping, the LaTeX compilation fails with
 unmatched brace errors.
 """
 
+import io
 import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any, TextIO
 
 from .citation_processor import convert_citations_to_latex
+from .patterns import (
+    BOLD_MARKERS_PATTERN,
+    BOLD_SIMPLE_PATTERN,
+    CITE_COMMAND_SPLIT_PATTERN,
+    DOUBLE_BACKTICK_CODE_PATTERN,
+    DOUBLE_TEXTBACKSLASH_SPACE_PATTERN,
+    ITALIC_MARKERS_PATTERN,
+    ITALIC_SIMPLE_PATTERN,
+    LATEX_COMMAND_START_PATTERN,
+    NESTED_BACKTICK_CODE_PATTERN,
+    SINGLE_BACKTICK_CODE_PATTERN,
+    SUPPLEMENTARY_TABLE_REFERENCE_PATTERN,
+    TABLE_ATTRIBUTE_CAPTION_PATTERN,
+    TABLE_ATTRIBUTE_CAPTION_START_PATTERN,
+    TABLE_CAPTION_LINE_PATTERN,
+    TABLE_CAPTION_PREFIX_PATTERN,
+    TABLE_ITALIC_PATTERN,
+    TABLE_LONGTABLE_PATTERN,
+    TABLE_REFERENCE_PATTERN,
+    TABLE_ROTATION_PATTERN,
+    UNESCAPED_PERCENT_PATTERN,
+    WHITESPACE_RUN_PATTERN,
+)
 from .types import (
     LatexContent,
     MarkdownContent,
@@ -37,6 +64,12 @@ from .types import (
     TableHeaders,
 )
 
+# Number of formatted rows written to the output stream at a time
+TABLE_ROW_BATCH_SIZE = 256
+
+# Maximum number of distinct cell values kept by the cell formatting memo
+CELL_FORMAT_CACHE_SIZE = 8192
+
 
 def convert_tables_to_latex(
     text: MarkdownContent,
@@ -72,14 +105,10 @@ def convert_tables_to_latex(
         caption_line_index = None
         if i > 0:
             # Check line immediately before
-            if re.match(r"^Table\*?\s+\d+[\s:.]\s*", lines[i - 1].strip(), re.IGNORECASE):
+            if TABLE_CAPTION_PREFIX_PATTERN.match(lines[i - 1].strip()):
                 caption_line_index = i - 1
             # Check line two positions back (in case of blank line)
-            elif (
-                i > 1
-                and lines[i - 1].strip() == ""
-                and re.match(r"^Table\*?\s+\d+[\s:.]\s*", lines[i - 2].strip(), re.IGNORECASE)
-            ):
+            elif i > 1 and lines[i - 1].strip() == "" and TABLE_CAPTION_PREFIX_PATTERN.match(lines[i - 2].strip()):
                 caption_line_index = i - 2
 
         if caption_line_index is not None:
@@ -88,7 +117,7 @@ def convert_tables_to_latex(
             if caption_line.lower().startswith("table*"):
                 table_width = "double"
             # Extract caption text after "Table X:" or "Table* X:" etc.
-            caption_match = re.match(r"^Table\*?\s+\d+[\s:.]?\s*(.*)$", caption_line, re.IGNORECASE)
+            caption_match = TABLE_CAPTION_LINE_PATTERN.match(caption_line)
             if caption_match:
                 table_caption = caption_match.group(1).strip()
 
@@ -104,19 +133,9 @@ def convert_tables_to_latex(
             # Skip header and separator
             i += 2
 
-            # Collect data rows
-            data_rows: TableData = []
-            while i < len(lines) and lines[i].strip():
-                current_line = lines[i].strip()
-                if _is_table_row(current_line):
-                    cells = _split_table_row_respecting_backticks(current_line)
-                    # Pad cells if needed
-                    while len(cells) < num_cols:
-                        cells.append("")
-                    data_rows.append(cells[:num_cols])  # Truncate if too many
-                    i += 1
-                else:
-                    break
+            # Find the data rows without materializing them yet
+            rows_start = i
+            rows_end = i = _find_table_end(lines, i)
 
             # Remove the caption line from result_lines if it was added
             if table_caption and caption_line_index is not None:
@@ -137,14 +156,33 @@ def convert_tables_to_latex(
                     result_lines.pop()  # Remove caption line
 
             # Check for new format table caption after the table
-            new_format_caption, table_id, rotation_angle = _parse_table_caption(lines, i)
+            new_format_caption, table_id, rotation_angle, use_longtable = _parse_table_caption(lines, i)
             if new_format_caption:
                 i += 2  # Skip blank line and caption line
 
+            data_rows = _iter_table_rows(lines, rows_start, rows_end, num_cols)
+            if use_longtable:
+                # Tables marked longtable=true are formatted row by row into a
+                # longtable, which LaTeX can break across pages
+                buffer = io.StringIO()
+                write_latex_longtable(
+                    buffer,
+                    headers,
+                    data_rows,
+                    new_format_caption or table_caption,
+                    table_id,
+                    protected_backtick_content,
+                    is_supplementary,
+                    width=table_width,
+                    rotation_angle=rotation_angle,
+                )
+                result_lines.append(buffer.getvalue())
+                continue
+
             # Generate LaTeX table with the processed caption
             latex_table = generate_latex_table(
                 headers,
-                data_rows,
+                list(data_rows),
                 new_format_caption or table_caption,
                 table_width,
                 table_id,
@@ -174,7 +212,7 @@ def _cleanup_double_escaping(text: str) -> str:
     """
     # Fix the specific pattern of double-escaped backslashes
     # Replace \\textbackslash{}textbackslash (with space) with just \\textbackslash{}
-    text = re.sub(r"\\textbackslash\{\}textbackslash\s+", r"\\textbackslash{}", text)
+    text = DOUBLE_TEXTBACKSLASH_SPACE_PATTERN.sub(r"\\textbackslash{}", text)
 
     return text
 
@@ -210,14 +248,7 @@ def generate_latex_table(
         protected_backtick_content = {}
 
     num_cols = len(headers)
-
-    # Check if this is a Markdown Syntax Overview table to preserve literal
-    # syntax in the first column
-    # Remove markdown formatting from header for comparison
-    first_header_clean = headers[0].lower().strip() if headers else ""
-    first_header_clean = re.sub(r"\*\*(.*?)\*\*", r"\1", first_header_clean)  # Remove **bold**
-    first_header_clean = re.sub(r"\*(.*?)\*", r"\1", first_header_clean)  # Remove *italic*
-    is_markdown_syntax_table = first_header_clean == "markdown element"
+    is_markdown_syntax_table = _is_markdown_syntax_table(headers)
 
     # Determine if we should use tabularx for better width handling
     # Use tabularx for:
@@ -249,43 +280,11 @@ def generate_latex_table(
         # Use regular column specification (all left-aligned with borders)
         col_spec = "|" + "l|" * num_cols
 
-    # Format headers
-    formatted_headers: list[str] = []
-    for i, header in enumerate(headers):
-        # For markdown syntax table, treat first two columns as literal code examples
-        is_code_example_column = i < 2 and is_markdown_syntax_table
-        formatted_headers.append(
-            _format_table_cell(
-                header,
-                is_code_example_column,
-                is_header=True,
-                protected_backtick_content=protected_backtick_content,
-            )
-        )
-
-    # Format data rows
-    formatted_data_rows: list[list[str]] = []
-    for row in data_rows:
-        formatted_row: list[str] = []
-        for i, cell in enumerate(row):
-            # For markdown syntax table, treat first two columns as literal code
-            is_code_example_column = i < 2 and is_markdown_syntax_table
-            formatted_row.append(
-                _format_table_cell(
-                    cell,
-                    is_code_example_column,
-                    is_header=False,
-                    protected_backtick_content=protected_backtick_content,
-                )
-            )
-        # For Markdown Syntax table, ensure the LaTeX Equivalent column (index 1)
-        # is always wrapped in \texttt{}, even if the source cell had no backticks
-        if is_markdown_syntax_table and len(formatted_row) > 1:
-            if "\\texttt{" not in formatted_row[1]:
-                # Escape unescaped % to avoid LaTeX comments inside tabular
-                safe_content = re.sub(r"(?<!\\)%", r"\\%", formatted_row[1])
-                formatted_row[1] = f"\\texttt{{{safe_content}}}"
-        formatted_data_rows.append(formatted_row)
+    # Format headers and data rows
+    formatted_headers = _format_table_row(headers, is_markdown_syntax_table, protected_backtick_content, is_header=True)
+    formatted_data_rows = [
+        _format_table_row(row, is_markdown_syntax_table, protected_backtick_content) for row in data_rows
+    ]
 
     # Determine table environment
     if use_tabularx:
@@ -363,20 +362,165 @@ def generate_latex_table(
     table_str = "\n".join(latex_lines)
 
     # Final safety pass: ensure unescaped % are escaped inside any \texttt{...} blocks
-    # This belt-and-suspenders step guarantees table integrity even if earlier
-    # per-cell logic misses a case during complex pipeline transformations.
+    return _escape_percent_in_texttt(table_str)
+
+
+def write_latex_longtable(
+    out: TextIO,
+    headers: TableHeaders,
+    data_rows: Iterable[list[str]],
+    caption: str | None = None,
+    table_id: str | None = None,
+    protected_backtick_content: ProtectedContent | None = None,
+    is_supplementary: bool = False,
+    width: str = "single",
+    rotation_angle: int | None = None,
+) -> int:
+    """Write a LaTeX longtable to a text stream, one batch of rows at a time.
+
+    Used for tables marked ``longtable=true``: rows are consumed lazily from
+    ``data_rows`` and formatted in batches, so no list of parsed or formatted
+    rows is built. The header row is repeated on every page and the caption
+    is placed after the last row. The table is wrapped in the
+    ``rxivlongtable`` environment of the class file, which switches
+    two-column pages to one column, and rotated tables are set on landscape
+    pages. Supplementary tables are numbered like the ``stable`` environment.
+
+    Args:
+        out: Text stream to write the table to
+        headers: List of table header strings
+        data_rows: Iterable of table rows (each row is a list of cell strings)
+        caption: Optional table caption
+        table_id: Optional table ID for labeling
+        protected_backtick_content: Protected backtick content dictionary
+        is_supplementary: Whether this is a supplementary table
+        width: Table width ("single" or "double")
+        rotation_angle: Optional rotation angle for table
+
+    Returns:
+        Number of data rows written
+    """
+    if protected_backtick_content is None:
+        protected_backtick_content = {}
+
+    num_cols = len(headers)
+    is_markdown_syntax_table = _is_markdown_syntax_table(headers)
+
+    # Single-column tables keep the width of the column they were placed in
+    if rotation_angle:
+        table_width = "\\linewidth"
+    elif width == "double":
+        table_width = "\\textwidth"
+    else:
+        table_width = "\\rxivlongtablewidth"
+
+    # longtable does not support X columns, so wide tables get fixed-width columns
+    if num_cols >= 5 or any(len(header) > 15 for header in headers):
+        column_width = 0.95 / max(num_cols, 1)
+        col_spec = "|" + f"p{{{column_width:.3f}{table_width}}}|" * num_cols
+    else:
+        col_spec = "|" + "l|" * num_cols
+
+    formatted_headers = _format_table_row(headers, is_markdown_syntax_table, protected_backtick_content, is_header=True)
+    header_row = _escape_percent_in_texttt(" & ".join(formatted_headers) + " \\\\")
+
+    out.write("\\begin{rxivlongtable}\n")
+    if rotation_angle:
+        out.write("\\begin{landscape}\n")
+    if is_supplementary:
+        # Number like the stable environments of the class file
+        out.write("\\renewcommand{\\thetable}{\\thestable}\\stepcounter{stable}\n")
+    if num_cols >= 5:
+        out.write("\\footnotesize\n")
+    out.write(f"\\begin{{longtable}}{{{col_spec}}}\n")
+    out.write(f"\\hline\n{header_row}\n\\hline\n\\endhead\n")
+    if caption:
+        label = table_id if table_id else "tab:comparison"
+        out.write(f"\\caption{{{caption}}}\\label{{{label}}}\\\\\n")
+        out.write("\\endlastfoot\n")
+
+    rows_written = 0
+    batch: list[str] = []
+    for row in data_rows:
+        formatted_row = _format_table_row(row, is_markdown_syntax_table, protected_backtick_content)
+        batch.append(_escape_percent_in_texttt(" & ".join(formatted_row) + " \\\\") + "\n\\hline\n")
+        rows_written += 1
+        if len(batch) >= TABLE_ROW_BATCH_SIZE:
+            out.write("".join(batch))
+            batch.clear()
+    out.write("".join(batch))
+
+    out.write("\\end{longtable}\n")
+    if not caption:
+        # Unlike a float, longtable steps the table counter without a caption
+        out.write("\\addtocounter{table}{-1}\n")
+    if rotation_angle:
+        out.write("\\end{landscape}\n")
+    out.write("\\end{rxivlongtable}")
+    return rows_written
+
+
+def _is_markdown_syntax_table(headers: TableHeaders) -> bool:
+    """Check if this is a Markdown Syntax Overview table.
+
+    Such tables preserve literal syntax in their first columns.
+    """
+    # Remove markdown formatting from header for comparison
+    first_header_clean = headers[0].lower().strip() if headers else ""
+    first_header_clean = BOLD_MARKERS_PATTERN.sub(r"\1", first_header_clean)  # Remove **bold**
+    first_header_clean = ITALIC_MARKERS_PATTERN.sub(r"\1", first_header_clean)  # Remove *italic*
+    return first_header_clean == "markdown element"
+
+
+def _format_table_row(
+    row: list[str],
+    is_markdown_syntax_table: bool,
+    protected_backtick_content: ProtectedContent,
+    is_header: bool = False,
+) -> list[str]:
+    """Format all cells of a header or data row for LaTeX output."""
+    formatted_row: list[str] = []
+    for i, cell in enumerate(row):
+        # For markdown syntax table, treat first two columns as literal code examples
+        is_code_example_column = i < 2 and is_markdown_syntax_table
+        formatted_row.append(
+            _format_table_cell(
+                cell,
+                is_code_example_column,
+                is_header=is_header,
+                protected_backtick_content=protected_backtick_content,
+            )
+        )
+
+    # For Markdown Syntax table, ensure the LaTeX Equivalent column (index 1)
+    # is always wrapped in \texttt{}, even if the source cell had no backticks
+    if not is_header and is_markdown_syntax_table and len(formatted_row) > 1:
+        if "\\texttt{" not in formatted_row[1]:
+            # Escape unescaped % to avoid LaTeX comments inside tabular
+            safe_content = UNESCAPED_PERCENT_PATTERN.sub(r"\\%", formatted_row[1])
+            formatted_row[1] = f"\\texttt{{{safe_content}}}"
+    return formatted_row
+
+
+def _escape_percent_in_texttt(latex: str) -> str:
+    r"""Ensure unescaped % are escaped inside any \texttt{...} blocks.
+
+    This belt-and-suspenders step guarantees table integrity even if earlier
+    per-cell logic misses a case during complex pipeline transformations.
+    """
+    if "%" not in latex:
+        return latex
+
     try:
-        parts = _split_on_latex_commands(table_str, ["texttt"])  # preserve balanced texttt blocks
+        parts = _split_on_latex_commands(latex, ["texttt"])  # preserve balanced texttt blocks
         for i, part in enumerate(parts):
             if part.startswith("\\texttt{"):
                 # Escape any unescaped % so they don't start LaTeX comments inside tabular/tabularx
-                parts[i] = re.sub(r"(?<!\\)%", r"\\%", part)
-        table_str = "".join(parts)
+                parts[i] = UNESCAPED_PERCENT_PATTERN.sub(r"\\%", part)
+        return "".join(parts)
     except Exception:
         # If anything goes wrong, return the original string (better to not alter output)
-        pass
-
-    return table_str
+        return latex
 
 
 def _format_table_cell(
@@ -403,6 +547,17 @@ def _format_table_cell(
     for placeholder, original in protected_backtick_content.items():
         cell = cell.replace(placeholder, original)
 
+    return _format_cell_content(cell, is_markdown_example_column)
+
+
+@lru_cache(maxsize=CELL_FORMAT_CACHE_SIZE)
+def _format_cell_content(cell: str, is_markdown_example_column: bool) -> str:
+    """Format restored cell content, memoized on the cell text and column mode.
+
+    Scientific tables repeat the same values (units, "n.s.", gene names) many
+    times, and formatting only depends on the cell text, so identical cells are
+    escaped once.
+    """
     # If this is the "Markdown Element" column, preserve literal syntax
     if is_markdown_example_column:
         return _format_markdown_syntax_cell(cell)
@@ -411,6 +566,28 @@ def _format_table_cell(
     return _format_regular_table_cell(cell)
 
 
+def get_cell_format_cache_stats() -> dict[str, Any]:
+    """Get statistics about the table cell formatting memo.
+
+    Returns:
+        Dictionary with cache statistics
+    """
+    info = _format_cell_content.cache_info()
+    total = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / total if total else 0.0,
+        "cached_cells": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def clear_cell_format_cache() -> None:
+    """Clear the table cell formatting memo and its statistics."""
+    _format_cell_content.cache_clear()
+
+
 def _format_markdown_syntax_cell(cell: str) -> str:
     """Format a cell in markdown syntax overview table to preserve literal syntax."""
 
@@ -432,7 +609,7 @@ def _format_markdown_syntax_cell(cell: str) -> str:
         return f"\\texttt{{{code_content}}}"
 
     # Process backticks first to protect literal syntax
-    cell = re.sub(r"`([^`]+)`", process_code_only, cell)
+    cell = SINGLE_BACKTICK_CODE_PATTERN.sub(process_code_only, cell)
 
     # Now apply markdown formatting only to text outside of \texttt{} blocks
     # Convert **bold** to \textbf{...} and *italic* to \textit{...} if not in \texttt
@@ -440,8 +617,8 @@ def _format_markdown_syntax_cell(cell: str) -> str:
         # Don't apply formatting inside \texttt{} blocks
         if "\\texttt{" in text:
             return text
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", text)
-        text = re.sub(r"\*([^*]+)\*", r"\\textit{\1}", text)
+        text = BOLD_SIMPLE_PATTERN.sub(r"\\textbf{\1}", text)
+        text = ITALIC_SIMPLE_PATTERN.sub(r"\\textit{\1}", text)
         return text
 
     # Split by \texttt blocks and apply formatting only to the non-texttt parts
@@ -454,7 +631,7 @@ def _format_markdown_syntax_cell(cell: str) -> str:
     for i in range(len(parts)):
         if parts[i].startswith("\\texttt{"):
             # Escape unescaped % inside texttt
-            parts[i] = re.sub(r"(?<!\\)%", r"\\%", parts[i])
+            parts[i] = UNESCAPED_PERCENT_PATTERN.sub(r"\\%", parts[i])
 
     return "".join(parts)
 
@@ -481,21 +658,17 @@ def _format_regular_table_cell(cell: str) -> str:
         # For multiline code in tables, replace newlines with spaces
         code_content = code_content.replace("\n", " ")
         # Remove multiple spaces
-        code_content = re.sub(r"\s+", " ", code_content).strip()
+        code_content = WHITESPACE_RUN_PATTERN.sub(" ", code_content).strip()
         return f"\\texttt{{{code_content}}}"
 
     # Process code blocks - use simple approach that handles all cases
     # First handle the specific case of `` `code` `` (double backticks with
     # inner backticks)
-    cell = re.sub(
-        r"``\s*`([^`]+)`\s*``",
-        process_code_in_table,
-        cell,
-    )
+    cell = NESTED_BACKTICK_CODE_PATTERN.sub(process_code_in_table, cell)
     # Then handle regular double backticks
-    cell = re.sub(r"``([^`]+)``", process_code_in_table, cell)
+    cell = DOUBLE_BACKTICK_CODE_PATTERN.sub(process_code_in_table, cell)
     # Finally handle single backticks
-    cell = re.sub(r"`([^`]+)`", process_code_in_table, cell)
+    cell = SINGLE_BACKTICK_CODE_PATTERN.sub(process_code_in_table, cell)
 
     # Apply formatting outside texttt blocks
     cell = _apply_formatting_outside_texttt(cell)
@@ -533,10 +706,7 @@ def _escape_latex_special_chars(text: str) -> str:
 def _is_latex_command(text: str) -> bool:
     """Check if text contains LaTeX commands that should use manual escaping."""
     # Look for LaTeX command patterns like \textbf{}, \emph{}, etc.
-    import re
-
-    latex_command_pattern = r"\\[a-zA-Z]+\{"
-    return bool(re.search(latex_command_pattern, text))
+    return bool(LATEX_COMMAND_START_PATTERN.search(text))
 
 
 def _escape_latex_syntax_for_texttt(text: str) -> str:
@@ -667,7 +837,7 @@ def _apply_formatting_outside_texttt(text: str) -> str:
             if part.startswith("\\texttt{"):
                 result.append(part)
             else:
-                part = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", part)
+                part = BOLD_SIMPLE_PATTERN.sub(r"\\textbf{\1}", part)
                 result.append(part)
         return "".join(result)
 
@@ -679,11 +849,7 @@ def _apply_formatting_outside_texttt(text: str) -> str:
             if part.startswith("\\texttt{"):
                 result.append(part)
             else:
-                part = re.sub(
-                    r"(?<!\*)\*([^*\s][^*]*[^*\s]|\w)\*(?!\*)",
-                    r"\\textit{\1}",
-                    part,
-                )
+                part = TABLE_ITALIC_PATTERN.sub(r"\\textit{\1}", part)
                 result.append(part)
         return "".join(result)
 
@@ -747,7 +913,7 @@ def _split_on_latex_commands(text: str, commands: list[str]) -> list[str]:
 def _escape_underscores_outside_cite(text: str) -> str:
     r"""Escape underscores but not inside \cite{} commands."""
     # Split text on cite commands to preserve them
-    parts = re.split(r"(\\cite\{[^}]*\})", text)
+    parts = CITE_COMMAND_SPLIT_PATTERN.split(text)
     result: list[str] = []
     for part in parts:
         if part.startswith("\\cite{"):
@@ -770,7 +936,7 @@ def _escape_outside_latex_commands(text: str) -> str:
             # For code blocks, ensure % is escaped so it doesn't start a LaTeX comment
             if part.startswith("\\texttt{"):
                 # Replace unescaped % with \%
-                part = re.sub(r"(?<!\\)%", r"\\%", part)
+                part = UNESCAPED_PERCENT_PATTERN.sub(r"\\%", part)
             result.append(part)
         else:
             part = part.replace("&", "\\&")
@@ -815,23 +981,45 @@ def _is_table_row(line: str) -> bool:
     return "|" in line and line.startswith("|") and line.endswith("|")
 
 
-def _parse_table_caption(lines: list[str], i: int) -> tuple[str | None, str | None, int | None]:
+def _find_table_end(lines: list[str], start: int) -> int:
+    """Find the index one past the last data row of a table starting at ``start``."""
+    i = start
+    while i < len(lines) and lines[i].strip() and _is_table_row(lines[i].strip()):
+        i += 1
+    return i
+
+
+def _iter_table_rows(lines: list[str], start: int, end: int, num_cols: int) -> Iterator[list[str]]:
+    """Yield the cells of the data rows in ``lines[start:end]`` one row at a time.
+
+    Rows are padded with empty cells or truncated to ``num_cols`` cells.
+    """
+    for i in range(start, end):
+        cells = _split_table_row_respecting_backticks(lines[i].strip())
+        # Pad cells if needed
+        while len(cells) < num_cols:
+            cells.append("")
+        yield cells[:num_cols]  # Truncate if too many
+
+
+def _parse_table_caption(lines: list[str], i: int) -> tuple[str | None, str | None, int | None, bool]:
     """Parse table caption in new format after table."""
     new_format_caption = None
     table_id = None
     rotation_angle = None
+    use_longtable = False
 
     if (
         i < len(lines)
         and lines[i].strip() == ""
         and i + 1 < len(lines)
-        and re.match(r"^\{#[a-zA-Z0-9_:-]+.*\}\s*\*\*.*\*\*", lines[i + 1].strip())
+        and TABLE_ATTRIBUTE_CAPTION_START_PATTERN.match(lines[i + 1].strip())
     ):
         # Found new format caption, parse it
         caption_line = lines[i + 1].strip()
 
         # Parse caption with optional attributes like rotate=90
-        caption_match = re.match(r"^\{#([a-zA-Z0-9_:-]+)([^}]*)\}\s*(.+)$", caption_line)
+        caption_match = TABLE_ATTRIBUTE_CAPTION_PATTERN.match(caption_line)
         if caption_match:
             table_id = caption_match.group(1)
             attributes_str = caption_match.group(2).strip()
@@ -839,15 +1027,16 @@ def _parse_table_caption(lines: list[str], i: int) -> tuple[str | None, str | No
 
             # Extract rotation attribute if present
             if attributes_str:
-                rotation_match = re.search(r"rotate=(\d+)", attributes_str)
+                rotation_match = TABLE_ROTATION_PATTERN.search(attributes_str)
                 if rotation_match:
                     rotation_angle = int(rotation_match.group(1))
+                use_longtable = TABLE_LONGTABLE_PATTERN.search(attributes_str) is not None
 
             # Process caption text to handle markdown formatting
-            new_format_caption = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", caption_text)
-            new_format_caption = re.sub(r"\*([^*]+)\*", r"\\textit{\1}", new_format_caption)
+            new_format_caption = BOLD_SIMPLE_PATTERN.sub(r"\\textbf{\1}", caption_text)
+            new_format_caption = ITALIC_SIMPLE_PATTERN.sub(r"\\textit{\1}", new_format_caption)
 
-    return new_format_caption, table_id, rotation_angle
+    return new_format_caption, table_id, rotation_angle, use_longtable
 
 
 def _split_table_row_respecting_backticks(row: str) -> list[str]:
@@ -915,10 +1104,10 @@ def convert_table_references_to_latex(text: MarkdownContent) -> LatexContent:
         Text with table references converted to LaTeX format with "Table" prefix
     """
     # Convert @table:id to Table \ref{table:id} (regular tables)
-    text = re.sub(r"@table:([a-zA-Z0-9_-]+)", r"Table \\ref{table:\1}", text)
+    text = TABLE_REFERENCE_PATTERN.sub(r"Table \\ref{table:\1}", text)
 
     # Convert @stable:id to Table \ref{stable:id} (supplementary tables)
-    text = re.sub(r"@stable:([a-zA-Z0-9_-]+)", r"Table \\ref{stable:\1}", text)
+    text = SUPPLEMENTARY_TABLE_REFERENCE_PATTERN.sub(r"Table \\ref{stable:\1}", text)
 
     return text
 
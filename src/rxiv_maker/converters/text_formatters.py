@@ -6,6 +6,27 @@ headers, and special character escaping.
 
 import re
 
+from .patterns import (
+    BOLD_PATTERN,
+    BOLD_SIMPLE_PATTERN,
+    DOUBLE_BACKTICK_CODE_PATTERN,
+    ESCAPE_CODE_SCAN_PATTERN,
+    ESCAPE_SCAN_PATTERN,
+    ITALIC_PATTERN,
+    ITALIC_STANDALONE_PATTERN,
+    LATEX_COMMAND_SPLIT_PATTERN,
+    PROTECTED_CONTEXT_SPLIT_PATTERN,
+    PROTECTED_LATEX_COMMAND_PATTERN,
+    SECTION_HEADER_PATTERN,
+    SINGLE_BACKTICK_CODE_PATTERN,
+    SUBSCRIPT_PATTERN,
+    SUBSECTION_HEADER_PATTERN,
+    SUBSUBSECTION_HEADER_PATTERN,
+    SUPERSCRIPT_PATTERN,
+    TEXTTT_OR_ENVIRONMENT_SPLIT_PATTERN,
+    TEXTTT_SPLIT_PATTERN,
+    UNESCAPED_UNDERSCORE_PATTERN,
+)
 from .types import LatexContent, MarkdownContent
 
 
@@ -24,18 +45,10 @@ def convert_subscript_superscript_to_latex(text: LatexContent) -> LatexContent:
     # Helper function to avoid replacing inside LaTeX commands
     def replace_outside_commands(pattern, replacement, text):
         """Replace pattern with replacement, but not inside LaTeX commands or math mode."""
-        # Combine all protection patterns into a single regex to avoid
-        # sequential processing issues where one pattern affects another
-        combined_pattern = (
-            r"(\\texttt\{[^}]*\})|"  # \texttt{...}
-            r"(\\text\{[^}]*\})|"  # \text{...}
-            r"(\$[^$]*\$)|"  # Inline math $...$
-            r"(\$\$.*?\$\$)|"  # Display math $$...$$
-            r"(\\begin\{equation\}.*?\\end\{equation\})"  # equation environments
-        )
-
-        # Split by the combined pattern - protected parts will be in groups
-        parts = re.split(combined_pattern, text, flags=re.DOTALL)
+        # Split by a single combined protection pattern to avoid sequential
+        # processing issues where one pattern affects another - protected
+        # parts will be in groups
+        parts = PROTECTED_CONTEXT_SPLIT_PATTERN.split(text)
         result = []
 
         for part in parts:
@@ -53,7 +66,7 @@ def convert_subscript_superscript_to_latex(text: LatexContent) -> LatexContent:
 
             if not is_protected:
                 # Only apply replacement to unprotected parts
-                part = re.sub(pattern, replacement, part)
+                part = pattern.sub(replacement, part)
 
             result.append(part)
 
@@ -61,9 +74,9 @@ def convert_subscript_superscript_to_latex(text: LatexContent) -> LatexContent:
 
     # Convert simple subscript and superscript using markdown-style syntax
     # H~2~O becomes H\textsubscript{2}O
-    text = replace_outside_commands(r"~([^~\s]+)~", r"\\textsubscript{\1}", text)
+    text = replace_outside_commands(SUBSCRIPT_PATTERN, r"\\textsubscript{\1}", text)
     # E=mc^2^ becomes E=mc\textsuperscript{2}
-    text = replace_outside_commands(r"\^([^\^\s]+)\^", r"\\textsuperscript{\1}", text)
+    text = replace_outside_commands(SUPERSCRIPT_PATTERN, r"\\textsuperscript{\1}", text)
 
     return text
 
@@ -78,8 +91,8 @@ def convert_text_formatting_to_latex(text: MarkdownContent) -> LatexContent:
         LaTeX formatted text
     """
     # Convert bold and italic
-    text = re.sub(r"\*\*(.+?)\*\*", r"\\textbf{\1}", text)
-    text = re.sub(r"\*(.+?)\*", r"\\textit{\1}", text)
+    text = BOLD_PATTERN.sub(r"\\textbf{\1}", text)
+    text = ITALIC_PATTERN.sub(r"\\textit{\1}", text)
 
     # Convert subscript and superscript
     text = convert_subscript_superscript_to_latex(text)
@@ -99,9 +112,9 @@ def convert_headers_to_latex(text: MarkdownContent) -> LatexContent:
     Returns:
         LaTeX text with section commands
     """
-    text = re.sub(r"^## (.+)$", r"\\section{\1}", text, flags=re.MULTILINE)
-    text = re.sub(r"^### (.+)$", r"\\subsection{\1}", text, flags=re.MULTILINE)
-    text = re.sub(r"^#### (.+)$", r"\\subsubsection{\1}", text, flags=re.MULTILINE)
+    text = SECTION_HEADER_PATTERN.sub(r"\\section{\1}", text)
+    text = SUBSECTION_HEADER_PATTERN.sub(r"\\subsection{\1}", text)
+    text = SUBSUBSECTION_HEADER_PATTERN.sub(r"\\subsubsection{\1}", text)
 
     return text
 
@@ -186,8 +199,8 @@ def process_code_spans(text: MarkdownContent) -> LatexContent:
                 return f"\\texttt{{{escaped_content}}}"
 
     # Process both double and single backticks
-    text = re.sub(r"``([^`]+)``", process_code_blocks, text)  # Double backticks first
-    text = re.sub(r"`([^`]+)`", process_code_blocks, text)  # Then single backticks
+    text = DOUBLE_BACKTICK_CODE_PATTERN.sub(process_code_blocks, text)  # Double backticks first
+    text = SINGLE_BACKTICK_CODE_PATTERN.sub(process_code_blocks, text)  # Then single backticks
 
     # Convert protected detokenize placeholders to actual LaTeX
     def replace_protected_detokenize(match: re.Match[str]) -> str:
@@ -262,14 +275,14 @@ def apply_bold_italic_formatting(text: MarkdownContent) -> LatexContent:
 
     # Replace bold/italic but skip if inside LaTeX commands
     # Split by LaTeX commands and only process text parts
-    parts = re.split(r"(\\[a-zA-Z]+\{[^}]*\})", text)
+    parts = LATEX_COMMAND_SPLIT_PATTERN.split(text)
     processed_parts: list[str] = []
 
     for i, part in enumerate(parts):
         if i % 2 == 0:  # This is regular text, not a LaTeX command
             # Apply bold/italic formatting
-            part = re.sub(r"\*\*(.+?)\*\*", safe_bold_replace, part)
-            part = re.sub(r"\*(.+?)\*", safe_italic_replace, part)
+            part = BOLD_PATTERN.sub(safe_bold_replace, part)
+            part = ITALIC_PATTERN.sub(safe_italic_replace, part)
         # If i % 2 == 1, it's a LaTeX command - leave it unchanged
         processed_parts.append(part)
 
@@ -286,7 +299,7 @@ def protect_bold_outside_texttt(text: MarkdownContent) -> LatexContent:
         Text with bold formatting applied outside code blocks
     """
     # Split by \texttt{} blocks and process only non-texttt parts
-    parts = re.split(r"(\\texttt\{[^}]*\})", text)
+    parts = TEXTTT_SPLIT_PATTERN.split(text)
     result: list[str] = []
 
     for _i, part in enumerate(parts):
@@ -295,7 +308,7 @@ def protect_bold_outside_texttt(text: MarkdownContent) -> LatexContent:
             result.append(part)
         else:
             # This is regular text, apply bold formatting
-            part = re.sub(r"\*\*([^*]+)\*\*", r"\\textbf{\1}", part)
+            part = BOLD_SIMPLE_PATTERN.sub(r"\\textbf{\1}", part)
             result.append(part)
     return "".join(result)
 
@@ -311,8 +324,7 @@ def protect_italic_outside_texttt(text: MarkdownContent) -> LatexContent:
     """
     # Split by both \texttt{} blocks and LaTeX environments
     # This regex captures \texttt{} and LaTeX environments (\begin{...}...\end{...})
-    pattern = r"(\\texttt\{[^}]*\}|\\begin\{[^}]*\*?\}.*?\\end\{[^}]*\*?\})"
-    parts = re.split(pattern, text, flags=re.DOTALL)
+    parts = TEXTTT_OR_ENVIRONMENT_SPLIT_PATTERN.split(text)
     result: list[str] = []
 
     for _i, part in enumerate(parts):
@@ -322,17 +334,20 @@ def protect_italic_outside_texttt(text: MarkdownContent) -> LatexContent:
         else:
             # This is regular text, apply italic formatting
             # Process italic markers - handle various contexts including list items
-            part = re.sub(
-                r"(?<!\*)\*([^*]+?)\*(?!\*)",
-                r"\\textit{\1}",
-                part,
-            )
+            part = ITALIC_STANDALONE_PATTERN.sub(r"\\textit{\1}", part)
             result.append(part)
     return "".join(result)
 
 
 def escape_special_characters(text: MarkdownContent) -> LatexContent:
-    """Escape special LaTeX characters in text.
+    r"""Escape special LaTeX characters in text.
+
+    The text is scanned once with ``ESCAPE_SCAN_PATTERN``, whose named
+    alternatives dispatch each region or character to its escaping rule:
+    protected LaTeX commands are kept as-is, ``\texttt{}`` blocks are escaped
+    as code, math and ``\text{}`` keep their carets, and file names,
+    percent signs, carets and arrows are escaped in running text. Escaped
+    output is never rescanned, so nothing is escaped twice.
 
     Args:
         text: Text to escape
@@ -340,287 +355,231 @@ def escape_special_characters(text: MarkdownContent) -> LatexContent:
     Returns:
         Text with LaTeX special characters escaped
     """
-    # First, handle all specific cases that contain listings environments
-    # This handles the nested brace issue where regex fails
-
-    # Find all texttt environments that contain listings
-    def replace_listings_texttt(text: str) -> str:
-        # Simple approach: find texttt blocks with listings and replace with verb
-        import re
-
-        # Find all \texttt{...} blocks
-        def process_texttt_block(match):
-            full_content = match.group(1)
-
-            # If this texttt block contains listings, replace with verb
-            if "\\begin{lstlisting}" in full_content:
-                # Use verb with a delimiter that's not in the content
-                delimiters = [
-                    "|",
-                    "!",
-                    "@",
-                    "#",
-                    "$",
-                    "%",
-                    "^",
-                    "&",
-                    "*",
-                    "+",
-                    "=",
-                    "~",
-                ]
-                delimiter = "|"
-                for d in delimiters:
-                    if d not in full_content:
-                        delimiter = d
-                        break
-                return f"\\verb{delimiter}{full_content}{delimiter}"
-            else:
-                # Return unchanged
-                return f"\\texttt{{{full_content}}}"
-
-        # Use re.DOTALL to match across newlines, and handle nested braces properly
-        # This pattern handles one level of nested braces without ReDoS vulnerability
-        pattern = r"\\texttt\{([^{}]*(?:\{[^}]*\}[^{}]*)*)\}"
-        text = re.sub(pattern, process_texttt_block, text, flags=re.DOTALL)
-
-        return text
-
-    text = replace_listings_texttt(text)
-
-    # IMPORTANT: Protect LaTeX commands FIRST before any underscore escaping
-    # Protect LaTeX reference commands that should not have underscores escaped
-    # These commands use identifiers that often contain underscores (like fig:name_with_underscores)
-    protected_latex_commands: dict[str, str] = {}
-
-    def protect_latex_command(match: re.Match[str]) -> str:
-        """Replace LaTeX command with placeholder."""
-        command = match.group(0)
-        placeholder = f"XXPROTECTEDLATEXCOMMANDXX{len(protected_latex_commands)}XXPROTECTEDLATEXCOMMANDXX"
-        protected_latex_commands[placeholder] = command
-        return placeholder
-
-    # CRITICAL: Protect content that's already been processed by table_processor
-    # The table processor uses \detokenize{} for complex cases - don't touch these
-    # Protect \texttt{\detokenize{...}} commands (from table processor)
-    text = re.sub(r"\\texttt\{\\detokenize\{[^}]*\}\}", protect_latex_command, text)
-
-    # Protect standalone \detokenize{...} commands
-    text = re.sub(r"\\detokenize\{[^}]*\}", protect_latex_command, text)
-
-    # Protect \includegraphics{} commands
-    text = re.sub(r"\\includegraphics\[[^\]]*\]\{[^}]*\}", protect_latex_command, text)
-
-    latex_ref_commands = [
-        r"\\ref\{[^}]*\}",  # \ref{fig:name_with_underscores}
-        r"\\eqref\{[^}]*\}",  # \eqref{eq:name_with_underscores}
-        r"\\label\{[^}]*\}",  # \label{fig:name_with_underscores}
-        r"\\pageref\{[^}]*\}",  # \pageref{sec:name_with_underscores}
-        r"\\cite\{[^}]*\}",  # \cite{author_2024}
-        r"\\citep\{[^}]*\}",  # \citep{author_2024}
-        r"\\citet\{[^}]*\}",  # \citet{author_2024}
-        r"\\citealt\{[^}]*\}",  # \citealt{author_2024}
-        r"\\cref\{[^}]*\}",  # \cref{fig:name_with_underscores} (cleveref)
-        r"\\Cref\{[^}]*\}",  # \Cref{fig:name_with_underscores} (cleveref)
-    ]
-
-    for pattern in latex_ref_commands:
-        text = re.sub(pattern, protect_latex_command, text)
-
-    # Then apply the general function for other cases
-    # Escape special characters in texttt commands
-    def escape_specials_in_texttt_content(content: str) -> str:
-        # Special handling for listings environments - they interfere with texttt
-        if "\\begin{lstlisting}" in content or "\\end{lstlisting}" in content:
-            # Use verb instead of texttt for listings content
-            # Find a delimiter that's not in the content
-            delimiters = ["|", "!", "@", "#", "$", "%", "^", "&", "*", "+", "=", "~"]
-            delimiter = "|"
-            for d in delimiters:
-                if d not in content:
-                    delimiter = d
-                    break
-            return f"\\verb{delimiter}{content}{delimiter}"
-        # Special handling for detokenize commands - don't escape the backslashes
-        elif "\\detokenize{" in content:
-            # This content already has detokenize, just return it wrapped in texttt
-            return f"\\texttt{{{content}}}"
-        # Special handling for LaTeX command protected content - don't escape backslashes
-        elif "LATEXCMD_PROTECTED_START{" in content and "}LATEXCMD_PROTECTED_END" in content:
-            # Extract the protected content and return it as-is
-            start_marker = "LATEXCMD_PROTECTED_START{"
-            end_marker = "}LATEXCMD_PROTECTED_END"
-            start_idx = content.find(start_marker)
-            end_idx = content.find(end_marker)
-            if start_idx != -1 and end_idx != -1:
-                protected_content = content[start_idx + len(start_marker) : end_idx]
-                return f"\\texttt{{{protected_content}}}"
-            # Fallback if markers are malformed
-            return f"\\texttt{{{content}}}"
-        else:
-            # For other backslashes, use textbackslash
-            # Skip processing if text already contains any form of textbackslash (already escaped)
-            if "textbackslash" not in content:
-                content = content.replace("\\", "\\textbackslash{}")
-
-        # Escape # characters only if not already escaped
-        if "\\#" not in content:
-            content = content.replace("#", "\\#")
-        return f"\\texttt{{{content}}}"
+    return _escape_scan(text, 0, len(text), ESCAPE_SCAN_PATTERN, escape_underscores=False, escape_carets=True)
 
-    # Use a more sophisticated approach to handle nested braces
-    def find_and_replace_texttt(text: str) -> str:
-        result = []
-        i = 0
-        while i < len(text):
-            # Look for \texttt{
-            if text[i : i + 8] == "\\texttt{":
-                # Find the matching closing brace
-                brace_count = 0
-                start = i + 8
-                j = start
-                while j < len(text):
-                    if text[j] == "{":
-                        brace_count += 1
-                    elif text[j] == "}":
-                        if brace_count == 0:
-                            # Found the matching closing brace
-                            content = text[start:j]
-                            replacement = escape_specials_in_texttt_content(content)
-                            result.append(replacement)
-                            i = j + 1
-                            break
-                        else:
-                            brace_count -= 1
-                    j += 1
-                else:
-                    # No matching brace found, just add the original text
-                    result.append(text[i])
-                    i += 1
-            else:
-                result.append(text[i])
-                i += 1
-        return "".join(result)
 
-    text = find_and_replace_texttt(text)
-
-    # Handle underscores carefully - LaTeX is very picky about this
-    # We need to escape underscores in text mode but NOT double-escape them
-
-    # Handle remaining underscores in file paths within parentheses
-    def escape_file_paths_in_parens(match: re.Match[str]) -> str:
-        paren_content = match.group(1)
-        # Only escape if it looks like a file path (has extension or
-        # is all caps directory)
-        if ("." in paren_content and "_" in paren_content) or (
-            paren_content.endswith(".md")
-            or paren_content.endswith(".bib")
-            or paren_content.endswith(".tex")
-            or paren_content.endswith(".py")
-            or paren_content.endswith(".csv")
-        ):
-            return f"({paren_content.replace('_', 'XUNDERSCOREX')})"
-        return match.group(0)
-
-    text = re.sub(r"\(([^)]+)\)", escape_file_paths_in_parens, text)
-
-    # Handle remaining underscores in file names and paths
-    # Match common filename patterns: WORD_WORD.ext, word_word.ext, etc.
-    def escape_filenames(match: re.Match[str]) -> str:
-        filename = match.group(0)
-        # Escape underscores in anything that looks like a filename
-        return filename.replace("_", "XUNDERSCOREX")
-
-    # Match filenames with extensions
-    text = re.sub(
-        r"\b[\w]+_[\w._]*\.(md|yml|yaml|bib|tex|py|csv|pdf|png|svg|jpg)\b",
-        escape_filenames,
-        text,
-    )
-
-    # Also match numbered files like 00_CONFIG, 01_MAIN, etc.
-    text = re.sub(r"\b\d+_[A-Z_]+\b", escape_filenames, text)
-
-    # Escape percent signs in text (but not in comments that start with %)
-    # Use a regex to avoid escaping percent signs at the start of lines (which are comments)
-    text = re.sub(r"(?<!\\)(?<!^)%", r"\\%", text, flags=re.MULTILINE)
-
-    # Final step: replace all placeholders with properly escaped underscores
-    text = text.replace("XUNDERSCOREX", "\\_")
-
-    # Restore protected LaTeX commands after escaping
-    for placeholder, original_command in protected_latex_commands.items():
-        text = text.replace(placeholder, original_command)
-
-    # Handle special characters that can cause LaTeX issues
-    # Escape caret character outside of math mode and texttt blocks
-    def escape_carets_outside_protected_contexts(text):
-        """Escape carets but not inside LaTeX commands or math mode."""
-        # Combine all protection patterns into a single regex
-        combined_pattern = (
-            r"(\\texttt\{[^}]*\})|"  # \texttt{...}
-            r"(\\text\{[^}]*\})|"  # \text{...}
-            r"(\$[^$]*\$)|"  # Inline math $...$
-            r"(\$\$.*?\$\$)|"  # Display math $$...$$
-            r"(\\begin\{equation\}.*?\\end\{equation\})"  # equation environments
-        )
+# Replacements for characters that only need a fixed substitution
+_CHARACTER_ESCAPES = {
+    # Unicode arrows can cause LaTeX math mode issues
+    "→": "$\\rightarrow$",
+    "←": "$\\leftarrow$",
+    "↑": "$\\uparrow$",
+    "↓": "$\\downarrow$",
+}
 
-        # Split by the combined pattern - protected parts will be in groups
-        parts = re.split(combined_pattern, text, flags=re.DOTALL)
-        result = []
+# Parenthesized text ending in one of these is treated as a file path
+_FILE_PATH_SUFFIXES = (".md", ".bib", ".tex", ".py", ".csv")
 
-        for part in parts:
-            if part is None or part == "":
-                continue
+# Delimiters tried in order when a code block has to become \verb
+_VERB_DELIMITERS = ["|", "!", "@", "#", "$", "%", "^", "&", "*", "+", "=", "~"]
 
-            # Check if this part matches any of our protection patterns
-            is_protected = (
-                part.startswith("\\texttt{")
-                or part.startswith("\\text{")
-                or (part.startswith("$") and not part.startswith("$$"))
-                or part.startswith("$$")
-                or part.startswith("\\begin{equation}")
+
+def _escape_scan(
+    text: str,
+    start: int,
+    end: int,
+    pattern: re.Pattern[str],
+    escape_underscores: bool,
+    escape_carets: bool,
+) -> str:
+    """Escape ``text[start:end]`` in a single left-to-right scan.
+
+    Args:
+        text: Full text being escaped (lookbehinds see text before ``start``)
+        start: Start of the region to escape
+        end: End of the region to escape
+        pattern: Scan pattern, ``ESCAPE_SCAN_PATTERN`` or ``ESCAPE_CODE_SCAN_PATTERN``
+        escape_underscores: Whether every unescaped underscore is escaped, as
+            inside parenthesized file paths
+        escape_carets: Whether carets are escaped (not in code or math)
+
+    Returns:
+        Escaped region
+    """
+    result: list[str] = []
+    pos = search_pos = start
+    # Start of the next region where carets are protected, for the caret rule
+    caret_segment_end = -1
+
+    while True:
+        match = pattern.search(text, search_pos, end)
+        if match is None:
+            break
+
+        kind = match.lastgroup
+        match_start, match_end = match.span()
+        replacement: str | None
+
+        if kind == "protected":
+            replacement = match.group()
+        elif kind == "texttt":
+            close = _find_closing_brace(text, match_end, end)
+            if close == -1:
+                replacement = None
+            else:
+                replacement = _escape_texttt_block(text[match_end:close], escape_underscores)
+                match_end = close + 1
+        elif kind == "no_caret":
+            replacement = _escape_scan(
+                text, match_start, match_end, ESCAPE_CODE_SCAN_PATTERN, escape_underscores, escape_carets=False
             )
+        elif kind == "paren":
+            replacement = _escape_parenthesized(text, match, pattern, escape_underscores, escape_carets)
+        elif kind in ("filename", "numbered", "placeholder"):
+            # Include the preceding character so an escaped leading underscore is kept
+            preceding = text[match_start - 1] if match_start > 0 else ""
+            filename = (preceding + match.group()).replace("XUNDERSCOREX", "\\_")
+            replacement = UNESCAPED_UNDERSCORE_PATTERN.sub(r"\\_", filename)[len(preceding) :]
+        elif kind == "double_backslash":
+            replacement = "\\textbackslash{}"
+        elif kind == "percent":
+            # Percent signs at the start of a line are comments
+            at_line_start = match_start == 0 or text[match_start - 1] == "\n"
+            replacement = "%" if at_line_start else "\\%"
+        elif kind == "caret":
+            if not escape_carets:
+                replacement = "^"
+            else:
+                if caret_segment_end < match_start:
+                    next_protected = PROTECTED_CONTEXT_SPLIT_PATTERN.search(text, match_start)
+                    caret_segment_end = next_protected.start() if next_protected else len(text)
+                # Carets followed by a dollar sign in the same segment may be math
+                in_math = text.find("$", match_end, caret_segment_end) != -1
+                replacement = "^" if in_math else "\\textasciicircum{}"
+        elif kind == "underscore":
+            already_escaped = match_start > 0 and text[match_start - 1] == "\\"
+            replacement = "\\_" if escape_underscores and not already_escaped else "_"
+        else:
+            replacement = _CHARACTER_ESCAPES[match.group()]
 
-            if not is_protected:
-                # Only escape carets in unprotected parts
-                # Only escape isolated carets that aren't already in math mode
-                part = re.sub(r"(?<!\$)(?<!\\\$)\^(?!\^)(?![^$]*\$)", r"\\textasciicircum{}", part)
+        if replacement is None:
+            # Not a complete region, treat its first character as plain text
+            search_pos = match_start + 1
+            continue
 
-            result.append(part)
+        result.append(text[pos:match_start])
+        result.append(replacement)
+        pos = search_pos = match_end
 
-        return "".join(result)
+    result.append(text[pos:end])
+    return "".join(result)
 
-    text = escape_carets_outside_protected_contexts(text)
 
-    # Handle Unicode arrows that can cause LaTeX math mode issues
-    # These need to be converted to proper LaTeX math commands
-    text = text.replace("→", "$\\rightarrow$")
-    text = text.replace("←", "$\\leftarrow$")
-    text = text.replace("↑", "$\\uparrow$")
-    text = text.replace("↓", "$\\downarrow$")
+def _find_closing_brace(text: str, start: int, end: int) -> int:
+    """Find the brace closing a group whose content starts at ``start``, or -1."""
+    depth = 0
+    for index in range(start, end):
+        char = text[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            if depth == 0:
+                return index
+            depth -= 1
+    return -1
+
+
+def _escape_parenthesized(
+    text: str,
+    match: re.Match[str],
+    pattern: re.Pattern[str],
+    escape_underscores: bool,
+    escape_carets: bool,
+) -> str | None:
+    """Escape parenthesized text, escaping all underscores in file paths.
 
-    # Clean up double escaping that may have occurred during table processing
-    text = _cleanup_double_escaping_textformatters(text)
+    Returns:
+        Escaped text, or None if a code block starting inside the parentheses
+        extends beyond them and must be escaped as a whole instead
+    """
+    content_start, content_end = match.span("paren_content")
+    content = match.group("paren_content")
+
+    texttt_start = content.find("\\texttt{")
+    while texttt_start != -1:
+        texttt_content_start = content_start + texttt_start + len("\\texttt{")
+        close = _find_closing_brace(text, texttt_content_start, len(text))
+        if close >= content_end:
+            return None
+        texttt_start = content.find("\\texttt{", texttt_start + 1)
+
+    # Only treat content as a path if it looks like one outside protected commands
+    if "_" in content:
+        path_content = PROTECTED_LATEX_COMMAND_PATTERN.sub("\x00", content)
+        if ("." in path_content and "_" in path_content) or path_content.endswith(_FILE_PATH_SUFFIXES):
+            escape_underscores = True
+
+    escaped = _escape_scan(text, content_start, content_end, pattern, escape_underscores, escape_carets)
+    return f"({escaped})"
 
-    return text
 
+def _escape_texttt_block(content: str, escape_underscores: bool) -> str:
+    r"""Escape the content of a \texttt{} block as code.
 
-def _cleanup_double_escaping_textformatters(text: str) -> str:
-    r"""Clean up double-escaped backslashes in texttt environments.
+    Protected LaTeX commands inside the block are left untouched.
 
-    Fixes patterns like \\textbackslash{}textbackslash that break LaTeX parsing.
+    Args:
+        content: Content between the braces of the block
+        escape_underscores: Whether all unescaped underscores are escaped
+
+    Returns:
+        Escaped \texttt{} (or \verb) block
     """
-    import re
+    protected_commands: list[str] = []
 
-    # Fix the specific pattern of double-escaped backslashes
-    # Replace \\textbackslash{}textbackslash (with space) with just \\textbackslash{}
-    text = re.sub(r"\\textbackslash\{\}textbackslash\s+", r"\\textbackslash{}", text)
+    def protect_command(match: re.Match[str]) -> str:
+        protected_commands.append(match.group())
+        return f"XXPROTECTEDLATEXCOMMANDXX{len(protected_commands) - 1}XXPROTECTEDLATEXCOMMANDXX"
 
-    # Also try without requiring space after
-    text = re.sub(r"\\textbackslash\{\}textbackslash", r"\\textbackslash{}", text)
+    if "\\" in content:
+        content = PROTECTED_LATEX_COMMAND_PATTERN.sub(protect_command, content)
 
-    return text
+    block = _escape_texttt_content(content)
+    block = _escape_scan(block, 0, len(block), ESCAPE_CODE_SCAN_PATTERN, escape_underscores, escape_carets=False)
+
+    for index, command in enumerate(protected_commands):
+        block = block.replace(f"XXPROTECTEDLATEXCOMMANDXX{index}XXPROTECTEDLATEXCOMMANDXX", command)
+    return block
+
+
+def _escape_texttt_content(content: str) -> str:
+    r"""Escape backslashes and hashes in \texttt{} content.
+
+    Content containing listings environments is returned as \verb instead.
+
+    Args:
+        content: Content between the braces of the block
+
+    Returns:
+        Escaped \texttt{} (or \verb) block
+    """
+    # Special handling for listings environments - they interfere with texttt
+    if "\\begin{lstlisting}" in content or "\\end{lstlisting}" in content:
+        # Use verb instead of texttt with a delimiter that's not in the content
+        delimiter = next((d for d in _VERB_DELIMITERS if d not in content), "|")
+        return f"\\verb{delimiter}{content}{delimiter}"
+    # Special handling for detokenize commands - don't escape the backslashes
+    elif "\\detokenize{" in content:
+        # This content already has detokenize, just return it wrapped in texttt
+        return f"\\texttt{{{content}}}"
+    # Special handling for LaTeX command protected content - don't escape backslashes
+    elif "LATEXCMD_PROTECTED_START{" in content and "}LATEXCMD_PROTECTED_END" in content:
+        # Extract the protected content and return it as-is
+        start_marker = "LATEXCMD_PROTECTED_START{"
+        end_marker = "}LATEXCMD_PROTECTED_END"
+        start_idx = content.find(start_marker)
+        end_idx = content.find(end_marker)
+        protected_content = content[start_idx + len(start_marker) : end_idx]
+        return f"\\texttt{{{protected_content}}}"
+    # For other backslashes, use textbackslash
+    # Skip processing if text already contains any form of textbackslash (already escaped)
+    elif "textbackslash" not in content:
+        content = content.replace("\\", "\\textbackslash{}")
+
+    # Escape # characters only if not already escaped
+    if "\\#" not in content:
+        content = content.replace("#", "\\#")
+    return f"\\texttt{{{content}}}"
 
 
 def restore_protected_seqsplit(text: LatexContent) -> LatexContent:
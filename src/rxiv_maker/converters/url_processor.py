@@ -6,6 +6,14 @@ including proper escaping of special characters in URLs.
 
 import re
 
+from .patterns import (
+    BARE_URL_PATTERN,
+    EMAIL_ADDRESS_PATTERN,
+    LATEX_HREF_COMMAND_PATTERN,
+    LATEX_URL_COMMAND_PATTERN,
+    MARKDOWN_LINK_PATTERN,
+    URL_FORMAT_PATTERN,
+)
 from .types import LatexContent, MarkdownContent
 
 
@@ -35,7 +43,7 @@ def convert_links_to_latex(text: MarkdownContent) -> LatexContent:
             return f"\\href{{{url_escaped}}}{{{link_text}}}"
 
     # Convert [text](url) format
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", process_link, text)
+    text = MARKDOWN_LINK_PATTERN.sub(process_link, text)
 
     # Handle bare URLs (convert standalone URLs to \url{})
     text = _convert_bare_urls(text)
@@ -74,9 +82,6 @@ def _convert_bare_urls(text: MarkdownContent) -> LatexContent:
         return f"\\url{{{url_escaped}}}"
 
     # First pass: protect existing LaTeX commands by temporarily replacing them
-    latex_url_pattern = r"\\url\{[^}]+\}"
-    latex_href_pattern = r"\\href\{[^}]+\}\{[^}]+\}"
-
     # Store existing LaTeX commands to avoid double-processing
     protected_commands: list[str] = []
 
@@ -85,11 +90,11 @@ def _convert_bare_urls(text: MarkdownContent) -> LatexContent:
         return f"__PROTECTED_LATEX_CMD_{len(protected_commands) - 1}__"
 
     # Protect existing LaTeX URL commands
-    text = re.sub(latex_url_pattern, protect_latex_command, text)
-    text = re.sub(latex_href_pattern, protect_latex_command, text)
+    text = LATEX_URL_COMMAND_PATTERN.sub(protect_latex_command, text)
+    text = LATEX_HREF_COMMAND_PATTERN.sub(protect_latex_command, text)
 
     # Now convert bare URLs
-    text = re.sub(r"https?://[^\s\}>\]]+", process_bare_url, text)
+    text = BARE_URL_PATTERN.sub(process_bare_url, text)
 
     # Restore protected LaTeX commands
     for i, cmd in enumerate(protected_commands):
@@ -107,9 +112,7 @@ def validate_url_format(url: str) -> bool:
     Returns:
         True if URL format is valid, False otherwise
     """
-    # Basic URL validation pattern
-    url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(url_pattern, url, re.IGNORECASE))
+    return bool(URL_FORMAT_PATTERN.match(url))
 
 
 def extract_urls_from_text(text: MarkdownContent) -> list[tuple[str, str]]:
@@ -124,12 +127,12 @@ def extract_urls_from_text(text: MarkdownContent) -> list[tuple[str, str]]:
     urls: list[tuple[str, str]] = []
 
     # Find markdown-style links [text](url)
-    markdown_links = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", text)
+    markdown_links = MARKDOWN_LINK_PATTERN.findall(text)
     for link_text, url in markdown_links:
         urls.append((link_text.strip(), url.strip()))
 
     # Find bare URLs
-    bare_urls = re.findall(r"https?://[^\s\}>\]]+", text)
+    bare_urls = BARE_URL_PATTERN.findall(text)
     for url in bare_urls:
         # For bare URLs, use the URL as both text and link
         urls.append((url, url))
@@ -160,7 +163,7 @@ def normalize_urls(text: MarkdownContent) -> MarkdownContent:
         return f"[{link_text}]({url})"
 
     # Normalize markdown links
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", normalize_url, text)
+    text = MARKDOWN_LINK_PATTERN.sub(normalize_url, text)
 
     return text
 
@@ -180,9 +183,6 @@ def convert_email_links_to_latex(text: MarkdownContent) -> LatexContent:
         email = match.group(0)
         return f"\\href{{mailto:{email}}}{{{email}}}"
 
-    # Email pattern
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-
     # Only convert emails not already in links
     # First protect existing links
     protected_links: list[str] = []
@@ -192,11 +192,11 @@ def convert_email_links_to_latex(text: MarkdownContent) -> LatexContent:
         return f"__PROTECTED_LINK_{len(protected_links) - 1}__"
 
     # Protect markdown links and LaTeX commands
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", protect_link, text)
-    text = re.sub(r"\\href\{[^}]+\}\{[^}]+\}", protect_link, text)
+    text = MARKDOWN_LINK_PATTERN.sub(protect_link, text)
+    text = LATEX_HREF_COMMAND_PATTERN.sub(protect_link, text)
 
     # Convert unprotected emails
-    text = re.sub(email_pattern, process_email, text)
+    text = EMAIL_ADDRESS_PATTERN.sub(process_email, text)
 
     # Restore protected links
     for i, link in enumerate(protected_links):
@@ -607,7 +607,7 @@ class ContentProcessor(RecoveryEnhancedMixin):
             return placeholder
 
         # Protect all LaTeX table environments
-        for env in ["table", "sidewaystable", "stable"]:
+        for env in ["table", "sidewaystable", "stable", "rxivlongtable", "longtable"]:
             pattern = rf"\\begin\{{{env}\*?\}}.*?\\end\{{{env}\*?\}}"
             table_processed_content = re.sub(pattern, protect_latex_table, table_processed_content, flags=re.DOTALL)
 
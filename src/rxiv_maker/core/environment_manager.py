@@ -25,6 +25,13 @@ class EnvironmentManager:
     DOCKER_IMAGE = "DOCKER_IMAGE"
     DOCKER_AVAILABLE = "DOCKER_AVAILABLE"
     MERMAID_CLI_OPTIONS = "MERMAID_CLI_OPTIONS"
+    RXIV_CONVERTER_ENGINE = "RXIV_CONVERTER_ENGINE"
+    RXIV_PARALLEL_CONVERSION = "RXIV_PARALLEL_CONVERSION"
+    RXIV_PYTHON_CACHE = "RXIV_PYTHON_CACHE"
+    RXIV_PYTHON_WORKER = "RXIV_PYTHON_WORKER"
+    RXIV_NO_STAGE_CACHE = "RXIV_NO_STAGE_CACHE"
+    RXIV_LATEX_FORMAT = "RXIV_LATEX_FORMAT"
+    RXIV_FIGURE_WORKER = "RXIV_FIGURE_WORKER"
     PYTHONPATH = "PYTHONPATH"
 
     # Docker/Container related
@@ -195,6 +202,75 @@ class EnvironmentManager:
         """
         os.environ[cls.MERMAID_CLI_OPTIONS] = options
 
+    @classmethod
+    def get_converter_engine(cls) -> str:
+        """Get markdown conversion engine with default fallback.
+
+        Returns:
+            Conversion engine: "legacy" or "spans"
+        """
+        engine = os.getenv(cls.RXIV_CONVERTER_ENGINE, "legacy").lower().strip()
+        if engine in ("legacy", "spans"):
+            return engine
+        return "legacy"
+
+    @classmethod
+    def is_parallel_conversion(cls) -> bool:
+        """Check if main and supplementary documents are converted in parallel.
+
+        Returns:
+            True if parallel conversion is enabled
+        """
+        return cls._get_boolean(cls.RXIV_PARALLEL_CONVERSION, default=False)
+
+    @classmethod
+    def is_python_cache_enabled(cls) -> bool:
+        """Check if results of executable Python commands are cached across builds.
+
+        The cache key only covers the code and its input context, so it is only
+        safe for code that does not read files, the clock or random numbers.
+
+        Returns:
+            True if Python command results should be reused from the cache
+        """
+        return cls._get_boolean(cls.RXIV_PYTHON_CACHE, default=False)
+
+    @classmethod
+    def is_python_worker_enabled(cls) -> bool:
+        """Check if Python commands run in one persistent worker process.
+
+        Returns:
+            True if the persistent Python worker is enabled
+        """
+        return cls._get_boolean(cls.RXIV_PYTHON_WORKER, default=False)
+
+    @classmethod
+    def is_stage_cache_disabled(cls) -> bool:
+        """Check if build stages run even when their inputs are unchanged.
+
+        Returns:
+            True if every build stage should run on every build
+        """
+        return cls._get_boolean(cls.RXIV_NO_STAGE_CACHE, default=False)
+
+    @classmethod
+    def is_latex_format_enabled(cls) -> bool:
+        """Check if LaTeX compiles with a cached format that has the preamble preloaded.
+
+        Returns:
+            True if preamble formats are enabled
+        """
+        return cls._get_boolean(cls.RXIV_LATEX_FORMAT, default=False)
+
+    @classmethod
+    def is_figure_worker_enabled(cls) -> bool:
+        """Check if Python figures run in children forked from a warm worker.
+
+        Returns:
+            True if the warm figure worker is enabled
+        """
+        return cls._get_boolean(cls.RXIV_FIGURE_WORKER, default=False)
+
     @classmethod
     def is_google_colab(cls) -> bool:
         """Detect if running in Google Colab environment.
@@ -273,6 +349,13 @@ class EnvironmentManager:
             cls.DOCKER_IMAGE,
             cls.DOCKER_AVAILABLE,
             cls.MERMAID_CLI_OPTIONS,
+            cls.RXIV_CONVERTER_ENGINE,
+            cls.RXIV_PARALLEL_CONVERSION,
+            cls.RXIV_PYTHON_CACHE,
+            cls.RXIV_PYTHON_WORKER,
+            cls.RXIV_NO_STAGE_CACHE,
+            cls.RXIV_LATEX_FORMAT,
+            cls.RXIV_FIGURE_WORKER,
         ]
 
         return {var: os.getenv(var, "") for var in rxiv_vars if os.getenv(var)}
@@ -311,6 +394,13 @@ class EnvironmentManager:
             cls.DOCKER_IMAGE,
             cls.DOCKER_AVAILABLE,
             cls.MERMAID_CLI_OPTIONS,
+            cls.RXIV_CONVERTER_ENGINE,
+            cls.RXIV_PARALLEL_CONVERSION,
+            cls.RXIV_PYTHON_CACHE,
+            cls.RXIV_PYTHON_WORKER,
+            cls.RXIV_NO_STAGE_CACHE,
+            cls.RXIV_LATEX_FORMAT,
+            cls.RXIV_FIGURE_WORKER,
         ]
 
         for var in rxiv_vars:
@@ -285,6 +285,34 @@ class ExecutionManager(RecoveryEnhancedMixin, ABC):
 
         return ordered_steps
 
+    def get_critical_path(self) -> List[ExecutionStep]:
+        """Find the chain of dependent steps that took the longest to run.
+
+        Step durations are summed along every dependency chain; the critical
+        path is the chain with the largest total, so it bounds how fast the
+        pipeline can finish however many steps run concurrently.
+
+        Returns:
+            Steps on the critical path, in execution order
+
+        Raises:
+            ValueError: If circular dependencies detected
+        """
+        finish_times: Dict[str, float] = {}
+        predecessors: Dict[str, Optional[str]] = {}
+
+        for step in self._resolve_dependencies():
+            slowest = max(step.dependencies, key=lambda dep: finish_times[dep], default=None)
+            predecessors[step.id] = slowest
+            finish_times[step.id] = step.duration + (finish_times[slowest] if slowest else 0.0)
+
+        path: List[ExecutionStep] = []
+        step_id = max(finish_times, key=lambda s: finish_times[s], default=None)
+        while step_id is not None:
+            path.append(self.step_index[step_id])
+            step_id = predecessors[step_id]
+        return path[::-1]
+
     def _execute_step(self, step: ExecutionStep, context: Dict[str, Any]) -> StepResult:
         """Execute a single step.
 
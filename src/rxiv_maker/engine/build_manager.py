@@ -1,11 +1,24 @@
 """Build manager for rxiv-maker PDF generation pipeline."""
 
+import asyncio
+import hashlib
 import os
+import re
 import subprocess
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
 from ..core.environment_manager import EnvironmentManager
+from ..core.execution_manager import (
+    AsyncLocalExecutionManager,
+    ExecutionContext,
+    ExecutionMode,
+    StepResult,
+    StepStatus,
+)
 from ..core.global_container_manager import get_global_container_manager
 from ..core.logging_config import get_logger, set_log_directory
 from ..core.path_manager import PathManager
@@ -13,9 +26,36 @@ from ..core.session_optimizer import get_optimized_session_key
 from ..utils.figure_checksum import get_figure_checksum_manager
 from ..utils.operation_ids import create_operation
 from ..utils.performance import get_performance_tracker
+from ..utils.preamble_format import get_preamble_format, invalidate_preamble_format
 
 logger = get_logger()
 
+STYLE_FILE_PATTERNS = ["*.cls", "*.bst", "*.sty"]
+
+# Files in the output directory that pdflatex and bibtex read
+LATEX_INPUT_SUFFIXES = {".tex", ".cls", ".bst", ".sty", ".bib"}
+
+# Directories never fingerprinted as stage inputs, besides hidden ones
+EXCLUDED_INPUT_DIRS = {"__pycache__", "node_modules", "site-packages", "venv", "env"}
+
+# Stages reading more files than this always run instead of hashing them all
+MAX_STAGE_INPUT_FILES = 5000
+
+# Quoted strings in manuscript code, which may name files it reads
+QUOTED_PATH_PATTERN = re.compile(r"""["']([^"'\n]+)["']""")
+
+# Files pdflatex writes and reads back on the next pass
+LATEX_AUXILIARY_SUFFIXES = (".aux", ".toc", ".out", ".lof", ".lot")
+
+# Log messages asking for another pdflatex pass
+LATEX_RERUN_PATTERN = re.compile(r"Rerun to get|Label\(s\) may have changed|Rerun LaTeX")
+
+# Same limit as latexmk, for documents whose references never settle
+MAX_LATEX_PASSES = 5
+
+# Lines of pdflatex output kept for reporting, instead of the whole output
+LATEX_OUTPUT_TAIL_LINES = 200
+
 
 # Import FigureGenerator dynamically to avoid import issues
 def get_figure_generator():
@@ -30,6 +70,29 @@ def get_figure_generator():
         return FigureGenerator
 
 
+class _ConvertedSections:
+    """Section converter that reuses the LaTeX a section cache produced earlier."""
+
+    def __init__(self, section_cache):
+        """Initialize the converter.
+
+        Args:
+            section_cache: SectionCache used by LaTeX generation, or None
+        """
+        self.section_cache = section_cache
+
+    def convert(self, content: str, is_supplementary: bool = False) -> str:
+        """Get the LaTeX of a section, converting it only if it was not converted before."""
+        from ..converters.md2tex import convert_markdown_to_latex
+
+        if self.section_cache is None:
+            return convert_markdown_to_latex(content, is_supplementary)
+        latex = self.section_cache.get_converted(content, is_supplementary)
+        if latex is None:
+            latex = self.section_cache.convert(content, is_supplementary)
+        return latex
+
+
 class BuildManager:
     """Manage the complete build process."""
 
@@ -107,9 +170,15 @@ class BuildManager:
         self.warnings_log = self.path_manager.get_output_file_path("build_warnings.log")
         self.bibtex_log = self.path_manager.get_output_file_path("bibtex_warnings.log")
 
-        # Configure centralized logging to write to output directory
+        # Configure centralized logging to write to output directory; the log
+        # file is per process, so concurrent builds share the last one set
         set_log_directory(self.output_dir)
 
+        # Fingerprints of build stages, set up when a full build starts
+        self._stage_fingerprints = None
+        # Section cache of the last LaTeX generation, reused by the word count
+        self._section_cache = None
+
     def log(self, message: str, level: str = "INFO"):
         """Log a message with appropriate formatting."""
         if level == "INFO":
@@ -279,54 +348,36 @@ class BuildManager:
             # Import and run validation directly instead of subprocess
             from .validate import validate_manuscript
 
-            # Set up environment and working directory using PathManager
-            original_cwd = os.getcwd()
-            manuscript_abs_path = str(self.path_manager.manuscript_path)
-
-            try:
-                # Change to manuscript directory for relative path resolution
-                os.chdir(self.path_manager.manuscript_path.parent)
-
-                # Set environment variables using EnvironmentManager
-                original_env = EnvironmentManager.get_manuscript_path()
-                EnvironmentManager.set_manuscript_path(self.path_manager.manuscript_name)
+            # Run validation with the absolute manuscript path, so it does not
+            # depend on the working directory or environment of the process
+            # DOI validation setting will be read from config automatically
+            result = validate_manuscript(
+                manuscript_path=str(self.path_manager.manuscript_path),
+                verbose=self.verbose,
+                include_info=False,
+                check_latex=True,
+                enable_doi_validation=None,  # Read from config
+                detailed=True,
+            )
 
-                try:
-                    # Run validation with proper arguments
-                    # DOI validation setting will be read from config automatically
-                    result = validate_manuscript(
-                        manuscript_path=manuscript_abs_path,
-                        verbose=self.verbose,
-                        include_info=False,
-                        check_latex=True,
-                        enable_doi_validation=None,  # Read from config
-                        detailed=True,
-                    )
-
-                    if result:
-                        self.log("Validation completed successfully")
-                        return True
-                    else:
-                        self.log("Validation failed", "ERROR")
-                        return False
-
-                finally:
-                    # Restore environment variable using EnvironmentManager
-                    if original_env is not None:
-                        EnvironmentManager.set_manuscript_path(original_env)
-                    else:
-                        os.environ.pop("MANUSCRIPT_PATH", None)
-
-            finally:
-                # Always restore original working directory
-                os.chdir(original_cwd)
+            if result:
+                self.log("Validation completed successfully")
+                return True
+            else:
+                self.log("Validation failed", "ERROR")
+                return False
 
         except Exception as e:
             self.log(f"Validation error: {e}", "ERROR")
             return False
 
-    def generate_figures(self) -> bool:
-        """Generate figures from source files."""
+    def generate_figures(self, need_update: bool | None = None) -> bool:
+        """Generate figures from source files.
+
+        Args:
+            need_update: Whether figures are out of date, if already checked
+                (checked here when None)
+        """
         self.log("Checking figure generation...", "STEP")
 
         if not self.figures_dir.exists():
@@ -334,7 +385,9 @@ class BuildManager:
             return True
 
         # Check if we need to generate figures
-        need_figures = self.force_figures or self._check_figures_need_update()
+        if need_update is None:
+            need_update = self._check_figures_need_update()
+        need_figures = self.force_figures or need_update
 
         if not need_figures:
             self.log("Figures are up to date")
@@ -480,10 +533,9 @@ class BuildManager:
             return True
 
         # Copy style files
-        style_extensions = ["*.cls", "*.bst", "*.sty"]
         copied_files = []
 
-        for pattern in style_extensions:
+        for pattern in STYLE_FILE_PATTERNS:
             for file in self.style_dir.glob(pattern):
                 try:
                     dest = self.output_dir / file.name
@@ -556,6 +608,8 @@ class BuildManager:
 
         try:
             # Import and call the generate_preprint function directly
+            from ..converters.python_executor import python_execution_scope
+            from ..converters.table_processor import get_cell_format_cache_stats
             from ..processors.yaml_processor import extract_yaml_metadata
             from .generate_preprint import generate_preprint
 
@@ -577,48 +631,242 @@ class BuildManager:
             # Inject Rxiv-Maker citation if requested
             from ..utils import inject_rxiv_citation
 
-            inject_rxiv_citation(yaml_metadata)
+            inject_rxiv_citation(yaml_metadata, self.path_manager.manuscript_path)
 
-            # Set environment variables using EnvironmentManager
-            original_env = EnvironmentManager.get_manuscript_path()
-            EnvironmentManager.set_manuscript_path(self.path_manager.manuscript_name)
-
-            # Change to the parent directory so the relative path works
-            original_cwd = os.getcwd()
-            # Use PathManager for directory navigation
+            # Manuscript code runs in the manuscript's parent directory, with an
+            # execution context of its own so concurrent builds do not share state
             manuscript_path_obj = self.path_manager.manuscript_path
             if manuscript_path_obj.is_dir():
-                # If manuscript_path is a directory, go to its parent
-                target_dir = manuscript_path_obj.parent
+                code_dir = manuscript_path_obj.parent
             else:
-                # If manuscript_path is a file, go to its directory's parent
-                target_dir = manuscript_path_obj.parent.parent
-            os.chdir(target_dir)
+                code_dir = manuscript_path_obj.parent.parent
+
+            # Reuse the LaTeX of sections that did not change since the last build
+            section_cache = self._get_section_cache()
+            self._section_cache = section_cache
+
+            with python_execution_scope(working_dir=code_dir):
+                # Generate the preprint with explicit manuscript path and name
+                result = generate_preprint(
+                    str(self.output_dir),
+                    yaml_metadata,
+                    self.manuscript_path,
+                    section_cache=section_cache,
+                    parallel=EnvironmentManager.is_parallel_conversion(),
+                    manuscript_name=self.manuscript_name,
+                )
 
-            try:
-                # Generate the preprint with explicit manuscript path
-                result = generate_preprint(str(self.output_dir), yaml_metadata, self.manuscript_path)
+            if section_cache is not None:
+                section_cache.save()
+                stats = section_cache.get_cache_stats()
+                logger.debug(f"Section cache: {stats['hits']} reused, {stats['misses']} converted")
+
+            # Cell memo statistics are per process, so they are only
+            # available here when the documents were converted in-process
+            cell_stats = get_cell_format_cache_stats()
+            if cell_stats["misses"]:
+                logger.debug(
+                    f"Table cell cache: {cell_stats['hit_rate']:.1%} hit rate "
+                    f"({cell_stats['hits']} hits, {cell_stats['misses']} misses)"
+                )
 
-                if result:
-                    self.log("LaTeX files generated successfully")
-                    return True
-                else:
-                    self.log("LaTeX generation failed", "ERROR")
-                    return False
-            finally:
-                # Restore environment and working directory using EnvironmentManager
-                os.chdir(original_cwd)
-                if original_env is not None:
-                    EnvironmentManager.set_manuscript_path(original_env)
-                else:
-                    # Clear the environment variable
-                    if EnvironmentManager.MANUSCRIPT_PATH in os.environ:
-                        del os.environ[EnvironmentManager.MANUSCRIPT_PATH]
+            if result:
+                self.log("LaTeX files generated successfully")
+                return True
+            else:
+                self.log("LaTeX generation failed", "ERROR")
+                return False
 
         except Exception as e:
             self.log(f"Error generating LaTeX files: {e}", "ERROR")
             return False
 
+    def _get_stage_fingerprints(self):
+        """Get the build stage fingerprint database, or None if stages always run."""
+        if EnvironmentManager.is_stage_cache_disabled():
+            return None
+
+        try:
+            from ..utils.stage_fingerprints import get_stage_fingerprints
+
+            return get_stage_fingerprints(self.manuscript_path)
+        except Exception as e:
+            logger.debug(f"Stage fingerprints unavailable, running every stage: {e}")
+            return None
+
+    @staticmethod
+    def _list_files(directory: Path, exclude: tuple[Path, ...] = (), limit: int | None = None) -> list[Path]:
+        """List files below a directory, skipping hidden, cache and excluded directories.
+
+        Args:
+            directory: Directory to list
+            exclude: Directories to skip
+            limit: Stop listing once more than this many files were found
+
+        Returns:
+            Files in sorted walk order, at most ``limit + 1`` if a limit is given
+        """
+        files: list[Path] = []
+        for root, dirnames, filenames in os.walk(directory):
+            root_path = Path(root)
+            dirnames[:] = sorted(
+                name
+                for name in dirnames
+                if not name.startswith(".") and name not in EXCLUDED_INPUT_DIRS and root_path / name not in exclude
+            )
+            files.extend(root_path / name for name in sorted(filenames) if not name.startswith("."))
+            if limit is not None and len(files) > limit:
+                break
+        return files
+
+    def _get_code_input_files(self, code_dir: Path, markdown_files: list[Path]) -> list[Path]:
+        """Find the files outside the manuscript directory that manuscript code names.
+
+        Python commands run in ``code_dir``. Rather than hashing everything
+        there, only files and directories named by quoted strings in the
+        manuscript are fingerprinted; files the code reads through computed
+        paths are not noticed.
+
+        Args:
+            code_dir: Directory Python commands run in
+            markdown_files: Manuscript files containing the commands
+
+        Returns:
+            Named files, and the files below named directories
+        """
+        code_root = code_dir.resolve()
+        manuscript_root = self.manuscript_dir.resolve()
+        files: list[Path] = []
+        for markdown_file in markdown_files:
+            content = markdown_file.read_text(encoding="utf-8", errors="replace")
+            for match in QUOTED_PATH_PATTERN.finditer(content):
+                try:
+                    candidate = (code_root / match.group(1)).resolve()
+                    relative = candidate.relative_to(code_root)
+                except (OSError, ValueError):
+                    continue
+                # The manuscript directory is fingerprinted as a whole already
+                if not relative.parts or candidate.is_relative_to(manuscript_root):
+                    continue
+                if candidate.is_file():
+                    files.append(candidate)
+                elif candidate.is_dir():
+                    files.extend(self._list_files(candidate, exclude=(self.output_dir,), limit=MAX_STAGE_INPUT_FILES))
+        return sorted(set(files))
+
+    def _get_stage_files(self, stage: str):
+        """Get the inputs, outputs and parameters of a build stage.
+
+        Args:
+            stage: Build step identifier
+
+        Returns:
+            Tuple of (input files, output files, parameters), or None if the
+            stage is not tracked and always runs
+        """
+        if stage == "copy_style_files":
+            if self.style_dir is None or not self.style_dir.exists():
+                return None
+            inputs = sorted(file for pattern in STYLE_FILE_PATTERNS for file in self.style_dir.glob(pattern))
+            return inputs, [self.output_dir / file.name for file in inputs], {}
+
+        if stage == "copy_references":
+            return [self.references_bib], [self.output_dir / "03_REFERENCES.bib"], {}
+
+        if stage == "copy_figures":
+            if not self.figures_dir.exists():
+                return None
+            # Figures are copied two levels deep: files and figure subdirectories
+            inputs = [
+                file
+                for file in self._list_files(self.figures_dir)
+                if len(file.relative_to(self.figures_dir).parts) <= 2
+            ]
+            figures_output = self.output_dir / "Figures"
+            return inputs, [figures_output / file.relative_to(self.figures_dir) for file in inputs], {}
+
+        if stage == "generate_tex":
+            from ..converters.patterns import EXECUTABLE_COMMAND_PATTERN
+            from ..processors.template_processor import get_template_path
+            from ..utils.section_cache import get_converter_version
+
+            # Manuscript code may read any file next to the manuscript
+            inputs = self._list_files(self.manuscript_dir, exclude=(self.output_dir,), limit=MAX_STAGE_INPUT_FILES)
+            code_files = [
+                file
+                for file in inputs
+                if file.suffix == ".md"
+                and EXECUTABLE_COMMAND_PATTERN.search(file.read_text(encoding="utf-8", errors="replace"))
+            ]
+            if code_files:
+                # Python commands run again on every build unless their results are cached
+                if not EnvironmentManager.is_python_cache_enabled():
+                    return None
+                # They run in the manuscript's parent directory
+                inputs.extend(self._get_code_input_files(self.manuscript_dir.parent, code_files))
+            if len(inputs) > MAX_STAGE_INPUT_FILES:
+                logger.debug(f"LaTeX generation reads more than {MAX_STAGE_INPUT_FILES} files, not fingerprinting it")
+                return None
+            inputs.append(Path(get_template_path()))
+            parameters = {
+                "converter_version": get_converter_version(),
+                "converter_engine": EnvironmentManager.get_converter_engine(),
+                "track_changes_tag": self.track_changes_tag or "",
+            }
+            return inputs, [self.output_tex, self.output_dir / "Supplementary.tex"], parameters
+
+        if stage == "compile_pdf":
+            inputs = [
+                file
+                for file in sorted(self.output_dir.iterdir())
+                if file.is_file() and file.suffix in LATEX_INPUT_SUFFIXES
+            ]
+            inputs.extend(self._list_files(self.output_dir / "Figures"))
+            return inputs, [self.output_pdf], {"engine": self.engine}
+
+        return None
+
+    def _run_stage(self, stage: str, description: str, function) -> bool:
+        """Run a build stage unless its inputs are unchanged since it last succeeded.
+
+        Args:
+            stage: Build step identifier
+            description: Description of the stage for log messages
+            function: Callable running the stage and returning success
+
+        Returns:
+            True if the stage succeeded or was up to date
+        """
+        fingerprints = self._stage_fingerprints
+        stage_files = self._get_stage_files(stage) if fingerprints is not None else None
+        if stage_files is None:
+            return function()
+
+        inputs, outputs, parameters = stage_files
+        # Fingerprints are per manuscript, which may be built into several output directories
+        parameters["output_dir"] = str(self.output_dir)
+        input_hashes = fingerprints.fingerprint(inputs)
+        if fingerprints.is_up_to_date(stage, input_hashes, parameters):
+            self.log(f"Up to date, skipping {description}")
+            return True
+
+        if not function():
+            fingerprints.invalidate(stage)
+            return False
+
+        fingerprints.record(stage, input_hashes, outputs, parameters)
+        return True
+
+    def _get_section_cache(self):
+        """Get the section conversion cache, or None if it cannot be used."""
+        try:
+            from ..utils.section_cache import get_section_cache
+
+            return get_section_cache(self.manuscript_path)
+        except Exception as e:
+            logger.debug(f"Section cache unavailable, converting all sections: {e}")
+            return None
+
     def compile_pdf(self) -> bool:
         """Compile LaTeX to PDF."""
         self.log("Compiling LaTeX to PDF...", "STEP")
@@ -631,14 +879,33 @@ class BuildManager:
     def _compile_pdf_container(self) -> bool:
         """Compile LaTeX to PDF using container engine."""
         try:
-            tex_file = self.output_dir / f"{self.manuscript_name}.tex"
-
-            # Execute multi-pass LaTeX compilation (3 passes for bibliography and cross-references)
-            if self.container_engine is None:
+            container_engine = self.container_engine
+            if container_engine is None:
                 raise RuntimeError("Container engine not initialized")
-            results = self.container_engine.run_latex_compilation(
-                tex_file=tex_file, working_dir=self.output_dir, passes=3
+
+            # The output directory is mounted, so pass decisions read its files from the host
+            container_output_dir = self.path_manager.to_container_path(self.output_dir)
+            session_key = get_optimized_session_key("latex_compilation")
+
+            def run_in_container(command, timeout):
+                return container_engine.run_command(
+                    command=command, working_dir=container_output_dir, session_key=session_key, timeout=timeout
+                )
+
+            def run_pdflatex(output_parser):
+                result = run_in_container(
+                    ["pdflatex", "-interaction=nonstopmode", f"{self.manuscript_name}.tex"], timeout=300
+                )
+                for line in (result.stdout or "").splitlines():
+                    output_parser.feed(line)
+                return result
+
+            result = self._run_latex_passes(
+                run_pdflatex=run_pdflatex,
+                run_bibtex=lambda: run_in_container(["bibtex", self.manuscript_name], timeout=60),
             )
+            if result is None:
+                return False
 
             # Check if PDF was generated successfully
             pdf_file = self.output_dir / f"{self.manuscript_name}.pdf"
@@ -647,9 +914,8 @@ class BuildManager:
                 return True
             else:
                 self.log("PDF compilation failed", "ERROR")
-                if self.verbose and results:
-                    for i, result in enumerate(results):
-                        self.log(f"Pass {i + 1} output: {result.stdout}", "WARNING")
+                if self.verbose:
+                    self.log(f"Last pass output: {result.stdout}", "WARNING")
                 return False
 
         except Exception as e:
@@ -658,115 +924,243 @@ class BuildManager:
 
     def _compile_pdf_local(self) -> bool:
         """Compile LaTeX to PDF using local installation."""
-        # Change to output directory for compilation
-        original_cwd = os.getcwd()
-
         try:
-            os.chdir(self.output_dir)
-
-            # Run pdflatex multiple times for proper cross-references
-            tex_file = f"{self.manuscript_name}.tex"
-
-            # First pass
-            subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", tex_file],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
-
-            # Run bibtex if references exist (check in current working directory)
-            # which is output_dir
-            output_references = Path("03_REFERENCES.bib")
-            if output_references.exists():
-                self.log("Running BibTeX to process bibliography...")
-                bibtex_result = subprocess.run(
-                    ["bibtex", self.manuscript_name],
+            # The tools run in the output directory without changing this
+            # process's working directory, so other builds can run at the same time.
+            def run_in_output_dir(command):
+                return subprocess.run(
+                    command,
+                    cwd=self.output_dir,
                     capture_output=True,
                     text=True,
                     encoding="utf-8",
                     errors="replace",
                 )
 
-                # Log BibTeX warnings and errors only
-                if bibtex_result.stderr:
-                    self.log(f"BibTeX errors: {bibtex_result.stderr}", "WARNING")
-                elif "warning" in bibtex_result.stdout.lower():
-                    # Count warnings but don't spam the output
-                    warning_count = bibtex_result.stdout.lower().count("warning")
-                    self.log(f"BibTeX completed with {warning_count} warning(s)", "WARNING")
-
-                # Check for serious bibtex errors that would prevent citation resolution
-                if bibtex_result.returncode != 0:
-                    self.log(
-                        f"BibTeX returned error code {bibtex_result.returncode}",
-                        "WARNING",
-                    )
-                    # Check if .bbl file was still created despite errors
-                    bbl_file = Path(f"{self.manuscript_name}.bbl")
-                    if not bbl_file.exists():
-                        self.log(
-                            "BibTeX failed to create .bbl file - citations will appear as ?",
-                            "ERROR",
-                        )
-                        return False
-                else:
-                    self.log("BibTeX completed successfully")
-                    # Log BibTeX warnings to file
-                    try:
-                        self._log_bibtex_warnings()
-                    except Exception as e:
-                        self.log(f"Debug: BibTeX warning logging failed: {e}", "WARNING")
-
-            # Second pass
-            subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", tex_file],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
+            # A format with the preamble preloaded saves loading the class and
+            # packages on every pass; without it the passes start from scratch
+            tex_file = self.output_dir / f"{self.manuscript_name}.tex"
+            formats: list[str | None] = [None]
+            if EnvironmentManager.is_latex_format_enabled():
+                preamble_format = get_preamble_format(tex_file)
+                if preamble_format is not None:
+                    formats.insert(0, preamble_format)
 
-            # Third pass
-            result3 = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", tex_file],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
+            pdf_file = self.output_dir / f"{self.manuscript_name}.pdf"
+            previous_pdf = pdf_file.stat().st_mtime_ns if pdf_file.exists() else None
+            for latex_format in formats:
+                format_args: list[str] = [f"-fmt={latex_format}"] if latex_format else []
+                result = self._run_latex_passes(
+                    run_pdflatex=lambda output_parser, format_args=format_args: self._stream_latex(
+                        ["pdflatex", "-interaction=nonstopmode", *format_args, f"{self.manuscript_name}.tex"],
+                        output_parser,
+                    ),
+                    run_bibtex=lambda: run_in_output_dir(["bibtex", self.manuscript_name]),
+                )
+                # A PDF left by an earlier build does not count as output of this one
+                if latex_format is None or (
+                    result is not None and pdf_file.exists() and pdf_file.stat().st_mtime_ns != previous_pdf
+                ):
+                    break
+                # The format itself may be what failed, so it is dumped again next time
+                self.log("Compilation with the preamble format failed, retrying without it", "WARNING")
+                invalidate_preamble_format(tex_file, latex_format)
+
+            if result is None:
+                return False
 
             # Check if compilation was successful
             # (PDF exists is more reliable than return code)
-            # Check for PDF in current directory (we're in output_dir)
-            pdf_file = Path(f"{self.manuscript_name}.pdf")
-
             if pdf_file.exists():
                 self.log("PDF compilation successful")
                 # Show warnings if any, but don't fail the build
-                if result3.returncode != 0 and self.verbose:
+                if result.returncode != 0 and self.verbose:
                     self.log("LaTeX completed with warnings:", "WARNING")
-                    if result3.stdout:
+                    if result.stdout:
                         print("LaTeX output:")
-                        print(result3.stdout[-2000:])  # Show last 2000 chars to avoid spam
+                        print(result.stdout[-2000:])  # Show last 2000 chars to avoid spam
                 return True
             else:
                 self.log("PDF compilation failed", "ERROR")
                 if self.verbose:
-                    self.log(f"Looking for PDF: {pdf_file.absolute()}")
-                    self.log(f"Current directory: {Path.cwd()}")
+                    self.log(f"Looking for PDF: {pdf_file}")
                     print("LaTeX output:")
-                    print(result3.stdout)
+                    print(result.stdout)
                     print("LaTeX errors:")
-                    print(result3.stderr)
+                    print(result.stderr)
                 return False
 
         except Exception as e:
             self.log(f"Error compiling PDF: {e}", "ERROR")
             return False
-        finally:
-            os.chdir(original_cwd)
+
+    def _run_latex_passes(self, run_pdflatex, run_bibtex):
+        """Run pdflatex until its auxiliary files settle, running bibtex only when needed.
+
+        Like latexmk, another pass only runs when a pass changed the auxiliary
+        files (.aux, .toc, .out, .lof, .lot) or LaTeX asked for a rerun, and
+        bibtex only runs when the citations, bibliography database or style
+        changed since it last ran. An unchanged rebuild therefore takes one
+        pass; a clean build takes the usual three.
+
+        A pass whose output contains a fatal error (a missing file or an
+        undefined command) ends the compilation, since the following passes
+        would fail the same way.
+
+        Args:
+            run_pdflatex: Callable running one pdflatex pass on the manuscript in
+                the output directory, feeding its output lines to the given
+                ``LaTeXOutputParser`` and returning the completed process
+            run_bibtex: Callable running bibtex on the manuscript in the output
+                directory and returning the completed process
+
+        Returns:
+            Result of the last pdflatex pass, or None if a pass hit a fatal
+            error or bibtex failed to produce a bibliography
+        """
+        from ..validators.latex_error_parser import LaTeXOutputParser
+
+        references = self.output_dir / "03_REFERENCES.bib"
+        bibtex_state_file = self.output_dir / f"{self.manuscript_name}.bibstate"
+        bbl_file = self.output_dir / f"{self.manuscript_name}.bbl"
+
+        for latex_pass in range(1, MAX_LATEX_PASSES + 1):
+            aux_before = self._get_latex_auxiliary_state()
+            output_parser = LaTeXOutputParser()
+            result = run_pdflatex(output_parser)
+            output_parser.close()
+            if output_parser.fatal_error is not None:
+                self._report_fatal_latex_error(output_parser.fatal_error)
+                return None
+
+            rerun = self._get_latex_auxiliary_state() != aux_before or self._latex_requested_rerun()
+
+            if references.exists():
+                bibtex_state = self._get_bibtex_state(references)
+                previous_state = bibtex_state_file.read_text(encoding="utf-8") if bibtex_state_file.exists() else ""
+                if not bbl_file.exists() or bibtex_state != previous_state:
+                    self.log("Running BibTeX to process bibliography...")
+                    if not self._check_bibtex_result(run_bibtex()):
+                        return None
+                    bibtex_state_file.write_text(bibtex_state, encoding="utf-8")
+                    rerun = True
+
+            if not rerun:
+                logger.debug(f"LaTeX output settled after {latex_pass} pass(es)")
+                return result
+
+        self.log(f"LaTeX cross-references still changing after {MAX_LATEX_PASSES} passes", "WARNING")
+        return result
+
+    def _stream_latex(self, command: list[str], output_parser) -> subprocess.CompletedProcess:
+        """Run pdflatex in the output directory, parsing its output as it is printed.
+
+        Only the last lines of output are kept. The run is stopped as soon as
+        the parser reports a fatal error, since nonstop mode would otherwise
+        carry on to the end of the document.
+
+        Args:
+            command: pdflatex command line
+            output_parser: ``LaTeXOutputParser`` receiving each output line
+
+        Returns:
+            Completed process whose stdout holds the tail of the output
+        """
+        tail: deque[str] = deque(maxlen=LATEX_OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
+            command,
+            cwd=self.output_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        ) as process:
+            assert process.stdout is not None
+            for line in process.stdout:
+                tail.append(line)
+                if output_parser.feed(line) is not None and process.poll() is None:
+                    process.kill()
+            returncode = process.wait()
+        return subprocess.CompletedProcess(command, returncode, "".join(tail), "")
+
+    def _report_fatal_latex_error(self, error) -> None:
+        """Log a fatal error that stopped LaTeX compilation."""
+        location = f" in {error.file_path}" if error.file_path else ""
+        self.log(f"LaTeX stopped at a fatal error{location}: {error.raw_error.lstrip('! ')}", "ERROR")
+        self.log(error.message, "ERROR")
+        if self.verbose and error.context:
+            print(error.context)
+
+    def _get_latex_auxiliary_state(self) -> dict[str, str]:
+        """Hash the auxiliary files that pdflatex reads back on its next pass."""
+        state = {}
+        for suffix in LATEX_AUXILIARY_SUFFIXES:
+            aux_file = self.output_dir / f"{self.manuscript_name}{suffix}"
+            if aux_file.exists():
+                state[suffix] = hashlib.sha256(aux_file.read_bytes()).hexdigest()
+        return state
+
+    def _latex_requested_rerun(self) -> bool:
+        """Check whether the last pdflatex pass asked to be run again."""
+        log_file = self.output_dir / f"{self.manuscript_name}.log"
+        try:
+            # Messages are wrapped at the log's line width, so join the lines first
+            log_text = log_file.read_text(encoding="utf-8", errors="replace").replace("\n", "")
+        except OSError:
+            return False
+        return LATEX_RERUN_PATTERN.search(log_text) is not None
+
+    def _get_bibtex_state(self, references: Path) -> str:
+        """Hash everything bibtex reads: citation lines, bibliography database and styles."""
+        hasher = hashlib.sha256()
+        aux_file = self.output_dir / f"{self.manuscript_name}.aux"
+        if aux_file.exists():
+            for line in aux_file.read_text(encoding="utf-8", errors="replace").splitlines():
+                if line.startswith(("\\citation", "\\bibdata", "\\bibstyle")):
+                    hasher.update(line.encode("utf-8") + b"\n")
+        hasher.update(references.read_bytes())
+        for style_file in sorted(self.output_dir.glob("*.bst")):
+            hasher.update(style_file.read_bytes())
+        return hasher.hexdigest()
+
+    def _check_bibtex_result(self, bibtex_result) -> bool:
+        """Log the outcome of a bibtex run.
+
+        Returns:
+            False if bibtex failed to create a bibliography
+        """
+        # Log BibTeX warnings and errors only
+        if bibtex_result.stderr:
+            self.log(f"BibTeX errors: {bibtex_result.stderr}", "WARNING")
+        elif "warning" in bibtex_result.stdout.lower():
+            # Count warnings but don't spam the output
+            warning_count = bibtex_result.stdout.lower().count("warning")
+            self.log(f"BibTeX completed with {warning_count} warning(s)", "WARNING")
+
+        # Check for serious bibtex errors that would prevent citation resolution
+        if bibtex_result.returncode != 0:
+            self.log(
+                f"BibTeX returned error code {bibtex_result.returncode}",
+                "WARNING",
+            )
+            # Check if .bbl file was still created despite errors
+            bbl_file = self.output_dir / f"{self.manuscript_name}.bbl"
+            if not bbl_file.exists():
+                self.log(
+                    "BibTeX failed to create .bbl file - citations will appear as ?",
+                    "ERROR",
+                )
+                return False
+        else:
+            self.log("BibTeX completed successfully")
+            # Log BibTeX warnings to file
+            try:
+                self._log_bibtex_warnings()
+            except Exception as e:
+                self.log(f"Debug: BibTeX warning logging failed: {e}", "WARNING")
+
+        return True
 
     def copy_pdf_to_manuscript(self) -> bool:
         """Copy generated PDF to manuscript directory with custom name."""
@@ -798,7 +1192,14 @@ class BuildManager:
             return False
 
     def run_word_count_analysis(self) -> bool:
-        """Run word count analysis on the manuscript."""
+        """Run word count analysis on the manuscript.
+
+        Sections converted by LaTeX generation are counted as converted there,
+        so their Python commands do not run a second time. Sections it did not
+        convert in this build (because the stage was up to date) come from the
+        section cache or are converted again, which only runs Python commands
+        whose results are cached.
+        """
         try:
             from ..converters.md2tex import extract_content_sections
             from ..utils import find_manuscript_md
@@ -812,7 +1213,8 @@ class BuildManager:
             self.log(f"Analyzing word count for: {manuscript_md}")
 
             # Extract content sections from markdown
-            content_sections = extract_content_sections(str(manuscript_md))
+            section_cache = self._section_cache or self._get_section_cache()
+            content_sections = extract_content_sections(str(manuscript_md), _ConvertedSections(section_cache))
 
             # Analyze word counts and provide warnings
             self._analyze_section_word_counts(content_sections)
@@ -829,8 +1231,6 @@ class BuildManager:
 
     def _analyze_section_word_counts(self, content_sections):
         """Analyze word counts for each section and provide warnings."""
-        import re
-
         section_guidelines = {
             "abstract": {"ideal": 150, "max_warning": 250, "description": "Abstract"},
             "main": {"ideal": 1500, "max_warning": 3000, "description": "Main content"},
@@ -969,8 +1369,170 @@ class BuildManager:
             self.log(f"Error running PDF validation: {e}", "WARNING")
             return True  # Don't fail the build on PDF validation errors
 
+    def _create_build_pipeline(self, progress_callback=None) -> AsyncLocalExecutionManager:
+        """Create the build steps as a dependency graph.
+
+        Steps whose dependencies are satisfied run concurrently, so copying
+        style files and references, word counting and (when the figures are
+        already up to date) validation overlap with the figure work.
+
+        Args:
+            progress_callback: Optional callback receiving (step name, current step, total steps)
+                as each reported step starts
+
+        Returns:
+            Execution manager holding the build steps
+        """
+        context = ExecutionContext(
+            mode=ExecutionMode.LOCAL,
+            working_dir=self.path_manager.manuscript_path,
+            output_dir=self.output_dir,
+            verbose=self.verbose,
+        )
+        # Steps report their own progress when they start
+        pipeline = AsyncLocalExecutionManager(
+            context, path_manager=self.path_manager, progress_callback=lambda message, current, total: None
+        )
+
+        perf_tracker = get_performance_tracker()
+        progress_lock = threading.Lock()
+        progress = {"current": 0, "total": 10 if self.skip_validation else 11}
+
+        def add_step(step_id, name, description, function, dependencies=None, required=True, report=True):
+            def run_step(context):
+                if report and progress_callback:
+                    with progress_lock:
+                        progress["current"] += 1
+                        progress_callback(name, progress["current"], progress["total"])
+
+                # Timed here, as concurrent builds run steps with the same id
+                start_time = time.time()
+                if not self._run_stage(step_id, description, function):
+                    return StepResult.FAILURE
+                perf_tracker.record_operation(step_id, time.time() - start_time)
+                return StepResult.SUCCESS
+
+            pipeline.add_async_step(step_id, name, description, run_step, dependencies=dependencies, required=required)
+
+        self._stage_fingerprints = self._get_stage_fingerprints()
+
+        # Validation checks figure outputs, so it waits for stale figures to be generated
+        figures_need_update = self.force_figures or (self.figures_dir.exists() and self._check_figures_need_update())
+
+        add_step(
+            "check_structure",
+            "Checking manuscript structure",
+            "manuscript structure check",
+            self.check_manuscript_structure,
+        )
+        add_step(
+            "setup_output",
+            "Setting up output directory",
+            "output directory setup",
+            self.setup_output_directory,
+            ["check_structure"],
+        )
+        add_step(
+            "generate_figures",
+            "Generating figures",
+            "figure generation",
+            lambda: self.generate_figures(need_update=figures_need_update),
+            ["setup_output"],
+        )
+
+        tex_dependencies = ["generate_figures"]
+        if not self.skip_validation:
+            validation_dependencies = ["generate_figures"] if figures_need_update else ["setup_output"]
+            add_step(
+                "validate_manuscript",
+                "Validating manuscript",
+                "manuscript validation",
+                self.validate_manuscript,
+                validation_dependencies,
+            )
+            tex_dependencies.append("validate_manuscript")
+
+        add_step(
+            "copy_style_files", "Copying style files", "copying style files", self.copy_style_files, ["setup_output"]
+        )
+        add_step("copy_references", "Copying references", "copying references", self.copy_references, ["setup_output"])
+        add_step("copy_figures", "Copying figures", "copying figures", self.copy_figures, ["generate_figures"])
+        add_step(
+            "generate_tex", "Generating LaTeX files", "LaTeX generation", self.generate_tex_files, tex_dependencies
+        )
+        add_step(
+            "compile_pdf",
+            "Compiling PDF",
+            "PDF compilation",
+            self.compile_pdf,
+            ["generate_tex", "copy_style_files", "copy_references", "copy_figures"],
+        )
+        add_step(
+            "copy_pdf_to_manuscript",
+            "Finalizing build",
+            "copying PDF to manuscript",
+            self.copy_pdf_to_manuscript,
+            ["compile_pdf"],
+        )
+
+        # Reports only; their results never fail the build
+        add_step(
+            "run_pdf_validation",
+            "Validating PDF",
+            "PDF validation",
+            self.run_pdf_validation,
+            ["copy_pdf_to_manuscript"],
+            required=False,
+            report=False,
+        )
+        add_step(
+            "run_word_count_analysis",
+            "Analyzing word count",
+            "word count analysis",
+            self.run_word_count_analysis,
+            ["generate_tex"],
+            required=False,
+            report=False,
+        )
+
+        pipeline.setup_pipeline()
+        return pipeline
+
+    @staticmethod
+    def _run_pipeline(pipeline) -> None:
+        """Run the build pipeline to completion on an event loop of its own.
+
+        asyncio.run cannot be called from a thread that is already running an
+        event loop (a Jupyter kernel or an async application), so the pipeline
+        then runs on a new loop in a worker thread while the caller waits.
+
+        Args:
+            pipeline: Build pipeline to execute
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(pipeline.execute_async())
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rxiv-pipeline") as executor:
+            executor.submit(asyncio.run, pipeline.execute_async()).result()
+
     def run_full_build(self, progress_callback=None) -> bool:
-        """Run the complete build process."""
+        """Run the complete build process.
+
+        Independent steps run concurrently, and the chain of steps that bounded
+        the build time (the critical path) is reported when the build succeeds.
+
+        Args:
+            progress_callback: Optional callback receiving (step name, current step, total steps)
+                as each step starts
+
+        Returns:
+            True if every required step succeeded
+        """
         # Create operation context for the entire build
         with create_operation("pdf_build", manuscript=self.manuscript_path, engine=self.engine) as op:
             op.log(f"Starting build process for manuscript: {self.manuscript_path}")
@@ -979,118 +1541,27 @@ class BuildManager:
                 "STEP",
             )
 
-            # Track performance
-            perf_tracker = get_performance_tracker()
-            current_step = 0
-            total_steps = 10 if self.skip_validation else 11
-
-            # Step 1: Check manuscript structure
-            current_step += 1
-            if progress_callback:
-                progress_callback("Checking manuscript structure", current_step, total_steps)
-            perf_tracker.start_operation("check_structure")
-            if not self.check_manuscript_structure():
-                op.log("Failed at manuscript structure check")
-                return False
-            perf_tracker.end_operation("check_structure")
-
-            # Step 2: Set up output directory
-            current_step += 1
-            if progress_callback:
-                progress_callback("Setting up output directory", current_step, total_steps)
-            perf_tracker.start_operation("setup_output")
-            if not self.setup_output_directory():
-                op.log("Failed at output directory setup")
-                return False
-            perf_tracker.end_operation("setup_output")
-
-            # Step 3: Generate figures (before validation to ensure figure files exist)
-            current_step += 1
-            if progress_callback:
-                progress_callback("Generating figures", current_step, total_steps)
-            perf_tracker.start_operation("generate_figures")
-            if not self.generate_figures():
-                op.log("Failed at figure generation")
-                return False
-            perf_tracker.end_operation("generate_figures")
-
-            # Step 4: Validate manuscript (if not skipped)
-            if not self.skip_validation:
-                current_step += 1
-                if progress_callback:
-                    progress_callback("Validating manuscript", current_step, total_steps)
-                perf_tracker.start_operation("validate_manuscript")
-                if not self.validate_manuscript():
-                    op.log("Failed at manuscript validation")
-                    return False
-                perf_tracker.end_operation("validate_manuscript")
-
-            # Step 5: Copy style files
-            current_step += 1
-            if progress_callback:
-                progress_callback("Copying style files", current_step, total_steps)
-            perf_tracker.start_operation("copy_files")
-            if not self.copy_style_files():
-                op.log("Failed at copying style files")
-                return False
-
-            # Step 6: Copy references
-            current_step += 1
-            if progress_callback:
-                progress_callback("Copying references", current_step, total_steps)
-            if not self.copy_references():
-                op.log("Failed at copying references")
-                return False
+            pipeline = self._create_build_pipeline(progress_callback)
+            self._run_pipeline(pipeline)
 
-            # Step 7: Copy figures
-            current_step += 1
-            if progress_callback:
-                progress_callback("Copying figures", current_step, total_steps)
-            if not self.copy_figures():
-                op.log("Failed at copying figures")
-                return False
-            perf_tracker.end_operation("copy_files")
-
-            # Step 8: Generate LaTeX files
-            current_step += 1
-            if progress_callback:
-                progress_callback("Generating LaTeX files", current_step, total_steps)
-            perf_tracker.start_operation("generate_tex")
-            if not self.generate_tex_files():
-                op.log("Failed at LaTeX generation")
-                return False
-            perf_tracker.end_operation("generate_tex")
-
-            # Step 9: Compile PDF
-            current_step += 1
-            if progress_callback:
-                progress_callback("Compiling PDF", current_step, total_steps)
-            perf_tracker.start_operation("compile_pdf")
-            if not self.compile_pdf():
-                op.log("Failed at PDF compilation")
-                return False
-            perf_tracker.end_operation("compile_pdf")
-
-            # Step 10: Copy PDF to manuscript directory
-            current_step += 1
-            if progress_callback:
-                progress_callback("Finalizing build", current_step, total_steps)
-            if not self.copy_pdf_to_manuscript():
-                op.log("Failed at copying PDF to manuscript")
-                return False
-
-            # Step 11: Run PDF validation
-            self.run_pdf_validation()
-
-            # Step 12: Run word count analysis
-            self.run_word_count_analysis()
+            for step in pipeline.steps:
+                if step.required and step.status != StepStatus.COMPLETED:
+                    failed_step = next((s for s in pipeline.steps if s.status == StepStatus.FAILED), step)
+                    op.log(f"Failed at {failed_step.description}")
+                    return False
 
             # Success!
             op.log(f"Build completed successfully: {self.output_pdf}")
             self.log(f"Build completed successfully: {self.output_pdf} (Operation ID: {op.operation_id})")
 
+            critical_path = pipeline.get_critical_path()
+            total_duration = sum(step.duration for step in critical_path)
+            chain = " → ".join(f"{step.id} ({step.duration:.1f}s)" for step in critical_path)
+            op.log(f"Critical path: {chain}")
+            self.log(f"Critical path ({total_duration:.1f}s): {chain}", "STEP")
+
             # Generate performance report
-            perf_report = perf_tracker.get_performance_report()
+            perf_report = get_performance_tracker().get_performance_report()
             if perf_report["summary"]["regressions"] > 0:
                 self.log(
                     f"Performance regressions detected: {perf_report['summary']['regressions']} operations",
@@ -1108,6 +1579,50 @@ class BuildManager:
         return self.run_full_build()
 
 
+def build_many(manuscripts, max_workers: int | None = None, **build_options) -> dict[str, bool]:
+    """Build several manuscripts concurrently in this process.
+
+    Each manuscript gets its own BuildManager. Builds pass their manuscript
+    path and name explicitly instead of relying on the working directory or
+    MANUSCRIPT_PATH, run their subprocesses with an explicit working directory,
+    and keep Python execution and supplementary note state in per-build
+    contexts, so they can share the process; most of their time is spent
+    waiting on LaTeX and figure subprocesses, so threads are enough to overlap
+    them.
+
+    Logging is still configured per process: every BuildManager points the
+    ``rxiv_maker.log`` file handler at its own output directory, so while
+    builds overlap the log of all of them goes to the output directory of the
+    build created last. Each build's ``build_warnings.log`` is its own.
+
+    Args:
+        manuscripts: Manuscript directories to build
+        max_workers: Maximum number of builds running at the same time
+            (defaults to the thread pool default)
+        **build_options: Keyword arguments passed to every BuildManager, such as
+            ``output_dir``, ``skip_validation`` or ``engine``
+
+    Returns:
+        Mapping from each manuscript path to whether its build succeeded
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def build(manuscript_path) -> bool:
+        try:
+            return BuildManager(manuscript_path=str(manuscript_path), **build_options).run_full_build()
+        except Exception as e:
+            logger.error(f"Build of {manuscript_path} failed: {e}")
+            return False
+
+    manuscripts = [str(manuscript_path) for manuscript_path in manuscripts]
+    if not manuscripts:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rxiv-build") as executor:
+        results = executor.map(build, manuscripts)
+        return dict(zip(manuscripts, results, strict=True))
+
+
 def main():
     """Main entry point for build manager command."""
     import argparse
@@ -0,0 +1,313 @@
+"""Dependency-aware scheduling of figure generation jobs.
+
+Figure scripts run as independent subprocesses, so the scheduler decides how
+many of them run at once and in which order:
+
+- The pool is sized from the usable CPU count and the available memory.
+- Jobs with the longest expected runtime, including everything waiting on
+  them, are started first. Runtimes are remembered between builds.
+- A script can declare what it reads with ``rxiv-depends`` comments. The
+  named files may be data files or another figure's output, for example::
+
+      # rxiv-depends: DATA/measurements.csv, SFigure__model.py
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEPENDS_PATTERN = re.compile(r"^\s*(?:#|%%)\s*rxiv-depends:\s*(.+?)\s*$", re.MULTILINE | re.IGNORECASE)
+MEMORY_PER_JOB = 512 * 1024 * 1024
+DEFAULT_RUNTIMES = {"R": 5.0, "python": 3.0, "mermaid": 1.0}
+
+
+@dataclass
+class FigureJob:
+    """A single figure source file to generate."""
+
+    source: Path
+    file_type: str
+    dependencies: list[Path] = field(default_factory=list)
+    upstream: set[str] = field(default_factory=set)
+    runtime: float = 0.0
+    priority: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Name identifying the job, the source file name."""
+        return self.source.name
+
+
+def parse_dependencies(source: Path) -> list[str]:
+    """Read the dependencies declared in a figure source file.
+
+    Args:
+        source: Figure source file (.py, .R or .mmd)
+
+    Returns:
+        Declared dependencies in order of appearance
+    """
+    try:
+        content = source.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+
+    dependencies: list[str] = []
+    for match in DEPENDS_PATTERN.finditer(content):
+        dependencies.extend(item.strip() for item in match.group(1).split(",") if item.strip())
+    return dependencies
+
+
+def default_worker_count(job_count: int, max_workers: Optional[int] = None) -> int:
+    """Choose how many figure jobs to run at the same time.
+
+    Args:
+        job_count: Number of jobs to run
+        max_workers: Optional upper bound requested by the caller
+
+    Returns:
+        Number of workers, at least one
+    """
+    try:
+        workers = len(os.sched_getaffinity(0))
+    except AttributeError:
+        workers = os.cpu_count() or 1
+
+    try:
+        import psutil
+
+        workers = min(workers, max(1, psutil.virtual_memory().available // MEMORY_PER_JOB))
+    except ImportError:
+        pass
+
+    if max_workers:
+        workers = min(workers, max_workers)
+    return max(1, min(workers, job_count))
+
+
+class FigureRuntimeHistory:
+    """Runtimes of figure jobs measured in earlier builds."""
+
+    def __init__(self, history_file: Path):
+        """Initialize the runtime history.
+
+        Args:
+            history_file: JSON file the runtimes are stored in
+        """
+        self.history_file = Path(history_file)
+        self._lock = threading.Lock()
+        self._runtimes: dict[str, float] = self._load()
+
+    def _load(self) -> dict[str, float]:
+        """Load stored runtimes, ignoring an unreadable file."""
+        try:
+            with open(self.history_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {name: float(value) for name, value in data.items() if isinstance(value, (int, float))}
+
+    def get(self, name: str) -> Optional[float]:
+        """Get the last measured runtime of a job, if any."""
+        return self._runtimes.get(name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the runtime of a job that did real work."""
+        with self._lock:
+            self._runtimes[name] = round(seconds, 3)
+
+    def save(self) -> None:
+        """Write the runtimes back to the history file."""
+        with self._lock:
+            data = dict(sorted(self._runtimes.items()))
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.history_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self.history_file)
+        except OSError as e:
+            logger.warning(f"Failed to save figure runtimes to {self.history_file}: {e}")
+
+
+class FigureScheduler:
+    """Orders figure jobs by their dependencies and expected runtimes."""
+
+    def __init__(
+        self,
+        jobs: list[FigureJob],
+        figures_dir: Path,
+        output_dir: Path,
+        history: Optional[FigureRuntimeHistory] = None,
+    ):
+        """Initialize the scheduler and resolve job dependencies.
+
+        Args:
+            jobs: Jobs to schedule
+            figures_dir: Directory containing the figure sources
+            output_dir: Directory figure outputs are written to, one subdirectory per figure
+            history: Runtimes from earlier builds used to order the jobs
+        """
+        self.jobs = {job.name: job for job in jobs}
+        self.figures_dir = Path(figures_dir)
+        self.output_dir = Path(output_dir)
+        self.history = history
+
+        by_stem = {job.source.stem: job for job in jobs}
+        for job in self.jobs.values():
+            known_runtime = history.get(job.name) if history else None
+            job.runtime = known_runtime if known_runtime is not None else DEFAULT_RUNTIMES.get(job.file_type, 1.0)
+            self._resolve_dependencies(job, by_stem)
+
+        self._break_cycles()
+        self._compute_priorities()
+
+    def _resolve_dependencies(self, job: FigureJob, by_stem: dict[str, FigureJob]) -> None:
+        """Turn declared dependencies into files and upstream jobs."""
+        for declared in parse_dependencies(job.source):
+            upstream = self.jobs.get(declared) or by_stem.get(declared)
+            if upstream is None:
+                # A file inside another figure's output directory depends on that figure
+                parts = Path(declared).parts
+                upstream = by_stem.get(parts[0]) if len(parts) > 1 else None
+                job.dependencies.append(self.output_dir / declared if upstream else self._resolve_path(declared))
+            else:
+                job.dependencies.append(self.output_dir / upstream.source.stem)
+
+            if upstream is not None and upstream is not job:
+                job.upstream.add(upstream.name)
+
+    def _resolve_path(self, declared: str) -> Path:
+        """Resolve a declared file relative to the figures or output directory."""
+        path = Path(declared)
+        if path.is_absolute():
+            return path
+        for base in (self.figures_dir, self.output_dir, self.figures_dir.parent):
+            if (base / path).exists():
+                return base / path
+        return self.figures_dir / path
+
+    def _break_cycles(self) -> None:
+        """Drop dependencies between jobs that wait on each other."""
+        remaining = {name: set(job.upstream) for name, job in self.jobs.items()}
+        while remaining:
+            ready = [name for name, upstream in remaining.items() if not upstream & remaining.keys()]
+            if not ready:
+                cyclic = sorted(remaining)
+                print(f"  ⚠️  Circular figure dependencies between {', '.join(cyclic)}, ignoring them")
+                for name in cyclic:
+                    self.jobs[name].upstream -= remaining.keys()
+                return
+            for name in ready:
+                del remaining[name]
+
+    def _compute_priorities(self) -> None:
+        """Rank each job by the longest chain of work that starts with it."""
+        downstream: dict[str, list[str]] = {name: [] for name in self.jobs}
+        for job in self.jobs.values():
+            for name in job.upstream:
+                downstream[name].append(job.name)
+
+        def priority(name: str) -> float:
+            job = self.jobs[name]
+            if not job.priority:
+                job.priority = job.runtime + max((priority(child) for child in downstream[name]), default=0.0)
+            return job.priority
+
+        for name in self.jobs:
+            priority(name)
+
+    def _pick_order(self, names) -> list[str]:
+        """Sort job names by decreasing priority, then by name."""
+        return sorted(names, key=lambda name: (-self.jobs[name].priority, name))
+
+    def ordered_jobs(self) -> list[FigureJob]:
+        """Get the jobs in an order that runs dependencies first.
+
+        Returns:
+            Jobs in dependency order, longest first among jobs that are ready
+        """
+        done: set[str] = set()
+        order: list[FigureJob] = []
+        while len(order) < len(self.jobs):
+            ready = [name for name, job in self.jobs.items() if name not in done and job.upstream <= done]
+            name = self._pick_order(ready)[0]
+            done.add(name)
+            order.append(self.jobs[name])
+        return order
+
+    def run(
+        self,
+        execute: Callable[[FigureJob], bool],
+        max_workers: Optional[int] = None,
+    ) -> tuple[list[str], list[str]]:
+        """Run all jobs, starting each one once its dependencies have finished.
+
+        Each job runs in a worker thread that supervises the figure
+        subprocess, so the number of workers bounds the number of
+        scripts running at the same time.
+
+        Args:
+            execute: Callable generating one figure. It returns True when the
+                figure was actually generated rather than taken from the cache,
+                and raises on failure.
+            max_workers: Optional upper bound on the number of workers
+
+        Returns:
+            Tuple of (completed job names, failed or skipped job names)
+        """
+        import time
+
+        workers = default_worker_count(len(self.jobs), max_workers)
+        completed: list[str] = []
+        failed: list[str] = []
+        pending = dict(self.jobs)
+
+        def timed(job: FigureJob) -> tuple[bool, float]:
+            start = time.monotonic()
+            generated = execute(job)
+            return generated, time.monotonic() - start
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rxiv-figure") as executor:
+            running: dict[concurrent.futures.Future, FigureJob] = {}
+
+            while pending or running:
+                for name in list(pending):
+                    job = pending[name]
+                    if job.upstream & set(failed):
+                        del pending[name]
+                        failed.append(name)
+                        print(f"  ⚠️  Skipping {name}: a figure it depends on failed")
+
+                finished = set(completed)
+                ready = [name for name, job in pending.items() if job.upstream <= finished]
+                for name in self._pick_order(ready)[: max(0, workers - len(running))]:
+                    running[executor.submit(timed, pending.pop(name))] = self.jobs[name]
+
+                if not running:
+                    continue
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        generated, seconds = future.result()
+                    except Exception as e:
+                        logger.debug(f"Figure job {job.name} failed: {e}")
+                        failed.append(job.name)
+                        continue
+                    completed.append(job.name)
+                    if generated and self.history is not None:
+                        self.history.record(job.name, seconds)
+
+        if self.history is not None:
+            self.history.save()
+
+        return completed, failed
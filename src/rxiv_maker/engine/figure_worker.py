@@ -0,0 +1,402 @@
+"""Warm worker processes for Python figure scripts.
+
+Starting a new interpreter for every figure script means resolving the uv
+environment and importing matplotlib, numpy, pandas and seaborn again each
+time. A warm worker imports those libraries once and then forks a fresh
+child for every script. The child starts from the worker's untouched state,
+so scripts stay isolated from each other, while the imports are already done.
+
+The same module also runs single scripts in a new interpreter. In both
+cases an audit hook records the files a script reads, so the figure cache
+can notice when a data file changes.
+
+This module runs inside the manuscript's Python environment as a plain
+script, so it only depends on the standard library. Fork is not available
+on Windows, where figures keep running in a new interpreter.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import Optional
+
+PRELOADED_MODULES = ("numpy", "pandas", "matplotlib", "matplotlib.pyplot", "seaborn")
+WORKER_SHUTDOWN_TIMEOUT = 5
+
+# Environment variables asking a script run to record the files it reads
+TRACE_FILE_VAR = "RXIV_FIGURE_TRACE_FILE"
+INPUT_ROOT_VAR = "RXIV_FIGURE_INPUT_ROOT"
+
+
+def is_supported() -> bool:
+    """Check if the platform can fork warm figure workers."""
+    return hasattr(os, "fork")
+
+
+def _preload_modules() -> list[str]:
+    """Import the plotting libraries figure scripts commonly use."""
+    import importlib
+
+    loaded = []
+    for name in PRELOADED_MODULES:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception:
+            continue
+    return loaded
+
+
+def _reset_child_state() -> None:
+    """Give a forked child the state of a freshly started interpreter."""
+    import random
+
+    random.seed()
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed()
+
+    if "matplotlib.pyplot" in sys.modules:
+        sys.modules["matplotlib.pyplot"].close("all")
+    if "matplotlib" in sys.modules:
+        sys.modules["matplotlib"].rc_file_defaults()
+
+
+def _trace_inputs() -> set[str]:
+    """Record the paths of files opened for reading from now on."""
+    opened: set[str] = set()
+    write_flags = os.O_WRONLY | os.O_RDWR
+
+    def audit(event, args):
+        if event != "open":
+            return
+        path, mode, flags = args
+        if not isinstance(path, (str, bytes)):
+            return
+        if mode is not None and any(char in mode for char in "wax+"):
+            return
+        if mode is None and flags & write_flags:
+            return
+        opened.add(os.path.abspath(os.fsdecode(path)))
+
+    sys.addaudithook(audit)
+    return opened
+
+
+def _environment_paths() -> list[str]:
+    """Get the interpreter and package directories a script's results depend on."""
+    import site
+
+    paths = [os.path.realpath(sys.executable)]
+    site_dirs = site.getsitepackages() + [site.getusersitepackages()]
+    paths.extend(path for path in site_dirs if os.path.isdir(path))
+    return paths
+
+
+def _write_trace(trace_file: str, script: str, opened: set[str]) -> None:
+    """Write the files a script read below the input root to the trace file."""
+    root = os.path.realpath(os.environ.get(INPUT_ROOT_VAR) or os.getcwd())
+    output_dir = os.environ.get("RXIV_FIGURE_OUTPUT_DIR")
+    excluded = {os.path.realpath(script)}
+    inputs = []
+    for path in sorted(opened):
+        real_path = os.path.realpath(path)
+        if real_path in excluded or "__pycache__" in Path(real_path).parts:
+            continue
+        if output_dir and real_path.startswith(os.path.realpath(output_dir) + os.sep):
+            continue
+        if real_path.startswith(root + os.sep) and os.path.isfile(real_path):
+            inputs.append(real_path)
+
+    with open(trace_file, "w", encoding="utf-8") as f:
+        json.dump({"inputs": inputs, "environment": _environment_paths()}, f)
+
+
+def _run_script(script: str) -> int:
+    """Run a figure script as __main__ and return its exit code."""
+    import runpy
+
+    sys.argv = [script]
+    sys.path.insert(0, str(Path(script).parent))
+    trace_file = os.environ.get(TRACE_FILE_VAR)
+    opened = _trace_inputs() if trace_file else set()
+    try:
+        _reset_child_state()
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        if trace_file:
+            try:
+                _write_trace(trace_file, script, opened)
+            except OSError:
+                pass
+    return 0
+
+
+def read_trace(trace_file: Path) -> Optional[dict]:
+    """Read the inputs recorded for a script run.
+
+    Args:
+        trace_file: Trace file passed to the script run
+
+    Returns:
+        Dictionary with "inputs" and "environment" path lists, or None if nothing was recorded
+    """
+    try:
+        with open(trace_file, encoding="utf-8") as f:
+            trace = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(trace, dict):
+        return None
+    return {"inputs": list(trace.get("inputs", [])), "environment": list(trace.get("environment", []))}
+
+
+def script_command(python_command: list[str], script: Path, cwd: Path) -> list[str]:
+    """Build the command running one figure script in a new interpreter.
+
+    Args:
+        python_command: Command starting the manuscript's Python interpreter
+        script: Figure script to run
+        cwd: Working directory of the script
+
+    Returns:
+        Command line running the script through this module
+    """
+    return [*python_command, str(Path(__file__).resolve()), "run", str(script), str(cwd)]
+
+
+def run_once(script: str, cwd: str) -> int:
+    """Run a single figure script in this interpreter."""
+    os.chdir(cwd)
+    returncode = _run_script(script)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return returncode
+
+
+def _handle_request(request: dict) -> dict:
+    """Fork a child that runs one script and collect its result."""
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        pid = os.fork()
+        if pid == 0:
+            returncode = 1
+            try:
+                devnull = os.open(os.devnull, os.O_RDONLY)
+                os.dup2(devnull, 0)
+                os.dup2(stdout_file.fileno(), 1)
+                os.dup2(stderr_file.fileno(), 2)
+                os.chdir(request["cwd"])
+                os.environ.update(request.get("env", {}))
+                returncode = _run_script(request["script"])
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(returncode)
+
+        _, status = os.waitpid(pid, 0)
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        return {
+            "returncode": os.waitstatus_to_exitcode(status),
+            "stdout": stdout_file.read().decode("utf-8", errors="replace"),
+            "stderr": stderr_file.read().decode("utf-8", errors="replace"),
+        }
+
+
+def serve() -> None:
+    """Serve figure script requests read as JSON lines from stdin."""
+    # Keep the protocol on a private descriptor so stray output cannot corrupt it
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    # The directory of this file is not where figure scripts import from
+    sys.path.pop(0)
+
+    protocol.write(json.dumps({"ready": True, "preloaded": _preload_modules()}) + "\n")
+    protocol.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response = _handle_request(json.loads(line))
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+
+class WarmPythonWorker:
+    """A running worker process that forks a child for each figure script."""
+
+    def __init__(self, command: list[str], cwd: Optional[str] = None, env: Optional[dict] = None):
+        """Start the worker and wait until its libraries are imported.
+
+        Args:
+            command: Command starting the manuscript's Python interpreter
+            cwd: Working directory the worker is started in
+            env: Environment of the worker
+
+        Raises:
+            RuntimeError: If the worker does not start
+        """
+        self.process = subprocess.Popen(
+            [*command, str(Path(__file__).resolve())],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            cwd=cwd,
+            env=env,
+        )
+        self.preloaded = self._read_response().get("preloaded", [])
+
+    def _read_response(self) -> dict:
+        """Read the next response line from the worker."""
+        line = self.process.stdout.readline() if self.process.stdout else ""
+        if not line:
+            raise RuntimeError(f"Figure worker exited with code {self.process.poll()}")
+        return json.loads(line)
+
+    def run(self, script: Path, cwd: Path, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+        """Run a figure script in a child forked from the worker.
+
+        Args:
+            script: Figure script to run
+            cwd: Working directory of the script
+            env: Environment variables set for the script
+
+        Returns:
+            Completed process with the script's exit code and captured output
+        """
+        request = {"script": str(script), "cwd": str(cwd), "env": env or {}}
+        stdin = self.process.stdin
+        if stdin is None:
+            raise RuntimeError("Figure worker has no input pipe")
+        try:
+            stdin.write(json.dumps(request) + "\n")
+            stdin.flush()
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"Figure worker is not running: {e}") from e
+
+        response = self._read_response()
+        return subprocess.CompletedProcess(
+            args=[str(script)],
+            returncode=response["returncode"],
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+        )
+
+    def close(self) -> None:
+        """Stop the worker."""
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+            self.process.wait(timeout=WORKER_SHUTDOWN_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        finally:
+            if self.process.stdout:
+                self.process.stdout.close()
+
+
+class WarmPythonWorkerPool:
+    """Pool of warm workers shared by concurrently generated figures."""
+
+    def __init__(self, command: list[str], size: int = 1, cwd: Optional[str] = None, env: Optional[dict] = None):
+        """Initialize the pool. Workers are started when first needed.
+
+        Args:
+            command: Command starting the manuscript's Python interpreter
+            size: Maximum number of workers
+            cwd: Working directory workers are started in
+            env: Environment of the workers
+        """
+        self.command = command
+        self.size = max(1, size)
+        self.cwd = cwd
+        self.env = env
+        self._idle: list[WarmPythonWorker] = []
+        self._started = 0
+        self._condition = threading.Condition()
+
+    def _acquire(self) -> WarmPythonWorker:
+        """Take an idle worker, starting one if the pool is not full."""
+        with self._condition:
+            while not self._idle and self._started >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._started += 1
+
+        try:
+            return WarmPythonWorker(self.command, cwd=self.cwd, env=self.env)
+        except Exception:
+            self._discard()
+            raise
+
+    def _release(self, worker: WarmPythonWorker) -> None:
+        """Return a healthy worker to the pool."""
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def _discard(self) -> None:
+        """Forget a worker that failed, making room for a new one."""
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
+
+    def run(self, script: Path, cwd: Path, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+        """Run a figure script on a warm worker.
+
+        Args:
+            script: Figure script to run
+            cwd: Working directory of the script
+            env: Environment variables set for the script
+
+        Returns:
+            Completed process with the script's exit code and captured output
+
+        Raises:
+            RuntimeError: If no worker could run the script
+        """
+        worker = self._acquire()
+        try:
+            result = worker.run(script, cwd, env)
+        except Exception:
+            worker.close()
+            self._discard()
+            raise
+        self._release(worker)
+        return result
+
+    def close(self) -> None:
+        """Stop all idle workers."""
+        with self._condition:
+            workers, self._idle = self._idle, []
+            self._started -= len(workers)
+        for worker in workers:
+            worker.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "run":
+        # Imports of the script resolve from its own directory, not from here
+        sys.path.pop(0)
+        sys.exit(run_once(sys.argv[2], sys.argv[3]))
+    serve()
@@ -11,7 +11,10 @@ import base64
 import logging
 import os
 import re
+import subprocess
 import sys
+import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
@@ -52,6 +55,8 @@ try:
 
     # Docker manager import removed - now using global container manager
     from ..utils.platform import platform_detector
+    from . import figure_worker
+    from .figure_scheduler import FigureJob, FigureRuntimeHistory, FigureScheduler, default_worker_count
 except ImportError:
     # Fallback for when running as script
     import sys
@@ -59,6 +64,13 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     from rxiv_maker.core.environment_manager import EnvironmentManager  # type: ignore[no-redef]
     from rxiv_maker.core.path_manager import PathManager  # type: ignore[no-redef]
+    from rxiv_maker.engine import figure_worker  # type: ignore[no-redef]
+    from rxiv_maker.engine.figure_scheduler import (  # type: ignore[no-redef]
+        FigureJob,
+        FigureRuntimeHistory,
+        FigureScheduler,
+        default_worker_count,
+    )
 
     # Docker manager import removed - now using global container manager
     from rxiv_maker.utils.platform import platform_detector  # type: ignore[no-redef]
@@ -114,6 +126,10 @@ class FigureGenerator:
         self.platform = platform_detector
         self.logger = logging.getLogger(__name__)
         self.verbose = EnvironmentManager.is_verbose()
+        # Declared dependencies of each figure source, filled in when figures are scheduled
+        self._figure_dependencies: dict[Path, list[Path]] = {}
+        # Warm Python workers, started for one generate_all_figures() call when enabled
+        self._python_workers: Optional[figure_worker.WarmPythonWorkerPool] = None
 
         # Initialize content-based caching if enabled
         self.checksum_manager = None
@@ -138,11 +154,12 @@ class FigureGenerator:
         # Initialize container engine if using container engine (docker or podman)
         self.container_engine = None
         if self.engine in ["docker", "podman"]:
-            # Use PathManager's working directory if available
+            # Use PathManager's working directory if available, otherwise the
+            # manuscript directory containing the figures
             if self.path_manager:
                 workspace_dir = self.path_manager._working_dir
             else:
-                workspace_dir = Path.cwd().resolve()
+                workspace_dir = self.figures_dir.parent
 
             # Use global container manager for shared engine instances
             from ..core.global_container_manager import get_global_container_manager
@@ -176,6 +193,10 @@ class FigureGenerator:
         if not output_file.exists():
             return True
 
+        # Data files or figures the source depends on changed after the output was written
+        if self._dependencies_changed(source_file, output_file):
+            return True
+
         # Check if source file content has changed
         try:
             relative_path = source_file.relative_to(self.figures_dir)
@@ -184,26 +205,33 @@ class FigureGenerator:
             # If we can't determine, err on the side of regeneration
             return True
 
-    def _update_figure_cache(self, source_file: Path) -> None:
+    def _update_figure_cache(self, source_file: Path, trace: Optional[dict] = None) -> None:
         """Update the cache after successfully generating a figure.
 
         Args:
             source_file: Source figure file that was processed
+            trace: Files the figure script read and the environment it ran in, if recorded
         """
         if self.enable_content_caching and self.checksum_manager is not None:
             try:
-                relative_path = source_file.relative_to(self.figures_dir)
-                self.checksum_manager.update_file_checksum(str(relative_path))
+                relative_path = str(source_file.relative_to(self.figures_dir))
+                inputs = list(trace["inputs"]) if trace else []
+                # Declared data files are inputs too, also for figures that cannot be traced
+                inputs.extend(str(path) for path in self._figure_dependencies.get(source_file, []) if path.is_file())
+                environment = trace["environment"] if trace else []
+                self.checksum_manager.set_file_inputs(relative_path, inputs, environment)
+                self.checksum_manager.update_file_checksum(relative_path)
             except (ValueError, Exception) as e:
                 # Cache update failed, but don't fail the whole operation
                 self.logger.warning(f"Failed to update checksum for {source_file.name}: {e}")
 
-    def generate_all_figures(self, parallel: bool = True, max_workers: int = 4):
+    def generate_all_figures(self, parallel: bool = True, max_workers: Optional[int] = None):
         """Generate all figures found in the figures directory.
 
         Args:
             parallel: Enable parallel processing of figures
-            max_workers: Maximum number of worker threads for parallel processing
+            max_workers: Maximum number of figures generated at the same time. If None,
+                it is derived from the CPU count and the available memory.
         """
         if not self.figures_dir.exists():
             print(f"Warning: Figures directory '{self.figures_dir}' does not exist")
@@ -228,31 +256,154 @@ class FigureGenerator:
 
             print(f"Found {total_files} figure file(s) to process")
 
-            # Process figures with optional parallelization
-            if parallel and total_files > 1:
-                self._generate_figures_parallel(mermaid_files, python_files, r_files, max_workers)
-            else:
-                self._generate_figures_sequential(mermaid_files, python_files, r_files)
+            jobs = [FigureJob(f, "mermaid") for f in mermaid_files]
+            jobs.extend(FigureJob(f, "python") for f in python_files)
+            jobs.extend(FigureJob(f, "R") for f in r_files)
+            scheduler = FigureScheduler(
+                sorted(jobs, key=lambda job: job.name),
+                self.figures_dir,
+                self.output_dir,
+                history=self._load_runtime_history(),
+            )
+            self._figure_dependencies = {job.source: job.dependencies for job in scheduler.jobs.values()}
+
+            if python_files and self.engine not in ["docker", "podman"]:
+                workers = default_worker_count(len(scheduler.jobs), max_workers) if parallel else 1
+                self._python_workers = self._start_python_workers(workers)
+
+            # Checksums of generated figures are saved once, after all figures ran
+            with self.checksum_manager.batch() if self.checksum_manager is not None else nullcontext():
+                # Process figures with optional parallelization
+                if parallel and total_files > 1:
+                    self._generate_figures_parallel(scheduler, max_workers)
+                else:
+                    self._generate_figures_sequential(scheduler)
 
         except Exception as e:
             self.logger.error(f"Error in figure generation: {e}")
             raise
+        finally:
+            if self._python_workers is not None:
+                self._python_workers.close()
+                self._python_workers = None
+
+    def _start_python_workers(self, size: int) -> Optional[figure_worker.WarmPythonWorkerPool]:
+        """Create a pool of warm Python workers if enabled and supported.
+
+        Args:
+            size: Maximum number of workers running at the same time
+
+        Returns:
+            WarmPythonWorkerPool, or None if figures start a new interpreter each
+        """
+        if not EnvironmentManager.is_figure_worker_enabled() or not figure_worker.is_supported():
+            return None
+
+        return figure_worker.WarmPythonWorkerPool(self._python_command(), size=size)
+
+    def _python_command(self) -> list[str]:
+        """Get the command starting the Python interpreter figure scripts run in."""
+        python_cmd = self.platform.python_cmd
+        return ["uv", "run", "python"] if "uv run" in python_cmd else [python_cmd]
+
+    def _run_on_warm_worker(self, py_file: Path, figure_dir: Path, env: dict) -> Optional[subprocess.CompletedProcess]:
+        """Run a Python figure script in a child forked from a warm worker.
+
+        Args:
+            py_file: Python figure script
+            figure_dir: Directory the figure is written to
+            env: Environment variables set for the script
+
+        Returns:
+            Completed process, or None if no warm workers are running or the
+            worker could not run the script
+        """
+        workers = self._python_workers
+        if workers is None:
+            return None
+        try:
+            return workers.run(py_file.absolute(), figure_dir.absolute(), env)
+        except (OSError, RuntimeError, ValueError) as e:
+            self.logger.warning(f"Warm figure worker failed, running {py_file.name} in a new interpreter: {e}")
+            return None
+
+    def _load_runtime_history(self) -> Optional[FigureRuntimeHistory]:
+        """Load figure runtimes measured in earlier builds of this manuscript."""
+        try:
+            from ..utils.cache_utils import get_cache_dir
 
-    def _generate_figures_sequential(self, mermaid_files, python_files, r_files):
-        """Generate figures sequentially with progress tracking."""
-        all_files = []
+            manuscript_name = self.figures_dir.parent.name
+            return FigureRuntimeHistory(get_cache_dir("figures") / f"figure_runtimes_{manuscript_name}.json")
+        except (ImportError, OSError) as e:
+            self.logger.debug(f"Figure runtime history unavailable: {e}")
+            return None
+
+    def _generate_figure(self, job: FigureJob) -> bool:
+        """Generate the figure of a scheduled job.
+
+        Args:
+            job: Figure job to run
+
+        Returns:
+            True if the figure outputs were written, False if they were left untouched
+
+        Raises:
+            RuntimeError: If the figure could not be generated
+        """
+        import time
+
+        start_time = time.time()
+        if job.file_type == "mermaid":
+            succeeded = self.generate_mermaid_figure(job.source)
+        elif job.file_type == "python":
+            succeeded = self.generate_python_figure(job.source)
+        elif job.file_type == "R":
+            succeeded = self.generate_r_figure(job.source)
+        else:
+            raise ValueError(f"Unsupported figure type: {job.file_type}")
+
+        # The generators report failures instead of raising, so that one
+        # failing figure does not stop the others
+        if not succeeded:
+            raise RuntimeError(f"{job.name} was not generated")
+
+        figure_dir = self.output_dir / job.source.stem
+        return figure_dir.is_dir() and any(
+            path.stat().st_mtime >= start_time for path in figure_dir.rglob("*") if path.is_file()
+        )
+
+    def _dependencies_changed(self, source_file: Path, output_file: Path) -> bool:
+        """Check whether a declared dependency changed after the output was written."""
+        dependencies = self._figure_dependencies.get(source_file)
+        if not dependencies:
+            return False
 
-        # Prepare file list with types
-        if mermaid_files and not self.r_only:
-            all_files.extend([(f, "mermaid", "🌊") for f in mermaid_files])
-        if python_files and not self.r_only:
-            all_files.extend([(f, "python", "🐍") for f in python_files])
-        if r_files:
-            all_files.extend([(f, "R", "📊") for f in r_files])
+        try:
+            output_mtime = output_file.stat().st_mtime
+        except OSError:
+            return True
+
+        for dependency in dependencies:
+            files = dependency.rglob("*") if dependency.is_dir() else [dependency]
+            for path in files:
+                try:
+                    if path.is_file() and path.stat().st_mtime > output_mtime:
+                        return True
+                except OSError:
+                    continue
+        return False
+
+    def _generate_figures_sequential(self, scheduler: FigureScheduler):
+        """Generate figures sequentially in dependency order with progress tracking."""
+        emojis = {"mermaid": "🌊", "python": "🐍", "R": "📊"}
+        all_files = [(job, emojis[job.file_type]) for job in scheduler.ordered_jobs()]
 
         if not all_files:
             return
 
+        # Like the parallel path, figures whose dependencies failed are skipped
+        failed: set[str] = set()
+
         # Use Rich progress bar if available, fallback to simple progress
         if RICH_AVAILABLE:
             with Progress(
@@ -266,44 +417,45 @@ class FigureGenerator:
             ) as progress:
                 task = progress.add_task("Generating figures...", total=len(all_files))
 
-                for _i, (file_path, file_type, emoji) in enumerate(all_files):
-                    progress.update(task, description=f"{emoji} Processing {file_path.name}")
+                for job, emoji in all_files:
+                    if job.upstream & failed:
+                        failed.add(job.name)
+                        progress.update(task, advance=1, description=f"⚠️  {job.name} skipped")
+                        print(f"  ⚠️  Skipping {job.name}: a figure it depends on failed")
+                        continue
+
+                    progress.update(task, description=f"{emoji} Processing {job.name}")
 
                     try:
-                        if file_type == "mermaid":
-                            self.generate_mermaid_figure(file_path)
-                        elif file_type == "python":
-                            self.generate_python_figure(file_path)
-                        elif file_type == "R":
-                            self.generate_r_figure(file_path)
-
-                        progress.update(task, advance=1, description=f"✅ {file_path.name} completed")
+                        self._generate_figure(job)
+                        progress.update(task, advance=1, description=f"✅ {job.name} completed")
                     except Exception as e:
-                        progress.update(task, advance=1, description=f"❌ {file_path.name} failed: {e}")
-                        print(f"Error generating {file_path.name}: {e}")
+                        failed.add(job.name)
+                        progress.update(task, advance=1, description=f"❌ {job.name} failed: {e}")
+                        print(f"Error generating {job.name}: {e}")
         else:
             # Fallback to simple progress without Rich
-            for i, (file_path, file_type, emoji) in enumerate(all_files):
-                print(f"[{i + 1}/{len(all_files)}] {emoji} Processing {file_path.name}")
+            for i, (job, emoji) in enumerate(all_files):
+                if job.upstream & failed:
+                    failed.add(job.name)
+                    print(f"  ⚠️  Skipping {job.name}: a figure it depends on failed")
+                    continue
+
+                print(f"[{i + 1}/{len(all_files)}] {emoji} Processing {job.name}")
 
                 try:
-                    if file_type == "mermaid":
-                        self.generate_mermaid_figure(file_path)
-                    elif file_type == "python":
-                        self.generate_python_figure(file_path)
-                    elif file_type == "R":
-                        self.generate_r_figure(file_path)
-
-                    print(f"  ✅ Completed: {file_path.name}")
+                    self._generate_figure(job)
+                    print(f"  ✅ Completed: {job.name}")
                 except Exception as e:
-                    print(f"  ❌ Failed: {file_path.name} - {e}")
+                    failed.add(job.name)
+                    print(f"  ❌ Failed: {job.name} - {e}")
 
-    def _generate_figures_parallel(self, mermaid_files, python_files, r_files, max_workers):
-        """Generate figures in parallel using ThreadPoolExecutor."""
-        import concurrent.futures
+    def _generate_figures_parallel(self, scheduler: FigureScheduler, max_workers: Optional[int] = None):
+        """Generate figures in parallel, starting each once its dependencies are done."""
         import threading
 
-        print(f"Using parallel processing with {max_workers} workers")
+        workers = default_worker_count(len(scheduler.jobs), max_workers)
+        print(f"Using parallel processing with {workers} workers")
 
         # Create thread-safe print function
         print_lock = threading.Lock()
@@ -312,68 +464,30 @@ class FigureGenerator:
             with print_lock:
                 print(*args, **kwargs)
 
-        def process_figure(file_info):
+        def process_figure(job: FigureJob) -> bool:
             """Process a single figure file."""
-            file_path, file_type = file_info
+            safe_print(f"  [Parallel] Processing: {job.name}")
             try:
-                safe_print(f"  [Parallel] Processing: {file_path.name}")
-
-                if file_type == "mermaid":
-                    self.generate_mermaid_figure(file_path)
-                elif file_type == "python":
-                    self.generate_python_figure(file_path)
-                elif file_type == "r":
-                    self.generate_r_figure(file_path)
-
-                safe_print(f"  [Parallel] ✓ Completed: {file_path.name}")
-                return True, file_path.name, None
+                generated = self._generate_figure(job)
             except Exception as e:
-                safe_print(f"  [Parallel] ✗ Failed: {file_path.name} - {e}")
-                return False, file_path.name, str(e)
-
-        # Prepare work items
-        work_items = []
+                safe_print(f"  [Parallel] ✗ Failed: {job.name} - {e}")
+                raise
+            safe_print(f"  [Parallel] ✓ Completed: {job.name}")
+            return generated
 
-        if mermaid_files and not self.r_only:
-            work_items.extend([(f, "mermaid") for f in mermaid_files])
+        safe_print(f"Processing {len(scheduler.jobs)} figures in parallel...")
 
-        if python_files and not self.r_only:
-            work_items.extend([(f, "python") for f in python_files])
+        completed, failed = scheduler.run(process_figure, max_workers=workers)
 
-        if r_files:
-            work_items.extend([(f, "r") for f in r_files])
-
-        if not work_items:
-            print("No figures to process")
-            return
-
-        safe_print(f"Processing {len(work_items)} figures in parallel...")
-
-        # Process figures in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {executor.submit(process_figure, item): item[0] for item in work_items}
-
-            # Collect results
-            completed = 0
-            failed = 0
-
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    success, filename, error = future.result()
-                    if success:
-                        completed += 1
-                    else:
-                        failed += 1
-                except Exception as exc:
-                    safe_print(f"  [Parallel] ✗ Exception for {file_path.name}: {exc}")
-                    failed += 1
-
-            safe_print(f"Parallel processing completed: {completed} successful, {failed} failed")
+        safe_print(f"Parallel processing completed: {len(completed)} successful, {len(failed)} failed")
 
     def generate_mermaid_figure(self, mmd_file):
-        """Generate figure from Mermaid diagram file using mermaid.ink API."""
+        """Generate figure from Mermaid diagram file using mermaid.ink API.
+
+        Returns:
+            True if the figure is up to date or was generated, False if only a
+            placeholder could be written
+        """
         try:
             # Create subdirectory for this figure
             figure_dir = self.output_dir / mmd_file.stem
@@ -385,7 +499,7 @@ class FigureGenerator:
             # Check if figure needs regeneration
             if not self._should_regenerate_figure(mmd_file, svg_output_file):
                 print(f"  ⚡ Skipping {mmd_file.name}: cached version is up-to-date")
-                return
+                return True
 
             print(f"  🎨 Generating SVG using mermaid.ink API: {figure_dir.name}/{svg_output_file.name}...")
 
@@ -409,7 +523,7 @@ class FigureGenerator:
                     # Generate a placeholder SVG to prevent build failures
                     print(f"  🔄 Creating placeholder SVG for {mmd_file.name}...")
                     self._create_placeholder_svg(svg_output_file, mmd_file.name, result.stderr)
-                    return
+                    return False
             else:
                 # Use mermaid.ink API approach
                 success = self._generate_mermaid_with_api(mermaid_content, svg_output_file, mmd_file.name)
@@ -421,15 +535,17 @@ class FigureGenerator:
                         mmd_file.name,
                         "mermaid.ink API approach failed - falling back to placeholder",
                     )
-                    return
+                    return False
 
             # All formats are generated directly by _generate_mermaid_with_api()
 
             # Update cache after successful generation
             self._update_figure_cache(mmd_file)
+            return True
 
         except Exception as e:
             self.logger.error(f"Error processing {mmd_file.name}: {e}")
+            return False
 
     def _parse_mermaid_file(self, mermaid_content):
         """Parse mermaid file content, extracting config and diagram content."""
@@ -563,7 +679,13 @@ class FigureGenerator:
             return False
 
     def generate_python_figure(self, py_file):
-        """Generate figure from Python script."""
+        """Generate figure from Python script.
+
+        Returns:
+            True if the figure is up to date or was generated, False if the
+            script failed or wrote no figure files
+        """
+        trace_file = None
         try:
             # Create subdirectory for this figure
             figure_dir = self.output_dir / py_file.stem
@@ -577,7 +699,7 @@ class FigureGenerator:
 
             if existing_outputs and not self._should_regenerate_figure(py_file, existing_outputs[0]):
                 print(f"  ⚡ Skipping {py_file.name}: cached version is up-to-date")
-                return
+                return True
 
             print(f"  🐍 Executing {py_file.name}...")
 
@@ -595,38 +717,37 @@ class FigureGenerator:
                     environment=env,
                 )
             else:
-                # Use local Python execution
-                python_cmd = self.platform.python_cmd
-                if "uv run" in python_cmd:
-                    # For uv run, we need to run from the project root but change to the
-                    # figure directory within the script execution
-                    exec_code = (
-                        f"import os; "
-                        f"__file__ = '{py_file.absolute()}'; "
-                        f"os.chdir('{figure_dir.absolute()}'); "
-                        f"exec(open('{py_file.absolute()}').read())"
-                    )
-                    cmd = ["uv", "run", "python", "-c", exec_code]
-                    # Run from current working directory (project root) not figure_dir
-                    cwd = None
+                # The script records the files it reads in the trace file
+                fd, trace_name = tempfile.mkstemp(prefix="rxiv_figure_inputs_", suffix=".json")
+                os.close(fd)
+                trace_file = Path(trace_name)
+                script_env = {
+                    "RXIV_FIGURE_OUTPUT_DIR": str(figure_dir.absolute()),
+                    figure_worker.TRACE_FILE_VAR: str(trace_file),
+                    figure_worker.INPUT_ROOT_VAR: str(self.figures_dir.parent),
+                }
+
+                warm_result = self._run_on_warm_worker(py_file, figure_dir, script_env)
+                if warm_result is not None:
+                    result = warm_result
                 else:
-                    cmd = [python_cmd, str(py_file.absolute())]
-                    # For other Python commands, run from figure directory
-                    cwd = str(figure_dir.absolute())
-
-                # Set environment variable to ensure script saves to correct location
-                import os
-
-                env = os.environ.copy()
-                env["RXIV_FIGURE_OUTPUT_DIR"] = str(figure_dir.absolute())
-
-                result = self.platform.run_command(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=cwd,
-                    env=env,
-                )
+                    # For uv run, the interpreter starts in the project root so uv finds the
+                    # environment, and the script runner changes to the figure directory
+                    python_command = self._python_command()
+                    cwd = None if python_command[0] == "uv" else str(figure_dir.absolute())
+                    cmd = figure_worker.script_command(python_command, py_file.absolute(), figure_dir.absolute())
+
+                    # Set environment variable to ensure script saves to correct location
+                    env = os.environ.copy()
+                    env.update(script_env)
+
+                    result = self.platform.run_command(
+                        cmd,
+                        capture_output=True,
+                        text=True,
+                        cwd=cwd,
+                        env=env,
+                    )
 
             if result.stdout:
                 # Print any output from the script (like success messages)
@@ -638,7 +759,7 @@ class FigureGenerator:
                 print(f"  ❌ Error executing {py_file.name}:")
                 if result.stderr:
                     print(f"     {result.stderr}")
-                return
+                return False
 
             print("     Debug: Script executed successfully, now checking for files...")
 
@@ -649,8 +770,6 @@ class FigureGenerator:
             time.sleep(0.1)
 
             # Force filesystem sync
-            import os
-
             os.sync() if hasattr(os, "sync") else None
 
             print(f"     Debug: About to scan directory: {figure_dir.absolute()}")
@@ -706,23 +825,33 @@ class FigureGenerator:
                 if current_files:
                     available_files = [f.name for f in current_files]
                     print(f"     Debug: Available files: {available_files}")
-                return
+                return False
 
             # Update cache after successful generation
-            self._update_figure_cache(py_file)
+            self._update_figure_cache(py_file, figure_worker.read_trace(trace_file) if trace_file else None)
+            return True
 
         except Exception as e:
             self.logger.error(f"Error executing {py_file.name}: {e}")
+            return False
+        finally:
+            if trace_file is not None:
+                trace_file.unlink(missing_ok=True)
 
     def generate_r_figure(self, r_file):
-        """Generate figure from R script."""
+        """Generate figure from R script.
+
+        Returns:
+            True if the figure is up to date or was generated, False if the
+            script could not run, failed or wrote no figure files
+        """
         try:
             # Check if Rscript is available (only for local execution)
             if self.engine != "docker" and not self._check_rscript():
                 print(f"  ⚠️  Skipping {r_file.name}: Rscript not available")
                 print("     Ensure R is installed and accessible in your PATH")
                 print("Check https://www.r-project.org/ for installation instructions")
-                return
+                return False
 
             # Create subdirectory for this figure
             figure_dir = self.output_dir / r_file.stem
@@ -736,7 +865,7 @@ class FigureGenerator:
 
             if existing_outputs and not self._should_regenerate_figure(r_file, existing_outputs[0]):
                 print(f"  ⚡ Skipping {r_file.name}: cached version is up-to-date")
-                return
+                return True
 
             print(f"  📊 Executing {r_file.name}...")
 
@@ -781,7 +910,7 @@ class FigureGenerator:
                 print(f"  ❌ Error executing {r_file.name}:")
                 if result.stderr:
                     print(f"     {result.stderr}")
-                return
+                return False
 
             # Check for generated files by scanning the figure subdirectory
             current_files = set()
@@ -820,13 +949,15 @@ class FigureGenerator:
                         print(f"     - {gen_file.name}")
             else:
                 print(f"  ⚠️  No output files detected for {r_file.name}")
-                return
+                return False
 
             # Update cache after successful generation
             self._update_figure_cache(r_file)
+            return True
 
         except Exception as e:
             print(f"  ❌ Error executing {r_file.name}: {e}")
+            return False
 
     def _import_matplotlib(self):
         """Safely import matplotlib."""
@@ -971,8 +1102,8 @@ def main():
     parser.add_argument(
         "--max-workers",
         type=int,
-        default=4,
-        help="Maximum number of parallel workers (default: 4)",
+        default=None,
+        help="Maximum number of parallel workers (default: based on CPU count and memory)",
     )
     parser.add_argument(
         "--engine",
@@ -1008,7 +1139,7 @@ def main():
 
     # Determine parallel processing settings
     use_parallel = args.parallel and not args.no_parallel
-    max_workers = max(1, min(args.max_workers, 8))  # Limit to reasonable range
+    max_workers = max(1, args.max_workers) if args.max_workers else None
 
     generator.generate_all_figures(parallel=use_parallel, max_workers=max_workers)
     print("Figure generation complete!")
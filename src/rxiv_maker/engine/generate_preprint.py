@@ -1,7 +1,10 @@
 """Generate LaTeX preprint from markdown template."""
 
+import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import yaml
 
@@ -9,7 +12,9 @@ import yaml
 if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from rxiv_maker.converters.patterns import EXECUTABLE_COMMAND_PATTERN
 from rxiv_maker.processors.template_processor import (
+    find_supplementary_md,
     generate_supplementary_tex,
     get_template_path,
     process_template_replacements,
@@ -20,9 +25,24 @@ from rxiv_maker.utils import (
     write_manuscript_output,
 )
 
+logger = logging.getLogger(__name__)
 
-def generate_preprint(output_dir, yaml_metadata, manuscript_path=None):
-    """Generate the preprint using the template."""
+
+def generate_preprint(
+    output_dir, yaml_metadata, manuscript_path=None, section_cache=None, parallel=False, manuscript_name=None
+):
+    """Generate the preprint using the template.
+
+    Args:
+        output_dir: Output directory for generated files
+        yaml_metadata: Manuscript metadata from the YAML config
+        manuscript_path: Path to the manuscript directory
+        section_cache: Optional SectionCache used to skip re-converting unchanged sections
+        parallel: Convert the main and supplementary documents at the same time
+            in separate processes
+        manuscript_name: Base name of the generated .tex file (defaults to the
+            name derived from the MANUSCRIPT_PATH environment variable)
+    """
     # Ensure output directory exists
     create_output_dir(output_dir)
 
@@ -33,19 +53,112 @@ def generate_preprint(output_dir, yaml_metadata, manuscript_path=None):
     # Find and process the manuscript markdown
     manuscript_md = find_manuscript_md(manuscript_path)
 
+    if parallel and _can_convert_in_parallel(manuscript_md, manuscript_path):
+        try:
+            return _generate_documents_in_parallel(
+                output_dir,
+                template_content,
+                yaml_metadata,
+                str(manuscript_md),
+                section_cache,
+                manuscript_path=manuscript_path,
+                manuscript_name=manuscript_name,
+            )
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parallel conversion failed, converting documents sequentially: {e}")
+
     # Process all template replacements
-    template_content = process_template_replacements(template_content, yaml_metadata, str(manuscript_md))
+    template_content = process_template_replacements(
+        template_content, yaml_metadata, str(manuscript_md), section_cache=section_cache
+    )
 
     # Extract manuscript name using centralized logic (PathManager handles this via write_manuscript_output)
     # The write_manuscript_output function now uses PathManager internally for consistent name extraction
-    manuscript_output = write_manuscript_output(output_dir, template_content, manuscript_name=None)
+    manuscript_output = write_manuscript_output(output_dir, template_content, manuscript_name=manuscript_name)
 
     # Generate supplementary information
-    generate_supplementary_tex(output_dir, yaml_metadata)
+    generate_supplementary_tex(output_dir, yaml_metadata, section_cache=section_cache, manuscript_path=manuscript_path)
 
     return manuscript_output
 
 
+def _can_convert_in_parallel(manuscript_md, manuscript_path=None):
+    """Check whether the main and supplementary documents can be converted independently.
+
+    Executable commands share one Python execution context across both
+    documents, so manuscripts that use them are always converted in order.
+    """
+    supplementary_md = find_supplementary_md(manuscript_path)
+    if not supplementary_md:
+        return False
+
+    for md_file in (manuscript_md, supplementary_md):
+        with open(md_file, encoding="utf-8") as f:
+            if EXECUTABLE_COMMAND_PATTERN.search(f.read()):
+                logger.debug(f"{md_file} contains executable commands, converting documents sequentially")
+                return False
+    return True
+
+
+def _generate_documents_in_parallel(
+    output_dir,
+    template_content,
+    yaml_metadata,
+    manuscript_md,
+    section_cache,
+    manuscript_path=None,
+    manuscript_name=None,
+):
+    r"""Convert the main and supplementary documents in two worker processes.
+
+    Each worker converts with its own copy of the section cache; the copies are
+    merged back so the parent can save the sections used by both documents.
+    Nothing else is merged: citations and cross-references between the two
+    documents are written as ``\cite``, ``\ref`` and ``\label`` commands
+    and only resolved by LaTeX and BibTeX when the PDF is compiled, so neither
+    conversion needs state produced by the other.
+    """
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        main_future = executor.submit(
+            _generate_main_document,
+            output_dir,
+            template_content,
+            yaml_metadata,
+            manuscript_md,
+            section_cache,
+            manuscript_name,
+        )
+        supplementary_future = executor.submit(
+            _generate_supplementary_document, output_dir, yaml_metadata, section_cache, manuscript_path
+        )
+
+        manuscript_output, main_cache = main_future.result()
+        supplementary_cache = supplementary_future.result()
+
+    if section_cache is not None:
+        section_cache.merge(main_cache)
+        section_cache.merge(supplementary_cache)
+
+    return manuscript_output
+
+
+def _generate_main_document(
+    output_dir, template_content, yaml_metadata, manuscript_md, section_cache, manuscript_name=None
+):
+    """Worker: convert the main manuscript and write it to the output directory."""
+    template_content = process_template_replacements(
+        template_content, yaml_metadata, manuscript_md, section_cache=section_cache
+    )
+    manuscript_output = write_manuscript_output(output_dir, template_content, manuscript_name=manuscript_name)
+    return manuscript_output, section_cache
+
+
+def _generate_supplementary_document(output_dir, yaml_metadata, section_cache, manuscript_path=None):
+    """Worker: convert the supplementary information and write Supplementary.tex."""
+    generate_supplementary_tex(output_dir, yaml_metadata, section_cache=section_cache, manuscript_path=manuscript_path)
+    return section_cache
+
+
 # CLI integration
 def main():
     """Main function for CLI integration."""
@@ -7,6 +7,7 @@ and other shell-escape requiring packages.
 
 import logging
 import os
+import re
 import shutil
 import subprocess
 import zipfile
@@ -14,6 +15,85 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Temporary build artifacts that arXiv regenerates automatically
+AUXILIARY_EXTENSIONS = {".aux", ".blg", ".log", ".pdf", ".out", ".fls", ".fdb_latexmk", ".synctex.gz"}
+
+# Formats that deflate cannot shrink, stored as they are in the ZIP package
+COMPRESSED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".pdf", ".gz", ".zip"}
+
+
+def _sync_file(source: Path, dest: Path, link: bool = False) -> bool:
+    """Bring a file in the package up to date with its source.
+
+    Args:
+        source: File to package
+        dest: Location of the file in the package
+        link: Hardlink the file instead of copying it when possible. Only
+            used for files nothing writes to in the package, such as figures.
+
+    Returns:
+        True if the file was copied or linked, False if it was already up to date
+    """
+    source_stat = source.stat()
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        dest_stat = None
+
+    if dest_stat is not None:
+        same_file = (dest_stat.st_ino, dest_stat.st_dev) == (source_stat.st_ino, source_stat.st_dev)
+        # copy2 preserves modification times, so unchanged copies match their source
+        same_copy = (dest_stat.st_size, dest_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns)
+        if same_file or same_copy:
+            return False
+        dest.unlink()
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if link:
+        try:
+            os.link(source, dest)
+            return True
+        except OSError:
+            pass
+    shutil.copy2(source, dest)
+    return True
+
+
+def _write_if_changed(dest: Path, content: str) -> bool:
+    """Write text to a file unless it already has exactly that content.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if dest.read_text(encoding="utf-8") == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    dest.write_text(content, encoding="utf-8")
+    return True
+
+
+def _remove_stale_files(arxiv_path: Path, packaged: set[Path]) -> list[Path]:
+    """Remove files left in the package by earlier runs that are no longer part of it.
+
+    Build artifacts of the compilation test are kept, they are excluded from
+    the ZIP package anyway and speed up the next test.
+
+    Returns:
+        Paths of the removed files, relative to the package
+    """
+    removed = []
+    for file_path in sorted(arxiv_path.rglob("*"), reverse=True):
+        relative_path = file_path.relative_to(arxiv_path)
+        if file_path.is_dir():
+            if not any(file_path.iterdir()):
+                file_path.rmdir()
+        elif relative_path not in packaged and file_path.suffix.lower() not in AUXILIARY_EXTENSIONS:
+            file_path.unlink()
+            removed.append(relative_path)
+    return removed
+
 
 def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path=None):
     """Prepare arXiv submission package.
@@ -33,10 +113,11 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
 
     arxiv_path = Path(arxiv_dir)
 
-    # Create clean arxiv directory
-    if arxiv_path.exists():
-        shutil.rmtree(arxiv_path)
-    arxiv_path.mkdir(parents=True)
+    # The package from the previous run is updated in place: unchanged files
+    # are left alone and only new or modified files are copied
+    arxiv_path.mkdir(parents=True, exist_ok=True)
+    packaged: set[Path] = set()
+    unchanged_count = 0
 
     manuscript_name = Path(manuscript_path).name if manuscript_path else "manuscript"
     print(f"Preparing arXiv submission package for '{manuscript_name}' in {arxiv_path}")
@@ -64,8 +145,11 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
             "the style file exists in the output directory."
         )
 
-    shutil.copy2(style_source, arxiv_path / "rxiv_maker_style.cls")
-    print(f"✓ Copied unified arXiv-compatible style file from {style_source}")
+    packaged.add(Path("rxiv_maker_style.cls"))
+    if _sync_file(style_source, arxiv_path / "rxiv_maker_style.cls"):
+        print(f"✓ Copied unified arXiv-compatible style file from {style_source}")
+    else:
+        unchanged_count += 1
 
     # Determine the main manuscript file name by looking for .tex files
     tex_files = list(output_path.glob("*.tex"))
@@ -100,6 +184,7 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
     for filename in main_files:
         source_file = output_path / filename
         if source_file.exists():
+            packaged.add(Path(filename))
             # Copy and modify the main tex file to use arxiv style
             if filename == main_tex_file:
                 with open(source_file, encoding="utf-8") as f:
@@ -107,8 +192,6 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
 
                 # Fix arXiv-specific issues
                 # 1. Fix escaped underscores in \includegraphics paths
-                import re
-
                 # Replace all \_ with _ inside \includegraphics{...} commands
                 def fix_includegraphics_underscores(match):
                     graphics_cmd = match.group(0)
@@ -135,12 +218,14 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
                 # No need to replace documentclass - unified style is arXiv-compatible
                 # Keep the original style file name since it's unified
                 # Write the modified content
-                with open(arxiv_path / filename, "w", encoding="utf-8") as f:
-                    f.write(content)
-                print(f"✓ Copied and modified {filename} for arXiv compatibility")
-            else:
-                shutil.copy2(source_file, arxiv_path / filename)
+                if _write_if_changed(arxiv_path / filename, content):
+                    print(f"✓ Copied and modified {filename} for arXiv compatibility")
+                else:
+                    unchanged_count += 1
+            elif _sync_file(source_file, arxiv_path / filename):
                 print(f"✓ Copied {filename}")
+            else:
+                unchanged_count += 1
         else:
             if filename.endswith(".bbl") or filename.endswith(".bst"):
                 print(f"⚠ Optional file not found: {filename}")
@@ -150,38 +235,34 @@ def prepare_arxiv_package(output_dir="./output", arxiv_dir=None, manuscript_path
     # Copy all figure files
     figures_source = output_path / "Figures"
     if figures_source.exists():
-        figures_dest = arxiv_path / "Figures"
+        figure_files: set[Path] = set()
 
-        # Copy figure directories with PNG files (arXiv preferred format)
+        # Copy figure directories with PNG files (arXiv preferred format),
+        # PDF files as backup and markdown files for tables (STable directories)
         for figure_dir in figures_source.iterdir():
             if figure_dir.is_dir() and not figure_dir.name.startswith("."):
-                dest_dir = figures_dest / figure_dir.name
-                dest_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy PNG files
-                for png_file in figure_dir.glob("*.png"):
-                    shutil.copy2(png_file, dest_dir / png_file.name)
-                    print(f"✓ Copied {png_file.relative_to(output_path)}")
-
-                # Also copy PDF files as backup
-                for pdf_file in figure_dir.glob("*.pdf"):
-                    shutil.copy2(pdf_file, dest_dir / pdf_file.name)
-                    print(f"✓ Copied {pdf_file.relative_to(output_path)}")
-
-                # Copy markdown files for tables (STable directories)
-                for md_file in figure_dir.glob("*.md"):
-                    shutil.copy2(md_file, dest_dir / md_file.name)
-                    print(f"✓ Copied {md_file.relative_to(output_path)}")
+                for pattern in ("*.png", "*.pdf", "*.md"):
+                    figure_files.update(figure_dir.glob(pattern))
 
         # Copy data files if they exist
         data_dir = figures_source / "DATA"
         if data_dir.exists():
-            data_dest = figures_dest / "DATA"
-            if data_dest.exists():
-                shutil.rmtree(data_dest)
-            shutil.copytree(data_dir, data_dest)
-            print("✓ Copied DATA directory")
+            figure_files.update(path for path in data_dir.rglob("*") if path.is_file())
+
+        # Figures are only read in the package, so they can share storage with the output
+        for figure_file in sorted(figure_files):
+            relative_path = figure_file.relative_to(output_path)
+            packaged.add(relative_path)
+            if _sync_file(figure_file, arxiv_path / relative_path, link=True):
+                print(f"✓ Copied {relative_path}")
+            else:
+                unchanged_count += 1
 
+    for stale_file in _remove_stale_files(arxiv_path, packaged):
+        print(f"✓ Removed {stale_file} (no longer in output)")
+
+    if unchanged_count:
+        print(f"✓ Kept {unchanged_count} unchanged files from the previous package")
     print(f"\n📦 arXiv package prepared in {arxiv_path}")
 
     # Verify all required files are present
@@ -414,35 +495,48 @@ def test_arxiv_compilation(arxiv_path):
 
 
 def create_zip_package(arxiv_path, zip_filename="for_arxiv.zip", manuscript_path=None):
-    """Create a ZIP file for arXiv submission."""
+    """Create a ZIP file for arXiv submission.
+
+    The ZIP package is rebuilt on every run; only the package directory is
+    updated incrementally. Already-compressed formats are stored as they are
+    instead of being deflated again.
+    """
     # Use manuscript-aware naming if manuscript path is provided
     if manuscript_path and zip_filename == "for_arxiv.zip":
         manuscript_name = Path(manuscript_path).name
         zip_filename = f"{manuscript_name}_for_arxiv.zip"
 
     zip_path = Path(zip_filename).resolve()
-
-    # Define auxiliary files that should be excluded from arXiv submission
-    # These are temporary build artifacts that arXiv regenerates automatically
-    auxiliary_extensions = {".aux", ".blg", ".log", ".pdf", ".out", ".fls", ".fdb_latexmk", ".synctex.gz"}
+    arxiv_path = Path(arxiv_path)
 
     print(f"\n📁 Creating ZIP package: {zip_path}")
 
     excluded_files = []
     included_files = []
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in arxiv_path.rglob("*"):
-            if file_path.is_file():
-                # Check if file should be excluded (auxiliary files)
-                if file_path.suffix.lower() in auxiliary_extensions:
-                    excluded_files.append(file_path.name)
-                    continue
-
-                # Store files with relative paths
-                arcname = file_path.relative_to(arxiv_path)
-                zipf.write(file_path, arcname)
-                included_files.append(str(arcname))
+    # Write next to the previous package, which is replaced once the new one is complete
+    temp_zip_path = zip_path.with_name(f"{zip_path.name}.tmp")
+    try:
+        with zipfile.ZipFile(temp_zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for file_path in sorted(arxiv_path.rglob("*")):
+                if file_path.is_file():
+                    # Exclude auxiliary files, which are temporary build artifacts
+                    # that arXiv regenerates automatically
+                    if file_path.suffix.lower() in AUXILIARY_EXTENSIONS:
+                        excluded_files.append(file_path.name)
+                        continue
+
+                    # Store files with relative paths
+                    arcname = file_path.relative_to(arxiv_path).as_posix()
+                    if file_path.suffix.lower() in COMPRESSED_EXTENSIONS:
+                        zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zipf.write(file_path, arcname)
+                    included_files.append(arcname)
+    except BaseException:
+        temp_zip_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_zip_path, zip_path)
 
     # Report what was included and excluded
     print(f"  📦 Added {len(included_files)} files:")
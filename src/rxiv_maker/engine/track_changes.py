@@ -4,19 +4,23 @@ This module provides change tracking capabilities by comparing the current
 manuscript against a specified git tag using latexdiff.
 """
 
-import builtins
 import contextlib
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Local implementations to avoid import issues
 import yaml
 
+# Number of tag conversions kept in the cache, most recently used first
+TAG_CACHE_MAX_ENTRIES = 8
+
 
 def extract_yaml_metadata_local(yaml_file_path: str) -> dict:
     """Extract YAML metadata from a config file."""
@@ -122,6 +126,23 @@ class TrackChangesManager:
         except subprocess.CalledProcessError:
             return False
 
+    def get_tag_commit(self) -> str | None:
+        """Resolve the git tag to the SHA of the commit it points to.
+
+        Returns:
+            Commit SHA, or None if the tag cannot be resolved
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--verify", "--quiet", f"{self.git_tag}^{{commit}}"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return result.stdout.strip() or None
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
     def extract_files_from_tag(self, temp_dir: Path) -> bool:
         """Extract manuscript files from the specified git tag.
 
@@ -137,36 +158,162 @@ class TrackChangesManager:
         tag_manuscript_dir = temp_dir / "tag_manuscript"
         tag_manuscript_dir.mkdir()
 
-        # Extract each manuscript file from the tag
+        # Only the files the converter reads, and that the current manuscript still has
+        file_names = []
         for file_name in self.manuscript_files:
-            file_path = self.manuscript_path / file_name
-            if not file_path.exists():
+            if (self.manuscript_path / file_name).exists():
+                file_names.append(file_name)
+            else:
                 self.log(f"Skipping {file_name} (not found in current manuscript)")
+
+        try:
+            blobs = self.read_tag_blobs([f"{self.manuscript_path.name}/{file_name}" for file_name in file_names])
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.log(f"Error reading files from git tag {self.git_tag}: {e}", force=True)
+            return False
+
+        # Write extracted content to temp directory
+        for file_name, content in zip(file_names, blobs, strict=True):
+            if content is None:
+                self.log(f"Warning: Could not extract {file_name} from tag {self.git_tag}")
                 continue
+            (tag_manuscript_dir / file_name).write_bytes(content)
+            self.log(f"Extracted {file_name} from tag {self.git_tag}")
 
-            try:
-                # Try to extract file from git tag
-                result = subprocess.run(
-                    [
-                        "git",
-                        "show",
-                        f"{self.git_tag}:{self.manuscript_path.name}/{file_name}",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+        return True
 
-                # Write extracted content to temp directory
-                (tag_manuscript_dir / file_name).write_text(result.stdout, encoding="utf-8")
-                self.log(f"Extracted {file_name} from tag {self.git_tag}")
+    def read_tag_blobs(self, paths: list[str]) -> list[bytes | None]:
+        """Read files as of the git tag straight from the object store.
 
-            except subprocess.CalledProcessError as e:
-                self.log(f"Warning: Could not extract {file_name} from tag {self.git_tag}: {e}")
+        All files are read by one ``git cat-file --batch`` process instead of
+        one ``git show`` per file.
+
+        Args:
+            paths: Repository paths of the files to read
+
+        Returns:
+            Contents of each file, or None for files that are not in the tag
+
+        Raises:
+            subprocess.CalledProcessError: If git fails
+        """
+        if not paths:
+            return []
+
+        requests = "".join(f"{self.git_tag}:{path}\n" for path in paths)
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=requests.encode("utf-8"),
+            capture_output=True,
+            check=True,
+        )
+
+        # Each answer is "<sha> <type> <size>" and the content, or "<name> missing"
+        output = result.stdout
+        blobs: list[bytes | None] = []
+        position = 0
+        for _ in paths:
+            header_end = output.index(b"\n", position)
+            header = output[position:header_end].split()
+            position = header_end + 1
+            if len(header) != 3 or not header[2].isdigit():
+                blobs.append(None)
                 continue
+            size = int(header[2])
+            blobs.append(output[position : position + size] if header[1] == b"blob" else None)
+            position += size + 1
+        return blobs
+
+    def prepare_tag_latex(self, temp_dir: Path) -> bool:
+        """Generate the tag version's LaTeX files, reusing them if the commit was converted before.
+
+        The files generated for a tag are cached under the SHA of its commit,
+        so repeated diffs against the same tag skip extraction and conversion.
 
+        Args:
+            temp_dir: Temporary directory to extract the tag's files to
+
+        Returns:
+            True if the tag's LaTeX files are in place, False otherwise
+        """
+        tag_output_dir = self.output_dir / "tag"
+        cache_dir = self._get_tag_cache_dir()
+
+        if cache_dir is not None and (cache_dir / "tag").is_dir():
+            shutil.rmtree(tag_output_dir, ignore_errors=True)
+            shutil.copytree(cache_dir / "tag", tag_output_dir)
+            # Mark the entry as recently used so pruning keeps it
+            with contextlib.suppress(OSError):
+                os.utime(cache_dir)
+            self.log(f"Reusing LaTeX files generated for tag {self.git_tag}")
+            return True
+
+        # Extract files from git tag
+        if not self.extract_files_from_tag(temp_dir):
+            return False
+
+        self.log("Generating LaTeX files for tag version...")
+        if not self.generate_latex_files(temp_dir / "tag_manuscript", "tag"):
+            return False
+
+        if cache_dir is None or not (tag_output_dir / "tag_manuscript.tex").exists():
+            return True
+
+        # Copy under a temporary name so an interrupted copy is never reused
+        partial_output = cache_dir / f"tag.{os.getpid()}.tmp"
+        try:
+            shutil.copytree(tag_output_dir, partial_output, dirs_exist_ok=True)
+            os.replace(partial_output, cache_dir / "tag")
+        except OSError as e:
+            self.log(f"Warning: Could not cache LaTeX files for tag {self.git_tag}: {e}")
+            shutil.rmtree(partial_output, ignore_errors=True)
+        self._prune_tag_cache(cache_dir.parent)
         return True
 
+    def _prune_tag_cache(self, cache_root: Path) -> None:
+        """Remove the least recently used tag conversions beyond the cache limit.
+
+        Args:
+            cache_root: Directory holding one cache directory per tag conversion
+        """
+        try:
+            entries = sorted(
+                (entry for entry in cache_root.iterdir() if entry.is_dir()),
+                key=lambda entry: entry.stat().st_mtime_ns,
+                reverse=True,
+            )
+        except OSError as e:
+            self.log(f"Warning: Could not prune tag cache {cache_root}: {e}")
+            return
+        for entry in entries[TAG_CACHE_MAX_ENTRIES:]:
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def _get_tag_cache_dir(self) -> Path | None:
+        """Get the cache directory for the tag's generated LaTeX files.
+
+        Returns:
+            Directory keyed on the tag's commit, the converter version and the
+            files extracted from it, or None if the tag cannot be resolved
+        """
+        commit = self.get_tag_commit()
+        if commit is None:
+            return None
+
+        from ..utils.cache_utils import get_cache_dir
+        from ..utils.section_cache import get_converter_version
+
+        # The converter version hashes the converter sources, so development
+        # installs do not reuse LaTeX generated by older converters
+        extracted_files = [name for name in self.manuscript_files if (self.manuscript_path / name).exists()]
+        key = "\0".join([commit, self.manuscript_path.name, get_converter_version(), *extracted_files])
+        cache_dir = get_cache_dir("track_changes") / hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.log(f"Warning: Could not create cache directory {cache_dir}: {e}")
+            return None
+        return cache_dir
+
     def generate_latex_files(self, manuscript_dir: Path, output_subdir: str) -> bool:
         """Generate LaTeX files from a manuscript directory.
 
@@ -265,11 +412,13 @@ class TrackChangesManager:
                 self.log(f"latexdiff stderr: {e.stderr}", force=True)
             return False
 
-    def compile_diff_pdf(self, diff_tex: Path) -> bool:
+    def compile_diff_pdf(self, diff_tex: Path, use_preamble_format: bool = True) -> bool:
         """Compile the difference LaTeX file to PDF.
 
         Args:
             diff_tex: Path to difference LaTeX file
+            use_preamble_format: Compile with a cached preamble format when
+                RXIV_LATEX_FORMAT is enabled
 
         Returns:
             True if compilation successful, False otherwise
@@ -281,9 +430,23 @@ class TrackChangesManager:
         try:
             self.log("Compiling change-tracked PDF...")
 
-            # Change to output directory for compilation
-            original_cwd = os.getcwd()
-            os.chdir(diff_tex.parent)
+            # Load the preamble from a cached format when enabled
+            pdflatex_command = ["pdflatex", "-interaction=nonstopmode", diff_tex.name]
+            preamble_format = None
+            if use_preamble_format:
+                from ..core.environment_manager import EnvironmentManager
+                from ..utils.preamble_format import get_preamble_format
+
+                if EnvironmentManager.is_latex_format_enabled():
+                    preamble_format = get_preamble_format(diff_tex)
+                if preamble_format is not None:
+                    pdflatex_command.insert(1, f"-fmt={preamble_format}")
+            pdf_file = diff_tex.with_suffix(".pdf")
+            previous_pdf = pdf_file.stat().st_mtime_ns if pdf_file.exists() else None
+
+            # Compile in the output directory; the process working directory is
+            # left alone, as it is shared by builds running in other threads
+            work_dir = diff_tex.parent
 
             # Extract base name for bibtex
             tex_basename = diff_tex.stem
@@ -291,7 +454,8 @@ class TrackChangesManager:
             # First LaTeX compilation pass - initial document processing
             self.log("LaTeX compilation pass 1/3 - processing document structure")
             result1 = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", diff_tex.name],
+                pdflatex_command,
+                cwd=work_dir,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -304,13 +468,13 @@ class TrackChangesManager:
                     self.log(f"LaTeX output: {result1.stdout}")
                     self.log(f"LaTeX errors: {result1.stderr}")
 
-            # Run bibtex if references exist (check in current working directory)
-            # which is output_dir
-            output_references = Path("03_REFERENCES.bib")
+            # Run bibtex if references exist in the output directory
+            output_references = work_dir / "03_REFERENCES.bib"
             if output_references.exists():
                 self.log("Running BibTeX to process bibliography...")
                 bibtex_result = subprocess.run(
                     ["bibtex", tex_basename],
+                    cwd=work_dir,
                     capture_output=True,
                     text=True,
                     encoding="utf-8",
@@ -329,7 +493,7 @@ class TrackChangesManager:
                 if bibtex_result.returncode != 0:
                     self.log(f"BibTeX returned error code {bibtex_result.returncode}")
                     # Check if .bbl file was still created despite errors
-                    bbl_file = Path(f"{tex_basename}.bbl")
+                    bbl_file = work_dir / f"{tex_basename}.bbl"
                     if not bbl_file.exists():
                         self.log(
                             "BibTeX failed to create .bbl file - citations will appear as ?",
@@ -346,7 +510,8 @@ class TrackChangesManager:
             # Second LaTeX compilation pass - bibliography integration
             self.log("LaTeX compilation pass 2/3 - integrating bibliography references")
             result2 = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", diff_tex.name],
+                pdflatex_command,
+                cwd=work_dir,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -362,7 +527,8 @@ class TrackChangesManager:
             # Final LaTeX compilation pass - cross-references and finalization
             self.log("LaTeX compilation pass 3/3 - finalizing cross-references and citations")
             result3 = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", diff_tex.name],
+                pdflatex_command,
+                cwd=work_dir,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -375,13 +541,10 @@ class TrackChangesManager:
                     self.log(f"LaTeX output: {result3.stdout}")
                     self.log(f"LaTeX errors: {result3.stderr}")
 
-            # Check if PDF was generated (use the name from the current directory)
-            pdf_name = diff_tex.with_suffix(".pdf").name
-            Path(pdf_name)
-
-            # Return to original directory for absolute path checking
-            os.chdir(original_cwd)
-            pdf_file = diff_tex.with_suffix(".pdf")
+            # Check if PDF was generated
+            if preamble_format is not None and (not pdf_file.exists() or pdf_file.stat().st_mtime_ns == previous_pdf):
+                self.log("Compilation with the preamble format failed, retrying without it", force=True)
+                return self.compile_diff_pdf(diff_tex, use_preamble_format=False)
 
             if pdf_file.exists():
                 self.log(f"✅ Change-tracked PDF generated: {pdf_file}")
@@ -393,10 +556,6 @@ class TrackChangesManager:
         except Exception as e:
             self.log(f"Error compiling PDF: {e}", force=True)
             return False
-        finally:
-            # Ensure we return to original directory
-            with contextlib.suppress(builtins.BaseException):
-                os.chdir(original_cwd)
 
     def generate_custom_filename(self) -> str:
         """Generate custom filename using the same convention as regular PDF generation.
@@ -439,20 +598,16 @@ class TrackChangesManager:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Extract files from git tag
-            if not self.extract_files_from_tag(temp_path):
-                return False
-
-            # Generate LaTeX files for both versions
             tag_manuscript_dir = temp_path / "tag_manuscript"
 
-            self.log("Generating LaTeX files for current version...")
-            if not self.generate_latex_files(self.manuscript_path, "current"):
-                return False
-
-            self.log("Generating LaTeX files for tag version...")
-            if not self.generate_latex_files(tag_manuscript_dir, "tag"):
-                return False
+            # The two versions are converted independently, so the current one
+            # is generated while the tag version is extracted and converted
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.log("Generating LaTeX files for current version...")
+                current_generated = executor.submit(self.generate_latex_files, self.manuscript_path, "current")
+                tag_generated = self.prepare_tag_latex(temp_path)
+                if not (current_generated.result() and tag_generated):
+                    return False
 
             # Find the main LaTeX files
             current_tex = self.output_dir / "current" / f"{self.manuscript_path.name}.tex"
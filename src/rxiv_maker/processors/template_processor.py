@@ -56,8 +56,21 @@ def get_template_path():
     )
 
 
-def find_supplementary_md():
-    """Find supplementary information file in the manuscript directory."""
+def find_supplementary_md(manuscript_path=None):
+    """Find supplementary information file in the manuscript directory.
+
+    Args:
+        manuscript_path: Path to the manuscript directory. If not provided, the
+            current directory and the MANUSCRIPT_PATH environment variable are used,
+            so builds running concurrently must always pass it.
+    """
+    if manuscript_path is not None:
+        manuscript_dir = Path(manuscript_path)
+        if manuscript_dir.is_file():
+            manuscript_dir = manuscript_dir.parent
+        supplementary_md = manuscript_dir / "02_SUPPLEMENTARY_INFO.md"
+        return supplementary_md if supplementary_md.exists() else None
+
     current_dir = Path.cwd()
     manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
 
@@ -129,11 +142,20 @@ def generate_supplementary_cover_page(yaml_metadata):
     return cover_latex
 
 
-def generate_supplementary_tex(output_dir, yaml_metadata=None):
-    """Generate Supplementary.tex file from supplementary markdown."""
+def generate_supplementary_tex(output_dir, yaml_metadata=None, section_cache=None, manuscript_path=None):
+    """Generate Supplementary.tex file from supplementary markdown.
+
+    Args:
+        output_dir: Directory to write Supplementary.tex into
+        yaml_metadata: Manuscript metadata used for the cover page
+        section_cache: Optional SectionCache used to skip re-converting unchanged sections
+        manuscript_path: Path to the manuscript directory (see ``find_supplementary_md``)
+    """
     from ..converters.md2tex import convert_markdown_to_latex
 
-    supplementary_md = find_supplementary_md()
+    convert = section_cache.convert if section_cache is not None else convert_markdown_to_latex
+
+    supplementary_md = find_supplementary_md(manuscript_path)
     if not supplementary_md:
         # Create empty supplementary file
         supplementary_tex_path = Path(output_dir) / "Supplementary.tex"
@@ -160,7 +182,7 @@ def generate_supplementary_tex(output_dir, yaml_metadata=None):
         # Convert section headers to regular LaTeX sections
         tables_content = re.sub(r"^## (.+)$", r"\\section*{\1}", tables_content, flags=re.MULTILINE)
 
-        tables_latex = "% Supplementary Tables\n\n" + convert_markdown_to_latex(tables_content, is_supplementary=True)
+        tables_latex = "% Supplementary Tables\n\n" + convert(tables_content, is_supplementary=True)
 
     if sections["notes"]:
         # Process notes section with special handling for section headers
@@ -178,9 +200,7 @@ def generate_supplementary_tex(output_dir, yaml_metadata=None):
 \\setcounter{subsection}{0}
 
 """
-        notes_latex = (
-            "% Supplementary Notes\n" + note_setup + convert_markdown_to_latex(notes_content, is_supplementary=True)
-        )
+        notes_latex = "% Supplementary Notes\n" + note_setup + convert(notes_content, is_supplementary=True)
 
     if sections["figures"]:
         # Process figures section with special handling for section headers
@@ -189,9 +209,7 @@ def generate_supplementary_tex(output_dir, yaml_metadata=None):
         # Convert section headers to regular LaTeX sections
         figures_content = re.sub(r"^## (.+)$", r"\\section*{\1}", figures_content, flags=re.MULTILINE)
 
-        figures_latex = "% Supplementary Figures\n\n" + convert_markdown_to_latex(
-            figures_content, is_supplementary=True
-        )
+        figures_latex = "% Supplementary Figures\n\n" + convert(figures_content, is_supplementary=True)
 
     # Combine sections in proper order
     supplementary_latex = tables_latex + "\n" + notes_latex + "\n" + figures_latex
@@ -282,8 +300,15 @@ def generate_bibliography(yaml_metadata):
     return f"\\bibliography{{{bibliography}}}"
 
 
-def process_template_replacements(template_content, yaml_metadata, article_md):
-    """Process all template replacements with metadata and content."""
+def process_template_replacements(template_content, yaml_metadata, article_md, section_cache=None):
+    """Process all template replacements with metadata and content.
+
+    Args:
+        template_content: LaTeX template content
+        yaml_metadata: Manuscript metadata from the YAML config
+        article_md: Path to the main manuscript markdown file
+        section_cache: Optional SectionCache used to skip re-converting unchanged sections
+    """
     # Process draft watermark based on status field
     is_draft = False
     if "status" in yaml_metadata:
@@ -385,7 +410,7 @@ def process_template_replacements(template_content, yaml_metadata, article_md):
     template_content = template_content.replace("<PY-RPL:BIBLIOGRAPHY>", bibliography_section)
 
     # Extract content sections from markdown
-    content_sections = extract_content_sections(article_md)
+    content_sections = extract_content_sections(article_md, section_cache)
 
     # Replace content placeholders with extracted sections
     template_content = template_content.replace("<PY-RPL:ABSTRACT>", content_sections.get("abstract", ""))
@@ -8,9 +8,10 @@ try:
     from .citation_utils import inject_rxiv_citation
 except ImportError:
     # Fallback for when citation_utils is not available
+    from pathlib import Path
     from typing import Any
 
-    def inject_rxiv_citation(yaml_metadata: dict[str, Any]) -> None:
+    def inject_rxiv_citation(yaml_metadata: dict[str, Any], manuscript_path: str | Path | None = None) -> None:
         """Fallback implementation when citation_utils is not available."""
         print("Warning: Citation utils not available, skipping citation injection")
 
@@ -3,9 +3,10 @@
 
 This module provides checksum-based DOI validation that only re-validates
 bibliography files when they actually change, not just when timestamps change.
+The checksum is stored with the file's size, modification time and inode, so
+an untouched bibliography is not read again.
 """
 
-import hashlib
 import json
 import logging
 import time
@@ -13,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from .cache_utils import get_cache_dir, get_legacy_cache_dir, migrate_cache_file
+from .file_hashing import file_signature, hash_file
 
 logger = logging.getLogger(__name__)
 
@@ -86,24 +88,38 @@ class BibliographyChecksumManager:
         except OSError as e:
             logger.error(f"Failed to save bibliography checksum to {self.checksum_file}: {e}")
 
+    def _stored_hash(self) -> dict[str, Any]:
+        """Get the stored checksum of the bibliography with its file signature."""
+        return {
+            "signature": self._checksum_data.get("bibliography_signature"),
+            "sha256": self._checksum_data.get("bibliography_checksum"),
+        }
+
+    def _is_unchanged_since_update(self) -> bool:
+        """Check if the bibliography file is untouched since the checksum was stored."""
+        signature = file_signature(self.bibliography_file)
+        return (
+            signature is not None
+            and bool(self._checksum_data.get("bibliography_checksum"))
+            and self._checksum_data.get("bibliography_signature") == signature
+        )
+
     def _calculate_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum for a file.
 
+        The stored checksum of the bibliography is reused while its signature is unchanged.
+
         Args:
             file_path: Path to the file
 
         Returns:
             SHA256 checksum as hex string
         """
-        hasher = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except OSError as e:
-            logger.error(f"Failed to calculate checksum for {file_path}: {e}")
-            return ""
+        known = self._stored_hash() if file_path == self.bibliography_file else None
+        checksum, _ = hash_file(file_path, known)
+        if not checksum:
+            logger.error(f"Failed to calculate checksum for {file_path}")
+        return checksum
 
     def _extract_doi_entries(self, content: str) -> dict[str, str]:
         """Extract DOI entries from bibliography content.
@@ -169,6 +185,11 @@ class BibliographyChecksumManager:
         if not self.bibliography_file.exists():
             return False, None
 
+        # DOI entries were extracted from exactly this file when the checksum was stored
+        if self._is_unchanged_since_update():
+            logger.debug("DOI entries unchanged")
+            return False, self._checksum_data.get("doi_entries", {})
+
         try:
             with open(self.bibliography_file, encoding="utf-8") as f:
                 content = f.read()
@@ -219,7 +240,9 @@ class BibliographyChecksumManager:
             logger.warning("Bibliography file not found for checksum update")
             return
 
-        current_checksum = self._calculate_file_checksum(self.bibliography_file)
+        # A file modified within the timestamp resolution may change again
+        # unnoticed, so no signature is stored for it
+        current_checksum, entry = hash_file(self.bibliography_file, self._stored_hash())
         if not current_checksum:
             logger.error("Failed to calculate checksum for bibliography file")
             return
@@ -236,6 +259,7 @@ class BibliographyChecksumManager:
         self._checksum_data.update(
             {
                 "bibliography_checksum": current_checksum,
+                "bibliography_signature": entry["signature"] if entry else None,
                 "doi_entries": current_doi_entries,
                 "last_validation_completed": validation_completed,
                 "last_validation_timestamp": int(time.time()) if validation_completed else None,
@@ -5,27 +5,31 @@ from pathlib import Path
 from typing import Any
 
 
-def inject_rxiv_citation(yaml_metadata: dict[str, Any]) -> None:
+def inject_rxiv_citation(yaml_metadata: dict[str, Any], manuscript_path: str | Path | None = None) -> None:
     """Inject Rxiv-Maker citation into bibliography if acknowledge_rxiv_maker is true.
 
     Args:
         yaml_metadata: The YAML metadata dictionary.
+        manuscript_path: Path to the manuscript directory. If not provided, the
+            MANUSCRIPT_PATH environment variable is resolved against the current directory.
     """
     # Check if acknowledgment is requested
     acknowledge_rxiv = yaml_metadata.get("acknowledge_rxiv_maker", False)
     if not acknowledge_rxiv:
         return
 
-    # Get manuscript path and bibliography file
-    manuscript_path = os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
-    current_dir = Path.cwd()
+    # Get manuscript directory and bibliography file
+    if manuscript_path is not None:
+        manuscript_dir = Path(manuscript_path)
+    else:
+        manuscript_dir = Path.cwd() / os.getenv("MANUSCRIPT_PATH", "MANUSCRIPT")
     bib_filename = yaml_metadata.get("bibliography", "03_REFERENCES.bib")
 
     # Handle .bib extension
     if not bib_filename.endswith(".bib"):
         bib_filename += ".bib"
 
-    bib_file_path = current_dir / manuscript_path / bib_filename
+    bib_file_path = manuscript_dir / bib_filename
 
     if not bib_file_path.exists():
         print(f"Warning: Bibliography file {bib_file_path} not found. Creating new file.")
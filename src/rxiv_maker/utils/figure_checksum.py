@@ -3,16 +3,25 @@
 
 This module provides checksum-based figure regeneration that only regenerates
 figures when source files (.mmd, .py, .R) actually change, not just when
-timestamps change.
+timestamps change. Files a figure read when it was last generated, and the
+interpreter and package directories it ran with, are part of its cache key.
+
+File hashes are remembered together with each file's size, modification time
+and inode, so unchanged files are not read again on every check.
 """
 
 import hashlib
 import json
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from .cache_utils import get_cache_dir, get_legacy_cache_dir, migrate_cache_file
+from .file_hashing import hash_file
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,8 @@ class FigureChecksumManager:
 
         # Cache file specific to this manuscript
         self.checksum_file = self.cache_dir / f"figure_checksums_{self.manuscript_name}.json"
+        self.inputs_file = self.cache_dir / f"figure_inputs_{self.manuscript_name}.json"
+        self.hashes_file = self.cache_dir / f"figure_hashes_{self.manuscript_name}.json"
         self.figures_dir = self.manuscript_path / "FIGURES"
 
         # Handle migration from legacy cache location
@@ -47,6 +58,13 @@ class FigureChecksumManager:
 
         # Load existing checksums
         self._checksums: dict[str, str] = self._load_checksums()
+        self._inputs: dict[str, dict[str, list[str]]] = self._load_inputs()
+        self._file_hashes: dict[str, dict[str, Any]] = self._load_file_hashes()
+
+        # Figures are generated from several threads; saves are deferred while a batch is open
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._pending_saves: set[str] = set()
 
     def _migrate_legacy_cache(self) -> None:
         """Migrate cache file from legacy location if it exists."""
@@ -77,17 +95,178 @@ class FigureChecksumManager:
             logger.warning(f"Failed to load checksums from {self.checksum_file}: {e}")
             return {}
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect checksum updates and save them once when the batch ends.
+
+        Batches can be nested and used from several threads. The cache files
+        are written when the outermost batch ends, also if it ends with an error,
+        since the collected updates belong to figures that were generated.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    pending, self._pending_saves = self._pending_saves, set()
+                    if "checksums" in pending:
+                        self._save_checksums()
+                    if "inputs" in pending:
+                        self._save_inputs()
+                    if "file_hashes" in pending:
+                        self._save_file_hashes()
+
+    def _write_cache_file(self, cache_file: Path, data: dict) -> None:
+        """Atomically replace a cache file with JSON data.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
     def _save_checksums(self) -> None:
-        """Save checksums to cache file."""
+        """Save checksums to cache file, or at the end of the current batch."""
+        with self._lock:
+            if self._batch_depth:
+                self._pending_saves.add("checksums")
+                return
+            try:
+                self._write_cache_file(self.checksum_file, self._checksums)
+                logger.debug(f"Saved {len(self._checksums)} checksums to {self.checksum_file}")
+            except OSError as e:
+                logger.error(f"Failed to save checksums to {self.checksum_file}: {e}")
+
+    def _load_inputs(self) -> dict[str, dict[str, list[str]]]:
+        """Load the recorded inputs of figure source files from the cache file."""
+        if not self.inputs_file.exists():
+            return {}
+
         try:
-            with open(self.checksum_file, "w", encoding="utf-8") as f:
-                json.dump(self._checksums, f, indent=2, sort_keys=True)
-            logger.debug(f"Saved {len(self._checksums)} checksums to {self.checksum_file}")
-        except OSError as e:
-            logger.error(f"Failed to save checksums to {self.checksum_file}: {e}")
+            with open(self.inputs_file, encoding="utf-8") as f:
+                inputs = json.load(f)
+            return {key: value for key, value in inputs.items() if isinstance(value, dict)}
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Failed to load figure inputs from {self.inputs_file}: {e}")
+            return {}
+
+    def _save_inputs(self) -> None:
+        """Save the recorded inputs of figure source files, or at the end of the current batch."""
+        with self._lock:
+            if self._batch_depth:
+                self._pending_saves.add("inputs")
+                return
+            try:
+                self._write_cache_file(self.inputs_file, self._inputs)
+            except OSError as e:
+                logger.error(f"Failed to save figure inputs to {self.inputs_file}: {e}")
+
+    def _load_file_hashes(self) -> dict[str, dict[str, Any]]:
+        """Load remembered file hashes and the file signatures they belong to."""
+        if not self.hashes_file.exists():
+            return {}
+
+        try:
+            with open(self.hashes_file, encoding="utf-8") as f:
+                file_hashes = json.load(f)
+            return {key: value for key, value in file_hashes.items() if isinstance(value, dict)}
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Failed to load figure file hashes from {self.hashes_file}: {e}")
+            return {}
+
+    def _save_file_hashes(self) -> None:
+        """Save remembered file hashes of existing files, or at the end of the current batch."""
+        with self._lock:
+            if self._batch_depth:
+                self._pending_saves.add("file_hashes")
+                return
+            self._file_hashes = {path: info for path, info in self._file_hashes.items() if os.path.exists(path)}
+            try:
+                self._write_cache_file(self.hashes_file, self._file_hashes)
+            except OSError as e:
+                logger.error(f"Failed to save figure file hashes to {self.hashes_file}: {e}")
+
+    def set_file_inputs(self, relative_path: str, inputs: list[str], environment: list[str] | None = None) -> None:
+        """Record the files a figure read and the environment it was generated with.
+
+        Args:
+            relative_path: Relative path of the figure source from the figures directory
+            inputs: Paths of files the figure read, such as data files
+            environment: Paths of the interpreter and package directories the figure ran with
+        """
+        manuscript_root = self.manuscript_path.resolve()
+        stored_inputs = set()
+        for path in inputs:
+            resolved = Path(path).resolve()
+            try:
+                stored_inputs.add(resolved.relative_to(manuscript_root).as_posix())
+            except ValueError:
+                stored_inputs.add(str(resolved))
+
+        recorded = {"inputs": sorted(stored_inputs), "environment": sorted(set(environment or []))}
+        with self._lock:
+            if not recorded["inputs"] and not recorded["environment"]:
+                if self._inputs.pop(relative_path, None) is not None:
+                    self._save_inputs()
+                return
+
+            if self._inputs.get(relative_path) != recorded:
+                self._inputs[relative_path] = recorded
+                self._save_inputs()
+
+    def get_file_inputs(self, relative_path: str) -> list[Path]:
+        """Get the files a figure read when it was last generated.
+
+        Args:
+            relative_path: Relative path of the figure source from the figures directory
+
+        Returns:
+            Absolute paths of the recorded input files
+        """
+        return [self.manuscript_path / path for path in self._inputs.get(relative_path, {}).get("inputs", [])]
+
+    def _calculate_cache_key(self, relative_path: str) -> str:
+        """Calculate the cache key of a figure source file.
+
+        The key is the checksum of the source file. If inputs were recorded for
+        the figure, their checksums and the state of its environment are included.
+
+        Args:
+            relative_path: Relative path from figures directory
+
+        Returns:
+            Cache key as hex string, empty if the source cannot be read
+        """
+        source_checksum = self._calculate_file_checksum(self.figures_dir / relative_path)
+        recorded = self._inputs.get(relative_path)
+        if not source_checksum or not recorded:
+            return source_checksum
+
+        hasher = hashlib.sha256(source_checksum.encode())
+        for stored, path in zip(recorded.get("inputs", []), self.get_file_inputs(relative_path), strict=True):
+            checksum = self._calculate_file_checksum(path) if path.is_file() else "missing"
+            hasher.update(f"\0input\0{stored}\0{checksum}".encode())
+
+        for stored in recorded.get("environment", []):
+            try:
+                stat = Path(stored).stat()
+                state = f"{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                state = "missing"
+            hasher.update(f"\0environment\0{stored}\0{state}".encode())
+
+        return hasher.hexdigest()
 
     def _calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate SHA256 checksum for a file.
+        """Calculate SHA256 checksum for a file, reusing it if the file is unchanged.
 
         Args:
             file_path: Path to the file
@@ -95,15 +274,16 @@ class FigureChecksumManager:
         Returns:
             SHA256 checksum as hex string
         """
-        hasher = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except OSError as e:
-            logger.error(f"Failed to calculate checksum for {file_path}: {e}")
-            return ""
+        key = str(Path(file_path).absolute())
+        known = self._file_hashes.get(key)
+        checksum, entry = hash_file(file_path, known)
+        if not checksum:
+            logger.error(f"Failed to calculate checksum for {file_path}")
+        elif entry is not None and entry is not known:
+            with self._lock:
+                self._file_hashes[key] = entry
+                self._save_file_hashes()
+        return checksum
 
     def get_figure_source_files(self) -> list[Path]:
         """Get all figure source files in the FIGURES directory.
@@ -129,24 +309,25 @@ class FigureChecksumManager:
         changed_files = []
         source_files = self.get_figure_source_files()
 
-        for file_path in source_files:
-            relative_path = file_path.relative_to(self.figures_dir)
-            file_key = str(relative_path)
+        with self.batch():
+            for file_path in source_files:
+                relative_path = file_path.relative_to(self.figures_dir)
+                file_key = str(relative_path)
 
-            current_checksum = self._calculate_file_checksum(file_path)
-            if not current_checksum:
-                continue
+                current_checksum = self._calculate_cache_key(file_key)
+                if not current_checksum:
+                    continue
 
-            cached_checksum = self._checksums.get(file_key)
+                cached_checksum = self._checksums.get(file_key)
 
-            if cached_checksum != current_checksum:
-                changed_files.append(file_path)
-                logger.debug(f"File changed: {file_key}")
-                if cached_checksum:
-                    logger.debug(f"  Old checksum: {cached_checksum}")
-                    logger.debug(f"  New checksum: {current_checksum}")
-                else:
-                    logger.debug(f"  New file with checksum: {current_checksum}")
+                if cached_checksum != current_checksum:
+                    changed_files.append(file_path)
+                    logger.debug(f"File changed: {file_key}")
+                    if cached_checksum:
+                        logger.debug(f"  Old checksum: {cached_checksum}")
+                        logger.debug(f"  New checksum: {current_checksum}")
+                    else:
+                        logger.debug(f"  New file with checksum: {current_checksum}")
 
         return changed_files
 
@@ -180,7 +361,7 @@ class FigureChecksumManager:
         if not file_path.exists():
             return True  # File doesn't exist, consider it changed
 
-        current_checksum = self._calculate_file_checksum(file_path)
+        current_checksum = self._calculate_cache_key(relative_path)
         if not current_checksum:
             return True  # Can't calculate checksum, assume changed
 
@@ -198,10 +379,11 @@ class FigureChecksumManager:
             logger.warning(f"File not found for checksum update: {file_path}")
             return
 
-        current_checksum = self._calculate_file_checksum(file_path)
+        current_checksum = self._calculate_cache_key(relative_path)
         if current_checksum:
-            self._checksums[relative_path] = current_checksum
-            self._save_checksums()
+            with self._lock:
+                self._checksums[relative_path] = current_checksum
+                self._save_checksums()
             logger.debug(f"Updated checksum for {relative_path}: {current_checksum}")
 
     def update_checksums(self, files: list[Path] | None = None) -> None:
@@ -214,45 +396,57 @@ class FigureChecksumManager:
             files = self.get_figure_source_files()
 
         updated_count = 0
-        for file_path in files:
-            if not file_path.exists():
-                logger.warning(f"File not found for checksum update: {file_path}")
-                continue
-
-            relative_path = file_path.relative_to(self.figures_dir)
-            file_key = str(relative_path)
-
-            current_checksum = self._calculate_file_checksum(file_path)
-            if current_checksum:
-                self._checksums[file_key] = current_checksum
-                updated_count += 1
-                logger.debug(f"Updated checksum for {file_key}: {current_checksum}")
-
-        if updated_count > 0:
-            self._save_checksums()
-            logger.info(f"Updated checksums for {updated_count} files")
+        with self.batch():
+            for file_path in files:
+                if not file_path.exists():
+                    logger.warning(f"File not found for checksum update: {file_path}")
+                    continue
+
+                relative_path = file_path.relative_to(self.figures_dir)
+                file_key = str(relative_path)
+
+                current_checksum = self._calculate_cache_key(file_key)
+                if current_checksum:
+                    with self._lock:
+                        self._checksums[file_key] = current_checksum
+                    updated_count += 1
+                    logger.debug(f"Updated checksum for {file_key}: {current_checksum}")
+
+            if updated_count > 0:
+                self._save_checksums()
+                logger.info(f"Updated checksums for {updated_count} files")
 
     def cleanup_orphaned_checksums(self) -> None:
         """Remove checksums for files that no longer exist."""
-        if not self.figures_dir.exists():
-            # If FIGURES directory doesn't exist, clear all checksums
-            if self._checksums:
-                self._checksums.clear()
-                self._save_checksums()
-                logger.info("Cleared all checksums - FIGURES directory not found")
-            return
+        with self._lock:
+            if not self.figures_dir.exists():
+                # If FIGURES directory doesn't exist, clear all checksums
+                if self._checksums:
+                    self._checksums.clear()
+                    self._save_checksums()
+                    logger.info("Cleared all checksums - FIGURES directory not found")
+                if self._inputs:
+                    self._inputs.clear()
+                    self._save_inputs()
+                return
+
+            current_files = {str(f.relative_to(self.figures_dir)) for f in self.get_figure_source_files()}
+            cached_files = set(self._checksums.keys())
+            orphaned_files = cached_files - current_files
+
+            if orphaned_files:
+                for file_key in orphaned_files:
+                    del self._checksums[file_key]
+                    logger.debug(f"Removed orphaned checksum for {file_key}")
 
-        current_files = {str(f.relative_to(self.figures_dir)) for f in self.get_figure_source_files()}
-        cached_files = set(self._checksums.keys())
-        orphaned_files = cached_files - current_files
-
-        if orphaned_files:
-            for file_key in orphaned_files:
-                del self._checksums[file_key]
-                logger.debug(f"Removed orphaned checksum for {file_key}")
+                self._save_checksums()
+                logger.info(f"Cleaned up {len(orphaned_files)} orphaned checksums")
 
-            self._save_checksums()
-            logger.info(f"Cleaned up {len(orphaned_files)} orphaned checksums")
+            orphaned_inputs = set(self._inputs) - current_files
+            if orphaned_inputs:
+                for file_key in orphaned_inputs:
+                    del self._inputs[file_key]
+                self._save_inputs()
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get statistics about the checksum cache.
@@ -272,6 +466,8 @@ class FigureChecksumManager:
             "total_source_files": len(source_files),
             "orphaned_entries": len(cached_files - current_files),
             "new_files": len(current_files - cached_files),
+            "files_with_inputs": len(self._inputs),
+            "cached_file_hashes": len(self._file_hashes),
             "figures_dir_exists": self.figures_dir.exists(),
         }
 
@@ -282,9 +478,14 @@ class FigureChecksumManager:
 
     def clear_cache(self) -> None:
         """Clear all checksums from cache."""
-        self._checksums.clear()
-        if self.checksum_file.exists():
-            self.checksum_file.unlink()
+        with self._lock:
+            self._checksums.clear()
+            self._inputs.clear()
+            self._file_hashes.clear()
+            self._pending_saves.clear()
+            for cache_file in (self.checksum_file, self.inputs_file, self.hashes_file):
+                if cache_file.exists():
+                    cache_file.unlink()
         logger.info("Cleared all cached checksums")
 
 
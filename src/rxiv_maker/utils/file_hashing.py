@@ -0,0 +1,69 @@
+"""SHA256 checksums of files, reused while a file is unchanged.
+
+A checksum is remembered together with the file's size, modification time
+and inode. As long as that signature is the same, the file is not read
+again. Caches of stage fingerprints, figure sources and the bibliography all
+store their checksums this way.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Files modified this recently may change again within the same timestamp
+# tick, so their hashes are not remembered (same reasoning as git's index)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_signature(file_path: str | Path) -> list[int] | None:
+    """Get the size, modification time and inode of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Signature list, or None if the file cannot be accessed
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def hash_file(file_path: str | Path, known: dict[str, Any] | None = None) -> tuple[str, dict[str, Any] | None]:
+    """Get the SHA256 checksum of a file, reusing a known checksum if the file is unchanged.
+
+    Args:
+        file_path: Path to the file
+        known: Entry previously returned for this file, if any
+
+    Returns:
+        Tuple of (checksum, entry). The checksum is an empty string if the
+        file cannot be read. The entry holds the signature and checksum to
+        remember for the file; it is ``known`` itself when that was reused,
+        and None if the file was modified too recently to be remembered.
+    """
+    signature = file_signature(file_path)
+    if signature is None:
+        logger.debug(f"Failed to calculate checksum for {file_path}: file not found")
+        return "", None
+
+    if known is not None and known.get("signature") == signature and known.get("sha256"):
+        return known["sha256"], known
+
+    try:
+        with open(file_path, "rb") as f:
+            checksum = hashlib.file_digest(f, "sha256").hexdigest()
+    except OSError as e:
+        logger.debug(f"Failed to calculate checksum for {file_path}: {e}")
+        return "", None
+
+    if time.time_ns() - signature[1] <= RACY_WINDOW_NS:
+        return checksum, None
+    return checksum, {"signature": signature, "sha256": checksum}
@@ -80,9 +80,12 @@ def copy_pdf_to_manuscript_folder(
     # Generate custom filename
     custom_filename = get_custom_pdf_filename(yaml_metadata)
 
-    # Check if we're already in the manuscript directory by looking for 01_MAIN.md
+    # An explicit manuscript directory does not depend on the working directory.
+    # Otherwise check if we're already in the manuscript directory by looking for 01_MAIN.md
     current_dir = Path.cwd()
-    if (current_dir / "01_MAIN.md").exists():
+    if manuscript_dir:
+        manuscript_pdf_path = Path(manuscript_path).resolve() / custom_filename
+    elif (current_dir / "01_MAIN.md").exists():
         # We're already in the manuscript directory
         manuscript_pdf_path = current_dir / custom_filename
     else:
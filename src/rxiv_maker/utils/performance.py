@@ -73,20 +73,28 @@ class PerformanceTracker:
         Returns:
             Operation duration in seconds
         """
-        if operation_id not in self.operation_timings:
+        # In-flight timings are keyed by operation id, so an operation running
+        # in two threads at once shares one timing; use record_operation then
+        start_time = self.operation_timings.pop(operation_id, None)
+        if start_time is None:
             return 0.0
 
-        duration = time.time() - self.operation_timings[operation_id]
+        duration = time.time() - start_time
+        self.record_operation(operation_id, duration)
 
-        # Store metric
-        if operation_id not in self.session_metrics:
-            self.session_metrics[operation_id] = []
-        self.session_metrics[operation_id].append(duration)
+        return duration
 
-        # Clean up timing
-        del self.operation_timings[operation_id]
+    def record_operation(self, operation_id: str, duration: float) -> None:
+        """Record the duration of an operation timed by the caller.
 
-        return duration
+        Unlike start_operation and end_operation, this keeps no state between
+        calls, so the same operation may run in several threads at once.
+
+        Args:
+            operation_id: Identifier for the operation
+            duration: Operation duration in seconds
+        """
+        self.session_metrics.setdefault(operation_id, []).append(duration)
 
     def get_baseline(self, operation_id: str, version: str | None = None) -> dict[str, float] | None:
         """Get performance baseline for an operation.
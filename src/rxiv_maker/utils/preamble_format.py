@@ -0,0 +1,266 @@
+r"""Cached pdflatex formats with a document's preamble preloaded.
+
+Loading the document class and its packages takes a large share of every
+pdflatex pass. With ``mylatexformat`` the preamble can be dumped once into a
+format file; passes started with ``-fmt`` then skip straight to
+``\begin{document}``.
+
+Formats are cached by a hash of the preamble, the style files next to the
+document and the pdflatex version. The TeX files a format loaded are recorded
+when it is dumped, and the format is rebuilt when any of them changes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+from .cache_utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Prefix of format names, used to recognise formats left in output directories
+FORMAT_PREFIX = "rxiv_preamble_"
+
+# Formats are tens of megabytes, so only the most recently used are kept
+MAX_CACHED_FORMATS = 4
+
+# Style files next to the document that the preamble may load
+STYLE_SUFFIXES = {".cls", ".sty"}
+
+
+@lru_cache(maxsize=1)
+def get_pdflatex_version() -> str | None:
+    """Get the first line of ``pdflatex --version``, or None if pdflatex is unavailable."""
+    try:
+        result = subprocess.run(["pdflatex", "--version"], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Could not run pdflatex: {e}")
+        return None
+    lines = result.stdout.splitlines()
+    return lines[0] if result.returncode == 0 and lines else None
+
+
+class PreambleFormatCache:
+    """Dumps and caches pdflatex formats for document preambles."""
+
+    def __init__(self, cache_dir: str | None = None):
+        """Initialize the format cache.
+
+        Args:
+            cache_dir: Directory for cache files (if None, uses platform-standard location)
+        """
+        # Use standardized cache directory if not specified
+        if cache_dir is None:
+            self.cache_dir = get_cache_dir("formats")
+        else:
+            self.cache_dir = Path(cache_dir)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_format(self, tex_file: Path) -> str | None:
+        """Make a format with the document's preamble available next to the document.
+
+        Args:
+            tex_file: LaTeX document to compile
+
+        Returns:
+            Format name to pass to ``pdflatex -fmt`` when compiling in the
+            document's directory, or None if it must be compiled without one
+        """
+        tex_file = Path(tex_file)
+        key = self._get_key(tex_file)
+        if key is None:
+            return None
+
+        format_name = f"{FORMAT_PREFIX}{key[:16]}"
+        cached_format = self.cache_dir / f"{format_name}.fmt"
+
+        if not (cached_format.exists() and self._is_current(format_name)):
+            logger.info("Dumping LaTeX preamble into a format file...")
+            if not self._dump_format(tex_file, format_name):
+                return None
+            self._prune()
+
+        # Mark the format as recently used
+        os.utime(cached_format)
+
+        # pdflatex looks for formats in the working directory
+        local_format = tex_file.parent / f"{format_name}.fmt"
+        for old_format in tex_file.parent.glob(f"{FORMAT_PREFIX}*.fmt"):
+            if old_format != local_format:
+                old_format.unlink(missing_ok=True)
+        if not local_format.exists():
+            try:
+                os.link(cached_format, local_format)
+            except OSError:
+                shutil.copy2(cached_format, local_format)
+
+        return format_name
+
+    def _get_key(self, tex_file: Path) -> str | None:
+        """Hash the preamble, the style files next to it and the pdflatex version."""
+        try:
+            content = tex_file.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Cannot read {tex_file}: {e}")
+            return None
+
+        preamble, found, _ = content.partition("\\begin{document}")
+        version = get_pdflatex_version()
+        if not found or version is None:
+            return None
+
+        hasher = hashlib.sha256()
+        hasher.update(version.encode("utf-8") + b"\x00")
+        hasher.update(preamble.encode("utf-8"))
+        for style_file in sorted(tex_file.parent.iterdir()):
+            if style_file.suffix in STYLE_SUFFIXES and style_file.is_file():
+                hasher.update(b"\x00" + style_file.name.encode("utf-8") + b"\x00")
+                hasher.update(style_file.read_bytes())
+        return hasher.hexdigest()
+
+    def _get_record_file(self, format_name: str) -> Path:
+        """Get the file listing the TeX files a cached format loaded."""
+        return self.cache_dir / f"{format_name}.json"
+
+    def _is_current(self, format_name: str) -> bool:
+        """Check that none of the TeX files loaded into a format changed since it was dumped."""
+        try:
+            with open(self._get_record_file(format_name), encoding="utf-8") as f:
+                inputs = json.load(f)["inputs"]
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            logger.debug(f"No input record for format {format_name}: {e}")
+            return False
+
+        for path, signature in inputs.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if [stat.st_size, stat.st_mtime_ns] != signature:
+                logger.debug(f"Format {format_name} is out of date: {path} changed")
+                return False
+        return True
+
+    def _dump_format(self, tex_file: Path, format_name: str) -> bool:
+        """Dump the document's preamble into a cached format file.
+
+        Returns:
+            True if the format was created
+        """
+        work_dir = tex_file.parent
+        try:
+            subprocess.run(
+                [
+                    "pdflatex",
+                    "-ini",
+                    "-recorder",
+                    "-interaction=nonstopmode",
+                    f"-jobname={format_name}",
+                    "&pdflatex",
+                    "mylatexformat.ltx",
+                    tex_file.name,
+                ],
+                cwd=work_dir,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=300,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Failed to dump LaTeX preamble format: {e}")
+            return False
+
+        dumped_format = work_dir / f"{format_name}.fmt"
+        recorder_file = work_dir / f"{format_name}.fls"
+        try:
+            if not dumped_format.exists():
+                logger.warning("Failed to dump LaTeX preamble format, compiling without it")
+                return False
+
+            # Files inside the document directory are covered by the cache key
+            inputs = {}
+            for line in recorder_file.read_text(encoding="utf-8", errors="replace").splitlines():
+                if not line.startswith("INPUT "):
+                    continue
+                path = (work_dir / line[len("INPUT ") :]).resolve()
+                if path.parent != work_dir.resolve() and path.is_file():
+                    stat = path.stat()
+                    inputs[str(path)] = [stat.st_size, stat.st_mtime_ns]
+
+            cached_format = self.cache_dir / f"{format_name}.fmt"
+            temp_format = cached_format.with_suffix(f".{os.getpid()}.tmp")
+            shutil.move(dumped_format, temp_format)
+            os.replace(temp_format, cached_format)
+            with open(self._get_record_file(format_name), "w", encoding="utf-8") as f:
+                json.dump({"inputs": inputs}, f, indent=2, sort_keys=True)
+            logger.debug(f"Cached preamble format {cached_format} ({len(inputs)} TeX inputs)")
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to cache LaTeX preamble format: {e}")
+            return False
+        finally:
+            for leftover in (dumped_format, recorder_file, work_dir / f"{format_name}.log"):
+                leftover.unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Delete all but the most recently used cached formats."""
+        formats = sorted(self.cache_dir.glob(f"{FORMAT_PREFIX}*.fmt"), key=lambda f: f.stat().st_mtime, reverse=True)
+        for old_format in formats[MAX_CACHED_FORMATS:]:
+            old_format.unlink(missing_ok=True)
+            self._get_record_file(old_format.stem).unlink(missing_ok=True)
+            logger.debug(f"Removed old preamble format {old_format.name}")
+
+    def invalidate(self, tex_file: Path, format_name: str) -> None:
+        """Remove a format that failed to compile the document.
+
+        Args:
+            tex_file: LaTeX document the format was made for
+            format_name: Format name returned by ``get_format``
+        """
+        (Path(tex_file).parent / f"{format_name}.fmt").unlink(missing_ok=True)
+        (self.cache_dir / f"{format_name}.fmt").unlink(missing_ok=True)
+        self._get_record_file(format_name).unlink(missing_ok=True)
+        logger.debug(f"Removed unusable preamble format {format_name}")
+
+    def clear_cache(self) -> None:
+        """Remove all cached formats."""
+        for cached_file in self.cache_dir.glob(f"{FORMAT_PREFIX}*"):
+            cached_file.unlink(missing_ok=True)
+        logger.info("Cleared all cached preamble formats")
+
+
+def get_preamble_format(tex_file: Path) -> str | None:
+    """Get a cached format with the document's preamble preloaded.
+
+    Args:
+        tex_file: LaTeX document to compile
+
+    Returns:
+        Format name to pass to ``pdflatex -fmt`` when compiling in the
+        document's directory, or None if it must be compiled without one
+    """
+    try:
+        return PreambleFormatCache().get_format(tex_file)
+    except Exception as e:
+        logger.warning(f"Preamble format unavailable, compiling without it: {e}")
+        return None
+
+
+def invalidate_preamble_format(tex_file: Path, format_name: str) -> None:
+    """Remove a cached format that failed to compile the document, so it is dumped again.
+
+    Args:
+        tex_file: LaTeX document the format was made for
+        format_name: Format name returned by ``get_preamble_format``
+    """
+    try:
+        PreambleFormatCache().invalidate(tex_file, format_name)
+    except Exception as e:
+        logger.warning(f"Failed to remove preamble format {format_name}: {e}")
@@ -0,0 +1,241 @@
+"""Section conversion cache for incremental LaTeX generation.
+
+This module caches the LaTeX output of each converted markdown section so that
+rebuilding a manuscript only re-converts the sections whose content actually
+changed. Entries are keyed on the section content hash plus the converter
+version, so any change to the converters, processors or templates
+invalidates the whole cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from ..__version__ import __version__
+from ..converters.md2tex import convert_markdown_to_latex
+from ..converters.patterns import EXECUTABLE_COMMAND_PATTERN
+from .cache_utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def _converter_sources() -> list[Path]:
+    """List the source files that determine how a section is converted."""
+    package_dir = Path(__file__).resolve().parent.parent
+    sources = []
+    for code_dir in (package_dir / "converters", package_dir / "processors"):
+        sources.extend(sorted(code_dir.glob("*.py")))
+    # Templates ship inside the package, or next to it in a source checkout
+    for template_dir in (package_dir / "tex", package_dir.parent / "tex"):
+        if template_dir.is_dir():
+            sources.extend(sorted(path for path in template_dir.rglob("*") if path.is_file()))
+    return sources
+
+
+@lru_cache(maxsize=1)
+def get_converter_version() -> str:
+    """Get a version string that changes whenever the converters change.
+
+    Combines the package version with a hash of the converter and processor
+    sources and the LaTeX templates, so that development installs also
+    invalidate cached sections after code changes.
+
+    Returns:
+        Converter version string
+    """
+    hasher = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent.parent
+    for source_file in _converter_sources():
+        try:
+            hasher.update(source_file.relative_to(package_dir.parent).as_posix().encode("utf-8"))
+            hasher.update(source_file.read_bytes())
+        except OSError as e:
+            logger.debug(f"Failed to read converter source {source_file}: {e}")
+    return f"{__version__}+{hasher.hexdigest()[:16]}"
+
+
+class SectionCache:
+    """Caches LaTeX conversions of markdown sections for a manuscript."""
+
+    def __init__(self, manuscript_path: str, cache_dir: str | None = None):
+        """Initialize the section cache.
+
+        Args:
+            manuscript_path: Path to the manuscript directory
+            cache_dir: Directory for cache files (if None, uses platform-standard location)
+        """
+        self.manuscript_path = Path(manuscript_path)
+        self.manuscript_name = self.manuscript_path.name
+        # Manuscript directories are often named alike, so key on the full path
+        path_hash = hashlib.sha256(str(self.manuscript_path.resolve()).encode("utf-8")).hexdigest()[:12]
+
+        # Use standardized cache directory if not specified
+        if cache_dir is None:
+            self.cache_dir = get_cache_dir("sections")
+        else:
+            self.cache_dir = Path(cache_dir)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Cache file specific to this manuscript
+        self.cache_file = self.cache_dir / f"section_cache_{self.manuscript_name}_{path_hash}.json"
+        self.converter_version = get_converter_version()
+
+        self._entries: dict[str, str] = self._load_entries()
+        self._used_keys: set[str] = set()
+        # Sections with executable commands converted during this build; never
+        # saved, since their output depends on the Python execution context
+        self._executed: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load_entries(self) -> dict[str, str]:
+        """Load cached sections, discarding them if the converter version changed."""
+        if not self.cache_file.exists():
+            logger.debug(f"No existing section cache found at {self.cache_file}")
+            return {}
+
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load section cache from {self.cache_file}: {e}")
+            return {}
+
+        if data.get("converter_version") != self.converter_version:
+            logger.debug("Converter version changed, discarding cached sections")
+            return {}
+
+        entries = data.get("sections", {})
+        logger.debug(f"Loaded {len(entries)} cached sections from {self.cache_file}")
+        return entries
+
+    def _make_key(self, content: str, is_supplementary: bool) -> str:
+        """Build the cache key for a section."""
+        hasher = hashlib.sha256()
+        hasher.update(self.converter_version.encode("utf-8"))
+        hasher.update(b"\x00supplementary" if is_supplementary else b"\x00main")
+        hasher.update(b"\x00")
+        hasher.update(content.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def convert(self, content: str, is_supplementary: bool = False) -> str:
+        """Convert a markdown section to LaTeX, reusing the cached result if unchanged.
+
+        Args:
+            content: Markdown content of the section
+            is_supplementary: Whether the section is supplementary content
+
+        Returns:
+            LaTeX content of the section
+        """
+        # Sections with executable commands depend on state outside their own
+        # content (the shared Python execution context), so always re-convert them
+        if EXECUTABLE_COMMAND_PATTERN.search(content):
+            latex = convert_markdown_to_latex(content, is_supplementary)
+            self._executed[self._make_key(content, is_supplementary)] = latex
+            return latex
+
+        key = self._make_key(content, is_supplementary)
+        self._used_keys.add(key)
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        latex = convert_markdown_to_latex(content, is_supplementary)
+        self._entries[key] = latex
+        return latex
+
+    def get_converted(self, content: str, is_supplementary: bool = False) -> str | None:
+        """Get the LaTeX of a section converted before, without converting it again.
+
+        Args:
+            content: Markdown content of the section
+            is_supplementary: Whether the section is supplementary content
+
+        Returns:
+            LaTeX content of the section, or None if it was not converted during
+            this build and is not cached
+        """
+        key = self._make_key(content, is_supplementary)
+        return self._executed.get(key, self._entries.get(key))
+
+    def merge(self, other: "SectionCache") -> None:
+        """Merge the entries and statistics of a cache copy used in another process.
+
+        Args:
+            other: Cache copy returned by a worker process
+        """
+        self._entries.update(other._entries)
+        self._used_keys.update(other._used_keys)
+        self._executed.update(other._executed)
+        self.hits += other.hits
+        self.misses += other.misses
+
+    def save(self) -> None:
+        """Save the sections used during this build to the cache file.
+
+        Entries that were not used since the cache was loaded belong to old
+        versions of the manuscript and are dropped, keeping the file bounded.
+        """
+        sections = {key: self._entries[key] for key in self._used_keys if key in self._entries}
+        data = {"converter_version": self.converter_version, "sections": sections}
+
+        # Write to a temporary file first so a crash or a concurrent build
+        # never leaves a truncated cache behind
+        temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, sort_keys=True)
+            os.replace(temp_file, self.cache_file)
+            logger.debug(f"Saved {len(sections)} cached sections to {self.cache_file}")
+        except OSError as e:
+            logger.error(f"Failed to save section cache to {self.cache_file}: {e}")
+        finally:
+            temp_file.unlink(missing_ok=True)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get statistics about the section cache.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        total = self.hits + self.misses
+        return {
+            "manuscript_name": self.manuscript_name,
+            "cache_file": str(self.cache_file),
+            "converter_version": self.converter_version,
+            "cached_sections": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Clear all cached sections."""
+        self._entries.clear()
+        self._used_keys.clear()
+        self._executed.clear()
+        if self.cache_file.exists():
+            self.cache_file.unlink()
+        logger.info("Cleared all cached sections")
+
+
+def get_section_cache(manuscript_path: str) -> SectionCache:
+    """Get a SectionCache instance for the given manuscript.
+
+    Args:
+        manuscript_path: Path to the manuscript directory
+
+    Returns:
+        SectionCache instance
+    """
+    return SectionCache(manuscript_path)
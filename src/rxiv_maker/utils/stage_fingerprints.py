@@ -0,0 +1,202 @@
+"""Build stage fingerprints for make-style up-to-date checks.
+
+Each build stage (LaTeX generation, file copies, PDF compilation) is recorded
+with the hashes of the files it read and wrote. On the next build a stage is
+skipped when its inputs and parameters hash the same and its recorded outputs
+are still present and unmodified.
+
+File hashes are remembered together with each file's size, modification time
+and inode, so unchanged files are not read again on every check.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from .cache_utils import get_cache_dir
+from .file_hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+class StageFingerprints:
+    """Records input and output hashes of build stages for a manuscript."""
+
+    def __init__(self, manuscript_path: str, cache_dir: str | None = None):
+        """Initialize the fingerprint database.
+
+        Args:
+            manuscript_path: Path to the manuscript directory
+            cache_dir: Directory for cache files (if None, uses platform-standard location)
+        """
+        self.manuscript_path = Path(manuscript_path)
+        self.manuscript_name = self.manuscript_path.name
+
+        # Use standardized cache directory if not specified
+        if cache_dir is None:
+            self.cache_dir = get_cache_dir("stages")
+        else:
+            self.cache_dir = Path(cache_dir)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Cache file specific to this manuscript
+        self.fingerprint_file = self.cache_dir / f"stage_fingerprints_{self.manuscript_name}.json"
+
+        # Stages of one build run concurrently and share this database
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._file_hashes: dict[str, dict[str, Any]] = {}
+        # Whether file hashes changed since the database was last saved
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load recorded stages from the fingerprint file."""
+        if not self.fingerprint_file.exists():
+            logger.debug(f"No existing stage fingerprints found at {self.fingerprint_file}")
+            return
+
+        try:
+            with open(self.fingerprint_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load stage fingerprints from {self.fingerprint_file}: {e}")
+            return
+
+        self._stages = data.get("stages", {})
+        self._file_hashes = data.get("files", {})
+        logger.debug(f"Loaded fingerprints of {len(self._stages)} stages from {self.fingerprint_file}")
+
+    def _save(self) -> None:
+        """Save recorded stages, keeping only hashes of files they refer to."""
+        referenced = set()
+        for entry in self._stages.values():
+            referenced.update(entry["inputs"])
+            referenced.update(entry["outputs"])
+        self._file_hashes = {path: info for path, info in self._file_hashes.items() if path in referenced}
+
+        data = {"stages": self._stages, "files": self._file_hashes}
+        temp_file = self.fingerprint_file.with_suffix(".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_file, self.fingerprint_file)
+            self._dirty = False
+            logger.debug(f"Saved fingerprints of {len(self._stages)} stages to {self.fingerprint_file}")
+        except OSError as e:
+            logger.error(f"Failed to save stage fingerprints to {self.fingerprint_file}: {e}")
+
+    def _hash_file(self, file_path: Path) -> str:
+        """Get the SHA256 checksum of a file, reusing it if the file is unchanged.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            SHA256 checksum as hex string, or an empty string if the file is missing
+        """
+        key = str(file_path)
+        known = self._file_hashes.get(key)
+        checksum, entry = hash_file(file_path, known)
+        if entry is not None and entry is not known:
+            self._file_hashes[key] = entry
+            self._dirty = True
+        return checksum
+
+    def fingerprint(self, files: list[Path]) -> dict[str, str]:
+        """Hash a list of files.
+
+        Args:
+            files: Files to hash; missing files hash to an empty string
+
+        Returns:
+            Mapping from each file path to its checksum
+        """
+        with self._lock:
+            return {str(file_path): self._hash_file(Path(file_path)) for file_path in files}
+
+    def is_up_to_date(self, stage: str, inputs: dict[str, str], parameters: dict[str, Any] | None = None) -> bool:
+        """Check whether a stage can be skipped.
+
+        Args:
+            stage: Stage name
+            inputs: Fingerprint of the files the stage reads
+            parameters: Settings that affect the stage's outputs
+
+        Returns:
+            True if the stage ran before with the same inputs and parameters and
+            its outputs have not changed since
+
+        Hashes refreshed while checking a skipped stage are saved, so the files
+        are not read again by the next build.
+        """
+        entry = self._stages.get(stage)
+        if entry is None or entry["parameters"] != (parameters or {}):
+            return False
+
+        if entry["inputs"] != inputs:
+            return False
+
+        if self.fingerprint([Path(path) for path in entry["outputs"]]) != entry["outputs"]:
+            return False
+
+        with self._lock:
+            if self._dirty:
+                self._save()
+        return True
+
+    def record(
+        self,
+        stage: str,
+        inputs: dict[str, str],
+        outputs: list[Path],
+        parameters: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a successful run of a stage.
+
+        Args:
+            stage: Stage name
+            inputs: Input fingerprint taken before the stage ran
+            outputs: Files the stage may write; files it did not write are
+                recorded as missing and must stay missing
+            parameters: Settings that affect the stage's outputs
+        """
+        output_hashes = self.fingerprint(outputs)
+        with self._lock:
+            self._stages[stage] = {"parameters": parameters or {}, "inputs": inputs, "outputs": output_hashes}
+            self._save()
+
+    def invalidate(self, stage: str) -> None:
+        """Forget a stage so it runs on the next build.
+
+        Args:
+            stage: Stage name
+        """
+        with self._lock:
+            if self._stages.pop(stage, None) is not None:
+                self._save()
+
+    def clear_cache(self) -> None:
+        """Clear all recorded stages."""
+        with self._lock:
+            self._stages.clear()
+            self._file_hashes.clear()
+            if self.fingerprint_file.exists():
+                self.fingerprint_file.unlink()
+        logger.info("Cleared all stage fingerprints")
+
+
+def get_stage_fingerprints(manuscript_path: str) -> StageFingerprints:
+    """Get a StageFingerprints instance for the given manuscript.
+
+    Args:
+        manuscript_path: Path to the manuscript directory
+
+    Returns:
+        StageFingerprints instance
+    """
+    return StageFingerprints(manuscript_path)
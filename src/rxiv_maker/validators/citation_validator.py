@@ -50,7 +50,7 @@ class CitationValidator(BaseValidator):
         # Determine DOI validation setting from config if not explicitly provided
         if enable_doi_validation is None:
             try:
-                manuscript_file = find_manuscript_md()
+                manuscript_file = find_manuscript_md(manuscript_path)
                 metadata = extract_yaml_metadata(str(manuscript_file))
                 self.enable_doi_validation = get_doi_validation_setting(metadata)
             except Exception:
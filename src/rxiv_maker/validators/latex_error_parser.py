@@ -2,11 +2,21 @@
 
 import os
 import re
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
 from .base_validator import BaseValidator, ValidationLevel, ValidationResult
 
+# Lines searched backward from an error for its file and line number
+LOCATION_LINES = 10
+
+# Lines shown on each side of an error
+CONTEXT_LINES = 3
+
+# Errors after which the rest of a pdflatex run is wasted work
+FATAL_ERROR_TYPES = frozenset({"missing_file", "missing_begin_document", "undefined_command", "undefined_environment"})
+
 
 @dataclass
 class LaTeXError:
@@ -196,38 +206,24 @@ class LaTeXErrorParser(BaseValidator):
 
     def _parse_log_file(self, log_content: str) -> list[LaTeXError]:
         """Parse LaTeX log file content for errors."""
-        errors = []
-        lines = log_content.split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
-
-            # Check for error patterns
-            latex_error = self._parse_error_line(line, lines, i)
-            if latex_error:
-                errors.append(latex_error)
-
-            i += 1
-
-        return errors
-
-    def _parse_error_line(self, line: str, all_lines: list[str], line_index: int) -> LaTeXError | None:
+        parser = LaTeXOutputParser()
+        for line in log_content.split("\n"):
+            parser.feed(line)
+        parser.close()
+        return parser.errors
+
+    @classmethod
+    def _parse_error_line(cls, line: str, all_lines: list[str], line_index: int) -> LaTeXError | None:
         """Parse a single line for LaTeX errors."""
         # Check each error pattern
-        for pattern, error_info in self.ERROR_PATTERNS.items():
+        for pattern, error_info in cls.ERROR_PATTERNS.items():
             match = re.search(pattern, line, re.IGNORECASE)
             if match:
                 # Extract file and line info from surrounding context
-                file_path, line_number = self._extract_location_info(all_lines, line_index)
+                file_path, line_number = cls._extract_location_info(all_lines, line_index)
 
                 # Get additional context
-                context = self._extract_error_context(all_lines, line_index)
+                context = cls._extract_error_context(all_lines, line_index)
 
                 return LaTeXError(
                     error_type=error_info["type"],
@@ -244,13 +240,14 @@ class LaTeXErrorParser(BaseValidator):
 
         return None
 
-    def _extract_location_info(self, lines: list[str], start_index: int) -> tuple[str | None, int | None]:
+    @staticmethod
+    def _extract_location_info(lines: list[str], start_index: int) -> tuple[str | None, int | None]:
         """Extract file path and line number from log context."""
         file_path = None
         line_number = None
 
         # Look backward for file information
-        for i in range(max(0, start_index - 10), start_index):
+        for i in range(max(0, start_index - LOCATION_LINES), start_index):
             line = lines[i]
 
             # Look for file path patterns
@@ -265,7 +262,8 @@ class LaTeXErrorParser(BaseValidator):
 
         return file_path, line_number
 
-    def _extract_error_context(self, lines: list[str], start_index: int, context_lines: int = 3) -> str | None:
+    @staticmethod
+    def _extract_error_context(lines: list[str], start_index: int, context_lines: int = CONTEXT_LINES) -> str | None:
         """Extract context around error location."""
         start = max(0, start_index - context_lines)
         end = min(len(lines), start_index + context_lines + 1)
@@ -318,3 +316,67 @@ class LaTeXErrorParser(BaseValidator):
                 return suggestion
 
         return "Check LaTeX syntax and package requirements"
+
+
+class LaTeXOutputParser:
+    """Incremental parser for pdflatex output and log files.
+
+    Lines are fed one at a time, as pdflatex prints them, and matched with the
+    rules of ``LaTeXErrorParser``. Only the lines needed for each error's
+    location and context are kept, and a fatal error is reported as soon as
+    its context is complete so a run can be stopped early.
+    """
+
+    def __init__(self, fatal_error_types: frozenset[str] = FATAL_ERROR_TYPES):
+        """Initialize an empty parser.
+
+        Args:
+            fatal_error_types: Error types that make the rest of a run pointless
+        """
+        self.fatal_error_types = fatal_error_types
+        self.errors: list[LaTeXError] = []
+        self.fatal_error: LaTeXError | None = None
+        # Each line is parsed once the lines after it that form its context arrived
+        self._lines: deque[str] = deque(maxlen=LOCATION_LINES + 1 + CONTEXT_LINES)
+        self._pending = 0
+
+    def feed(self, line: str) -> LaTeXError | None:
+        """Parse one line of output.
+
+        Args:
+            line: Output line, with or without its line ending
+
+        Returns:
+            The first fatal error found so far, if any
+        """
+        self._lines.append(line.rstrip("\r\n"))
+        self._pending += 1
+        if self._pending > CONTEXT_LINES:
+            self._parse_line(len(self._lines) - self._pending)
+        return self.fatal_error
+
+    def close(self) -> list[LaTeXError]:
+        """Parse the lines still waiting for context after the output ended.
+
+        Returns:
+            All errors found in the output
+        """
+        while self._pending:
+            self._parse_line(len(self._lines) - self._pending)
+        return self.errors
+
+    def _parse_line(self, index: int) -> None:
+        """Parse the buffered line at ``index`` against the shared error rules."""
+        self._pending -= 1
+        line = self._lines[index].strip()
+        if not line:
+            return
+
+        latex_error = LaTeXErrorParser._parse_error_line(line, list(self._lines), index)
+        if latex_error is None:
+            return
+
+        self.errors.append(latex_error)
+        # Only TeX errors ("! ...") are fatal; warnings can mention the same text
+        if self.fatal_error is None and latex_error.error_type in self.fatal_error_types and line.startswith("!"):
+            self.fatal_error = latex_error
@@ -0,0 +1,68 @@
+"""Unit tests for the bibliography checksum manager."""
+
+import hashlib
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from rxiv_maker.utils.bibliography_checksum import BibliographyChecksumManager
+
+
+@pytest.fixture
+def manuscript(tmp_path):
+    """Create a manuscript with a bibliography file."""
+    manuscript = tmp_path / "MANUSCRIPT"
+    manuscript.mkdir()
+    (manuscript / "03_REFERENCES.bib").write_text(
+        "@article{smith2020,\n  title={A study},\n  doi={10.1000/example}\n}\n", encoding="utf-8"
+    )
+    return manuscript
+
+
+@pytest.fixture
+def manager(manuscript, tmp_path):
+    """Create a bibliography checksum manager with a private cache directory."""
+    return BibliographyChecksumManager(str(manuscript), cache_dir=str(tmp_path / "cache"))
+
+
+def _age(path):
+    old = time.time_ns() - 60 * 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+
+class TestBibliographyChecksum:
+    """Test change detection for the bibliography."""
+
+    def test_untouched_bibliography_not_read(self, manager, manuscript):
+        _age(manuscript / "03_REFERENCES.bib")
+        manager.update_checksum()
+
+        reloaded = BibliographyChecksumManager(str(manuscript), cache_dir=str(manager.cache_dir))
+        with (
+            patch("hashlib.file_digest", wraps=hashlib.file_digest) as digest,
+            patch.object(reloaded, "_extract_doi_entries", wraps=reloaded._extract_doi_entries) as extract,
+        ):
+            assert not reloaded.needs_validation()
+            assert digest.call_count == 0 and extract.call_count == 0
+            changed, entries = reloaded.doi_entries_have_changed()
+        assert not changed and list(entries) == ["10.1000/example"]
+
+    def test_edited_bibliography_needs_validation(self, manager, manuscript):
+        bibliography = manuscript / "03_REFERENCES.bib"
+        _age(bibliography)
+        manager.update_checksum()
+
+        bibliography.write_text(bibliography.read_text(encoding="utf-8").replace("example", "other"), encoding="utf-8")
+
+        assert manager.bibliography_has_changed()[0]
+        assert manager.needs_validation()
+
+    def test_fresh_edit_keeps_hashing(self, manager, manuscript):
+        manager.update_checksum()
+
+        assert manager._checksum_data["bibliography_signature"] is None
+        with patch("hashlib.file_digest", wraps=hashlib.file_digest) as digest:
+            assert not manager.bibliography_has_changed()[0]
+            assert digest.call_count == 1
@@ -6,7 +6,7 @@ import subprocess
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 try:
     import pytest
@@ -25,7 +25,7 @@ except ImportError:
     pytest = MockPytest()
 
 try:
-    from rxiv_maker.engine.build_manager import BuildManager
+    from rxiv_maker.engine.build_manager import BuildManager, build_many
 
     BUILD_MANAGER_AVAILABLE = True
 except ImportError:
@@ -333,72 +333,200 @@ class TestBuildProcessOrder(unittest.TestCase):
 
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    def test_pdf_validation_runs_before_word_count(self):
-        """Test that PDF validation runs before word count analysis."""
+    BUILD_STEPS = [
+        "check_manuscript_structure",
+        "setup_output_directory",
+        "generate_figures",
+        "validate_manuscript",
+        "copy_style_files",
+        "copy_references",
+        "copy_figures",
+        "generate_tex_files",
+        "compile_pdf",
+        "copy_pdf_to_manuscript",
+        "run_pdf_validation",
+        "run_word_count_analysis",
+    ]
+
+    def _run_build(self, build_manager, fingerprints=None, **overrides):
+        """Run the full build with every step mocked, recording the order steps finish in."""
+        from contextlib import ExitStack
+
+        finished = []
+
+        def recorded(name):
+            step = overrides.get(name, lambda: True)
+
+            def run(*args, **kwargs):
+                result = step()
+                finished.append(name)
+                return result
+
+            return run
+
+        with ExitStack() as stack:
+            for name in self.BUILD_STEPS:
+                stack.enter_context(patch.object(build_manager, name, side_effect=recorded(name)))
+            stack.enter_context(patch.object(build_manager, "_get_stage_fingerprints", return_value=fingerprints))
+            log = stack.enter_context(patch.object(build_manager, "log"))
+            result = build_manager.run_full_build()
+
+        return result, finished, log
+
+    def test_validation_and_word_count_ordering(self):
+        """Test that PDF validation waits for the PDF and word count for the converted sections."""
         build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
 
-        # Track the order of method calls
-        call_order = []
+        result, finished, _ = self._run_build(build_manager)
 
-        def track_pdf_validation():
-            call_order.append("pdf_validation")
-            return True
+        self.assertTrue(result)
+        self.assertEqual(sorted(finished), sorted(self.BUILD_STEPS))
+        self.assertGreater(finished.index("run_pdf_validation"), finished.index("copy_pdf_to_manuscript"))
+        self.assertGreater(finished.index("run_word_count_analysis"), finished.index("generate_tex_files"))
 
-        def track_word_count():
-            call_order.append("word_count")
-            return True
+    def test_build_inside_event_loop(self):
+        """Test that a build started from a running event loop still runs every step."""
+        import asyncio
 
-        # Mock all prerequisites to return True
-        with patch.object(build_manager, "check_manuscript_structure", return_value=True):
-            with patch.object(build_manager, "setup_output_directory", return_value=True):
-                with patch.object(build_manager, "generate_figures", return_value=True):
-                    with patch.object(build_manager, "validate_manuscript", return_value=True):
-                        with patch.object(build_manager, "copy_style_files", return_value=True):
-                            with patch.object(build_manager, "copy_references", return_value=True):
-                                with patch.object(build_manager, "copy_figures", return_value=True):
-                                    with patch.object(
-                                        build_manager,
-                                        "generate_tex_files",
-                                        return_value=True,
-                                    ):
-                                        with patch.object(
-                                            build_manager,
-                                            "compile_pdf",
-                                            return_value=True,
-                                        ):
-                                            with patch.object(
-                                                build_manager,
-                                                "copy_pdf_to_manuscript",
-                                                return_value=True,
-                                            ):
-                                                with patch.object(
-                                                    build_manager,
-                                                    "run_pdf_validation",
-                                                    side_effect=track_pdf_validation,
-                                                ):
-                                                    with patch.object(
-                                                        build_manager,
-                                                        "run_word_count_analysis",
-                                                        side_effect=track_word_count,
-                                                    ):
-                                                        with patch.object(build_manager, "log"):
-                                                            result = build_manager.run_full_build()
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
 
-                                                            # Should have run successfully
-                                                            self.assertTrue(result)
+        async def build_from_loop():
+            return self._run_build(build_manager)
+
+        result, finished, _ = asyncio.run(build_from_loop())
+
+        self.assertTrue(result)
+        self.assertEqual(sorted(finished), sorted(self.BUILD_STEPS))
+
+    def test_word_count_reuses_converted_sections(self):
+        """Test that the word count does not convert sections LaTeX generation already converted."""
+        from rxiv_maker.converters.md2tex import extract_content_sections
+        from rxiv_maker.utils.section_cache import SectionCache
+
+        main_md = Path(self.manuscript_dir) / "01_MAIN.md"
+        main_md.write_text(
+            "# Title\n\n## Abstract\n\nWe measured {{py: 40 + 2}} samples.\n\n## Methods\n\nPlain text.\n",
+            encoding="utf-8",
+        )
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+        build_manager._section_cache = SectionCache(self.manuscript_dir, cache_dir=os.path.join(self.temp_dir, "cache"))
+        extract_content_sections(str(main_md), build_manager._section_cache)
+
+        with (
+            patch("rxiv_maker.utils.section_cache.convert_markdown_to_latex") as convert,
+            patch("rxiv_maker.converters.md2tex.convert_markdown_to_latex") as convert_directly,
+            patch.object(build_manager, "log"),
+        ):
+            self.assertTrue(build_manager.run_word_count_analysis())
+        convert.assert_not_called()
+        convert_directly.assert_not_called()
+
+    def test_independent_steps_run_concurrently(self):
+        """Test that steps with no dependency between them run at the same time."""
+        import threading
+
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+        # Each copy step only returns once the other one has started
+        barrier = threading.Barrier(2, timeout=5)
+
+        result, _, _ = self._run_build(
+            build_manager,
+            copy_style_files=lambda: barrier.wait() is not None,
+            copy_references=lambda: barrier.wait() is not None,
+        )
+
+        self.assertTrue(result)
+
+    def test_validation_waits_on_stale_figures(self):
+        """Test that validation only runs alongside figure generation when figures are current."""
+        os.makedirs(os.path.join(self.manuscript_dir, "FIGURES"))
+
+        for stale in (True, False):
+            build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+            with patch.object(build_manager, "_check_figures_need_update", return_value=stale):
+                pipeline = build_manager._create_build_pipeline()
 
-                                                            # Should have called both methods
-                                                            self.assertEqual(len(call_order), 2)
+            dependencies = pipeline.step_index["validate_manuscript"].dependencies
+            self.assertEqual("generate_figures" in dependencies, stale)
 
-                                                            # PDF validation should come first
-                                                            self.assertEqual(
-                                                                call_order[0],
-                                                                "pdf_validation",
-                                                            )
-                                                            self.assertEqual(
-                                                                call_order[1],
-                                                                "word_count",
-                                                            )
+    def test_failed_step_stops_dependents(self):
+        """Test that a failing required step fails the build and skips the steps after it."""
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+
+        result, finished, _ = self._run_build(build_manager, compile_pdf=lambda: False)
+
+        self.assertFalse(result)
+        self.assertIn("compile_pdf", finished)
+        self.assertNotIn("copy_pdf_to_manuscript", finished)
+        self.assertNotIn("run_pdf_validation", finished)
+
+    def test_unchanged_stages_skipped_on_rebuild(self):
+        """Test that stages whose inputs did not change are skipped on the next build."""
+        from rxiv_maker.utils.stage_fingerprints import StageFingerprints
+
+        main_md = Path(self.manuscript_dir) / "01_MAIN.md"
+        main_md.write_text("# Title\n", encoding="utf-8")
+        (Path(self.manuscript_dir) / "03_REFERENCES.bib").write_text("@article{a}\n", encoding="utf-8")
+        fingerprints = StageFingerprints(self.manuscript_dir, cache_dir=os.path.join(self.temp_dir, "cache"))
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+        tracked = {"copy_style_files", "copy_references", "generate_tex_files", "compile_pdf"}
+
+        _, first, _ = self._run_build(build_manager, fingerprints)
+        result, second, _ = self._run_build(build_manager, fingerprints)
+
+        self.assertTrue(result)
+        self.assertTrue(tracked <= set(first))
+        self.assertTrue(tracked.isdisjoint(second))
+        self.assertIn("validate_manuscript", second)
+
+        main_md.write_text("# New title\n", encoding="utf-8")
+        _, third, _ = self._run_build(build_manager, fingerprints)
+
+        self.assertIn("generate_tex_files", third)
+        self.assertNotIn("copy_references", third)
+
+    def test_python_commands_rerun_without_cache(self):
+        """Test that LaTeX generation reruns for Python commands unless their results are cached."""
+        from rxiv_maker.utils.stage_fingerprints import StageFingerprints
+
+        (Path(self.manuscript_dir) / "01_MAIN.md").write_text(
+            'Today is {{py: date.today()}} and {{py: open("data/values.csv").read()}}\n', encoding="utf-8"
+        )
+        fingerprints = StageFingerprints(self.manuscript_dir, cache_dir=os.path.join(self.temp_dir, "cache"))
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+
+        with patch.dict(os.environ, {"RXIV_PYTHON_CACHE": "0"}):
+            self._run_build(build_manager, fingerprints)
+            _, second, _ = self._run_build(build_manager, fingerprints)
+        self.assertIn("generate_tex_files", second)
+
+        with patch.dict(os.environ, {"RXIV_PYTHON_CACHE": "1"}):
+            self._run_build(build_manager, fingerprints)
+            _, fourth, _ = self._run_build(build_manager, fingerprints)
+            self.assertNotIn("generate_tex_files", fourth)
+
+            # Commands run in the manuscript's parent directory; only files they name are inputs
+            Path(self.temp_dir, "notes.txt").write_text("unrelated\n", encoding="utf-8")
+            _, fifth, _ = self._run_build(build_manager, fingerprints)
+            self.assertNotIn("generate_tex_files", fifth)
+
+            Path(self.temp_dir, "data").mkdir()
+            Path(self.temp_dir, "data", "values.csv").write_text("1,2\n", encoding="utf-8")
+            _, sixth, _ = self._run_build(build_manager, fingerprints)
+        self.assertIn("generate_tex_files", sixth)
+
+    def test_critical_path_reported(self):
+        """Test that the slowest dependency chain is reported after the build."""
+        import time
+
+        build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
+
+        result, _, log = self._run_build(build_manager, generate_figures=lambda: time.sleep(0.2) is None)
+
+        self.assertTrue(result)
+        reports = [call.args[0] for call in log.call_args_list if call.args[0].startswith("Critical path")]
+        self.assertEqual(len(reports), 1)
+        self.assertIn("setup_output (0.0s) → generate_figures (0.2s) → ", reports[0])
 
 
 @pytest.mark.build_manager
@@ -668,16 +796,292 @@ l.4 \undefined
         build_manager = BuildManager(manuscript_path=self.manuscript_dir, output_dir=self.output_dir)
 
         # First compilation fails, second succeeds (simulating recovery)
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                Mock(returncode=1, stdout="", stderr="Error in first run"),
-                Mock(returncode=0, stdout="Success", stderr=""),
-            ]
+        with patch("subprocess.Popen") as mock_popen:
+            first_run, second_run = MagicMock(), MagicMock()
+            for process, output, returncode in ((first_run, "Error in first run\n", 1), (second_run, "Success\n", 0)):
+                process.__enter__.return_value = process
+                process.stdout = iter([output])
+                process.wait.return_value = returncode
+            mock_popen.side_effect = [first_run, second_run]
 
             # Should attempt recovery by calling compile_pdf multiple times if first fails  # noqa: E501
             build_manager.compile_pdf()
             # Check that subprocess was called at least once
-            self.assertTrue(mock_run.call_count >= 1)
+            self.assertTrue(mock_popen.call_count >= 1)
+
+
+@pytest.mark.build_manager
+@unittest.skipUnless(BUILD_MANAGER_AVAILABLE, "Build manager not available")
+class TestAdaptiveCompilePasses(unittest.TestCase):
+    """Test that pdflatex and bibtex only run as often as the document needs."""
+
+    def setUp(self):
+        """Set up a build whose output directory holds references."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manuscript_dir = Path(self.temp_dir) / "manuscript"
+        self.manuscript_dir.mkdir()
+        self.output_dir = Path(self.temp_dir) / "output"
+        self.output_dir.mkdir()
+        (self.output_dir / "03_REFERENCES.bib").write_text("@article{a, title={A}}\n", encoding="utf-8")
+        self.build_manager = BuildManager(manuscript_path=str(self.manuscript_dir), output_dir=str(self.output_dir))
+        self.citations = ["a"]
+        self.commands = []
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        from rxiv_maker.core.logging_config import cleanup
+
+        cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _output(self, suffix):
+        return self.output_dir / f"{self.build_manager.manuscript_name}{suffix}"
+
+    def _fake_tool(self, command, **kwargs):
+        """Imitate pdflatex and bibtex on a document citing ``self.citations``."""
+        self.commands.append(command[0])
+        if command[0] == "bibtex":
+            self._output(".bbl").write_text("".join(f"\\bibitem{{{key}}}\n" for key in self.citations))
+        else:
+            aux = "".join(f"\\citation{{{key}}}\n" for key in self.citations) + "\\bibdata{03_REFERENCES}\n"
+            if self._output(".bbl").exists():
+                # Labels of bibliography entries only exist once the .bbl has been read
+                aux += self._output(".bbl").read_text().replace("\\bibitem", "\\bibcite")
+            self._output(".aux").write_text(aux)
+            self._output(".log").write_text("")
+            self._output(".pdf").write_bytes(b"%PDF")
+        return Mock(returncode=0, stdout="", stderr="")
+
+    def _fake_process(self, command, **kwargs):
+        """Imitate a streamed pdflatex process whose output comes from ``_fake_tool``."""
+        result = self._fake_tool(command, **kwargs)
+        process = MagicMock()
+        process.__enter__.return_value = process
+        process.stdout = iter(result.stdout.splitlines(keepends=True))
+        process.poll.return_value = None
+        process.wait.return_value = result.returncode
+        self.processes.append(process)
+        return process
+
+    def _compile(self, succeeds=True):
+        self.commands = []
+        self.processes = []
+        with (
+            patch("rxiv_maker.engine.build_manager.subprocess.run", side_effect=self._fake_tool),
+            patch("rxiv_maker.engine.build_manager.subprocess.Popen", side_effect=self._fake_process),
+            patch.object(self.build_manager, "log"),
+        ):
+            self.assertEqual(self.build_manager._compile_pdf_local(), succeeds)
+        return self.commands
+
+    def test_clean_build_runs_three_passes(self):
+        """Test that a clean build runs bibtex once and pdflatex until references settle."""
+        self.assertEqual(self._compile(), ["pdflatex", "bibtex", "pdflatex", "pdflatex"])
+
+    def test_unchanged_rebuild_runs_one_pass(self):
+        """Test that rebuilding an unchanged document runs pdflatex once and skips bibtex."""
+        self._compile()
+        self.assertEqual(self._compile(), ["pdflatex"])
+
+    def test_new_citation_reruns_bibliography(self):
+        """Test that citing another reference runs bibtex again."""
+        self._compile()
+        self.citations.append("b")
+        self.assertEqual(self._compile(), ["pdflatex", "bibtex", "pdflatex", "pdflatex"])
+
+    def test_changed_database_reruns_bibliography(self):
+        """Test that editing the bibliography database runs bibtex again."""
+        self._compile()
+        (self.output_dir / "03_REFERENCES.bib").write_text("@article{a, title={Changed}}\n", encoding="utf-8")
+        self.assertEqual(self._compile(), ["pdflatex", "bibtex", "pdflatex"])
+
+    def test_warning_to_rerun_requests_one_more_pass(self):
+        """Test that the log's rerun warning, even when wrapped, triggers another pass."""
+        self._compile()
+        original_tool = self._fake_tool
+
+        def warning_once(command, **kwargs):
+            result = original_tool(command, **kwargs)
+            if self.commands.count("pdflatex") == 1:
+                # pdflatex wraps log lines, which can split the message
+                self._output(".log").write_text("Label(s) may have changed. Rerun to get cross-refe\nrences right.\n")
+            return result
+
+        self._fake_tool = warning_once
+        self.assertEqual(self._compile(), ["pdflatex", "pdflatex"])
+
+    def test_passes_are_capped(self):
+        """Test that a document whose auxiliary file never settles stops after the pass limit."""
+        from rxiv_maker.engine.build_manager import MAX_LATEX_PASSES
+
+        self._compile()
+        original_tool = self._fake_tool
+
+        def unsettled(command, **kwargs):
+            result = original_tool(command, **kwargs)
+            with open(self._output(".aux"), "a") as aux:
+                aux.write(f"% pass {len(self.commands)}\n")
+            return result
+
+        self._fake_tool = unsettled
+        self.assertEqual(self._compile(), ["pdflatex"] * MAX_LATEX_PASSES)
+
+    def test_engine_sessions_use_same_pass_logic(self):
+        """Test that compiling through a container engine follows the same pass decisions."""
+        self.build_manager.engine = "docker"
+        self.build_manager.container_engine = Mock()
+        self.build_manager.container_engine.run_command.side_effect = lambda command, **kwargs: self._fake_tool(command)
+
+        for expected in (["pdflatex", "bibtex", "pdflatex", "pdflatex"], ["pdflatex"]):
+            self.commands = []
+            with patch.object(self.build_manager, "log"):
+                self.assertTrue(self.build_manager._compile_pdf_container())
+            self.assertEqual(self.commands, expected)
+
+    def test_fatal_failure_stops_compilation(self):
+        """Test that a missing file kills the running pass and skips the remaining ones."""
+        original_tool = self._fake_tool
+
+        def missing_file(command, **kwargs):
+            result = original_tool(command, **kwargs)
+            if command[0] == "pdflatex":
+                result.stdout = (
+                    "(./MANUSCRIPT.tex\n! LaTeX Error: File `missing.sty' not found.\n\n"
+                    "Type X to quit or <RETURN> to proceed,\nor enter new name. (Default extension: sty)\n"
+                )
+            return result
+
+        self._fake_tool = missing_file
+        self.assertEqual(self._compile(succeeds=False), ["pdflatex"])
+        self.processes[0].kill.assert_called_once()
+
+    def test_nonfatal_errors_do_not_stop_compilation(self):
+        """Test that errors nonstop mode recovers from still run every needed pass."""
+        original_tool = self._fake_tool
+
+        def overfull_box(command, **kwargs):
+            result = original_tool(command, **kwargs)
+            if command[0] == "pdflatex":
+                result.stdout = "Overfull \\hbox (12.0pt too wide) in paragraph\n! Missing $ inserted.\nl.12\n"
+            return result
+
+        self._fake_tool = overfull_box
+        self.assertEqual(self._compile(), ["pdflatex", "bibtex", "pdflatex", "pdflatex"])
+        for process in self.processes:
+            process.kill.assert_not_called()
+
+    def test_unusable_preamble_format_falls_back(self):
+        """Test that passes are rerun without the cached preamble format if it produces nothing."""
+        self._compile()
+        original_tool = self._fake_tool
+        format_flags = []
+
+        def broken_format(command, **kwargs):
+            if any(arg.startswith("-fmt=") for arg in command):
+                format_flags.append(command[1:-1])
+                self.commands.append(command[0])
+                return Mock(returncode=1, stdout="", stderr="")
+            return original_tool(command, **kwargs)
+
+        self._fake_tool = broken_format
+        # The PDF of the previous build must not be mistaken for output of this one
+        os.utime(self._output(".pdf"), ns=(0, 0))
+        with (
+            patch.dict(os.environ, {"RXIV_LATEX_FORMAT": "true"}),
+            patch("rxiv_maker.engine.build_manager.get_preamble_format", return_value="rxiv_preamble_0") as get_format,
+            patch("rxiv_maker.engine.build_manager.invalidate_preamble_format") as invalidate,
+        ):
+            self.assertEqual(self._compile(), ["pdflatex", "pdflatex"])
+
+        get_format.assert_called_once_with(self._output(".tex"))
+        invalidate.assert_called_once_with(self._output(".tex"), "rxiv_preamble_0")
+        self.assertEqual(format_flags, [["-interaction=nonstopmode", "-fmt=rxiv_preamble_0"]])
+
+    def test_fatal_preamble_format_pass_falls_back(self):
+        """Test that a fatal error in a pass using the preamble format retries without the format."""
+        original_tool = self._fake_tool
+
+        def fatal_with_format(command, **kwargs):
+            if any(arg.startswith("-fmt=") for arg in command):
+                self.commands.append(command[0])
+                stdout = (
+                    "! LaTeX Error: File `missing.sty' not found.\n\n"
+                    "Type X to quit or <RETURN> to proceed,\nor enter new name. (Default extension: sty)\n"
+                )
+                return Mock(returncode=1, stdout=stdout, stderr="")
+            return original_tool(command, **kwargs)
+
+        self._fake_tool = fatal_with_format
+        with (
+            patch.dict(os.environ, {"RXIV_LATEX_FORMAT": "true"}),
+            patch("rxiv_maker.engine.build_manager.get_preamble_format", return_value="rxiv_preamble_0"),
+            patch("rxiv_maker.engine.build_manager.invalidate_preamble_format") as invalidate,
+        ):
+            self.assertEqual(self._compile(), ["pdflatex", "pdflatex", "bibtex", "pdflatex", "pdflatex"])
+
+        invalidate.assert_called_once_with(self._output(".tex"), "rxiv_preamble_0")
+        self.processes[0].kill.assert_called_once()
+
+
+@pytest.mark.build_manager
+@unittest.skipUnless(BUILD_MANAGER_AVAILABLE, "Build manager not available")
+class TestConcurrentBuilds(unittest.TestCase):
+    """Test building several manuscripts in one process."""
+
+    def setUp(self):
+        """Create two minimal manuscripts."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.manuscripts = []
+        for name in ("PAPER_A", "PAPER_B"):
+            manuscript_dir = self.temp_dir / name
+            manuscript_dir.mkdir()
+            (manuscript_dir / "00_CONFIG.yml").write_text(f"title: {name}\n", encoding="utf-8")
+            (manuscript_dir / "01_MAIN.md").write_text(
+                f"---\ntitle: {name}\n---\n\n## Introduction\n\nValue {{{{py:value = '{name}'}}}}{{py:value}}.\n",
+                encoding="utf-8",
+            )
+            self.manuscripts.append(manuscript_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        from rxiv_maker.core.logging_config import cleanup
+
+        cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_conversion_leaves_process_state_alone(self):
+        """Test that concurrent conversions keep the working directory and environment."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        original_cwd = os.getcwd()
+        original_env = os.environ.get("MANUSCRIPT_PATH")
+        managers = [BuildManager(manuscript_path=str(path), skip_validation=True) for path in self.manuscripts]
+        for manager in managers:
+            manager.setup_output_directory()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda manager: manager.generate_tex_files(), managers))
+
+        self.assertEqual(results, [True, True])
+        self.assertEqual(os.getcwd(), original_cwd)
+        self.assertEqual(os.environ.get("MANUSCRIPT_PATH"), original_env)
+        for manager in managers:
+            content = manager.output_tex.read_text(encoding="utf-8")
+            # Each manuscript sees only the variables its own code defined
+            self.assertIn(f"Value {manager.manuscript_name}.", content)
+
+    def test_build_many_maps_results(self):
+        """Test that build_many reports each manuscript and survives failing builds."""
+
+        def fake_build(manager):
+            if manager.manuscript_name == "PAPER_B":
+                raise RuntimeError("broken build")
+            return True
+
+        with patch.object(BuildManager, "run_full_build", autospec=True, side_effect=fake_build):
+            results = build_many(self.manuscripts, max_workers=2, skip_validation=True)
+
+        self.assertEqual(results, {str(self.manuscripts[0]): True, str(self.manuscripts[1]): False})
 
 
 if __name__ == "__main__":
@@ -6,10 +6,13 @@ including blindtext commands and the extensible framework for future commands.
 
 from rxiv_maker.converters.custom_command_processor import (
     COMMAND_PROCESSORS,
+    CUSTOM_COMMANDS,
+    CustomCommand,
     _process_blindtext_commands,
     get_supported_commands,
     process_custom_commands,
     register_command_processor,
+    register_custom_command,
 )
 
 
@@ -230,6 +233,51 @@ class TestCommandRegistry:
             COMMAND_PROCESSORS.update(original_processors)
 
 
+class TestCommandEngine:
+    """Test the single-scan command expansion engine."""
+
+    def setup_method(self):
+        self.original_commands = CUSTOM_COMMANDS.copy()
+
+    def teardown_method(self):
+        CUSTOM_COMMANDS.clear()
+        CUSTOM_COMMANDS.update(self.original_commands)
+
+    def test_plugin_command_expanded_in_one_scan(self):
+        """Test that registered commands are dispatched alongside built-in ones."""
+
+        def expand_shout(text, match):
+            return match.group("shout_word").upper(), match.end()
+
+        register_custom_command(CustomCommand("shout", r"\{\{shout:(?P<shout_word>\w+)\}\}", expand_shout))
+
+        result = process_custom_commands("{{shout:hello}} {{blindtext}} `{{shout:code}}`")
+        assert result == "HELLO \\blindtext `{{shout:code}}`"
+
+    def test_incomplete_match_left_unchanged(self):
+        """Test that a handler can decline a match and scanning continues."""
+
+        def expand_only_closed(text, match):
+            end = text.find("]]", match.end())
+            if end == -1:
+                return None
+            return text[match.end() : end], end + 2
+
+        register_custom_command(CustomCommand("bracket", r"\[\[", expand_only_closed))
+
+        assert process_custom_commands("[[a]] [[b") == "a [[b"
+
+    def test_expansions_not_rescanned(self):
+        """Test that replacements are emitted as-is and not expanded again."""
+
+        def expand_echo(text, match):
+            return "{{blindtext}}", match.end()
+
+        register_custom_command(CustomCommand("echo", r"\{\{echo\}\}", expand_echo))
+
+        assert process_custom_commands("{{echo}} {{blindtext}}") == "{{blindtext}} \\blindtext"
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
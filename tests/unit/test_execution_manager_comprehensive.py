@@ -216,6 +216,26 @@ class TestLocalExecutionManager:
             assert execution_order == ["A", "B", "C"]
             assert result.success is True
 
+    def test_critical_path_follows_slowest_dependencies(self):
+        """Test that the critical path is the dependency chain with the longest total duration."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            context = ExecutionContext(mode=ExecutionMode.LOCAL, working_dir=temp_path, output_dir=temp_path / "output")
+
+            manager = LocalExecutionManager(context)
+            for step_id, dependencies, duration in [
+                ("setup", [], 1.0),
+                ("figures", ["setup"], 5.0),
+                ("styles", ["setup"], 2.0),
+                ("compile", ["figures", "styles"], 3.0),
+                ("word_count", ["setup"], 6.0),
+            ]:
+                manager.add_step(step_id, step_id, step_id, lambda context: StepResult.SUCCESS, dependencies)
+                manager.step_index[step_id].duration = duration
+
+            assert [step.id for step in manager.get_critical_path()] == ["setup", "figures", "compile"]
+
     def test_step_error_handling(self):
         """Test error handling in step execution."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,148 @@
+"""Unit tests for figure checksum cache keys."""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from rxiv_maker.utils.figure_checksum import FigureChecksumManager
+
+
+@pytest.fixture
+def manuscript(tmp_path):
+    """Create a manuscript with a figure script and its data file."""
+    manuscript = tmp_path / "MANUSCRIPT"
+    (manuscript / "FIGURES" / "DATA").mkdir(parents=True)
+    (manuscript / "FIGURES" / "Figure__plot.py").write_text("print('plot')\n", encoding="utf-8")
+    (manuscript / "FIGURES" / "Figure__flow.mmd").write_text("graph TD\n  A --> B\n", encoding="utf-8")
+    (manuscript / "FIGURES" / "DATA" / "values.csv").write_text("x,y\n1,2\n", encoding="utf-8")
+    return manuscript
+
+
+@pytest.fixture
+def manager(manuscript, tmp_path):
+    """Create a checksum manager with a private cache directory."""
+    return FigureChecksumManager(str(manuscript), cache_dir=str(tmp_path / "cache"))
+
+
+class TestFigureInputs:
+    """Test that recorded inputs are part of a figure's cache key."""
+
+    def test_changed_input_marks_figure_stale(self, manager, manuscript):
+        data_file = manuscript / "FIGURES" / "DATA" / "values.csv"
+        manager.set_file_inputs("Figure__plot.py", [str(data_file)])
+        manager.update_checksums()
+        assert not manager.has_file_changed("Figure__plot.py")
+
+        data_file.write_text("x,y\n1,3\n", encoding="utf-8")
+        assert manager.has_file_changed("Figure__plot.py")
+        assert manager.get_changed_files() == [manuscript / "FIGURES" / "Figure__plot.py"]
+
+        # Inputs stay recorded across instances and in bulk updates
+        reloaded = FigureChecksumManager(str(manuscript), cache_dir=str(manager.cache_dir))
+        assert reloaded.get_file_inputs("Figure__plot.py") == [manuscript / "FIGURES/DATA/values.csv"]
+        reloaded.update_checksums()
+        assert not reloaded.has_file_changed("Figure__plot.py")
+
+    def test_environment_change_marks_figure_stale(self, manager, tmp_path):
+        site_packages = tmp_path / "site-packages"
+        (site_packages / "numpy-1.0.dist-info").mkdir(parents=True)
+        manager.set_file_inputs("Figure__plot.py", [], [str(site_packages)])
+        manager.update_file_checksum("Figure__plot.py")
+
+        os.utime(site_packages, ns=(0, 0))
+        assert manager.has_file_changed("Figure__plot.py")
+
+    def test_sources_without_inputs_keep_plain_checksums(self, manager, manuscript):
+        manager.update_checksums()
+        source = manuscript / "FIGURES" / "Figure__flow.mmd"
+        assert manager._checksums["Figure__flow.mmd"] == manager._calculate_file_checksum(source)
+
+        manager.set_file_inputs("Figure__flow.mmd", [], [])
+        assert not manager.inputs_file.exists()
+        assert not manager.has_file_changed("Figure__flow.mmd")
+
+    def test_orphaned_inputs_dropped(self, manager, manuscript):
+        manager.set_file_inputs("Figure__plot.py", [str(manuscript / "FIGURES" / "DATA" / "values.csv")])
+        (manuscript / "FIGURES" / "Figure__plot.py").unlink()
+
+        manager.cleanup_orphaned_checksums()
+
+        assert manager.get_file_inputs("Figure__plot.py") == []
+        manager.clear_cache()
+        assert not manager.inputs_file.exists()
+
+
+class TestBatchedSaves:
+    """Test that checksum updates are collected and saved once."""
+
+    @pytest.fixture
+    def many_figures(self, manuscript):
+        for i in range(40):
+            (manuscript / "FIGURES" / f"SFigure__{i}.py").write_text(f"print({i})\n", encoding="utf-8")
+        return sorted(path.name for path in (manuscript / "FIGURES").glob("*.*"))
+
+    def _update_concurrently(self, manager, names):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(manager.update_file_checksum, names))
+
+    def test_batch_writes_cache_once(self, manager, many_figures):
+        with patch.object(manager, "_write_cache_file", wraps=manager._write_cache_file) as write:
+            with manager.batch():
+                with manager.batch():
+                    self._update_concurrently(manager, many_figures)
+                assert write.call_count == 0
+                assert not manager.checksum_file.exists()
+
+        write.assert_called_once()
+        assert sorted(json.loads(manager.checksum_file.read_text(encoding="utf-8"))) == many_figures
+
+    def test_batch_saved_when_generation_fails(self, manager, many_figures):
+        with pytest.raises(RuntimeError), manager.batch():
+            manager.update_file_checksum(many_figures[0])
+            raise RuntimeError("figure generation failed")
+
+        assert list(json.loads(manager.checksum_file.read_text(encoding="utf-8"))) == [many_figures[0]]
+
+    def test_concurrent_updates_not_lost(self, manager, many_figures):
+        self._update_concurrently(manager, many_figures)
+
+        assert sorted(json.loads(manager.checksum_file.read_text(encoding="utf-8"))) == many_figures
+        assert list(manager.cache_dir.glob("*.tmp")) == []
+
+
+class TestStatFastPath:
+    """Test that unchanged files are not hashed again."""
+
+    def _age(self, *paths):
+        old = time.time_ns() - 60 * 1_000_000_000
+        for path in paths:
+            os.utime(path, ns=(old, old))
+
+    def test_unchanged_files_not_read_again(self, manager, manuscript):
+        source = manuscript / "FIGURES" / "Figure__plot.py"
+        data_file = manuscript / "FIGURES" / "DATA" / "values.csv"
+        self._age(source, data_file, manuscript / "FIGURES" / "Figure__flow.mmd")
+        manager.set_file_inputs("Figure__plot.py", [str(data_file)])
+        manager.update_checksums()
+
+        reloaded = FigureChecksumManager(str(manuscript), cache_dir=str(manager.cache_dir))
+        with patch("hashlib.file_digest", wraps=hashlib.file_digest) as digest:
+            assert reloaded.get_changed_files() == []
+            assert digest.call_count == 0
+
+            data_file.write_text("x,y\n1,3\n", encoding="utf-8")
+            assert reloaded.has_file_changed("Figure__plot.py")
+            assert digest.call_count == 1
+
+    def test_just_modified_files_hashed_each_time(self, manager, manuscript):
+        manager.update_checksums()
+
+        with patch("hashlib.file_digest", wraps=hashlib.file_digest) as digest:
+            assert not manager.has_file_changed("Figure__plot.py")
+            assert not manager.has_file_changed("Figure__plot.py")
+            assert digest.call_count == 2
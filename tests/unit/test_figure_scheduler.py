@@ -0,0 +1,217 @@
+"""Unit tests for dependency-aware figure scheduling."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from rxiv_maker.engine.figure_scheduler import (
+    FigureJob,
+    FigureRuntimeHistory,
+    FigureScheduler,
+    default_worker_count,
+    parse_dependencies,
+)
+
+
+@pytest.fixture
+def figures_dir(tmp_path):
+    """Create a figures directory with a few scripts."""
+    figures = tmp_path / "FIGURES"
+    (figures / "DATA").mkdir(parents=True)
+    (figures / "DATA" / "values.csv").write_text("x,y\n", encoding="utf-8")
+    (figures / "SFigure__model.py").write_text("print('model')\n", encoding="utf-8")
+    (figures / "Figure__fit.py").write_text(
+        "# rxiv-depends: DATA/values.csv, SFigure__model.py\nprint('fit')\n", encoding="utf-8"
+    )
+    (figures / "Figure__summary.R").write_text(
+        "# rxiv-depends: Figure__fit/fit.csv\nprint('summary')\n", encoding="utf-8"
+    )
+    (figures / "Figure__workflow.mmd").write_text("graph TD\n  A --> B\n", encoding="utf-8")
+    return figures
+
+
+def _jobs(figures_dir):
+    types = {".py": "python", ".R": "R", ".mmd": "mermaid"}
+    return [FigureJob(path, types[path.suffix]) for path in sorted(figures_dir.glob("*.*"))]
+
+
+class TestDependencies:
+    """Test how declared dependencies are resolved."""
+
+    def test_declared_dependencies_parsed(self, figures_dir):
+        assert parse_dependencies(figures_dir / "Figure__fit.py") == ["DATA/values.csv", "SFigure__model.py"]
+        assert parse_dependencies(figures_dir / "Figure__workflow.mmd") == []
+
+    def test_dependencies_resolved_to_files_and_figures(self, figures_dir):
+        scheduler = FigureScheduler(_jobs(figures_dir), figures_dir, figures_dir)
+
+        fit = scheduler.jobs["Figure__fit.py"]
+        assert fit.upstream == {"SFigure__model.py"}
+        assert fit.dependencies == [figures_dir / "DATA" / "values.csv", figures_dir / "SFigure__model"]
+        assert scheduler.jobs["Figure__summary.R"].upstream == {"Figure__fit.py"}
+
+        order = [job.name for job in scheduler.ordered_jobs()]
+        assert order.index("SFigure__model.py") < order.index("Figure__fit.py") < order.index("Figure__summary.R")
+
+    def test_dependency_cycle_is_broken(self, figures_dir):
+        (figures_dir / "SFigure__model.py").write_text("# rxiv-depends: Figure__fit.py\n", encoding="utf-8")
+
+        scheduler = FigureScheduler(_jobs(figures_dir), figures_dir, figures_dir)
+
+        assert scheduler.jobs["Figure__fit.py"].upstream == set()
+        assert scheduler.jobs["SFigure__model.py"].upstream == set()
+        assert len(scheduler.ordered_jobs()) == 4
+
+
+class TestScheduling:
+    """Test the order and concurrency of scheduled jobs."""
+
+    def test_longest_chains_start_first(self, figures_dir, tmp_path):
+        history = FigureRuntimeHistory(tmp_path / "runtimes.json")
+        history.record("Figure__workflow.mmd", 30.0)
+        history.record("SFigure__model.py", 1.0)
+        history.record("Figure__fit.py", 10.0)
+        history.record("Figure__summary.R", 25.0)
+
+        scheduler = FigureScheduler(_jobs(figures_dir), figures_dir, figures_dir, history=history)
+
+        # The model figure is quick but 36 seconds of work wait on it
+        assert [job.name for job in scheduler.ordered_jobs()] == [
+            "SFigure__model.py",
+            "Figure__fit.py",
+            "Figure__workflow.mmd",
+            "Figure__summary.R",
+        ]
+
+    def test_jobs_wait_on_dependencies(self, figures_dir, tmp_path):
+        history = FigureRuntimeHistory(tmp_path / "runtimes.json")
+        scheduler = FigureScheduler(_jobs(figures_dir), figures_dir, figures_dir, history=history)
+        events = []
+        lock = threading.Lock()
+
+        def execute(job):
+            with lock:
+                events.append(("start", job.name))
+            time.sleep(0.02)
+            with lock:
+                events.append(("end", job.name))
+            return job.name != "Figure__workflow.mmd"
+
+        completed, failed = scheduler.run(execute, max_workers=4)
+
+        assert sorted(completed) == sorted(scheduler.jobs) and failed == []
+        assert events.index(("end", "SFigure__model.py")) < events.index(("start", "Figure__fit.py"))
+        assert events.index(("end", "Figure__fit.py")) < events.index(("start", "Figure__summary.R"))
+
+        # Only figures that were actually generated update the stored runtimes
+        stored = FigureRuntimeHistory(tmp_path / "runtimes.json")
+        assert stored.get("Figure__fit.py") is not None
+        assert stored.get("Figure__workflow.mmd") is None
+
+    def test_failed_dependency_skips_dependents(self, figures_dir):
+        scheduler = FigureScheduler(_jobs(figures_dir), figures_dir, figures_dir)
+        executed = []
+
+        def execute(job):
+            executed.append(job.name)
+            if job.name == "SFigure__model.py":
+                raise RuntimeError("script failed")
+            return True
+
+        completed, failed = scheduler.run(execute, max_workers=2)
+
+        assert completed == ["Figure__workflow.mmd"]
+        assert sorted(failed) == ["Figure__fit.py", "Figure__summary.R", "SFigure__model.py"]
+        assert "Figure__fit.py" not in executed
+
+    def test_pool_size_follows_memory(self):
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+        psutil = pytest.importorskip("psutil")
+        with patch.object(psutil, "virtual_memory", return_value=SimpleNamespace(available=1024**3)):
+            assert default_worker_count(20) == min(cpus, 2)
+            assert default_worker_count(20, max_workers=1) == 1
+            assert default_worker_count(1) == 1
+
+
+class TestFigureGeneratorScheduling:
+    """Test that the figure generator runs figures through the scheduler."""
+
+    @pytest.fixture
+    def generator(self, figures_dir, tmp_path):
+        from rxiv_maker.engine.generate_figures import FigureGenerator
+
+        generator = FigureGenerator(
+            figures_dir=str(figures_dir),
+            output_dir=str(figures_dir),
+            engine="local",
+            enable_content_caching=False,
+        )
+        history = FigureRuntimeHistory(tmp_path / "runtimes.json")
+        with patch.object(FigureGenerator, "_load_runtime_history", return_value=history):
+            yield generator
+
+    def test_parallel_dispatch_reaches_each_generator(self, generator):
+        with (
+            patch.object(generator, "generate_mermaid_figure") as mermaid,
+            patch.object(generator, "generate_python_figure") as python,
+            patch.object(generator, "generate_r_figure") as r_script,
+        ):
+            generator.generate_all_figures(parallel=True)
+
+        assert mermaid.call_count == 1
+        assert python.call_count == 2
+        r_script.assert_called_once_with(generator.figures_dir / "Figure__summary.R")
+
+    def test_changed_data_file_triggers_regeneration(self, generator, figures_dir):
+        with patch.object(generator, "generate_python_figure"), patch.object(generator, "generate_r_figure"):
+            with patch.object(generator, "generate_mermaid_figure"):
+                generator.generate_all_figures(parallel=False)
+
+        source = figures_dir / "Figure__fit.py"
+        output = figures_dir / "Figure__fit" / "Figure__fit.png"
+        output.parent.mkdir(exist_ok=True)
+        output.write_bytes(b"png")
+        old = time.time() - 60
+        for path in (figures_dir / "DATA" / "values.csv", figures_dir / "SFigure__model.py"):
+            os.utime(path, (old, old))
+        assert not generator._dependencies_changed(source, output)
+
+        (figures_dir / "DATA" / "values.csv").write_text("x,y\n1,2\n", encoding="utf-8")
+        assert generator._dependencies_changed(source, output)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_failing_script_skips_its_dependents(self, tmp_path, parallel, capsys):
+        from rxiv_maker.engine.generate_figures import FigureGenerator
+
+        figures = tmp_path / "FIGURES"
+        figures.mkdir()
+        marker = tmp_path / "dependent_ran"
+        (figures / "Afail.py").write_text("raise SystemExit(1)\n", encoding="utf-8")
+        (figures / "Bdep.py").write_text(
+            f"# rxiv-depends: Afail.py\nopen({str(marker)!r}, 'w').close()\n", encoding="utf-8"
+        )
+        generator = FigureGenerator(
+            figures_dir=str(figures), output_dir=str(figures), engine="local", enable_content_caching=False
+        )
+        generator.platform = SimpleNamespace(
+            python_cmd=sys.executable, run_command=lambda cmd, **kwargs: subprocess.run(cmd, **kwargs)
+        )
+
+        with (
+            patch.object(FigureGenerator, "_load_runtime_history", return_value=None),
+            patch.dict(os.environ, {"RXIV_FIGURE_WORKER": "false"}),
+        ):
+            generator.generate_all_figures(parallel=parallel)
+
+        output = capsys.readouterr().out
+        assert not marker.exists()
+        assert "Skipping Bdep.py: a figure it depends on failed" in output
+        assert "Completed: Afail.py" not in output
+        if parallel:
+            assert "0 successful, 2 failed" in output
@@ -0,0 +1,144 @@
+"""Unit tests for warm Python figure workers."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rxiv_maker.engine import figure_worker
+from rxiv_maker.engine.figure_worker import WarmPythonWorkerPool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+
+
+@pytest.fixture
+def pool():
+    """Create a pool of warm workers running this interpreter."""
+    pool = WarmPythonWorkerPool([sys.executable], size=2)
+    yield pool
+    pool.close()
+
+
+class TestWarmPythonWorkerPool:
+    """Test running figure scripts in forked children."""
+
+    def test_scripts_run_in_isolated_children(self, pool, tmp_path):
+        script = tmp_path / "Figure__state.py"
+        script.write_text(
+            "import json, os, sys\n"
+            "print(hasattr(json, 'marker'), os.getcwd(), os.environ['RXIV_FIGURE_OUTPUT_DIR'], __file__)\n"
+            "print(os.getppid(), os.getpid())\n"
+            "json.marker = True\n",
+            encoding="utf-8",
+        )
+        figure_dir = tmp_path / "Figure__state"
+        figure_dir.mkdir()
+
+        results = [pool.run(script, figure_dir, {"RXIV_FIGURE_OUTPUT_DIR": str(figure_dir)}) for _ in range(2)]
+
+        outputs = [result.stdout.splitlines() for result in results]
+        assert all(result.returncode == 0 for result in results)
+        assert outputs[0][0] == outputs[1][0] == f"False {figure_dir} {figure_dir} {script}"
+        # Both scripts were forked from the same warm worker
+        parents, children = zip(*(line[1].split() for line in outputs), strict=True)
+        assert parents[0] == parents[1] and children[0] != children[1]
+
+    def test_exit_codes_and_tracebacks_returned(self, pool, tmp_path):
+        failing = tmp_path / "failing.py"
+        failing.write_text("print('before')\nraise ValueError('bad data')\n", encoding="utf-8")
+        exiting = tmp_path / "exiting.py"
+        exiting.write_text("import sys\nprint('warning', file=sys.stderr)\nsys.exit(3)\n", encoding="utf-8")
+
+        failed = pool.run(failing, tmp_path)
+        exited = pool.run(exiting, tmp_path)
+
+        assert (failed.returncode, failed.stdout) == (1, "before\n")
+        assert "ValueError: bad data" in failed.stderr
+        assert (exited.returncode, exited.stderr) == (3, "warning\n")
+
+    def test_broken_pool_falls_back_to_new_interpreter(self, tmp_path):
+        from rxiv_maker.engine.generate_figures import FigureGenerator
+
+        figures_dir = tmp_path / "FIGURES"
+        figures_dir.mkdir()
+        (figures_dir / "Figure__plot.py").write_text(
+            "import os\nopen(os.path.join(os.environ['RXIV_FIGURE_OUTPUT_DIR'], 'Figure__plot.png'), 'wb').close()\n",
+            encoding="utf-8",
+        )
+        generator = FigureGenerator(
+            figures_dir=str(figures_dir), output_dir=str(figures_dir), engine="local", enable_content_caching=False
+        )
+        generator.platform = MagicMock(python_cmd=sys.executable)
+        run_command = generator.platform.run_command
+
+        with (
+            patch.dict(os.environ, {"RXIV_FIGURE_WORKER": "1"}),
+            patch.object(FigureGenerator, "_load_runtime_history", return_value=None),
+        ):
+            generator.generate_all_figures(parallel=False)
+            assert (figures_dir / "Figure__plot" / "Figure__plot.png").exists()
+            run_command.assert_not_called()
+
+            (figures_dir / "Figure__plot" / "Figure__plot.png").unlink()
+            with patch.object(WarmPythonWorkerPool, "run", side_effect=RuntimeError("Figure worker exited")):
+                generator.generate_all_figures(parallel=False)
+            run_command.assert_called_once()
+        assert generator._python_workers is None
+
+
+class TestInputTracing:
+    """Test recording the files a figure script reads."""
+
+    @pytest.fixture
+    def manuscript(self, tmp_path):
+        manuscript = tmp_path / "MANUSCRIPT"
+        (manuscript / "FIGURES" / "DATA").mkdir(parents=True)
+        (manuscript / "FIGURES" / "DATA" / "values.csv").write_text("x,y\n1,2\n", encoding="utf-8")
+        (manuscript / "FIGURES" / "plot_helpers.py").write_text("SCALE = 2\n", encoding="utf-8")
+        (manuscript / "FIGURES" / "Figure__plot.py").write_text(
+            "import os\n"
+            "import plot_helpers\n"
+            "data = open(os.path.join(os.path.dirname(__file__), 'DATA', 'values.csv')).read()\n"
+            "with open(os.path.join(os.environ['RXIV_FIGURE_OUTPUT_DIR'], 'Figure__plot.png'), 'w') as f:\n"
+            "    f.write(data * plot_helpers.SCALE)\n"
+            "with open(os.path.join(os.environ['RXIV_FIGURE_OUTPUT_DIR'], 'Figure__plot.png')) as f:\n"
+            "    f.read()\n",
+            encoding="utf-8",
+        )
+        (manuscript / "FIGURES" / "Figure__plot").mkdir()
+        return manuscript
+
+    def _env(self, manuscript, tmp_path):
+        return {
+            "RXIV_FIGURE_OUTPUT_DIR": str(manuscript / "FIGURES" / "Figure__plot"),
+            figure_worker.TRACE_FILE_VAR: str(tmp_path / "trace.json"),
+            figure_worker.INPUT_ROOT_VAR: str(manuscript),
+        }
+
+    def _expected_inputs(self, manuscript):
+        figures = manuscript.resolve() / "FIGURES"
+        return [str(figures / "DATA" / "values.csv"), str(figures / "plot_helpers.py")]
+
+    def test_script_run_records_data_files(self, manuscript, tmp_path):
+        script = manuscript / "FIGURES" / "Figure__plot.py"
+        command = figure_worker.script_command([sys.executable], script, manuscript / "FIGURES" / "Figure__plot")
+
+        result = subprocess.run(
+            command, capture_output=True, text=True, env={**os.environ, **self._env(manuscript, tmp_path)}
+        )
+
+        assert result.returncode == 0, result.stderr
+        trace = figure_worker.read_trace(tmp_path / "trace.json")
+        assert trace["inputs"] == self._expected_inputs(manuscript)
+        assert os.path.realpath(sys.executable) in trace["environment"]
+
+    def test_warm_pool_records_data_files(self, pool, manuscript, tmp_path):
+        script = manuscript / "FIGURES" / "Figure__plot.py"
+
+        result = pool.run(script, manuscript / "FIGURES" / "Figure__plot", self._env(manuscript, tmp_path))
+
+        assert result.returncode == 0, result.stderr
+        assert figure_worker.read_trace(tmp_path / "trace.json")["inputs"] == self._expected_inputs(manuscript)
+        assert figure_worker.read_trace(tmp_path / "missing.json") is None
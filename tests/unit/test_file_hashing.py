@@ -0,0 +1,54 @@
+"""Unit tests for checksums reused while files are unchanged."""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+from rxiv_maker.utils.file_hashing import file_signature, hash_file
+
+
+def _age(path, seconds=60):
+    """Move a file's modification time into the past, outside the racy window."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestHashFile:
+    """Test hashing files with a remembered signature."""
+
+    def test_unchanged_file_is_not_read_again(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n", encoding="utf-8")
+        _age(path)
+
+        checksum, entry = hash_file(path)
+        assert checksum == hashlib.sha256(b"x,y\n").hexdigest()
+        assert entry == {"signature": file_signature(path), "sha256": checksum}
+
+        with patch("hashlib.file_digest") as digest:
+            assert hash_file(path, entry) == (checksum, entry)
+        digest.assert_not_called()
+
+    def test_changed_file_is_hashed_again(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n", encoding="utf-8")
+        _age(path)
+        _, entry = hash_file(path)
+
+        path.write_text("x,y\n1,2\n", encoding="utf-8")
+        _age(path)
+
+        checksum, new_entry = hash_file(path, entry)
+        assert checksum == hashlib.sha256(b"x,y\n1,2\n").hexdigest()
+        assert new_entry is not None and new_entry["sha256"] == checksum
+
+    def test_freshly_modified_file_is_not_remembered(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n", encoding="utf-8")
+
+        checksum, entry = hash_file(path)
+        assert checksum and entry is None
+
+    def test_missing_file(self, tmp_path):
+        assert hash_file(tmp_path / "missing.csv") == ("", None)
+        assert file_signature(tmp_path / "missing.csv") is None
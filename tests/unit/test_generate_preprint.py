@@ -4,8 +4,11 @@ Tests the preprint generation functionality including template processing,
 YAML metadata handling, CLI integration, and error scenarios.
 """
 
+import os
+import shutil
 import tempfile
 import unittest
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -56,9 +59,13 @@ class TestGeneratePreprintCore(unittest.TestCase):
         mock_create_dir.assert_called_once_with(self.output_dir)
         mock_get_template.assert_called_once()
         mock_find_md.assert_called_once_with(None)
-        mock_process_template.assert_called_once_with("template content", self.yaml_metadata, "/fake/manuscript.md")
+        mock_process_template.assert_called_once_with(
+            "template content", self.yaml_metadata, "/fake/manuscript.md", section_cache=None
+        )
         mock_write_output.assert_called_once_with(self.output_dir, "processed template content", manuscript_name=None)
-        mock_generate_supp.assert_called_once_with(self.output_dir, self.yaml_metadata)
+        mock_generate_supp.assert_called_once_with(
+            self.output_dir, self.yaml_metadata, section_cache=None, manuscript_path=None
+        )
 
         # Verify result
         self.assertEqual(result, "/output/manuscript.tex")
@@ -328,11 +335,15 @@ class TestGeneratePreprintIntegration(unittest.TestCase):
         # Verify all components called correctly
         mock_create_dir.assert_called_once_with(self.output_dir)
         mock_find_md.assert_called_once_with("/custom/manuscript.md")
-        mock_process_template.assert_called_once_with(template_content, yaml_metadata, "/manuscripts/paper.md")
+        mock_process_template.assert_called_once_with(
+            template_content, yaml_metadata, "/manuscripts/paper.md", section_cache=None
+        )
         mock_write_output.assert_called_once_with(
             self.output_dir, "\\documentclass{article}\\begin{document}...", manuscript_name=None
         )
-        mock_generate_supp.assert_called_once_with(self.output_dir, yaml_metadata)
+        mock_generate_supp.assert_called_once_with(
+            self.output_dir, yaml_metadata, section_cache=None, manuscript_path="/custom/manuscript.md"
+        )
 
         self.assertEqual(result, "/output/paper.tex")
 
@@ -434,5 +445,112 @@ class TestGeneratePreprintErrorHandling(unittest.TestCase):
                 generate_preprint(self.output_dir, {})
 
 
+class TestGeneratePreprintParallel(unittest.TestCase):
+    """Test parallel conversion of the main and supplementary documents."""
+
+    # Each document cites references and refers to labels defined in the other
+    MAIN_MD = (
+        "---\ntitle: Parallel\n---\n\n## Introduction\n\n"
+        "See @sfig:extra, @stable:data and @snote:one [@smith2020] and **bold** text.\n"
+    )
+    SUPPLEMENTARY_MD = (
+        "## Supplementary Notes\n\n{#snote:one} **A note.**\n\n"
+        "Some *italic* notes on @fig:main and @eq:model [@smith2020; @doe2021].\n"
+    )
+
+    def setUp(self):
+        """Create a manuscript with supplementary information."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.manuscript_dir = self.temp_dir / "MANUSCRIPT"
+        self.manuscript_dir.mkdir()
+        (self.manuscript_dir / "01_MAIN.md").write_text(self.MAIN_MD, encoding="utf-8")
+        (self.manuscript_dir / "02_SUPPLEMENTARY_INFO.md").write_text(self.SUPPLEMENTARY_MD, encoding="utf-8")
+
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        env_patcher = patch.dict(os.environ, {"MANUSCRIPT_PATH": "MANUSCRIPT"})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def tearDown(self):
+        """Restore the working directory."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parallel_output_matches_sequential(self):
+        """Test that both modes write identical documents."""
+        yaml_metadata = {"title": "Parallel"}
+        sequential = generate_preprint(str(self.temp_dir / "seq"), yaml_metadata, "MANUSCRIPT")
+        parallel = generate_preprint(str(self.temp_dir / "par"), yaml_metadata, "MANUSCRIPT", parallel=True)
+
+        self.assertEqual(Path(parallel).read_text(encoding="utf-8"), Path(sequential).read_text(encoding="utf-8"))
+        supplementary = (self.temp_dir / "par" / "Supplementary.tex").read_text(encoding="utf-8")
+        self.assertEqual(supplementary, (self.temp_dir / "seq" / "Supplementary.tex").read_text(encoding="utf-8"))
+        # References across documents are left for LaTeX to resolve
+        self.assertIn("\\ref{snote:one}", Path(parallel).read_text(encoding="utf-8"))
+        self.assertIn("\\ref{fig:main}", supplementary)
+        self.assertIn("\\cite{smith2020,doe2021}", supplementary)
+
+    @patch("rxiv_maker.engine.generate_preprint._generate_documents_in_parallel")
+    def test_executable_commands_force_sequential_conversion(self, mock_parallel):
+        """Test that documents sharing a Python execution context are converted in order."""
+        (self.manuscript_dir / "02_SUPPLEMENTARY_INFO.md").write_text("Value: {{py:x}}\n", encoding="utf-8")
+
+        generate_preprint(str(self.temp_dir / "output"), {}, "MANUSCRIPT", parallel=True)
+
+        mock_parallel.assert_not_called()
+        self.assertTrue((self.temp_dir / "output" / "Supplementary.tex").exists())
+
+    def test_section_cache_copies_are_merged(self):
+        """Test that sections converted in the workers end up in the parent cache."""
+        section_cache = Mock()
+        worker_cache = Mock()
+        with (
+            patch("rxiv_maker.engine.generate_preprint.ProcessPoolExecutor", _InlineExecutor),
+            patch(
+                "rxiv_maker.engine.generate_preprint._generate_main_document",
+                return_value=("main.tex", worker_cache),
+            ),
+            patch(
+                "rxiv_maker.engine.generate_preprint._generate_supplementary_document",
+                return_value=worker_cache,
+            ),
+        ):
+            result = generate_preprint(str(self.temp_dir / "output"), {}, "MANUSCRIPT", section_cache, parallel=True)
+
+        self.assertEqual(result, "main.tex")
+        self.assertEqual(section_cache.merge.call_count, 2)
+
+    def test_explicit_paths_ignore_working_directory(self):
+        """Test that an explicit manuscript path and name need no chdir or environment."""
+        os.chdir(self.original_cwd)
+        with patch.dict(os.environ, {"MANUSCRIPT_PATH": "ELSEWHERE"}):
+            result = generate_preprint(
+                str(self.temp_dir / "output"), {}, str(self.manuscript_dir), manuscript_name="PAPER"
+            )
+
+        self.assertEqual(Path(result), self.temp_dir / "output" / "PAPER.tex")
+        supplementary = (self.temp_dir / "output" / "Supplementary.tex").read_text(encoding="utf-8")
+        self.assertIn("A note.", supplementary)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs submitted calls in the current process."""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
 if __name__ == "__main__":
     unittest.main()
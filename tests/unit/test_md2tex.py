@@ -1,5 +1,6 @@
 """Unit tests for the md2tex module."""
 
+import io
 import re
 
 from rxiv_maker.converters.citation_processor import convert_citations_to_latex
@@ -16,8 +17,11 @@ from rxiv_maker.converters.md2tex import (
     map_section_title_to_key,
 )
 from rxiv_maker.converters.table_processor import (
+    clear_cell_format_cache,
     convert_table_references_to_latex,
     convert_tables_to_latex,
+    get_cell_format_cache_stats,
+    write_latex_longtable,
 )
 from rxiv_maker.converters.url_processor import escape_url_for_latex
 
@@ -458,6 +462,120 @@ class TestTableFormattingConversion:
         assert "regular" in result
 
 
+class TestStreamingTableConversion:
+    """Test row-by-row conversion of tables marked as longtables."""
+
+    @staticmethod
+    def _large_table(row_count, attributes=" longtable=true"):
+        rows = "\n".join(f"| Gene{i} | {i}% | *n.s.* |" for i in range(row_count))
+        return (
+            f"| Gene | Value | Sig |\n|---|---|---|\n{rows}\n\n{{#stable:big{attributes}}} **Big Table.** Many rows.\n"
+        )
+
+    def test_marked_tables_become_longtable(self):
+        """Test that tables marked longtable=true become a longtable with every row."""
+        row_count = 250
+        result = convert_tables_to_latex(self._large_table(row_count))
+
+        assert "\\begin{longtable}{|l|l|l|}" in result
+        assert "\\begin{table}" not in result
+        assert "Gene & Value & Sig \\\\\n\\hline\n\\endhead" in result
+        assert "\\caption{\\textbf{Big Table.} Many rows.}\\label{stable:big}" in result
+        assert result.count("\\textit{n.s.}") == row_count
+        assert f"Gene{row_count - 1} & {row_count - 1}\\% & \\textit{{n.s.}} \\\\" in result
+        assert "{#stable:big" not in result
+        assert "addtocounter" not in result
+
+    def test_unmarked_tables_keep_float_environment(self):
+        """Test that large tables stay floating tables unless marked as longtables."""
+        result = convert_tables_to_latex(self._large_table(1000, attributes=""))
+
+        assert "\\begin{table}[ht]" in result
+        assert "longtable" not in result
+
+    def test_longtables_keep_rotation_and_width(self):
+        """Test that rotated and two-column longtables keep their layout."""
+        rows = "\n".join(f"| {i} | {i} | {i} | {i} | {i} |" for i in range(5))
+        table = f"| A | B | C | D | E |\n|---|---|---|---|---|\n{rows}\n"
+
+        rotated = convert_tables_to_latex(f"{table}\n{{#table:wide rotate=90 longtable=true}} **Wide.**\n")
+        assert "\\begin{rxivlongtable}\n\\begin{landscape}\n" in rotated
+        assert "\\end{longtable}\n\\end{landscape}\n\\end{rxivlongtable}" in rotated
+        assert "p{0.190\\linewidth}" in rotated
+
+        double = convert_tables_to_latex(f"Table* 1: Wide.\n{table}\n{{#table:wide longtable=true}} **Wide.**\n")
+        assert "p{0.190\\textwidth}" in double and "landscape" not in double
+        single = convert_tables_to_latex(f"Table 1: Narrow.\n{table}\n{{#table:narrow longtable=true}} **Narrow.**\n")
+        assert "p{0.190\\rxivlongtablewidth}" in single
+
+    def test_longtables_survive_full_conversion(self):
+        """Test that later conversion passes leave longtable cells alone."""
+        row = "| H~2~O | `a%b` | https://example.org/a_b |"
+
+        def convert(row_count, attributes):
+            rows = "\n".join([row] * row_count)
+            return convert_markdown_to_latex(
+                f"| A | B | C |\n|---|---|---|\n{rows}\n\n{{#table:cells{attributes}}} **Cells.**\n"
+            )
+
+        small = convert(2, "")
+        large = convert(250, " longtable=true")
+        assert "\\begin{longtable}" in large and "XXPROTECTEDTABLEXX" not in large
+        small_rows = {line for line in small.split("\n") if line.startswith("H")}
+        large_rows = [line for line in large.split("\n") if line.startswith("H")]
+        assert len(large_rows) == 250
+        assert set(large_rows) == small_rows == {"H\\~{}2\\~{}O & \\texttt{a\\%b} & https://example.org/a\\_b \\\\"}
+
+    def test_lazy_rows_written_in_batches(self):
+        """Test that rows are read from an iterator and written to the stream."""
+        buffer = io.StringIO()
+        rows = ([f"a{i}", f"b{i}"] for i in range(1000))
+
+        written = write_latex_longtable(buffer, ["A", "B"], rows, is_supplementary=True)
+
+        output = buffer.getvalue()
+        assert written == 1000
+        assert output.startswith("\\begin{rxivlongtable}\n\\renewcommand{\\thetable}{\\thestable}\\stepcounter{stable}")
+        assert output.endswith("\\end{longtable}\n\\addtocounter{table}{-1}\n\\end{rxivlongtable}")
+        assert output.count("\\hline") == 1002
+        assert "\\caption" not in output
+
+
+class TestCellFormatCache:
+    """Test memoization of table cell formatting."""
+
+    def setup_method(self):
+        clear_cell_format_cache()
+
+    def test_duplicate_cells_hit_memo(self):
+        """Test that repeated cell values are formatted once."""
+        rows = "\n".join(f"| Gene{i} | *n.s.* |" for i in range(10))
+        result = convert_tables_to_latex(f"| Gene | Sig |\n|---|---|\n{rows}\n")
+
+        assert result.count("\\textit{n.s.}") == 10
+        stats = get_cell_format_cache_stats()
+        assert stats["hits"] == 9
+        assert stats["misses"] == 13
+        assert stats["hit_rate"] == 9 / 22
+
+    def test_memo_keyed_on_column_mode(self):
+        """Test that the same cell text is formatted per column mode."""
+        markdown = "| Markdown Element | Syntax | Output |\n|---|---|---|\n| **bold** | x | **bold** |\n"
+        result = convert_tables_to_latex(markdown)
+
+        assert "\\textbf{bold} & \\texttt{x} & \\textbf{bold} \\\\" in result
+        assert get_cell_format_cache_stats()["hits"] == 0
+
+    def test_cache_reset(self):
+        """Test that clearing the memo resets its statistics."""
+        convert_tables_to_latex("| A |\n|---|\n| x |\n")
+        clear_cell_format_cache()
+
+        stats = get_cell_format_cache_stats()
+        assert stats["hits"] == stats["misses"] == stats["cached_cells"] == 0
+        assert stats["hit_rate"] == 0.0
+
+
 class TestNoAutomaticNewpage:
     """Test that automatic newpage insertion has been removed."""
 
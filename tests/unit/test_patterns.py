@@ -0,0 +1,44 @@
+"""Tests for the shared precompiled converter patterns."""
+
+import re
+
+from rxiv_maker.converters import citation_processor, html_processor, patterns, table_processor, text_formatters
+
+
+def _registry_patterns():
+    return {name: value for name, value in vars(patterns).items() if name.endswith("_PATTERN")}
+
+
+class TestPatternRegistry:
+    """Test the compiled pattern registry."""
+
+    def test_all_entries_precompiled(self):
+        registry = _registry_patterns()
+        assert registry
+        for name, value in registry.items():
+            assert isinstance(value, re.Pattern), name
+
+        for group in (patterns.LATEX_REFERENCE_COMMAND_PATTERNS, patterns.HTML_REMOVED_ELEMENT_PATTERNS):
+            assert all(isinstance(value, re.Pattern) for value in group)
+
+    def test_modules_share_pattern_objects(self):
+        assert text_formatters.BOLD_SIMPLE_PATTERN is patterns.BOLD_SIMPLE_PATTERN
+        assert table_processor.BOLD_SIMPLE_PATTERN is patterns.BOLD_SIMPLE_PATTERN
+        assert citation_processor.SINGLE_CITATION_PATTERN is patterns.SINGLE_CITATION_PATTERN
+        assert html_processor.HTML_BOLD_PATTERN is patterns.HTML_BOLD_PATTERN
+
+    def test_citation_and_ref_commands(self):
+        text = r"See \ref{fig:a_b} and \cite{smith_2020} but not \textbf{x_y}"
+        matches = [m.group(0) for p in patterns.LATEX_REFERENCE_COMMAND_PATTERNS for m in p.finditer(text)]
+        assert matches == [r"\ref{fig:a_b}", r"\cite{smith_2020}"]
+
+    def test_html_elements_dropped_with_content(self):
+        text = "<p>keep</p><SCRIPT type='x'>drop()</SCRIPT><style>\na{}\n</style>"
+        for pattern in patterns.HTML_REMOVED_ELEMENT_PATTERNS:
+            text = pattern.sub("", text)
+        assert text == "<p>keep</p>"
+
+    def test_protected_region_split(self):
+        parts = patterns.PROTECTED_CONTEXT_SPLIT_PATTERN.split("a^2^ $x^2$ b")
+        assert "$x^2$" in parts
+        assert "a^2^ " in parts
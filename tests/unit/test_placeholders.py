@@ -0,0 +1,49 @@
+"""Unit tests for single-pass placeholder restoration."""
+
+from rxiv_maker.converters.math_processor import protect_math_expressions, restore_math_expressions
+from rxiv_maker.converters.placeholders import restore_placeholders
+
+
+class TestRestorePlaceholders:
+    """Test restoring protected content from placeholder tables."""
+
+    def test_all_placeholders_restored(self):
+        table = {
+            "XXPROTECTEDMATHXX0XXPROTECTEDMATHXX": "$a$",
+            "XXPROTECTEDMATHXX1XXPROTECTEDMATHXX": "$b$",
+        }
+        content = "x XXPROTECTEDMATHXX0XXPROTECTEDMATHXX y XXPROTECTEDMATHXX1XXPROTECTEDMATHXX"
+        assert restore_placeholders(content, table) == "x $a$ y $b$"
+
+    def test_indices_not_confused(self):
+        table = {f"XXPROTECTEDMATHXX{i}XXPROTECTEDMATHXX": f"${i}$" for i in range(12)}
+        content = "XXPROTECTEDMATHXX1XXPROTECTEDMATHXX XXPROTECTEDMATHXX11XXPROTECTEDMATHXX"
+        assert restore_placeholders(content, table) == "$1$ $11$"
+
+    def test_foreign_placeholders_untouched(self):
+        table = {"XXPROTECTEDMATHXX0XXPROTECTEDMATHXX": "$a$"}
+        content = "XXPROTECTEDTABLEXX0XXPROTECTEDTABLEXX XXPROTECTEDMATHXX0XXPROTECTEDMATHXX"
+        assert restore_placeholders(content, table) == "XXPROTECTEDTABLEXX0XXPROTECTEDTABLEXX $a$"
+
+    def test_adjacent_placeholders(self):
+        table = {
+            "XXPROTECTEDMATHXX0XXPROTECTEDMATHXX": "$a$",
+            "XXPROTECTEDMATHXX1XXPROTECTEDMATHXX": "$b$",
+        }
+        content = "XXPROTECTEDMATHXX0XXPROTECTEDMATHXXXXPROTECTEDMATHXX1XXPROTECTEDMATHXX"
+        assert restore_placeholders(content, table) == "$a$$b$"
+
+    def test_collects_restored_placeholders(self):
+        table = {
+            "XXPROTECTEDBACKTICKXX0XXPROTECTEDBACKTICKXX": "`a`",
+            "XXPROTECTEDBACKTICKXX1XXPROTECTEDBACKTICKXX": "`b`",
+        }
+        restored: set[str] = set()
+        restore_placeholders("| XXPROTECTEDBACKTICKXX1XXPROTECTEDBACKTICKXX |", table, restored)
+        assert restored == {"XXPROTECTEDBACKTICKXX1XXPROTECTEDBACKTICKXX"}
+
+    def test_math_round_trip(self):
+        content = "Inline $x^2$, display $$\\int f$$ and $y_1$."
+        protected, table = protect_math_expressions(content)
+        assert "$" not in protected
+        assert restore_math_expressions(protected, table) == content
@@ -0,0 +1,112 @@
+"""Unit tests for cached preamble formats."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from rxiv_maker.utils.preamble_format import MAX_CACHED_FORMATS, PreambleFormatCache
+
+DOCUMENT = "\\documentclass{rxiv_maker_style}\n\\usepackage{float}\n\\begin{document}\nBody\n\\end{document}\n"
+
+
+class TestPreambleFormatCache:
+    """Test dumping, reusing and rebuilding preamble formats."""
+
+    def setup_method(self):
+        self.dumps = []
+
+    def _setup(self, tmp_path):
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        document = output_dir / "MANUSCRIPT.tex"
+        document.write_text(DOCUMENT, encoding="utf-8")
+        (output_dir / "rxiv_maker_style.cls").write_text("% class", encoding="utf-8")
+        package = tmp_path / "texmf" / "float.sty"
+        package.parent.mkdir()
+        package.write_text("% float", encoding="utf-8")
+        self.package = package
+        return document, PreambleFormatCache(cache_dir=str(tmp_path / "cache"))
+
+    def _fake_dump(self, command, cwd, **kwargs):
+        """Imitate ``pdflatex -ini``: write the format and a recorder file."""
+        self.dumps.append(command)
+        jobname = next(arg for arg in command if arg.startswith("-jobname=")).split("=", 1)[1]
+        (Path(cwd) / f"{jobname}.fmt").write_bytes(b"format")
+        (Path(cwd) / f"{jobname}.fls").write_text(
+            f"PWD {cwd}\nINPUT ./rxiv_maker_style.cls\nINPUT {self.package}\nOUTPUT {jobname}.fmt\n", encoding="utf-8"
+        )
+        (Path(cwd) / f"{jobname}.log").write_text("log", encoding="utf-8")
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    def _get_format(self, cache, document, fake_run=None):
+        with (
+            patch("rxiv_maker.utils.preamble_format.get_pdflatex_version", return_value="pdfTeX 3.141592653"),
+            patch("rxiv_maker.utils.preamble_format.subprocess.run", side_effect=fake_run or self._fake_dump),
+        ):
+            return cache.get_format(document)
+
+    def test_format_dumped_once_and_reused(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+
+        first = self._get_format(cache, document)
+        second = self._get_format(cache, document)
+
+        assert first == second
+        assert first.startswith("rxiv_preamble_")
+        assert len(self.dumps) == 1
+        assert "mylatexformat.ltx" in self.dumps[0]
+        assert (document.parent / f"{first}.fmt").exists()
+        assert not (document.parent / f"{first}.fls").exists()
+
+    def test_body_edits_keep_format(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+        first = self._get_format(cache, document)
+
+        document.write_text(DOCUMENT.replace("Body", "Edited body"), encoding="utf-8")
+
+        assert self._get_format(cache, document) == first
+        assert len(self.dumps) == 1
+
+    def test_edited_preamble_and_style_each_make_new_format(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+        first = self._get_format(cache, document)
+
+        document.write_text(DOCUMENT.replace("{float}", "{float}\n\\usepackage{xcolor}"), encoding="utf-8")
+        second = self._get_format(cache, document)
+        (document.parent / "rxiv_maker_style.cls").write_text("% class v2", encoding="utf-8")
+        third = self._get_format(cache, document)
+
+        assert len({first, second, third}) == 3
+        assert len(self.dumps) == 3
+        # Only the current format is left next to the document
+        assert [f.name for f in document.parent.glob("*.fmt")] == [f"{third}.fmt"]
+
+    def test_updated_package_rebuilds_format(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+        first = self._get_format(cache, document)
+
+        stat = self.package.stat()
+        os.utime(self.package, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert self._get_format(cache, document) == first
+        assert len(self.dumps) == 2
+
+    def test_failed_dump_returns_none(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+
+        def failing_dump(command, cwd, **kwargs):
+            return subprocess.CompletedProcess(command, 1, "! LaTeX Error: File `missing.sty' not found.", "")
+
+        assert self._get_format(cache, document, failing_dump) is None
+        assert not list(document.parent.glob("*.fmt"))
+
+    def test_old_formats_pruned(self, tmp_path):
+        document, cache = self._setup(tmp_path)
+
+        for version in range(MAX_CACHED_FORMATS + 2):
+            document.write_text(DOCUMENT.replace("{float}", f"{{float}}% {version}"), encoding="utf-8")
+            self._get_format(cache, document)
+
+        assert len(list(cache.cache_dir.glob("*.fmt"))) == MAX_CACHED_FORMATS
+        assert len(list(cache.cache_dir.glob("*.json"))) == MAX_CACHED_FORMATS
@@ -0,0 +1,95 @@
+"""Unit tests for incremental arXiv package preparation."""
+
+import os
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from rxiv_maker.engine.prepare_arxiv import create_zip_package, prepare_arxiv_package
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """Create an output directory as left by a manuscript build."""
+    output = tmp_path / "output"
+    (output / "Figures" / "Figure1").mkdir(parents=True)
+    (output / "Figures" / "DATA").mkdir()
+    (output / "MANUSCRIPT.tex").write_text(
+        "\\documentclass{rxiv_maker_style}\n\\includegraphics[width=\\linewidth]{Figures/Figure1/Figure\\_1.png}\n",
+        encoding="utf-8",
+    )
+    (output / "Supplementary.tex").write_text("Supplementary\n", encoding="utf-8")
+    (output / "03_REFERENCES.bib").write_text("@article{a, title={A}}\n", encoding="utf-8")
+    (output / "rxiv_maker_style.cls").write_text("% style\n", encoding="utf-8")
+    (output / "Figures" / "Figure1" / "Figure_1.png").write_bytes(os.urandom(4096))
+    (output / "Figures" / "DATA" / "values.csv").write_text("x,y\n" * 1000, encoding="utf-8")
+    return output
+
+
+def _prepare(output_dir):
+    with patch("rxiv_maker.engine.prepare_arxiv.test_arxiv_compilation", return_value=True):
+        return prepare_arxiv_package(str(output_dir), str(output_dir.parent / "arxiv"), "MANUSCRIPT")
+
+
+class TestIncrementalPackage:
+    """Test that repeated packaging only touches what changed."""
+
+    def test_unchanged_files_kept_between_runs(self, output_dir):
+        arxiv_path = _prepare(output_dir)
+        main_file = arxiv_path / "MANUSCRIPT.tex"
+        figure = arxiv_path / "Figures" / "Figure1" / "Figure_1.png"
+        before = {path: path.stat() for path in (main_file, figure)}
+
+        _prepare(output_dir)
+
+        for path, stat in before.items():
+            assert (path.stat().st_ino, path.stat().st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+        assert "Figure_1.png" in main_file.read_text(encoding="utf-8")
+
+    def test_figures_share_storage_with_output(self, output_dir):
+        arxiv_path = _prepare(output_dir)
+
+        source = output_dir / "Figures" / "DATA" / "values.csv"
+        packaged = arxiv_path / "Figures" / "DATA" / "values.csv"
+        assert packaged.stat().st_ino == source.stat().st_ino
+
+        # A regenerated figure replaces the file in the output directory
+        source.unlink()
+        source.write_text("x,y\n1,2\n", encoding="utf-8")
+        _prepare(output_dir)
+        assert packaged.read_text(encoding="utf-8") == "x,y\n1,2\n"
+
+    def test_deleted_outputs_dropped_from_package(self, output_dir):
+        arxiv_path = _prepare(output_dir)
+        (arxiv_path / "MANUSCRIPT.log").write_text("compilation test log", encoding="utf-8")
+
+        (output_dir / "Figures" / "Figure1" / "Figure_1.png").unlink()
+        _prepare(output_dir)
+
+        assert not (arxiv_path / "Figures" / "Figure1").exists()
+        # Artifacts of the compilation test are not package files
+        assert (arxiv_path / "MANUSCRIPT.log").exists()
+
+
+class TestZipPackage:
+    """Test the ZIP package built from the package directory."""
+
+    def test_zip_holds_current_package_files(self, output_dir, tmp_path):
+        arxiv_path = _prepare(output_dir)
+        (arxiv_path / "MANUSCRIPT.aux").write_text("aux", encoding="utf-8")
+        zip_path = create_zip_package(arxiv_path, str(tmp_path / "for_arxiv.zip"))
+
+        (output_dir / "Supplementary.tex").write_text("Revised supplementary\n", encoding="utf-8")
+        _prepare(output_dir)
+        assert create_zip_package(arxiv_path, str(tmp_path / "for_arxiv.zip")) == zip_path
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert len(zipf.namelist()) == 6
+            assert zipf.read("Supplementary.tex") == b"Revised supplementary\n"
+            assert zipf.read("Figures/DATA/values.csv") == b"x,y\n" * 1000
+            assert zipf.getinfo("Figures/DATA/values.csv").compress_type == zipfile.ZIP_DEFLATED
+            assert zipf.getinfo("Figures/Figure1/Figure_1.png").compress_type == zipfile.ZIP_STORED
+            assert "MANUSCRIPT.aux" not in zipf.namelist()
+        assert not list(tmp_path.glob("*.tmp"))
@@ -4,12 +4,17 @@ This module tests the secure Python execution functionality,
 including security restrictions, error handling, and output formatting.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
 from rxiv_maker.converters.python_executor import (
     PythonExecutor,
     SecurityError,
     get_python_executor,
+    python_execution_scope,
 )
 
 
@@ -336,6 +341,34 @@ class TestGlobalExecutor:
         result = executor2.execute_inline("global_test_var")
         assert result == "42"
 
+    def test_execution_scope_isolates_threads(self, tmp_path):
+        """Test that builds in different threads each get their own executor."""
+
+        def run_scoped(value):
+            with python_execution_scope(working_dir=tmp_path) as executor:
+                assert get_python_executor() is executor
+                executor.execute_block(f"scoped_value = {value}")
+                return executor.execute_inline("scoped_value"), executor.working_dir
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(run_scoped, [1, 2]))
+
+        assert results == [("1", tmp_path), ("2", tmp_path)]
+        assert "scoped_value" not in get_python_executor().execution_context
+
+    def test_execution_leaves_process_output_streams_alone(self):
+        """Test that running code does not swap the sys.stdout shared by every thread."""
+        executor = PythonExecutor()
+        streams = []
+
+        def run(code, context):
+            streams.append((sys.stdout, sys.stderr))
+            return {"success": True, "output": "ok", "context": {}}
+
+        with patch.object(executor, "_execute_with_subprocess", side_effect=run):
+            assert executor.execute_code_safely("x = 1") == ("ok", True)
+        assert streams == [(sys.stdout, sys.stderr)]
+
     def test_context_isolation(self):
         """Test that different executor instances have isolated contexts."""
         executor1 = PythonExecutor()
@@ -349,6 +382,83 @@ class TestGlobalExecutor:
         assert "not defined" in result.lower()
 
 
+class _MemoryResultCache:
+    """In-memory stand-in for the persistent result cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_data(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, data):
+        self.entries[key] = data
+
+
+class TestExecutionResultCache:
+    """Test reuse of stored execution results."""
+
+    def setup_method(self):
+        self.cache = _MemoryResultCache()
+        self.spawned = []
+
+    def _executor(self, monkeypatch):
+        executor = PythonExecutor(result_cache=self.cache)
+        original_run = executor._run_subprocess
+
+        def counting_run(code, context_json):
+            self.spawned.append(code)
+            return original_run(code, context_json)
+
+        monkeypatch.setattr(executor, "_run_subprocess", counting_run)
+        return executor
+
+    def test_unchanged_blocks_skip_subprocess(self, monkeypatch):
+        """Test that a rebuild with unchanged blocks reuses output and variables."""
+        first = self._executor(monkeypatch)
+        assert first.execute_block("total = 40 + 2") == ""
+        assert first.execute_inline("total") == "42"
+        assert len(self.spawned) == 2
+
+        second = self._executor(monkeypatch)
+        assert second.execute_block("total = 40 + 2") == ""
+        assert second.execute_inline("total") == "42"
+        assert len(self.spawned) == 2
+        assert second.execution_context == first.execution_context == {"total": 42}
+
+    def test_changed_inputs_miss(self, monkeypatch):
+        """Test that changing the code or the input variables runs the code again."""
+        executor = self._executor(monkeypatch)
+        executor.execute_inline("1 + 1")
+        executor.execute_inline("1 + 2")
+        executor.execute_block("value = 1")
+        executor.execute_inline("1 + 1")
+        assert len(self.spawned) == 4
+
+    def test_failures_not_stored(self, monkeypatch):
+        """Test that failed executions are not cached."""
+        executor = self._executor(monkeypatch)
+        assert "[Error:" in executor.execute_inline("missing_name")
+        assert self.cache.entries == {}
+
+    def test_cache_key_covers_python_version(self, monkeypatch):
+        """Test that results are keyed on the interpreter version."""
+        key = PythonExecutor._make_cache_key("print(1)", "{}")
+        monkeypatch.setattr("sys.version", "0.0.0")
+        assert PythonExecutor._make_cache_key("print(1)", "{}") != key
+
+    def test_cache_is_opt_in(self, monkeypatch):
+        """Test that results are only cached when RXIV_PYTHON_CACHE is set."""
+        from rxiv_maker.converters import python_executor
+
+        monkeypatch.delenv("RXIV_PYTHON_CACHE", raising=False)
+        assert python_executor._get_result_cache() is None
+
+        monkeypatch.setenv("RXIV_PYTHON_CACHE", "1")
+        monkeypatch.setattr("rxiv_maker.utils.advanced_cache.get_global_cache", lambda *args, **kwargs: self.cache)
+        assert python_executor._get_result_cache() is self.cache
+
+
 class TestEdgeCases:
     """Test edge cases and unusual scenarios."""
 
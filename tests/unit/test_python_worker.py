@@ -0,0 +1,95 @@
+"""Tests for the persistent Python worker used by the executor."""
+
+import pytest
+
+from rxiv_maker.converters.python_executor import PythonExecutor
+from rxiv_maker.converters.python_worker import PythonWorker
+
+
+class _MemoryResultCache:
+    """In-memory stand-in for the persistent result cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_data(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, data):
+        self.entries[key] = data
+
+
+class TestPythonWorker:
+    """Test execution in a persistent worker process."""
+
+    def setup_method(self):
+        self.executors = []
+
+    def teardown_method(self):
+        for executor in self.executors:
+            executor.close()
+
+    def _executor(self, **kwargs):
+        executor = PythonExecutor(use_worker=True, **kwargs)
+        self.executors.append(executor)
+        return executor
+
+    def test_definitions_persist_between_calls(self):
+        """Test that functions and variables stay in the worker namespace."""
+        executor = self._executor()
+        executor.execute_block("def square(x):\n    return x * x\nbase = 3")
+
+        assert executor.execute_inline("square(base)") == "9"
+        assert executor.execution_context == {"base": 3}
+
+    def test_namespace_cleared_on_reset(self):
+        """Test that resetting the executor also resets the worker namespace."""
+        executor = self._executor()
+        executor.execute_block("value = 1")
+        executor.reset_context()
+
+        assert "not defined" in executor.execute_inline("value")
+
+    def test_cache_hit_resyncs_namespace(self):
+        """Test that variables from cached blocks are sent to the worker."""
+        cache = _MemoryResultCache()
+        self._executor(result_cache=cache).execute_block("value = 5")
+
+        executor = self._executor(result_cache=cache)
+        executor.execute_block("value = 5")
+        assert not executor.worker.is_alive()
+        assert executor.execute_inline("value * 2") == "10"
+
+    def test_crash_restarts_process(self):
+        """Test that a worker that dies mid-call is replaced on the next call."""
+        executor = self._executor()
+
+        assert "exited unexpectedly" in executor.execute_block("raise SystemExit")
+        assert executor.execute_inline("1 + 1") == "2"
+
+    def test_timeout_restarts_process(self):
+        """Test that a call exceeding the timeout kills and replaces the worker."""
+        executor = self._executor(timeout=1)
+        executor.execute_block("value = 7")
+
+        assert "timed out after 1 seconds" in executor.execute_block("while True:\n    pass")
+        assert executor.execute_inline("value") == "7"
+
+    def test_security_checks_enforced(self):
+        """Test that code is validated before it reaches the worker."""
+        executor = self._executor()
+
+        assert executor.execute_inline("__import__('os')").startswith("[Blocked:")
+        assert not executor.worker.is_alive()
+
+    @pytest.mark.parametrize("size", [1, 200_000])
+    def test_frames_carry_any_payload_size(self, size):
+        """Test that the framed protocol round-trips small and large messages."""
+        worker = PythonWorker()
+        try:
+            result = worker.execute(f"print('x' * {size})", "{}")
+        finally:
+            worker.close()
+
+        assert result["success"]
+        assert result["output"] == "x" * size + "\n"
@@ -0,0 +1,108 @@
+"""Unit tests for the section conversion cache."""
+
+from unittest.mock import patch
+
+from rxiv_maker.converters.md2tex import convert_markdown_to_latex
+from rxiv_maker.converters.section_processor import extract_content_sections
+from rxiv_maker.utils.section_cache import SectionCache, _converter_sources
+
+ARTICLE = "## Introduction\n\nSome **bold** text.\n\n## Methods\n\nWe used *italic* methods.\n"
+
+
+class TestSectionCache:
+    """Test caching of converted markdown sections."""
+
+    def test_convert_matches_converter(self, tmp_path):
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=str(tmp_path / "cache"))
+        content = "Some **bold** text with $x_1$."
+        assert cache.convert(content) == convert_markdown_to_latex(content)
+
+    def test_unchanged_sections_are_reused_across_builds(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        first = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        sections = extract_content_sections(ARTICLE, first)
+        first.save()
+        assert first.misses == 2
+
+        second = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        changed = ARTICLE.replace("italic", "different")
+        with patch("rxiv_maker.utils.section_cache.convert_markdown_to_latex", wraps=convert_markdown_to_latex) as spy:
+            new_sections = extract_content_sections(changed, second)
+
+        assert spy.call_count == 1
+        assert second.hits == 1
+        assert new_sections["introduction"] == sections["introduction"]
+        assert new_sections == extract_content_sections(changed)
+
+    def test_manuscripts_with_the_same_name_keep_separate_caches(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        first = SectionCache(str(tmp_path / "a" / "MANUSCRIPT"), cache_dir=cache_dir)
+        first.convert("First text")
+        first.save()
+        second = SectionCache(str(tmp_path / "b" / "MANUSCRIPT"), cache_dir=cache_dir)
+        second.convert("Second text")
+        second.save()
+
+        assert first.cache_file != second.cache_file
+        reloaded = SectionCache(str(tmp_path / "a" / "MANUSCRIPT"), cache_dir=cache_dir)
+        reloaded.convert("First text")
+        assert reloaded.hits == 1
+        assert not list((tmp_path / "cache").glob("*.tmp"))
+
+    def test_supplementary_flag_is_part_of_key(self, tmp_path):
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=str(tmp_path / "cache"))
+        cache.convert("Text", is_supplementary=False)
+        cache.convert("Text", is_supplementary=True)
+        assert cache.misses == 2
+
+    def test_version_change_invalidates_cache(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        cache.convert("Text")
+        cache.save()
+
+        with patch("rxiv_maker.utils.section_cache.get_converter_version", return_value="other"):
+            reloaded = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        assert reloaded.get_cache_stats()["cached_sections"] == 0
+
+    def test_version_covers_processors_and_templates(self):
+        names = {path.name for path in _converter_sources()}
+        assert {"md2tex.py", "template_processor.py", "template.tex"} <= names
+
+    def test_sections_with_python_commands_are_not_cached(self, tmp_path):
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=str(tmp_path / "cache"))
+        with patch("rxiv_maker.utils.section_cache.convert_markdown_to_latex", return_value="out") as mock_convert:
+            cache.convert("Value: {py: 1 + 1}")
+            cache.convert("Value: {py: 1 + 1}")
+        assert mock_convert.call_count == 2
+        assert cache.get_cache_stats()["cached_sections"] == 0
+
+    def test_save_drops_unused_entries(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        cache.convert("Old text")
+        cache.save()
+
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        cache.convert("New text")
+        cache.save()
+
+        reloaded = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        assert reloaded.get_cache_stats()["cached_sections"] == 1
+
+    def test_converted_sections_are_looked_up_without_converting(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        cache = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        with patch("rxiv_maker.utils.section_cache.convert_markdown_to_latex", return_value="out") as mock_convert:
+            cache.convert("Value: {py: 1 + 1}")
+            cache.convert("Plain text")
+            assert cache.get_converted("Value: {py: 1 + 1}") == "out"
+            assert cache.get_converted("Plain text") == "out"
+            assert cache.get_converted("Plain text", is_supplementary=True) is None
+        assert mock_convert.call_count == 2
+
+        # Results of Python commands are only reused within the build that ran them
+        cache.save()
+        reloaded = SectionCache(str(tmp_path / "MANUSCRIPT"), cache_dir=cache_dir)
+        assert reloaded.get_converted("Value: {py: 1 + 1}") is None
+        assert reloaded.get_converted("Plain text") == "out"
@@ -0,0 +1,100 @@
+"""Unit tests for the span tokenizer and the span-based conversion engine."""
+
+from pathlib import Path
+
+import pytest
+
+from rxiv_maker.converters.md2tex import convert_markdown_to_latex
+from rxiv_maker.converters.span_tokenizer import SpanType, tokenize_markdown
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+FIXTURE_DOCUMENTS = [
+    "tests/fixtures/01_MAIN.md",
+    "EXAMPLE_MANUSCRIPT/01_MAIN.md",
+    "EXAMPLE_MANUSCRIPT/02_SUPPLEMENTARY_INFO.md",
+    "MANUSCRIPT/01_MAIN.md",
+    "MANUSCRIPT/02_SUPPLEMENTARY_INFO.md",
+    "examples/figure-positioning-examples/01_MAIN.md",
+]
+
+
+class TestTokenizeMarkdown:
+    """Test tokenization of markdown into typed spans."""
+
+    def test_spans_span_whole_content(self):
+        content = "Intro\n\n```python\nx = 1\n```\n\n$$E = mc^2$$\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\nEnd"
+        spans = tokenize_markdown(content)
+        assert "".join(span.text for span in spans) == content
+        for span in spans:
+            assert content[span.start : span.end] == span.text
+
+    def test_span_types(self):
+        content = "Intro\n\n```python\nx = 1\n```\n\n$$E = mc^2$$\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\nEnd"
+        types = [span.type for span in tokenize_markdown(content)]
+        assert types == [
+            SpanType.TEXT,
+            SpanType.CODE,
+            SpanType.TEXT,
+            SpanType.MATH,
+            SpanType.TEXT,
+            SpanType.TABLE,
+            SpanType.TEXT,
+        ]
+
+    def test_plain_prose_is_single_span(self):
+        spans = tokenize_markdown("Just **some** text with $x$ inline math.")
+        assert len(spans) == 1
+        assert spans[0].type is SpanType.TEXT
+
+    def test_attributed_math_is_not_math_span(self):
+        spans = tokenize_markdown("Before\n\n$$F = ma$$ {#eq:newton}\n\nAfter")
+        assert [span.type for span in spans] == [SpanType.TEXT]
+
+    def test_math_inside_backticks_is_not_math_span(self):
+        spans = tokenize_markdown("Write `$$x$$` for display math.")
+        assert [span.type for span in spans] == [SpanType.TEXT]
+
+    def test_table_span_includes_captions(self):
+        content = "Text\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\n{#stable:data} **Data table.**\n\nMore text"
+        table = next(span for span in tokenize_markdown(content) if span.type is SpanType.TABLE)
+        assert table.text.startswith("| A | B |")
+        assert table.text.endswith("{#stable:data} **Data table.**")
+
+    def test_table_span_includes_legacy_caption(self):
+        content = "Text\n\nTable 1: Legacy caption\n| A | B |\n|---|---|\n| 1 | 2 |\n"
+        table = next(span for span in tokenize_markdown(content) if span.type is SpanType.TABLE)
+        assert table.text.startswith("Table 1: Legacy caption\n")
+
+
+class TestSpanEngine:
+    """Test that the span engine matches the legacy engine."""
+
+    @pytest.mark.parametrize("document", FIXTURE_DOCUMENTS)
+    @pytest.mark.parametrize("is_supplementary", [False, True])
+    def test_fixture_output_identical(self, document, is_supplementary):
+        path = REPO_ROOT / document
+        if not path.exists():
+            pytest.skip(f"{document} not found")
+        content = path.read_text(encoding="utf-8")
+
+        legacy = convert_markdown_to_latex(content, is_supplementary, engine="legacy")
+        spans = convert_markdown_to_latex(content, is_supplementary, engine="spans")
+        assert spans == legacy
+
+    def test_mixed_content_identical(self):
+        content = (
+            "# Title\n\nSome **bold** text with $x_1$ and [@ref1].\n\n"
+            "```python\nprint('a_b')\n```\n\n$$\\sum_i x_i$$\n\n"
+            "| Name | Value |\n|------|-------|\n| `a_b` | $x^2$ |\n\n"
+            "{#table:t1} **A table.**\n\nFinal paragraph with *italic*."
+        )
+        assert convert_markdown_to_latex(content, engine="spans") == convert_markdown_to_latex(content, engine="legacy")
+
+    def test_engine_from_environment(self, monkeypatch):
+        monkeypatch.setenv("RXIV_CONVERTER_ENGINE", "spans")
+        assert convert_markdown_to_latex("Some **bold** text.") == r"Some \textbf{bold} text."
+
+    def test_unknown_engine_raises(self):
+        with pytest.raises(ValueError):
+            convert_markdown_to_latex("text", engine="unknown")
@@ -0,0 +1,103 @@
+"""Unit tests for build stage fingerprints."""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+from rxiv_maker.utils.stage_fingerprints import StageFingerprints
+
+
+def _age(path, seconds=60):
+    """Move a file's modification time into the past, outside the racy window."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestStageFingerprints:
+    """Test make-style up-to-date checks for build stages."""
+
+    def setup_method(self):
+        self.stage = "copy_references"
+
+    def _record(self, tmp_path, parameters=None):
+        source = tmp_path / "refs.bib"
+        output = tmp_path / "out.bib"
+        if not source.exists():
+            source.write_text("@article{a}", encoding="utf-8")
+            output.write_text("@article{a}", encoding="utf-8")
+
+        fingerprints = StageFingerprints(str(tmp_path / "MANUSCRIPT"), cache_dir=str(tmp_path / "cache"))
+        fingerprints.record(self.stage, fingerprints.fingerprint([source]), [output], parameters)
+        return source, output
+
+    def _reloaded(self, tmp_path):
+        return StageFingerprints(str(tmp_path / "MANUSCRIPT"), cache_dir=str(tmp_path / "cache"))
+
+    def test_unchanged_stage_is_up_to_date_across_builds(self, tmp_path):
+        source, _ = self._record(tmp_path, {"engine": "local"})
+        fingerprints = self._reloaded(tmp_path)
+
+        assert fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]), {"engine": "local"})
+
+    def test_changed_input_reruns_stage(self, tmp_path):
+        source, _ = self._record(tmp_path)
+        source.write_text("@article{b}", encoding="utf-8")
+        fingerprints = self._reloaded(tmp_path)
+
+        assert not fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+
+    def test_changed_parameters_rerun_stage(self, tmp_path):
+        source, _ = self._record(tmp_path, {"engine": "local"})
+        fingerprints = self._reloaded(tmp_path)
+
+        assert not fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]), {"engine": "docker"})
+
+    def test_modified_and_missing_outputs_rerun_stage(self, tmp_path):
+        source, output = self._record(tmp_path)
+        output.write_text("edited", encoding="utf-8")
+        fingerprints = self._reloaded(tmp_path)
+        assert not fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+
+        output.unlink()
+        assert not fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+
+    def test_invalidated_stage_reruns(self, tmp_path):
+        source, _ = self._record(tmp_path)
+        fingerprints = self._reloaded(tmp_path)
+        fingerprints.invalidate(self.stage)
+
+        assert not self._reloaded(tmp_path).is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+
+    def test_unchanged_files_are_not_read_again(self, tmp_path):
+        source, output = self._record(tmp_path)
+        _age(source)
+        _age(output)
+        fingerprints = self._reloaded(tmp_path)
+        fingerprints.record(self.stage, fingerprints.fingerprint([source]), [output])
+
+        fingerprints = self._reloaded(tmp_path)
+        with patch("rxiv_maker.utils.file_hashing.hashlib.file_digest") as file_digest:
+            assert fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+        file_digest.assert_not_called()
+
+    def test_hashes_refreshed_by_skipped_stage_are_saved(self, tmp_path):
+        source, output = self._record(tmp_path)
+        _age(source)
+        _age(output)
+
+        # The recorded hashes were taken within the racy window, so this check reads the files
+        fingerprints = self._reloaded(tmp_path)
+        assert fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+
+        fingerprints = self._reloaded(tmp_path)
+        with patch("rxiv_maker.utils.file_hashing.hashlib.file_digest") as file_digest:
+            assert fingerprints.is_up_to_date(self.stage, fingerprints.fingerprint([source]))
+        file_digest.assert_not_called()
+
+    def test_freshly_modified_files_are_always_hashed(self, tmp_path):
+        source, _ = self._record(tmp_path)
+        fingerprints = self._reloaded(tmp_path)
+
+        with patch("rxiv_maker.utils.file_hashing.hashlib.file_digest", wraps=hashlib.file_digest) as spy:
+            fingerprints.fingerprint([source])
+        assert spy.call_count == 1
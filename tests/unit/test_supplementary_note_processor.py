@@ -62,6 +62,23 @@ More content here."""
         # Should only have renewcommand setup once (for the first note)
         assert restored.count("\\renewcommand{\\thesubsection}{Supp. Note \\arabic{subsection}}") == 1
 
+    def test_concurrent_conversions_keep_notes_apart(self):
+        """Test that a conversion in another thread does not see or clear the notes."""
+        import threading
+
+        processed = process_supplementary_notes("{#snote:mine} **Mine.**")
+
+        def convert_other():
+            other = process_supplementary_notes("{#snote:theirs} **Theirs.**")
+            restore_supplementary_note_placeholders(other)
+
+        thread = threading.Thread(target=convert_other)
+        thread.start()
+        thread.join()
+
+        restored = restore_supplementary_note_placeholders(processed)
+        assert "\\suppnotesection{Mine.}\\label{snote:mine}" in restored
+
     def test_supplementary_note_with_special_characters(self):
         """Test processing notes with special characters in titles."""
         content = "{#snote:test} **Title with & Special % Characters.**"
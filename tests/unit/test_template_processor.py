@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from rxiv_maker.processors.template_processor import (
+    find_supplementary_md,
     generate_bibliography,
     generate_keywords,
     get_template_path,
@@ -88,3 +89,15 @@ class TestTemplateProcessor:
         assert "Comprehensive Test" in result
         assert "Jane Doe" in result
         assert "comprehensive" in result
+
+    def test_find_supplementary_md_ignores_working_directory(self, tmp_path, monkeypatch):
+        """Test that an explicit manuscript path is used instead of the cwd and environment."""
+        (tmp_path / "02_SUPPLEMENTARY_INFO.md").write_text("# Elsewhere\n", encoding="utf-8")
+        manuscript = tmp_path / "PAPER"
+        manuscript.mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MANUSCRIPT_PATH", "PAPER")
+
+        assert find_supplementary_md(manuscript) is None
+        (manuscript / "02_SUPPLEMENTARY_INFO.md").write_text("# Notes\n", encoding="utf-8")
+        assert find_supplementary_md(manuscript) == manuscript / "02_SUPPLEMENTARY_INFO.md"
@@ -1,7 +1,10 @@
 """Unit tests for text_formatters module."""
 
 from rxiv_maker.converters.md2tex import convert_markdown_to_latex
-from rxiv_maker.converters.text_formatters import process_code_spans
+from rxiv_maker.converters.text_formatters import (
+    escape_special_characters,
+    process_code_spans,
+)
 
 
 class TestCodeSpanMathProcessing:
@@ -226,3 +229,53 @@ class TestRegressionTests:
         result = process_code_spans(input_text)
 
         assert "XUNDERSCOREX" in result
+
+
+class TestSpecialCharacterEscaping:
+    """Test the single-scan special character escaping."""
+
+    # Outputs of the previous one-pass-per-rule implementation
+    SAMPLES = {
+        "See \\ref{fig:a_b} and \\cite{smith_2020} for details": (
+            "See \\ref{fig:a_b} and \\cite{smith_2020} for details"
+        ),
+        "(see \\ref{fig:a_b} in data_file.csv)": "(see \\ref{fig:a_b} in data\\_file.csv)",
+        "Edit 00_CONFIG.yml and 01_MAIN.md (or my_script.py)": (
+            "Edit 00\\_CONFIG.yml and 01\\_MAIN.md (or my\\_script.py)"
+        ),
+        "% comment\n100% done, 50% left": "% comment\n100\\% done, 50\\% left",
+        "Carets a^b outside math and $x^2$ inside, $$y^2$$ too": (
+            "Carets a\\textasciicircum{}b outside math and $x^2$ inside, $$y\\textasciicircum{}2$$ too"
+        ),
+        "\\texttt{C:\\dir #1} and \\texttt{\\detokenize{a_b}}": (
+            "\\texttt{C:\\textbackslash{}dir \\#1} and \\texttt{\\detokenize{a_b}}"
+        ),
+        "Arrows → ← ↑ ↓ in running prose": (
+            "Arrows $\\rightarrow$ $\\leftarrow$ $\\uparrow$ $\\downarrow$ in running prose"
+        ),
+        "\\includegraphics[width=1]{FIGURES/fig_one.png}": "\\includegraphics[width=1]{FIGURES/fig_one.png}",
+    }
+
+    def test_matches_previous_output_on_samples(self):
+        """Test that typical manuscript content is escaped as before."""
+        for sample, expected in self.SAMPLES.items():
+            assert escape_special_characters(sample) == expected, sample
+
+    def test_escaped_underscore_opening_file_name(self):
+        """Test that an underscore placeholder at the start of a file name is replaced."""
+        assert escape_special_characters("see XUNDERSCOREXfile_name.csv") == "see \\_file\\_name.csv"
+        assert escape_special_characters("aXUNDERSCOREXb_c.csv and XUNDERSCOREX") == "a\\_b\\_c.csv and \\_"
+
+    def test_protected_commands_in_parens(self):
+        """Test that references inside a file path in parentheses keep their underscores."""
+        result = escape_special_characters("(see \\ref{fig:a_b} in data_file.csv)")
+
+        assert result == "(see \\ref{fig:a_b} in data\\_file.csv)"
+
+    def test_double_backslash_collapsed(self):
+        """Test that doubled backslash escapes collapse without a cleanup pass."""
+        assert escape_special_characters("Path \\textbackslash{}textbackslash x") == "Path \\textbackslash{}x"
+
+    def test_escaped_underscores_not_escaped_again(self):
+        """Test that already escaped underscores in file names are left alone."""
+        assert escape_special_characters("\\_00_CONFIG.yml here") == "\\_00\\_CONFIG.yml here"
@@ -4,9 +4,10 @@ import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 from rxiv_maker.engine.track_changes import TrackChangesManager
 
@@ -104,10 +105,22 @@ class TestTrackChangesManager(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @staticmethod
+    def _cat_file_output(*contents):
+        """Build ``git cat-file --batch`` output for blobs, with None for missing objects."""
+        output = b""
+        for content in contents:
+            if content is None:
+                output += b"test-tag:missing missing\n"
+            else:
+                output += b"0123abcd blob %d\n%s\n" % (len(content), content)
+        return output
+
     @patch("subprocess.run")
     def test_extract_files_from_tag_success(self, mock_run):
         """Test successful file extraction from git tag."""
-        mock_run.return_value = MagicMock(stdout="file content", returncode=0)
+        contents = [b"main content\n", b"supplementary", b"title: Test\n", b"@article{test,}\n"]
+        mock_run.return_value = MagicMock(stdout=self._cat_file_output(*contents), returncode=0)
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -117,34 +130,26 @@ class TestTrackChangesManager(unittest.TestCase):
             # Check that tag_manuscript directory was created
             self.assertTrue((temp_path / "tag_manuscript").exists())
 
-            # Verify git show was called for each manuscript file
-            expected_calls = []
-            for file_name in self.track_changes.manuscript_files:
-                expected_calls.append(
-                    call(
-                        [
-                            "git",
-                            "show",
-                            f"test-tag:{self.manuscript_path.name}/{file_name}",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                )
-
-            self.assertEqual(mock_run.call_count, len(expected_calls))
+            # Verify all manuscript files were read by one batched git process
+            mock_run.assert_called_once()
+            args, kwargs = mock_run.call_args
+            self.assertEqual(args[0], ["git", "cat-file", "--batch"])
+            manuscript_name = self.manuscript_path.name
+            expected_requests = "".join(
+                f"test-tag:{manuscript_name}/{file_name}\n" for file_name in self.track_changes.manuscript_files
+            )
+            self.assertEqual(kwargs["input"], expected_requests.encode("utf-8"))
+
+            for file_name, content in zip(self.track_changes.manuscript_files, contents, strict=True):
+                self.assertEqual((temp_path / "tag_manuscript" / file_name).read_bytes(), content)
 
     @patch("subprocess.run")
     def test_extract_files_from_tag_missing_file(self, mock_run):
         """Test file extraction when some files are missing from tag."""
-        # First call succeeds, second fails
-        mock_run.side_effect = [
-            MagicMock(stdout="file content", returncode=0),  # 01_MAIN.md
-            subprocess.CalledProcessError(1, "git"),  # 02_SUPPLEMENTARY_INFO.md
-            MagicMock(stdout="config content", returncode=0),  # 00_CONFIG.yml
-            MagicMock(stdout="bib content", returncode=0),  # 03_REFERENCES.bib
-        ]
+        # 02_SUPPLEMENTARY_INFO.md is missing from the tag
+        mock_run.return_value = MagicMock(
+            stdout=self._cat_file_output(b"file content", None, b"config content", b"bib content"), returncode=0
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -152,6 +157,8 @@ class TestTrackChangesManager(unittest.TestCase):
 
             self.assertTrue(result)  # Should still return True
             self.assertTrue((temp_path / "tag_manuscript").exists())
+            self.assertFalse((temp_path / "tag_manuscript" / "02_SUPPLEMENTARY_INFO.md").exists())
+            self.assertEqual((temp_path / "tag_manuscript" / "00_CONFIG.yml").read_bytes(), b"config content")
 
     @patch("subprocess.run")
     def test_generate_latex_files_success(self, mock_run):
@@ -266,19 +273,62 @@ class TestTrackChangesManager(unittest.TestCase):
         # Create the PDF file that pdflatex would create
         diff_pdf.touch()
 
-        original_cwd = os.getcwd()
-
         result = self.track_changes.compile_diff_pdf(diff_tex)
 
         self.assertTrue(result)
 
-        # Check that we changed to the correct directory
-        mock_chdir.assert_any_call(diff_tex.parent)
-        mock_chdir.assert_called_with(original_cwd)  # Should return to original
+        # Compilation runs in the output directory without changing the process directory
+        mock_chdir.assert_not_called()
+        for call in mock_run.call_args_list:
+            self.assertEqual(call.kwargs["cwd"], diff_tex.parent)
 
         # Check that pdflatex was called 3 times
         self.assertEqual(mock_run.call_count, 3)
 
+    @patch("os.chdir")
+    @patch("subprocess.run")
+    def test_diff_compiles_with_cached_preamble_format(self, mock_run, mock_chdir):
+        """Test that every pass uses the cached preamble format when it is enabled."""
+        diff_tex = Path(self.temp_dir) / "test.tex"
+        diff_tex.write_text("\\documentclass{article}\\begin{document}test\\end{document}")
+
+        def compile_pass(command, **kwargs):
+            diff_tex.with_suffix(".pdf").touch()
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        mock_run.side_effect = compile_pass
+
+        with (
+            patch.dict(os.environ, {"RXIV_LATEX_FORMAT": "true"}),
+            patch("rxiv_maker.utils.preamble_format.get_preamble_format", return_value="rxiv_preamble_0"),
+        ):
+            self.assertTrue(self.track_changes.compile_diff_pdf(diff_tex))
+
+        commands = [call.args[0] for call in mock_run.call_args_list]
+        self.assertEqual(len(commands), 3)
+        self.assertTrue(all(command[1] == "-fmt=rxiv_preamble_0" for command in commands))
+
+    @patch("subprocess.run")
+    def test_diff_compiles_in_output_directory(self, mock_run):
+        """Test that every pass runs in the output directory without changing the process directory."""
+        diff_tex = Path(self.temp_dir) / "test.tex"
+        diff_tex.write_text("\\documentclass{article}\\begin{document}test\\end{document}")
+        (diff_tex.parent / "03_REFERENCES.bib").write_text("@article{a}")
+
+        def compile_pass(command, **kwargs):
+            diff_tex.with_suffix(".pdf").touch()
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        mock_run.side_effect = compile_pass
+
+        with patch("os.chdir") as mock_chdir:
+            self.assertTrue(self.track_changes.compile_diff_pdf(diff_tex, use_preamble_format=False))
+
+        mock_chdir.assert_not_called()
+        commands = [call.args[0][0] for call in mock_run.call_args_list]
+        self.assertEqual(commands, ["pdflatex", "bibtex", "pdflatex", "pdflatex"])
+        self.assertTrue(all(call.kwargs["cwd"] == diff_tex.parent for call in mock_run.call_args_list))
+
     def test_compile_diff_pdf_missing_file(self):
         """Test PDF compilation when diff file is missing."""
         diff_tex = Path(self.temp_dir) / "missing.tex"
@@ -353,6 +403,88 @@ class TestTrackChangesManager(unittest.TestCase):
         mock_copy.assert_called_once()
         mock_compile.assert_called_once()
 
+    @patch.object(TrackChangesManager, "validate_git_tag", return_value=True)
+    @patch.object(TrackChangesManager, "extract_files_from_tag", return_value=True)
+    @patch.object(TrackChangesManager, "get_tag_commit", return_value=None)
+    @patch.object(TrackChangesManager, "run_latexdiff", return_value=False)
+    def test_versions_converted_concurrently(self, mock_latexdiff, mock_commit, mock_extract, mock_validate):
+        """Test that the current and tag versions are converted at the same time."""
+        # Each conversion waits for the other, so running them in turn would time out
+        both_running = threading.Barrier(2, timeout=5)
+
+        def convert(manuscript_dir, output_subdir):
+            both_running.wait()
+            return True
+
+        with patch.object(TrackChangesManager, "generate_latex_files", side_effect=convert) as mock_generate:
+            self.track_changes.generate_change_tracked_pdf()
+
+        self.assertEqual(sorted(c.args[1] for c in mock_generate.call_args_list), ["current", "tag"])
+        mock_latexdiff.assert_called_once()
+
+    def test_tag_conversion_reused_on_same_commit(self):
+        """Test that the tag's generated files are cached under its commit and reused."""
+        cache_root = Path(self.temp_dir) / "cache"
+
+        def convert(manuscript_dir, output_subdir):
+            output = self.output_dir / output_subdir
+            output.mkdir(exist_ok=True)
+            (output / "tag_manuscript.tex").write_text(f"converted from {manuscript_dir.name}")
+            return True
+
+        with (
+            patch("rxiv_maker.utils.cache_utils.get_cache_dir", side_effect=lambda name: cache_root / name),
+            patch.object(TrackChangesManager, "get_tag_commit", return_value="a" * 40) as mock_commit,
+            patch.object(TrackChangesManager, "extract_files_from_tag", return_value=True) as mock_extract,
+            patch.object(TrackChangesManager, "generate_latex_files", side_effect=convert) as mock_generate,
+        ):
+            self.assertTrue(self.track_changes.prepare_tag_latex(Path(self.temp_dir)))
+            shutil.rmtree(self.output_dir / "tag")
+            self.assertTrue(self.track_changes.prepare_tag_latex(Path(self.temp_dir)))
+
+            self.assertEqual(mock_extract.call_count, 1)
+            self.assertEqual(mock_generate.call_count, 1)
+            self.assertEqual(
+                (self.output_dir / "tag" / "tag_manuscript.tex").read_text(), "converted from tag_manuscript"
+            )
+
+            # Moving the tag to another commit converts it again
+            mock_commit.return_value = "b" * 40
+            self.assertTrue(self.track_changes.prepare_tag_latex(Path(self.temp_dir)))
+            self.assertEqual(mock_generate.call_count, 2)
+
+    def test_tag_cache_key_changes_with_converter(self):
+        """Test that changed converter sources invalidate the cached tag files."""
+        cache_root = Path(self.temp_dir) / "cache"
+
+        with (
+            patch("rxiv_maker.utils.cache_utils.get_cache_dir", side_effect=lambda name: cache_root / name),
+            patch.object(TrackChangesManager, "get_tag_commit", return_value="a" * 40),
+            patch("rxiv_maker.utils.section_cache.get_converter_version", return_value="1.0+aaaa"),
+        ):
+            first = self.track_changes._get_tag_cache_dir()
+            with patch("rxiv_maker.utils.section_cache.get_converter_version", return_value="1.0+bbbb"):
+                second = self.track_changes._get_tag_cache_dir()
+
+        self.assertNotEqual(first, second)
+
+    def test_tag_cache_keeps_recent_entries(self):
+        """Test that the tag cache evicts the least recently used conversions."""
+        from rxiv_maker.engine.track_changes import TAG_CACHE_MAX_ENTRIES
+
+        cache_root = Path(self.temp_dir) / "cache" / "track_changes"
+        for index in range(TAG_CACHE_MAX_ENTRIES + 2):
+            entry = cache_root / f"entry{index}"
+            entry.mkdir(parents=True)
+            os.utime(entry, ns=(index * 1_000_000_000, index * 1_000_000_000))
+
+        self.track_changes._prune_tag_cache(cache_root)
+
+        remaining = sorted(entry.name for entry in cache_root.iterdir())
+        self.assertEqual(len(remaining), TAG_CACHE_MAX_ENTRIES)
+        self.assertNotIn("entry0", remaining)
+        self.assertNotIn("entry1", remaining)
+
     @patch.object(TrackChangesManager, "validate_git_tag")
     def test_generate_change_tracked_pdf_invalid_tag(self, mock_validate):
         """Test change-tracked PDF generation with invalid git tag."""
@@ -558,6 +558,61 @@ l.45 E = mc^2
         self.assertTrue(any("Unknown LaTeX command" in msg or "control sequence" in msg for msg in error_messages))
 
 
+@pytest.mark.validation
+@unittest.skipUnless(VALIDATORS_AVAILABLE, "Validators not available")
+class TestLaTeXOutputParser(unittest.TestCase):
+    """Test incremental parsing of pdflatex output."""
+
+    OUTPUT = [
+        "(./MANUSCRIPT.tex",
+        "Overfull \\hbox (3.0pt too wide) in paragraph at lines 10--12",
+        "! Undefined control sequence.",
+        "l.42 \\unknowncommand",
+        "                     {test}",
+        "",
+        "! Missing $ inserted.",
+        "l.45 E = mc^2",
+    ]
+
+    def test_fatal_failure_flagged_before_output_ends(self):
+        """Test that a fatal error is reported once its context lines have arrived."""
+        from rxiv_maker.validators.latex_error_parser import LaTeXOutputParser
+
+        parser = LaTeXOutputParser()
+        reported = [parser.feed(line) for line in self.OUTPUT]
+
+        self.assertEqual(reported[:5], [None] * 5)
+        self.assertEqual(reported[5].error_type, "undefined_command")
+        self.assertIn(">>> ! Undefined control sequence.", reported[5].context)
+        self.assertIn("l.42", reported[5].context)
+
+    def test_incremental_parse_matches_log_parse(self):
+        """Test that streamed output yields the same errors as parsing the whole log."""
+        from rxiv_maker.validators.latex_error_parser import LaTeXOutputParser
+
+        parser = LaTeXOutputParser()
+        for line in self.OUTPUT:
+            parser.feed(line + "\n")
+
+        log_errors = LaTeXErrorParser(tempfile.mkdtemp())._parse_log_file("\n".join(self.OUTPUT))
+        self.assertEqual(parser.close(), log_errors)
+        self.assertEqual(
+            [error.error_type for error in log_errors], ["overfull_hbox", "undefined_command", "math_mode_error"]
+        )
+
+    def test_mentions_in_warnings_are_not_fatal(self):
+        """Test that only TeX error lines can stop a run."""
+        from rxiv_maker.validators.latex_error_parser import LaTeXOutputParser
+
+        parser = LaTeXOutputParser()
+        for line in ["LaTeX Warning: File `draft.png' not found on input line 3.", "! Missing $ inserted."]:
+            parser.feed(line)
+        parser.close()
+
+        self.assertIsNone(parser.fatal_error)
+        self.assertEqual(len(parser.errors), 2)
+
+
 @pytest.mark.validation
 @unittest.skipUnless(VALIDATORS_AVAILABLE, "Validators not available")
 class TestValidationIntegration(unittest.TestCase):